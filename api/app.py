@@ -3,17 +3,17 @@ Library Management API - Flask application with book CRUD and search endpoints.
 Provides REST API for managing books, authors, members, and loans.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
 import traceback
 from datetime import datetime
 from werkzeug.security import generate_password_hash
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 # Import our modules
 from api.data_store import (
-    BOOKS, AUTHORS, MEMBERS, LOANS, BALLOTS, PROPOSALS, VOTES,
+    BOOKS, AUTHORS, MEMBERS, LOANS, BALLOTS, PROPOSALS, VOTES, bump_data_version,
     get_next_book_id, get_next_loan_id, get_next_member_id, get_next_ballot_id, get_next_vote_id,
     create_proposal, update_proposal, get_proposal, get_all_proposals,
     create_vote, get_vote_by_member_and_proposal, get_votes_for_proposal, update_vote, delete_vote
@@ -22,7 +22,12 @@ from api.validators import (
     validate_book, validate_book_update, validate_loan, validate_loan_return, validate_member,
     validate_ballot_vote, validate_ballot, validate_proposal, validate_vote, validate_proposal_update, validate_vote_update
 )
-from api.auth import token_required, authenticate_member, generate_token
+from api.response_cache import cached_response
+from api.auth import token_required, admin_required, authenticate_member, generate_token
+from api.bulk import (
+    AUTHOR_RESOURCE, BOOK_RESOURCE, MEMBER_RESOURCE, DEFAULT_BATCH_SIZE, MAX_BATCH_SIZE, FORMAT_MIMETYPES,
+    BulkFormatError, BulkResource, resolve_format, iter_text_lines, import_records, export_records
+)
 
 # Import voting system
 from api.voting.routes import voting_bp
@@ -135,7 +140,9 @@ def register_member() -> Tuple[Dict[str, Any], int]:
             "name": data["name"].strip(),
             "email": data["email"].strip().lower(),
             "password_hash": generate_password_hash(data["password"]),
-            "registration_date": datetime.now().strftime("%Y-%m-%d")
+            "registration_date": datetime.now().strftime("%Y-%m-%d"),
+            "role": "user",
+            "status": "active"
         }
 
         MEMBERS[member_id] = new_member
@@ -156,6 +163,7 @@ def register_member() -> Tuple[Dict[str, Any], int]:
 
 # Book endpoints
 @app.route("/books", methods=["GET"])
+@cached_response("books", "authors")
 def list_books() -> Tuple[List[Dict[str, Any]], int]:
     """
     List books with optional search filtering.
@@ -256,6 +264,7 @@ def create_book() -> Tuple[Dict[str, Any], int]:
         }
 
         BOOKS[book_id] = new_book
+        bump_data_version("books")
 
         # Return book with author info
         author = AUTHORS.get(new_book["author_id"])
@@ -270,6 +279,7 @@ def create_book() -> Tuple[Dict[str, Any], int]:
         return {"error": "Failed to create book"}, 500
 
 @app.route("/books/<int:book_id>", methods=["GET"])
+@cached_response("books", "authors")
 def get_book(book_id: int) -> Tuple[Dict[str, Any], int]:
     """
     Get a specific book by ID.
@@ -349,6 +359,7 @@ def update_book(book_id: int) -> Tuple[Dict[str, Any], int]:
             book["available_copies"] = int(data["available_copies"])
         if "total_copies" in data:
             book["total_copies"] = int(data["total_copies"])
+        bump_data_version("books")
 
         # Return updated book with author info
         author = AUTHORS.get(book["author_id"])
@@ -386,6 +397,7 @@ def delete_book(book_id: int) -> Tuple[Dict[str, str], int]:
 
         # Delete the book
         del BOOKS[book_id]
+        bump_data_version("books")
 
         return {"message": "Book deleted successfully"}, 200
 
@@ -394,6 +406,106 @@ def delete_book(book_id: int) -> Tuple[Dict[str, str], int]:
         return {"error": "Failed to delete book"}, 500
 
 
+# BULK IMPORT / EXPORT ENDPOINTS
+
+def _bulk_import(resource: BulkResource) -> Tuple[Dict[str, Any], int]:
+    """
+    Import records of one type from an NDJSON or CSV request body.
+
+    Query parameters:
+        format: "ndjson" or "csv" (optional, defaults to the Content-Type)
+        batch_size: Rows validated and inserted together (default: 500, max: 5000)
+
+    Returns:
+        201: {"imported": int, "failed": int, "ids": [int], "errors": [{"row": int, "error": "string"}]}
+        400: Invalid batch size, empty body, or no valid rows
+        415: Unsupported payload format
+    """
+    try:
+        fmt = resolve_format(request.mimetype, request.args.get("format"))
+    except BulkFormatError as e:
+        return {"error": str(e)}, 415
+
+    batch_size = request.args.get("batch_size", DEFAULT_BATCH_SIZE, type=int)
+    if batch_size is None or not 1 <= batch_size <= MAX_BATCH_SIZE:
+        return {"error": f"batch_size must be between 1 and {MAX_BATCH_SIZE}"}, 400
+
+    summary = import_records(resource, iter_text_lines(request.stream), fmt, batch_size)
+    if not summary["imported"] and not summary["failed"]:
+        return {"error": "Request body required"}, 400
+    return summary, 201 if summary["imported"] else 400
+
+def _bulk_export(resource: BulkResource) -> Any:
+    """
+    Stream all records of one type as NDJSON or CSV.
+
+    Query parameters:
+        format: "ndjson" (default) or "csv"
+
+    Returns:
+        200: Streamed records, one per line
+        400: Unsupported format
+    """
+    try:
+        fmt = resolve_format(None, request.args.get("format", "ndjson"))
+    except BulkFormatError as e:
+        return {"error": str(e)}, 400
+
+    return Response(
+        stream_with_context(export_records(resource, fmt)),
+        mimetype=FORMAT_MIMETYPES[fmt],
+        headers={"Content-Disposition": f"attachment; filename={resource.name}s.{fmt}"}
+    )
+
+@app.route("/books/import", methods=["POST"])
+@token_required
+def import_books() -> Tuple[Dict[str, Any], int]:
+    """Bulk import books from NDJSON or CSV (fields as for POST /books)."""
+    try:
+        return _bulk_import(BOOK_RESOURCE)
+    except Exception as e:
+        print(f"Import books error: {str(e)}")
+        return {"error": "Failed to import books"}, 500
+
+@app.route("/books/export", methods=["GET"])
+def export_books() -> Any:
+    """Stream all books as NDJSON or CSV."""
+    return _bulk_export(BOOK_RESOURCE)
+
+@app.route("/authors/import", methods=["POST"])
+@token_required
+def import_authors() -> Tuple[Dict[str, Any], int]:
+    """Bulk import authors from NDJSON or CSV with "name" and optional "bio" fields."""
+    try:
+        return _bulk_import(AUTHOR_RESOURCE)
+    except Exception as e:
+        print(f"Import authors error: {str(e)}")
+        return {"error": "Failed to import authors"}, 500
+
+@app.route("/authors/export", methods=["GET"])
+def export_authors() -> Any:
+    """Stream all authors as NDJSON or CSV."""
+    return _bulk_export(AUTHOR_RESOURCE)
+
+@app.route("/members/import", methods=["POST"])
+@token_required
+@admin_required
+def import_members() -> Tuple[Dict[str, Any], int]:
+    """Bulk import members from NDJSON or CSV (fields as for POST /members). Admin only."""
+    try:
+        return _bulk_import(MEMBER_RESOURCE)
+    except Exception as e:
+        print(f"Import members error: {str(e)}")
+        return {"error": "Failed to import members"}, 500
+
+@app.route("/members/export", methods=["GET"])
+@token_required
+@admin_required
+def export_members() -> Any:
+    """Stream all members as NDJSON or CSV, without password hashes. Admin only."""
+    return _bulk_export(MEMBER_RESOURCE)
+
+
 # LOAN ENDPOINTS
 
 @app.route("/loans/borrow", methods=["POST"])
@@ -450,6 +562,7 @@ def borrow_book() -> Tuple[Dict[str, Any], int]:
 
         # Decrease available copies of the book
         book["available_copies"] -= 1
+        bump_data_version("books")
 
         # Return loan details
         return {
@@ -515,6 +628,7 @@ def return_book() -> Tuple[Dict[str, Any], int]:
 
         # Increase available copies of the book
         book["available_copies"] += 1
+        bump_data_version("books")
 
         return {
             "loan_id": loan_id,
@@ -577,7 +691,28 @@ def get_loan_details(loan_id: int) -> Tuple[Dict[str, Any], int]:
 
 # BALLOT VOTING SYSTEM (for elections with multiple candidates)
 
+def _active_ballots_expiry(now: str) -> Optional[str]:
+    """
+    Get the next time a ballot opens or closes, after which the active list changes.
+
+    Args:
+        now: Current time as an ISO 8601 string
+
+    Returns:
+        ISO 8601 time of the next start/end boundary, or None if there is none
+    """
+    boundaries = []
+    for ballot in BALLOTS.values():
+        if ballot["status"] != "active":
+            continue
+        if ballot["start_date"] > now:
+            boundaries.append(ballot["start_date"])
+        elif ballot["end_date"] >= now:
+            boundaries.append(ballot["end_date"])
+    return min(boundaries, default=None)
+
 @app.route("/ballots", methods=["GET"])
+@cached_response("ballots", expires=_active_ballots_expiry)
 def list_ballots() -> Tuple[List[Dict[str, Any]], int]:
     """
     List all active ballots available for voting.
@@ -676,6 +811,7 @@ def submit_ballot_vote(ballot_id: int) -> Tuple[Dict[str, Any], int]:
         }
 
         VOTES[vote_id] = new_vote
+        bump_data_version("votes")
 
         # Get option title for response
         option_title = next((opt["title"] for opt in ballot["options"] if opt["id"] == option_id), "Unknown option")
@@ -698,6 +834,7 @@ def submit_ballot_vote(ballot_id: int) -> Tuple[Dict[str, Any], int]:
 
 
 @app.route("/ballots/<int:ballot_id>/results", methods=["GET"])
+@cached_response("ballots", "votes")
 def get_ballot_results(ballot_id: int) -> Tuple[Dict[str, Any], int]:
     """
     Get voting results for a specific ballot.
@@ -760,6 +897,7 @@ def get_ballot_results(ballot_id: int) -> Tuple[Dict[str, Any], int]:
 
 @app.route("/proposals", methods=["GET"])
 @token_required
+@cached_response("proposals", "votes")
 def get_proposals() -> Tuple[Dict[str, Any], int]:
     """
     Get all proposals.
@@ -1207,6 +1345,12 @@ def root():
             "member_registration": "/members",
             "books": "/books",
             "book_detail": "/books/{id}",
+            "import_books": "/books/import",
+            "export_books": "/books/export",
+            "import_authors": "/authors/import",
+            "export_authors": "/authors/export",
+            "import_members": "/members/import",
+            "export_members": "/members/export",
             "borrow_book": "/loans/borrow",
             "return_book": "/loans/return",
             "loan_details": "/loans/{id}",
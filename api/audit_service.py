@@ -194,6 +194,29 @@ class AuditService:
             status=status
         )
 
+    @staticmethod
+    def log_bulk_action(action: str, resource_type: str, resource_ids: List[int], failed: int = 0, details: str = "") -> int:
+        """
+        Log one entry for a batch of records written together (bulk import).
+
+        Args:
+            action: Type of action, e.g. IMPORT
+            resource_type: Type of resource affected (book, member, author)
+            resource_ids: IDs of the records written by the batch
+            failed: Number of rows in the batch that were rejected
+            details: Additional context
+
+        Returns:
+            Audit log ID
+        """
+        return AuditService.log_action(
+            action=action,
+            resource_type=resource_type,
+            new_value={"count": len(resource_ids), "ids": list(resource_ids), "failed": failed},
+            status="success" if resource_ids else "failed",
+            details=details
+        )
+
     @staticmethod
     def get_audit_logs(
         limit: int = 100,
@@ -0,0 +1,393 @@
+"""
+Bulk import and streaming export for books, authors and members.
+
+Imports accept NDJSON (one JSON object per line) or CSV with a header row.
+The request body is parsed incrementally, one line at a time, and rows are
+validated and inserted in batches: each batch is validated with the batch
+validators, reserves its IDs in one step, is written under DATA_LOCK and
+produces a single audit entry. Expensive per-row work such as password
+hashing happens in each resource's ``prepare`` step, before the lock is
+taken. Rejected rows, including malformed CSV rows, are reported with their
+line number and do not stop the import.
+
+Exports stream one record per line in the same formats, so the store is never
+serialized into a single response body.
+"""
+
+import csv
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from werkzeug.security import generate_password_hash
+
+from api.audit_service import AuditService
+from api.data_store import (
+    AUTHORS, BOOKS, DATA_LOCK, MEMBERS, bump_data_version,
+    reserve_author_ids, reserve_book_ids, reserve_member_ids
+)
+from api.validators import validate_authors, validate_books, validate_members
+
+DEFAULT_BATCH_SIZE = 500
+MAX_BATCH_SIZE = 5000
+
+FORMAT_MIMETYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+_MIMETYPE_FORMATS = {
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "text/csv": "csv",
+}
+
+# (line_number, record, error) - exactly one of record / error is set
+ParsedRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+class BulkFormatError(ValueError):
+    """Raised when a bulk payload format is missing or unsupported."""
+
+
+class BulkResource(NamedTuple):
+    """How one record type is validated, stored and exported in bulk."""
+    name: str
+    store: Dict[int, Dict[str, Any]]
+    collection: Optional[str]  # DATA_VERSIONS key bumped on import, if responses are cached
+    reserve_ids: Callable[[int], range]
+    validate_batch: Callable[[List[Dict[str, Any]]], List[Tuple[int, Optional[str]]]]
+    prepare: Callable[[Dict[str, Any]], Optional[str]]
+    build: Callable[[int, Dict[str, Any]], Dict[str, Any]]
+    export_fields: Tuple[str, ...]
+
+
+def resolve_format(mimetype: Optional[str], requested: Optional[str] = None) -> str:
+    """
+    Pick the payload format from an explicit ``format`` value or the mimetype.
+
+    Args:
+        mimetype: Request or Accept mimetype, without parameters
+        requested: Explicit format name ("ndjson" or "csv"), takes precedence
+
+    Returns:
+        "ndjson" or "csv"
+
+    Raises:
+        BulkFormatError: If the format cannot be determined or is unsupported
+    """
+    if requested:
+        fmt = requested.strip().lower()
+        if fmt not in FORMAT_MIMETYPES:
+            raise BulkFormatError(f"Unsupported format: {requested}. Use one of: ndjson, csv")
+        return fmt
+    fmt = _MIMETYPE_FORMATS.get((mimetype or "").lower())
+    if fmt is None:
+        raise BulkFormatError("Content-Type must be application/x-ndjson or text/csv")
+    return fmt
+
+
+def iter_text_lines(stream: Iterable[bytes]) -> Iterator[str]:
+    """
+    Decode a byte stream line by line, dropping a leading UTF-8 byte order mark.
+
+    Args:
+        stream: Iterable of raw lines, e.g. ``request.stream``
+
+    Yields:
+        Decoded lines with their line endings preserved
+    """
+    first = True
+    for raw in stream:
+        line = raw.decode("utf-8", errors="replace")
+        if first:
+            line = line.lstrip("\ufeff")
+            first = False
+        yield line
+
+
+def iter_ndjson(lines: Iterable[str]) -> Iterator[ParsedRow]:
+    """
+    Parse NDJSON lines, skipping blank lines.
+
+    Args:
+        lines: Decoded text lines
+
+    Yields:
+        (line_number, record, error) for each non-blank line
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_number, None, "Invalid JSON"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Each line must be a JSON object"
+            continue
+        yield line_number, record, None
+
+
+def iter_csv(lines: Iterable[str]) -> Iterator[ParsedRow]:
+    """
+    Parse CSV lines with a header row.
+
+    Empty cells are dropped so optional fields fall back to their defaults,
+    and cells beyond the header are ignored.
+
+    A row the csv module cannot parse is reported as an error and parsing
+    resumes on the next line. A malformed header row ends the import, since
+    no later row can be mapped to fields.
+
+    Args:
+        lines: Decoded text lines
+
+    Yields:
+        (line_number, record, error) for each data row; line_number is the
+        line on which the row ends
+    """
+    consumed = 0
+
+    def counted_lines():
+        nonlocal consumed
+        for line in lines:
+            consumed += 1
+            yield line
+
+    reader = csv.DictReader(counted_lines())
+    try:
+        reader.fieldnames
+    except csv.Error as e:
+        yield consumed, None, f"Malformed CSV header: {e}"
+        return
+
+    last_error_line = None
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            if consumed == last_error_line:
+                return  # The reader made no progress past the bad row
+            last_error_line = consumed
+            yield consumed, None, f"Malformed CSV: {e}"
+            continue
+        record = {key: value for key, value in row.items() if key is not None and value not in ("", None)}
+        if record:
+            yield reader.line_num, record, None
+
+
+def _batched(rows: Iterable[ParsedRow], size: int) -> Iterator[List[ParsedRow]]:
+    """Group parsed rows into lists of at most ``size`` rows."""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def import_records(resource: BulkResource, lines: Iterable[str], fmt: str,
+                   batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, Any]:
+    """
+    Validate and insert records from an NDJSON or CSV line stream.
+
+    Incoming ``id`` values are ignored; every stored record gets a new ID.
+
+    Args:
+        resource: Record type to import
+        lines: Decoded text lines of the payload
+        fmt: "ndjson" or "csv"
+        batch_size: Rows validated, inserted and audited together
+
+    Returns:
+        {"imported": int, "failed": int, "ids": [int], "errors": [{"row": int, "error": str}]}
+    """
+    parse = iter_csv if fmt == "csv" else iter_ndjson
+    imported_ids = []
+    errors = []
+
+    for batch in _batched(parse(lines), batch_size):
+        rows = []
+        batch_errors = []
+        for line_number, record, error in batch:
+            if error is not None:
+                batch_errors.append({"row": line_number, "error": error})
+                continue
+            record.pop("id", None)
+            error = resource.prepare(record)
+            if error is not None:
+                batch_errors.append({"row": line_number, "error": error})
+                continue
+            rows.append((line_number, record))
+
+        # Validate and write under one lock so checks such as unique emails
+        # cannot race with another writer between validation and insert
+        ids = range(0)
+        with DATA_LOCK:
+            rejected = dict(resource.validate_batch([record for _, record in rows]))
+            accepted = [record for index, (_, record) in enumerate(rows) if index not in rejected]
+            if accepted:
+                ids = resource.reserve_ids(len(accepted))
+                for record_id, record in zip(ids, accepted):
+                    resource.store[record_id] = resource.build(record_id, record)
+                if resource.collection is not None:
+                    bump_data_version(resource.collection)
+
+        for index, error in rejected.items():
+            batch_errors.append({"row": rows[index][0], "error": error})
+        batch_errors.sort(key=lambda entry: entry["row"])
+
+        AuditService.log_bulk_action("IMPORT", resource.name, list(ids), failed=len(batch_errors))
+        imported_ids.extend(ids)
+        errors.extend(batch_errors)
+
+    return {
+        "imported": len(imported_ids),
+        "failed": len(errors),
+        "ids": imported_ids,
+        "errors": errors,
+    }
+
+
+class _Echo:
+    """File-like object whose write() hands the formatted line back."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def export_records(resource: BulkResource, fmt: str) -> Iterator[str]:
+    """
+    Stream stored records as NDJSON or CSV, ordered by ID.
+
+    Only the ID list is snapshotted; each record is read as it is emitted, so
+    records deleted mid-export are skipped.
+
+    Args:
+        resource: Record type to export
+        fmt: "ndjson" or "csv"
+
+    Yields:
+        One formatted line per record (plus a header line for CSV)
+    """
+    fields = resource.export_fields
+    with DATA_LOCK:
+        record_ids = sorted(resource.store)
+
+    writer = csv.writer(_Echo()) if fmt == "csv" else None
+    if writer is not None:
+        yield writer.writerow(fields)
+
+    for record_id in record_ids:
+        record = resource.store.get(record_id)
+        if record is None:
+            continue
+        if writer is not None:
+            yield writer.writerow([record.get(field, "") for field in fields])
+        else:
+            yield json.dumps({field: record.get(field) for field in fields}) + "\n"
+
+
+def _text_fields(*fields: str, defaults: Optional[Dict[str, Any]] = None) -> Callable[[Dict[str, Any]], Optional[str]]:
+    """
+    Build a row preparer that applies defaults and rejects non-string text fields.
+
+    The single-record validators assume JSON bodies shaped by a form; bulk rows
+    come from arbitrary files, so type errors are reported per row instead.
+    """
+    messages = tuple((field, f"{field} must be a string") for field in fields)
+    defaults = dict(defaults or {})
+
+    def prepare(data):
+        for field, value in defaults.items():
+            data.setdefault(field, value)
+        for field, message in messages:
+            if field in data and not isinstance(data[field], str):
+                return message
+        return None
+
+    return prepare
+
+
+def _build_book(book_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": book_id,
+        "title": data["title"].strip(),
+        "author_id": int(data["author_id"]),
+        "isbn": data["isbn"].strip(),
+        "available_copies": int(data["available_copies"]),
+        "total_copies": int(data["total_copies"])
+    }
+
+
+def _build_author(author_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": author_id,
+        "name": str(data["name"]).strip(),
+        "bio": str(data.get("bio", "")).strip()
+    }
+
+
+_check_member_text = _text_fields("name", "email", "password")
+
+
+def _prepare_member(data: Dict[str, Any]) -> Optional[str]:
+    """Check member text fields and hash the password before DATA_LOCK is taken."""
+    error = _check_member_text(data)
+    data.pop("password_hash", None)
+    if error is None and "password" in data:
+        data["password_hash"] = generate_password_hash(data["password"])
+    return error
+
+
+def _build_member(member_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": member_id,
+        "name": data["name"].strip(),
+        "email": data["email"].strip().lower(),
+        "password_hash": data["password_hash"],
+        "registration_date": datetime.now().strftime("%Y-%m-%d"),
+        "role": "user",
+        "status": "active"
+    }
+
+
+BOOK_RESOURCE = BulkResource(
+    name="book",
+    store=BOOKS,
+    collection="books",
+    reserve_ids=reserve_book_ids,
+    validate_batch=validate_books,
+    prepare=_text_fields("title", "isbn", defaults={"available_copies": 1, "total_copies": 1}),
+    build=_build_book,
+    export_fields=("id", "title", "author_id", "isbn", "available_copies", "total_copies"),
+)
+
+AUTHOR_RESOURCE = BulkResource(
+    name="author",
+    store=AUTHORS,
+    collection="authors",
+    reserve_ids=reserve_author_ids,
+    validate_batch=validate_authors,
+    prepare=_text_fields("name", "bio"),
+    build=_build_author,
+    export_fields=("id", "name", "bio"),
+)
+
+# Password hashes are never exported
+MEMBER_RESOURCE = BulkResource(
+    name="member",
+    store=MEMBERS,
+    collection=None,
+    reserve_ids=reserve_member_ids,
+    validate_batch=validate_members,
+    prepare=_prepare_member,
+    build=_build_member,
+    export_fields=("id", "name", "email", "registration_date", "role", "status"),
+)
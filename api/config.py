@@ -13,6 +13,14 @@ class Settings:
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15"))
     REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
 
+    # User Storage Configuration (unset keeps users in memory)
+    USER_DB_PATH: Optional[str] = os.getenv("USER_DB_PATH")
+    USER_DB_POOL_SIZE: int = int(os.getenv("USER_DB_POOL_SIZE", "5"))
+
+    # Refresh Token Denylist Configuration
+    REFRESH_TOKEN_DENYLIST_CAPACITY: int = int(os.getenv("REFRESH_TOKEN_DENYLIST_CAPACITY", "1000000"))
+    REFRESH_TOKEN_DENYLIST_FP_RATE: float = float(os.getenv("REFRESH_TOKEN_DENYLIST_FP_RATE", "0.001"))
+
     # Password Hashing Configuration
     BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
 
@@ -16,6 +16,7 @@ LOAN_ID_COUNTER = 1
 BALLOT_ID_COUNTER = 2
 PROPOSAL_ID_COUNTER = 2
 VOTE_ID_COUNTER = 3
+AUDIT_LOG_ID_COUNTER = 0
 
 # Thread-safety locks for concurrent access
 DATA_LOCK = threading.RLock()
@@ -219,24 +220,67 @@ VOTES = {
     }
 }
 
+# Audit trail written by api.audit_service
+AUDIT_LOGS = {}
+
+# Per-collection version counters for collections served through
+# api.response_cache. Every mutation bumps the counter, so a cached response
+# stamped with an older version is never served again.
+DATA_VERSIONS = {"books": 0, "authors": 0, "ballots": 0, "proposals": 0, "votes": 0}
+
+def bump_data_version(*collections):
+    """Mark collections as modified, invalidating cached responses built from them (thread-safe)"""
+    with DATA_LOCK:
+        for name in collections:
+            DATA_VERSIONS[name] += 1
+
+def get_data_versions(*collections):
+    """Get the current version stamp for the given collections"""
+    with DATA_LOCK:
+        return tuple(DATA_VERSIONS[name] for name in collections)
+
 def get_next_book_id():
     """Generate next auto-increment ID for books"""
     global BOOK_ID_COUNTER
     BOOK_ID_COUNTER += 1
     return BOOK_ID_COUNTER
 
+def reserve_book_ids(count):
+    """Reserve a contiguous block of book IDs (thread-safe)"""
+    global BOOK_ID_COUNTER
+    with DATA_LOCK:
+        start = BOOK_ID_COUNTER + 1
+        BOOK_ID_COUNTER += count
+        return range(start, BOOK_ID_COUNTER + 1)
+
 def get_next_author_id():
     """Generate next auto-increment ID for authors"""
     global AUTHOR_ID_COUNTER
     AUTHOR_ID_COUNTER += 1
     return AUTHOR_ID_COUNTER
 
+def reserve_author_ids(count):
+    """Reserve a contiguous block of author IDs (thread-safe)"""
+    global AUTHOR_ID_COUNTER
+    with DATA_LOCK:
+        start = AUTHOR_ID_COUNTER + 1
+        AUTHOR_ID_COUNTER += count
+        return range(start, AUTHOR_ID_COUNTER + 1)
+
 def get_next_member_id():
     """Generate next auto-increment ID for members"""
     global MEMBER_ID_COUNTER
     MEMBER_ID_COUNTER += 1
     return MEMBER_ID_COUNTER
 
+def reserve_member_ids(count):
+    """Reserve a contiguous block of member IDs (thread-safe)"""
+    global MEMBER_ID_COUNTER
+    with DATA_LOCK:
+        start = MEMBER_ID_COUNTER + 1
+        MEMBER_ID_COUNTER += count
+        return range(start, MEMBER_ID_COUNTER + 1)
+
 def get_next_loan_id():
     """Generate next auto-increment ID for loans"""
     global LOAN_ID_COUNTER
@@ -263,6 +307,13 @@ def get_next_vote_id():
         VOTE_ID_COUNTER += 1
         return VOTE_ID_COUNTER
 
+def get_next_audit_log_id():
+    """Generate next auto-increment ID for audit log entries (thread-safe)"""
+    with DATA_LOCK:
+        global AUDIT_LOG_ID_COUNTER
+        AUDIT_LOG_ID_COUNTER += 1
+        return AUDIT_LOG_ID_COUNTER
+
 # Thread-safe voting data access functions
 def create_proposal(proposal_data):
     """Create a new proposal (thread-safe)"""
@@ -270,6 +321,7 @@ def create_proposal(proposal_data):
         proposal_id = get_next_proposal_id()
         proposal_data["id"] = proposal_id
         PROPOSALS[proposal_id] = proposal_data.copy()
+        bump_data_version("proposals")
         return proposal_id
 
 def update_proposal(proposal_id, update_data):
@@ -277,6 +329,7 @@ def update_proposal(proposal_id, update_data):
     with PROPOSAL_LOCK:
         if proposal_id in PROPOSALS:
             PROPOSALS[proposal_id].update(update_data)
+            bump_data_version("proposals")
             return True
         return False
 
@@ -296,6 +349,7 @@ def create_vote(vote_data):
         vote_id = get_next_vote_id()
         vote_data["id"] = vote_id
         VOTES[vote_id] = vote_data.copy()
+        bump_data_version("votes")
         return vote_id
 
 def get_vote_by_member_and_proposal(member_id, proposal_id):
@@ -316,6 +370,7 @@ def update_vote(vote_id, update_data):
     with VOTE_LOCK:
         if vote_id in VOTES:
             VOTES[vote_id].update(update_data)
+            bump_data_version("votes")
             return True
         return False
 
@@ -324,13 +379,14 @@ def delete_vote(vote_id):
     with VOTE_LOCK:
         if vote_id in VOTES:
             del VOTES[vote_id]
+            bump_data_version("votes")
             return True
         return False
 
 def reset_data_store():
     """Reset data store to initial state (useful for testing)"""
     global BOOK_ID_COUNTER, AUTHOR_ID_COUNTER, MEMBER_ID_COUNTER, LOAN_ID_COUNTER, BALLOT_ID_COUNTER
-    global PROPOSAL_ID_COUNTER, VOTE_ID_COUNTER
+    global PROPOSAL_ID_COUNTER, VOTE_ID_COUNTER, AUDIT_LOG_ID_COUNTER
     global BOOKS, AUTHORS, MEMBERS, LOANS, BALLOTS, PROPOSALS, VOTES
 
     BOOK_ID_COUNTER = 5
@@ -340,6 +396,7 @@ def reset_data_store():
     BALLOT_ID_COUNTER = 2
     PROPOSAL_ID_COUNTER = 2
     VOTE_ID_COUNTER = 4
+    AUDIT_LOG_ID_COUNTER = 0
 
     # Reset to original sample data
     BOOKS.clear()
@@ -458,3 +515,8 @@ def reset_data_store():
             "is_anonymous": False
         }
     })
+
+    AUDIT_LOGS.clear()
+
+    # Bump rather than zero the versions so responses cached before the reset stay stale
+    bump_data_version(*DATA_VERSIONS)
@@ -86,6 +86,7 @@ async def root():
             "register": "/auth/register",
             "login": "/auth/login",
             "refresh": "/auth/refresh",
+            "logout": "/auth/logout",
             "protected": "/protected/",
             "voting": "/voting/"
         }
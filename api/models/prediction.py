@@ -19,8 +19,8 @@ class Prediction(Base):
     driver_id = Column(Integer, ForeignKey("drivers.driver_id"), nullable=False)
     predicted_win_probability = Column(
         Numeric(5, 2),
-        nullable=False,
-        CheckConstraint("predicted_win_probability >= 0 AND predicted_win_probability <= 100")
+        CheckConstraint("predicted_win_probability >= 0 AND predicted_win_probability <= 100"),
+        nullable=False
     )
     model_version = Column(String(50), nullable=False)
     prediction_timestamp = Column(DateTime, default=datetime.utcnow, index=True)
@@ -22,8 +22,8 @@ class Race(Base):
     race_name = Column(String(100), nullable=False)
     status = Column(
         String(20),
-        default="scheduled",
         CheckConstraint("status IN ('scheduled', 'completed', 'cancelled')"),
+        default="scheduled",
         index=True
     )
     created_at = Column(DateTime, default=datetime.utcnow)
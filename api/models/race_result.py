@@ -24,8 +24,8 @@ class RaceResult(Base):
     fastest_lap_time = Column(Interval)
     status = Column(
         String(20),
-        default="finished",
-        CheckConstraint("status IN ('finished', 'retired', 'dnf', 'disqualified')")
+        CheckConstraint("status IN ('finished', 'retired', 'dnf', 'disqualified')"),
+        default="finished"
     )
     created_at = Column(DateTime, default=datetime.utcnow)
 
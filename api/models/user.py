@@ -23,8 +23,8 @@ class User(Base):
     username = Column(String(100))
     role = Column(
         String(20),
-        default="user",
-        CheckConstraint("role IN ('user', 'admin')")
+        CheckConstraint("role IN ('user', 'admin')"),
+        default="user"
     )
     created_at = Column(DateTime, default=datetime.utcnow)
     last_login = Column(DateTime)
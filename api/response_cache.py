@@ -0,0 +1,177 @@
+"""
+Version-stamped response cache with strong ETags for read-heavy GET endpoints.
+
+A cached view is keyed by endpoint, URL arguments and query parameters, and
+stamped with the versions of the data-store collections it reads (see
+``bump_data_version`` in api.data_store). While the stamp is unchanged a
+request is answered from the cached body; once any of those collections is
+mutated the stamp moves on and the next request rebuilds the response.
+
+Each body carries a strong ETag derived from its bytes, so a client polling
+with ``If-None-Match`` gets a 304 without the body being sent again.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from functools import wraps
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Tuple
+
+from flask import make_response, request
+
+from api.data_store import get_data_versions
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class CachedResponse(NamedTuple):
+    """A serialized 200 response and the data versions it was built from."""
+    stamp: Tuple[int, ...]
+    expires: Optional[str]
+    body: bytes
+    mimetype: str
+    etag: str
+
+
+class ResponseCache:
+    """
+    Bounded LRU map from request key to the latest cached response.
+
+    Only one response is kept per key: a lookup with a newer stamp misses and
+    the rebuilt response replaces the stale one.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of keys kept before evicting the least recently used
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, stamp: Tuple[int, ...], now: str) -> Optional[CachedResponse]:
+        """
+        Look up a response that is still current.
+
+        Args:
+            key: Request key
+            stamp: Current versions of the collections the response depends on
+            now: Current time as an ISO 8601 string, checked against ``expires``
+
+        Returns:
+            Cached response, or None if absent, built from older data, or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.stamp != stamp or (entry.expires is not None and now >= entry.expires):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Hashable, entry: CachedResponse) -> None:
+        """
+        Store a response, evicting the least recently used key if full.
+
+        Args:
+            key: Request key
+            entry: Response to cache
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global cache instance shared by the Flask app
+response_cache = ResponseCache()
+
+
+def _request_key() -> Tuple[Any, ...]:
+    """Build the cache key for the current request."""
+    return (
+        request.endpoint,
+        tuple(sorted((request.view_args or {}).items())),
+        tuple(sorted(request.args.items(multi=True))),
+    )
+
+
+def _not_modified(etag: str) -> Any:
+    response = make_response("", 304)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def cached_response(*collections: str,
+                    expires: Optional[Callable[[str], Optional[str]]] = None) -> Callable:
+    """
+    Decorator caching a GET view's 200 responses until its data changes.
+
+    Must be placed below any authentication decorator so that auth still runs
+    on every request. Responses other than 200 are passed through uncached.
+
+    Args:
+        *collections: Data-store collections the view reads, e.g. "books"
+        expires: Optional function taking the current ISO time and returning the
+            ISO time at which the response becomes stale on its own (for views
+            that filter on the clock), or None if it does not
+
+    Returns:
+        Decorator for a Flask view function
+    """
+    def decorator(view: Callable) -> Callable:
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = _request_key()
+            # Read the stamp before building so a concurrent mutation leaves the entry stale
+            stamp = get_data_versions(*collections)
+            now = datetime.now().isoformat()
+            entry = response_cache.get(key, stamp, now)
+
+            if entry is None:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                body = response.get_data()
+                entry = CachedResponse(
+                    stamp=stamp,
+                    expires=expires(now) if expires is not None else None,
+                    body=body,
+                    mimetype=response.mimetype,
+                    etag=hashlib.blake2b(body, digest_size=16).hexdigest(),
+                )
+                response_cache.put(key, entry)
+
+            if request.if_none_match.contains(entry.etag):
+                return _not_modified(entry.etag)
+
+            response = make_response(entry.body, 200)
+            response.mimetype = entry.mimetype
+            response.set_etag(entry.etag)
+            response.headers["Cache-Control"] = "no-cache"
+            return response
+
+        return wrapper
+
+    return decorator
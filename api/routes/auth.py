@@ -114,24 +114,27 @@ async def login(request: LoginRequest):
 @router.post("/refresh", response_model=TokenResponse)
 async def refresh_token(request: RefreshRequest):
     """
-    Generate a new access token using a valid refresh token.
+    Rotate a refresh token into a new access and refresh token pair.
+
+    The presented refresh token is consumed; reusing it revokes every token
+    issued from the same login.
 
     Args:
         request: RefreshRequest containing refresh_token
 
     Returns:
-        TokenResponse with new access_token (refresh_token unchanged)
+        TokenResponse with new access_token and new refresh_token
 
     Raises:
-        HTTPException: 401 for invalid/expired refresh token, 400 for validation errors
+        HTTPException: 401 for invalid/expired/reused refresh token, 400 for validation errors
     """
     try:
-        # Generate new access token
-        new_access_token = auth_service.refresh_access_token(request.refresh_token)
+        # Consume the refresh token and issue its successor
+        tokens = auth_service.rotate_refresh_token(request.refresh_token)
 
         return TokenResponse(
-            access_token=new_access_token,
-            refresh_token=request.refresh_token,  # Return original refresh token
+            access_token=tokens["access_token"],
+            refresh_token=tokens["refresh_token"],
             token_type="bearer"
         )
 
@@ -152,4 +155,24 @@ async def refresh_token(request: RefreshRequest):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(request: RefreshRequest):
+    """
+    Revoke a refresh token and all tokens rotated from the same login.
+
+    Args:
+        request: RefreshRequest containing refresh_token
+
+    Raises:
+        HTTPException: 401 for invalid/expired refresh token
+    """
+    try:
+        auth_service.revoke_refresh_token(request.refresh_token)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e)
+        )
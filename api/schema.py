@@ -0,0 +1,262 @@
+"""
+Schema compiler for request payload validation.
+
+A payload shape is described once, at import time, as a sequence of checks
+built by the helpers below. ``compile_schema`` binds those checks into a
+single validator function, so per-request work is a walk over a tuple of
+prebuilt closures with no regex compilation, field-list construction or
+branching on the schema itself.
+
+Every check takes the payload dict and returns an error message, or None if
+the payload passes. Checks run in declaration order and the first error wins,
+which keeps error messages identical to the hand-written validators.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Pattern, Tuple
+
+Check = Callable[[Dict[str, Any]], Optional[str]]
+Validator = Callable[[Any], Tuple[bool, Optional[str]]]
+
+
+def compile_schema(*checks: Check) -> Validator:
+    """
+    Compile checks into a validator function.
+
+    Args:
+        *checks: Checks to run, in order
+
+    Returns:
+        Function taking a payload and returning (is_valid, error_message)
+    """
+    bound = tuple(checks)
+
+    def validator(data: Any) -> Tuple[bool, Optional[str]]:
+        if not isinstance(data, dict):
+            return False, "Invalid data format"
+        for check in bound:
+            error = check(data)
+            if error is not None:
+                return False, error
+        return True, None
+
+    return validator
+
+
+def required(*fields: str, allow_falsy: bool = False) -> Check:
+    """
+    Require fields to be present.
+
+    Args:
+        *fields: Field names that must be present
+        allow_falsy: Accept falsy values other than None (e.g. 0, "")
+
+    Returns:
+        Check reporting the first missing field
+    """
+    messages = tuple((field, f"Missing required field: {field}") for field in fields)
+
+    if allow_falsy:
+        def check(data):
+            for field, message in messages:
+                if data.get(field) is None:
+                    return message
+            return None
+    else:
+        def check(data):
+            for field, message in messages:
+                if not data.get(field):
+                    return message
+            return None
+
+    return check
+
+
+def text(field: str, min_length: int, max_length: int, message: str,
+         optional: bool = False, coerce: bool = True) -> Check:
+    """
+    Check the stripped length of a text field.
+
+    Args:
+        field: Field name
+        min_length: Minimum stripped length
+        max_length: Maximum stripped length
+        message: Error message when the length is out of range
+        optional: Skip the check when the field is absent
+        coerce: Convert the value with str() before stripping
+
+    Returns:
+        Length check for the field
+    """
+    def check(data):
+        if optional and field not in data:
+            return None
+        value = data[field]
+        length = len((str(value) if coerce else value).strip())
+        if length < min_length or length > max_length:
+            return message
+        return None
+
+    return check
+
+
+def integer(field: str, message: str, optional: bool = False,
+            minimum: Optional[int] = None, minimum_message: Optional[str] = None,
+            member_of: Optional[Mapping] = None, member_message: Optional[str] = None) -> Check:
+    """
+    Check that a field parses as an integer, optionally bounded or a known ID.
+
+    Args:
+        field: Field name
+        message: Error message when the value is not an integer
+        optional: Skip the check when the field is absent
+        minimum: Smallest accepted value
+        minimum_message: Error message when below ``minimum``
+        member_of: Mapping the parsed value must be a key of (checked live)
+        member_message: Error message when the key is missing
+
+    Returns:
+        Integer check for the field
+    """
+    def check(data):
+        if optional and field not in data:
+            return None
+        try:
+            value = int(data[field])
+        except (ValueError, TypeError):
+            return message
+        if minimum is not None and value < minimum:
+            return minimum_message
+        if member_of is not None and value not in member_of:
+            return member_message
+        return None
+
+    return check
+
+
+def matches(field: str, pattern: Pattern, message: str, optional: bool = False,
+            normalize: Optional[Callable[[Any], str]] = None) -> Check:
+    """
+    Check a field against a precompiled regular expression.
+
+    Args:
+        field: Field name
+        pattern: Compiled pattern matched from the start of the value
+        message: Error message when the value does not match
+        optional: Skip the check when the field is absent
+        normalize: Transform applied to the raw value before matching
+
+    Returns:
+        Pattern check for the field
+    """
+    match = pattern.match
+
+    def check(data):
+        if optional and field not in data:
+            return None
+        value = data[field]
+        if normalize is not None:
+            value = normalize(value)
+        if not match(value):
+            return message
+        return None
+
+    return check
+
+
+def boolean(field: str, message: str) -> Check:
+    """
+    Check that an optional field, when present, is a real boolean.
+
+    Args:
+        field: Field name
+        message: Error message when the value is not a bool
+
+    Returns:
+        Boolean check for the field
+    """
+    def check(data):
+        if field in data and not isinstance(data[field], bool):
+            return message
+        return None
+
+    return check
+
+
+def one_of(field: str, choices: Iterable[Any], message: str) -> Check:
+    """
+    Check that an optional field, when present, is one of a fixed set.
+
+    Args:
+        field: Field name
+        choices: Accepted values
+        message: Error message for other values
+
+    Returns:
+        Choice check for the field
+    """
+    accepted = frozenset(choices)
+
+    def check(data):
+        if field in data:
+            try:
+                if data[field] not in accepted:
+                    return message
+            except TypeError:
+                return message
+        return None
+
+    return check
+
+
+def read_only(*fields: str) -> Check:
+    """
+    Reject payloads that try to set read-only fields.
+
+    Args:
+        *fields: Field names that cannot be updated
+
+    Returns:
+        Check reporting the first read-only field present
+    """
+    messages = tuple((field, f"Field '{field}' cannot be updated") for field in fields)
+
+    def check(data):
+        for field, message in messages:
+            if field in data:
+                return message
+        return None
+
+    return check
+
+
+def custom(func: Check) -> Check:
+    """
+    Use a hand-written check for rules the builders do not cover.
+
+    Args:
+        func: Function taking the payload and returning an error or None
+
+    Returns:
+        The function unchanged, for symmetry with the other builders
+    """
+    return func
+
+
+def validate_many(validator: Callable[[Any], Tuple[bool, Optional[str]]],
+                  records: Iterable[Any]) -> List[Tuple[int, Optional[str]]]:
+    """
+    Run a validator over many records.
+
+    Args:
+        validator: Validator returning (is_valid, error_message)
+        records: Payloads to validate
+
+    Returns:
+        List of (row_index, error_message) for rejected rows only
+    """
+    errors = []
+    for index, record in enumerate(records):
+        is_valid, error = validator(record)
+        if not is_valid:
+            errors.append((index, error))
+    return errors
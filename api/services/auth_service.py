@@ -1,10 +1,12 @@
 """Authentication service for user registration, login, and token management."""
 
+import time
 import uuid
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
 from pydantic import ValidationError
 
-from api.models.user import User
+from api.models.user import UserLegacy as User
+from api.services.token_store import refresh_token_store
 from api.services.user_repository import user_repository
 from api.utils.password import hash_password, verify_password
 from api.utils.jwt_manager import jwt_manager
@@ -17,6 +19,7 @@ class AuthService:
         """Initialize auth service with dependencies."""
         self.user_repo = user_repository
         self.jwt_manager = jwt_manager
+        self.token_store = refresh_token_store
 
     def register_user(self, email: str, password: str, username: str) -> User:
         """
@@ -31,11 +34,13 @@ class AuthService:
             Created User object
 
         Raises:
-            ValueError: If user with email already exists or validation fails
+            ValueError: If user with email or username already exists or validation fails
         """
-        # Check if user already exists
+        # Check if user already exists before paying for the password hash
         if self.user_repo.user_exists(email):
             raise ValueError(f"User with email {email} already exists")
+        if self.user_repo.username_exists(username):
+            raise ValueError(f"User with username {username} already exists")
 
         # Hash the password
         hashed_password = hash_password(password)
@@ -45,7 +50,7 @@ class AuthService:
             email=email,
             hashed_password=hashed_password,
             username=username,
-            id=uuid.uuid4()
+            id=str(uuid.uuid4())
         )
 
         # Add to repository
@@ -79,6 +84,8 @@ class AuthService:
         """
         Generate access and refresh tokens for a user.
 
+        The refresh token starts a new rotation family.
+
         Args:
             email: User's email address
 
@@ -86,13 +93,55 @@ class AuthService:
             Dictionary containing access_token and refresh_token
         """
         access_token = self.jwt_manager.create_access_token(email)
-        refresh_token = self.jwt_manager.create_refresh_token(email)
+        refresh_token = self._issue_refresh_token(email, family_id=uuid.uuid4().hex)
 
         return {
             "access_token": access_token,
             "refresh_token": refresh_token
         }
 
+    def _issue_refresh_token(self, email: str, family_id: str) -> str:
+        """
+        Create a refresh token and register it with the token store.
+
+        Args:
+            email: User's email address
+            family_id: Rotation family the token belongs to
+
+        Returns:
+            JWT refresh token string
+        """
+        jti = uuid.uuid4().hex
+        refresh_token = self.jwt_manager.create_refresh_token(email, jti=jti, family_id=family_id)
+        expires_at = time.time() + self.jwt_manager.refresh_token_expire_days * 86400
+        self.token_store.register(jti, family_id, email, expires_at)
+        return refresh_token
+
+    def _decode_refresh_token(self, refresh_token: str) -> Dict[str, Any]:
+        """
+        Decode a refresh token and check its type and claims.
+
+        Args:
+            refresh_token: Refresh token string
+
+        Returns:
+            Token payload dictionary
+
+        Raises:
+            ValueError: If the token is invalid, expired, wrong type or missing its ID
+        """
+        try:
+            payload = self.jwt_manager.decode_token(refresh_token)
+        except Exception as e:
+            raise ValueError(f"Invalid or expired refresh token: {str(e)}")
+
+        if not self.jwt_manager.verify_token_type(payload, "refresh"):
+            raise ValueError("Invalid or expired refresh token: Invalid token type")
+        if not payload.get("jti"):
+            raise ValueError("Invalid or expired refresh token: Missing token ID")
+
+        return payload
+
     def refresh_access_token(self, refresh_token: str) -> str:
         """
         Generate a new access token using a valid refresh token.
@@ -104,27 +153,75 @@ class AuthService:
             New access token string
 
         Raises:
-            ValueError: If refresh token is invalid, expired, or wrong type
+            ValueError: If refresh token is invalid, expired, revoked, or wrong type
         """
-        try:
-            # Decode the refresh token
-            payload = self.jwt_manager.decode_token(refresh_token)
+        payload = self._decode_refresh_token(refresh_token)
 
-            # Verify it's a refresh token
-            if not self.jwt_manager.verify_token_type(payload, "refresh"):
-                raise ValueError("Invalid token type")
+        if self.token_store.is_revoked(payload["jti"]):
+            raise ValueError("Invalid or expired refresh token: Token has been revoked")
 
-            # Extract email and verify user still exists
-            email = payload.get("email")
-            if not email or not self.user_repo.user_exists(email):
-                raise ValueError("User not found")
+        # Extract email and verify user still exists
+        email = payload.get("email")
+        if not email or not self.user_repo.user_exists(email):
+            raise ValueError("Invalid or expired refresh token: User not found")
 
-            # Generate new access token
-            return self.jwt_manager.create_access_token(email)
+        # Generate new access token
+        return self.jwt_manager.create_access_token(email)
 
-        except Exception as e:
+    def rotate_refresh_token(self, refresh_token: str) -> Dict[str, str]:
+        """
+        Exchange a refresh token for a new access token and refresh token.
+
+        The presented token is consumed. Presenting it again revokes every
+        token in its rotation family.
+
+        Args:
+            refresh_token: Valid refresh token string
+
+        Returns:
+            Dictionary containing access_token and refresh_token
+
+        Raises:
+            ValueError: If refresh token is invalid, expired, reused, or wrong type
+        """
+        payload = self._decode_refresh_token(refresh_token)
+
+        try:
+            record = self.token_store.consume(payload["jti"])
+        except ValueError as e:
             raise ValueError(f"Invalid or expired refresh token: {str(e)}")
 
+        email = record.email
+        if not self.user_repo.user_exists(email):
+            raise ValueError("Invalid or expired refresh token: User not found")
+
+        return {
+            "access_token": self.jwt_manager.create_access_token(email),
+            "refresh_token": self._issue_refresh_token(email, family_id=record.family_id)
+        }
+
+    def revoke_refresh_token(self, refresh_token: str) -> int:
+        """
+        Revoke a refresh token and every token rotated from the same login.
+
+        Args:
+            refresh_token: Refresh token string
+
+        Returns:
+            Number of active tokens revoked
+
+        Raises:
+            ValueError: If refresh token is invalid, expired, or wrong type
+        """
+        payload = self._decode_refresh_token(refresh_token)
+
+        family_id = payload.get("fam")
+        if family_id:
+            return self.token_store.revoke_family(family_id)
+
+        self.token_store.revoke(payload["jti"])
+        return 1
+
 
 # Global auth service instance
 auth_service = AuthService()
\ No newline at end of file
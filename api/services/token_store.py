@@ -0,0 +1,427 @@
+"""Refresh-token store supporting rotation, revocation and reuse detection.
+
+Every refresh token carries a unique ID (``jti``) and a family ID (``fam``)
+shared by all tokens rotated from the same login. Presenting a token
+consumes it; presenting an already-consumed token is treated as theft and
+revokes the whole family.
+
+Two interchangeable implementations are provided:
+
+- ``RefreshTokenStore`` keeps tokens in process memory. Revoked IDs sit in a
+  denylist fronted by a Bloom filter, so the common case (a token that was
+  never revoked) is answered without touching the exact set. Expired entries
+  are purged in expiry order from a min-heap.
+- ``SQLiteRefreshTokenStore`` keeps tokens in the SQLite user database, so
+  outstanding refresh tokens survive restarts and are shared by every
+  worker process.
+
+``create_refresh_token_store`` picks the SQLite backend when ``USER_DB_PATH``
+is configured and falls back to the in-memory store otherwise.
+"""
+
+import heapq
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from api.config import settings
+from api.services.user_repository import SQLiteConnectionPool
+from api.utils.bloom_filter import BloomFilter
+
+
+@dataclass
+class RefreshTokenRecord:
+    """Issued refresh token metadata."""
+    jti: str
+    family_id: str
+    email: str
+    expires_at: float
+
+
+class TokenReuseError(ValueError):
+    """Raised when a consumed or revoked refresh token is presented again."""
+
+
+class RefreshTokenStore:
+    """In-memory refresh-token family store keyed by token ID."""
+
+    def __init__(self, denylist_capacity: Optional[int] = None, false_positive_rate: Optional[float] = None):
+        """
+        Initialize empty token, family and denylist indexes.
+
+        Args:
+            denylist_capacity: Expected number of revoked, unexpired tokens
+            false_positive_rate: Target Bloom filter false positive rate
+        """
+        self._capacity = denylist_capacity or settings.REFRESH_TOKEN_DENYLIST_CAPACITY
+        self._fp_rate = false_positive_rate or settings.REFRESH_TOKEN_DENYLIST_FP_RATE
+
+        # Active tokens by jti
+        self._tokens: Dict[str, RefreshTokenRecord] = {}
+        # Family ID -> jtis (active or revoked) not yet expired
+        self._families: Dict[str, Set[str]] = {}
+        # Denylist: revoked jti -> record, kept until the token would expire
+        self._revoked: Dict[str, RefreshTokenRecord] = {}
+        self._bloom = BloomFilter(self._capacity, self._fp_rate)
+        # Stale bits left in the Bloom filter by purged denylist entries
+        self._bloom_stale = 0
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def register(self, jti: str, family_id: str, email: str, expires_at: float) -> None:
+        """
+        Record a newly issued refresh token.
+
+        Args:
+            jti: Unique token ID
+            family_id: ID shared by all tokens rotated from one login
+            email: Token owner's email address
+            expires_at: Expiry as a UNIX timestamp
+        """
+        with self._lock:
+            self._purge_locked(time.time())
+            self._tokens[jti] = RefreshTokenRecord(jti, family_id, email, expires_at)
+            self._families.setdefault(family_id, set()).add(jti)
+            heapq.heappush(self._expiry_heap, (expires_at, jti))
+
+    def is_revoked(self, jti: str) -> bool:
+        """
+        Check whether a token ID is on the denylist.
+
+        Args:
+            jti: Token ID to check
+
+        Returns:
+            True if the token has been revoked or consumed
+        """
+        if not self._bloom.might_contain(jti):
+            return False
+        return jti in self._revoked
+
+    def consume(self, jti: str) -> RefreshTokenRecord:
+        """
+        Atomically consume an active token so it cannot be used again.
+
+        Args:
+            jti: ID of the presented refresh token
+
+        Returns:
+            The consumed token's record
+
+        Raises:
+            TokenReuseError: If the token was already consumed or revoked;
+                the token's whole family is revoked as a precaution
+            ValueError: If the token is unknown to the store
+        """
+        with self._lock:
+            if self.is_revoked(jti):
+                self._revoke_family_locked(self._revoked[jti].family_id)
+                raise TokenReuseError("Refresh token has already been used or revoked")
+
+            record = self._tokens.get(jti)
+            if record is None:
+                raise ValueError("Unknown refresh token")
+
+            self._revoke_locked(jti)
+            return record
+
+    def revoke(self, jti: str) -> None:
+        """
+        Revoke a single refresh token.
+
+        Args:
+            jti: Token ID to revoke
+        """
+        with self._lock:
+            self._revoke_locked(jti)
+
+    def revoke_family(self, family_id: str) -> int:
+        """
+        Revoke every active token in a family.
+
+        Args:
+            family_id: Family ID to revoke
+
+        Returns:
+            Number of tokens revoked
+        """
+        with self._lock:
+            return self._revoke_family_locked(family_id)
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        """
+        Drop tokens and denylist entries whose expiry has passed.
+
+        Args:
+            now: Current UNIX timestamp (defaults to time.time())
+
+        Returns:
+            Number of token IDs purged
+        """
+        with self._lock:
+            return self._purge_locked(time.time() if now is None else now)
+
+    def active_count(self) -> int:
+        """Get the number of active (unconsumed, unexpired) tokens."""
+        return len(self._tokens)
+
+    def revoked_count(self) -> int:
+        """Get the number of denylisted token IDs awaiting expiry."""
+        return len(self._revoked)
+
+    def clear(self) -> None:
+        """Remove all tokens and revocations (for testing)."""
+        with self._lock:
+            self._tokens.clear()
+            self._families.clear()
+            self._revoked.clear()
+            self._expiry_heap.clear()
+            self._bloom.clear()
+            self._bloom_stale = 0
+
+    def _revoke_locked(self, jti: str) -> None:
+        """Move a token to the denylist. Caller must hold the lock."""
+        if jti in self._revoked:
+            return
+        record = self._tokens.pop(jti, None)
+        if record is None:
+            # Unknown token: denylist it for the longest possible lifetime
+            record = RefreshTokenRecord(jti, "", "", time.time() + self._max_ttl())
+            heapq.heappush(self._expiry_heap, (record.expires_at, jti))
+        self._revoked[jti] = record
+        self._bloom.add(jti)
+
+    def _revoke_family_locked(self, family_id: str) -> int:
+        """Revoke all active tokens in a family. Caller must hold the lock."""
+        revoked = 0
+        for jti in list(self._families.get(family_id, ())):
+            if jti in self._tokens:
+                self._revoke_locked(jti)
+                revoked += 1
+        return revoked
+
+    def _purge_locked(self, now: float) -> int:
+        """Pop expired entries off the heap. Caller must hold the lock."""
+        purged = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, jti = heapq.heappop(heap)
+            record = self._tokens.pop(jti, None)
+            revoked = self._revoked.pop(jti, None)
+            if revoked is not None:
+                self._bloom_stale += 1
+                record = revoked
+            if record is None:
+                continue
+            members = self._families.get(record.family_id)
+            if members is not None:
+                members.discard(jti)
+                if not members:
+                    del self._families[record.family_id]
+            purged += 1
+
+        # Rebuild the Bloom filter once purged entries dominate its bits
+        if self._bloom_stale > max(len(self._revoked), self._capacity // 10):
+            self._rebuild_bloom()
+
+        return purged
+
+    def _rebuild_bloom(self) -> None:
+        """Rebuild the Bloom filter from the live denylist."""
+        capacity = max(self._capacity, len(self._revoked) * 2)
+        self._bloom = BloomFilter(capacity, self._fp_rate)
+        for jti in self._revoked:
+            self._bloom.add(jti)
+        self._bloom_stale = 0
+
+    @staticmethod
+    def _max_ttl() -> float:
+        """Longest lifetime a refresh token can have, in seconds."""
+        return settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
+
+class SQLiteRefreshTokenStore:
+    """SQLite-backed refresh-token store with the same interface as RefreshTokenStore."""
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS refresh_tokens ("
+        " jti TEXT PRIMARY KEY,"
+        " family_id TEXT NOT NULL,"
+        " email TEXT NOT NULL,"
+        " expires_at REAL NOT NULL,"
+        " revoked INTEGER NOT NULL DEFAULT 0"
+        ")",
+        "CREATE INDEX IF NOT EXISTS refresh_tokens_family ON refresh_tokens (family_id)",
+        "CREATE INDEX IF NOT EXISTS refresh_tokens_expiry ON refresh_tokens (expires_at)",
+    )
+    _SELECT = "SELECT jti, family_id, email, expires_at, revoked FROM refresh_tokens WHERE jti = ?"
+    # Denylist a token, keeping its record if it was issued here
+    _REVOKE = (
+        "INSERT INTO refresh_tokens (jti, family_id, email, expires_at, revoked)"
+        " VALUES (?, '', '', ?, 1)"
+        " ON CONFLICT (jti) DO UPDATE SET revoked = 1"
+    )
+
+    def __init__(self, db_path: str, pool_size: int = 5):
+        """
+        Open the database and create the refresh_tokens table if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+            pool_size: Number of pooled connections
+        """
+        self.pool = SQLiteConnectionPool(db_path, pool_size)
+        with self.pool.connection() as conn:
+            for statement in self._SCHEMA:
+                conn.execute(statement)
+
+    def register(self, jti: str, family_id: str, email: str, expires_at: float) -> None:
+        """
+        Record a newly issued refresh token.
+
+        Args:
+            jti: Unique token ID
+            family_id: ID shared by all tokens rotated from one login
+            email: Token owner's email address
+            expires_at: Expiry as a UNIX timestamp
+        """
+        with self.pool.connection() as conn:
+            conn.execute("DELETE FROM refresh_tokens WHERE expires_at <= ?", (time.time(),))
+            conn.execute(
+                "INSERT OR REPLACE INTO refresh_tokens (jti, family_id, email, expires_at, revoked)"
+                " VALUES (?, ?, ?, ?, 0)",
+                (jti, family_id, email, expires_at)
+            )
+
+    def is_revoked(self, jti: str) -> bool:
+        """
+        Check whether a token ID is on the denylist.
+
+        Args:
+            jti: Token ID to check
+
+        Returns:
+            True if the token has been revoked or consumed
+        """
+        with self.pool.connection() as conn:
+            row = conn.execute("SELECT revoked FROM refresh_tokens WHERE jti = ?", (jti,)).fetchone()
+        return row is not None and bool(row[0])
+
+    def consume(self, jti: str) -> RefreshTokenRecord:
+        """
+        Atomically consume an active token so it cannot be used again.
+
+        The conditional UPDATE makes consumption atomic across worker
+        processes sharing the database.
+
+        Args:
+            jti: ID of the presented refresh token
+
+        Returns:
+            The consumed token's record
+
+        Raises:
+            TokenReuseError: If the token was already consumed or revoked;
+                the token's whole family is revoked as a precaution
+            ValueError: If the token is unknown to the store
+        """
+        with self.pool.connection() as conn:
+            consumed = conn.execute(
+                "UPDATE refresh_tokens SET revoked = 1 WHERE jti = ? AND revoked = 0", (jti,)
+            ).rowcount
+            row = conn.execute(self._SELECT, (jti,)).fetchone()
+            if not consumed and row is not None:
+                self._revoke_family(conn, row[1])
+
+        if row is None:
+            raise ValueError("Unknown refresh token")
+        if not consumed:
+            raise TokenReuseError("Refresh token has already been used or revoked")
+        return RefreshTokenRecord(row[0], row[1], row[2], row[3])
+
+    def revoke(self, jti: str) -> None:
+        """
+        Revoke a single refresh token.
+
+        Args:
+            jti: Token ID to revoke
+        """
+        with self.pool.connection() as conn:
+            # Unknown token: denylist it for the longest possible lifetime
+            conn.execute(self._REVOKE, (jti, time.time() + RefreshTokenStore._max_ttl()))
+
+    def revoke_family(self, family_id: str) -> int:
+        """
+        Revoke every active token in a family.
+
+        Args:
+            family_id: Family ID to revoke
+
+        Returns:
+            Number of tokens revoked
+        """
+        with self.pool.connection() as conn:
+            return self._revoke_family(conn, family_id)
+
+    @staticmethod
+    def _revoke_family(conn: sqlite3.Connection, family_id: str) -> int:
+        """Revoke all active tokens in a family within the caller's transaction."""
+        if not family_id:
+            return 0
+        return conn.execute(
+            "UPDATE refresh_tokens SET revoked = 1 WHERE family_id = ? AND revoked = 0", (family_id,)
+        ).rowcount
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        """
+        Drop tokens and denylist entries whose expiry has passed.
+
+        Args:
+            now: Current UNIX timestamp (defaults to time.time())
+
+        Returns:
+            Number of token IDs purged
+        """
+        with self.pool.connection() as conn:
+            return conn.execute(
+                "DELETE FROM refresh_tokens WHERE expires_at <= ?", (time.time() if now is None else now,)
+            ).rowcount
+
+    def active_count(self) -> int:
+        """Get the number of active (unconsumed, unexpired) tokens."""
+        with self.pool.connection() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM refresh_tokens WHERE revoked = 0 AND expires_at > ?", (time.time(),)
+            ).fetchone()[0]
+
+    def revoked_count(self) -> int:
+        """Get the number of denylisted token IDs awaiting expiry."""
+        with self.pool.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM refresh_tokens WHERE revoked = 1").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove all tokens and revocations (for testing)."""
+        with self.pool.connection() as conn:
+            conn.execute("DELETE FROM refresh_tokens")
+
+
+def create_refresh_token_store(db_path: Optional[str] = None):
+    """
+    Create the configured refresh-token store.
+
+    Args:
+        db_path: SQLite database path; defaults to ``settings.USER_DB_PATH``
+
+    Returns:
+        SQLiteRefreshTokenStore if a path is configured, RefreshTokenStore otherwise
+    """
+    db_path = db_path or settings.USER_DB_PATH
+    if db_path:
+        return SQLiteRefreshTokenStore(db_path, pool_size=settings.USER_DB_POOL_SIZE)
+    return RefreshTokenStore()
+
+
+# Global refresh-token store instance
+refresh_token_store = create_refresh_token_store()
@@ -1,16 +1,79 @@
-"""In-memory user repository for storing and retrieving users."""
+"""User repositories for storing and retrieving users.
 
-from typing import Dict, Optional
-from api.models.user import User
+Two interchangeable implementations are provided:
+
+- ``UserRepository`` keeps users in memory with case-folded email and
+  username indexes.
+- ``SQLiteUserRepository`` persists users to a SQLite file through a small
+  connection pool so state survives restarts.
+
+``create_user_repository`` picks the SQLite backend when ``USER_DB_PATH`` is
+configured and falls back to the in-memory repository otherwise.
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from api.config import settings
+from api.models.user import UserLegacy
+
+# Number of users inserted per transaction during bulk import
+DEFAULT_IMPORT_BATCH_SIZE = 500
+
+
+def normalize_email(email: str) -> str:
+    """
+    Normalize an email address for index lookups.
+
+    Args:
+        email: Email address as supplied by the client
+
+    Returns:
+        Whitespace-stripped, case-folded email
+    """
+    return email.strip().casefold()
+
+
+def normalize_username(username: str) -> str:
+    """
+    Normalize a username for index lookups.
+
+    Args:
+        username: Username as supplied by the client
+
+    Returns:
+        Whitespace-stripped, case-folded username
+    """
+    return username.strip().casefold()
+
+
+def _chunked(items: Iterable[UserLegacy], size: int) -> Iterator[List[UserLegacy]]:
+    """Yield successive lists of at most ``size`` users."""
+    batch: List[UserLegacy] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
 
 
 class UserRepository:
-    """In-memory user storage using a dictionary."""
+    """In-memory user storage with case-folded email and username indexes."""
 
-    # Class-level dict to store users across all instances
-    _users: Dict[str, User] = {}
+    def __init__(self):
+        """Initialize empty indexes."""
+        # Primary index: normalized email -> user
+        self._users: Dict[str, UserLegacy] = {}
+        # Secondary index: normalized username -> normalized email
+        self._usernames: Dict[str, str] = {}
+        self._lock = threading.RLock()
 
-    def add_user(self, user: User) -> None:
+    def add_user(self, user: UserLegacy) -> None:
         """
         Add a user to the repository.
 
@@ -18,52 +81,491 @@ class UserRepository:
             user: User object to store
 
         Raises:
-            ValueError: If user with the same email already exists
+            ValueError: If a user with the same email or username already exists
         """
-        if user.email in self._users:
-            raise ValueError(f"User with email {user.email} already exists")
+        email_key = normalize_email(user.email)
+        username_key = normalize_username(user.username)
+
+        with self._lock:
+            if email_key in self._users:
+                raise ValueError(f"User with email {user.email} already exists")
+            if username_key in self._usernames:
+                raise ValueError(f"User with username {user.username} already exists")
 
-        self._users[user.email] = user
+            self._users[email_key] = user
+            self._usernames[username_key] = email_key
 
-    def get_user_by_email(self, email: str) -> Optional[User]:
+    def add_users(self, users: Iterable[UserLegacy],
+                  batch_size: int = DEFAULT_IMPORT_BATCH_SIZE) -> Dict[str, Any]:
+        """
+        Bulk-import users in batches.
+
+        Rows that collide with an existing user (or an earlier row in the same
+        import) are skipped and reported rather than aborting the import.
+
+        Args:
+            users: Iterable of User objects to import
+            batch_size: Number of users applied per batch
+
+        Returns:
+            Dictionary with the ``imported`` count and a list of per-row ``errors``
+        """
+        imported = 0
+        errors: List[Dict[str, Any]] = []
+        offset = 0
+
+        for batch in _chunked(users, batch_size):
+            with self._lock:
+                accepted = _filter_batch(batch, offset, errors,
+                                         self._users.__contains__,
+                                         self._usernames.__contains__)
+                for user in accepted:
+                    email_key = normalize_email(user.email)
+                    self._users[email_key] = user
+                    self._usernames[normalize_username(user.username)] = email_key
+            imported += len(accepted)
+            offset += len(batch)
+
+        return {"imported": imported, "errors": errors}
+
+    def get_user_by_email(self, email: str) -> Optional[UserLegacy]:
         """
         Retrieve a user by email address.
 
         Args:
-            email: User's email address
+            email: User's email address (case-insensitive)
+
+        Returns:
+            User object if found, None otherwise
+        """
+        return self._users.get(normalize_email(email))
+
+    def get_user_by_username(self, username: str) -> Optional[UserLegacy]:
+        """
+        Retrieve a user by username.
+
+        Args:
+            username: User's username (case-insensitive)
 
         Returns:
             User object if found, None otherwise
         """
-        return self._users.get(email)
+        email_key = self._usernames.get(normalize_username(username))
+        if email_key is None:
+            return None
+        return self._users.get(email_key)
 
     def user_exists(self, email: str) -> bool:
         """
         Check if a user exists by email address.
 
         Args:
-            email: User's email address
+            email: User's email address (case-insensitive)
 
         Returns:
             True if user exists, False otherwise
         """
-        return email in self._users
+        return normalize_email(email) in self._users
+
+    def username_exists(self, username: str) -> bool:
+        """
+        Check if a username is already taken.
+
+        Args:
+            username: Username to check (case-insensitive)
+
+        Returns:
+            True if the username is taken, False otherwise
+        """
+        return normalize_username(username) in self._usernames
 
-    def get_all_users(self) -> Dict[str, User]:
+    def count_users(self) -> int:
+        """
+        Get the number of stored users.
+
+        Returns:
+            Total user count
+        """
+        return len(self._users)
+
+    def get_all_users(self) -> Dict[str, UserLegacy]:
         """
         Get all users for debugging/testing purposes.
 
         Returns:
-            Dictionary of all users keyed by email
+            Dictionary of all users keyed by normalized email
         """
-        return self._users.copy()
+        with self._lock:
+            return self._users.copy()
 
     def clear_all_users(self) -> None:
         """
         Clear all users from repository (for testing).
         """
-        self._users.clear()
+        with self._lock:
+            self._users.clear()
+            self._usernames.clear()
+
+
+def _filter_batch(batch: List[UserLegacy], offset: int, errors: List[Dict[str, Any]],
+                  email_taken, username_taken, id_taken=None) -> List[UserLegacy]:
+    """
+    Drop users from a bulk-import batch that would violate uniqueness.
+
+    Args:
+        batch: Users in this batch
+        offset: Row index of the first user in the batch
+        errors: List that rejected rows are appended to
+        email_taken: Callable returning True if a normalized email is stored
+        username_taken: Callable returning True if a normalized username is stored
+        id_taken: Optional callable returning True if a user ID is stored;
+            when given, IDs must also be unique
+
+    Returns:
+        Users from the batch that can be inserted
+    """
+    accepted: List[UserLegacy] = []
+    seen_emails = set()
+    seen_usernames = set()
+    seen_ids = set()
+
+    for index, user in enumerate(batch, start=offset):
+        email_key = normalize_email(user.email)
+        username_key = normalize_username(user.username)
+        user_id = str(user.id)
+
+        if id_taken is not None and (user_id in seen_ids or id_taken(user_id)):
+            errors.append({"row": index, "email": user.email,
+                           "error": f"User with id {user_id} already exists"})
+            continue
+        if email_key in seen_emails or email_taken(email_key):
+            errors.append({"row": index, "email": user.email,
+                           "error": f"User with email {user.email} already exists"})
+            continue
+        if username_key in seen_usernames or username_taken(username_key):
+            errors.append({"row": index, "email": user.email,
+                           "error": f"User with username {user.username} already exists"})
+            continue
+
+        seen_emails.add(email_key)
+        seen_usernames.add(username_key)
+        seen_ids.add(user_id)
+        accepted.append(user)
+
+    return accepted
+
+
+class SQLiteConnectionPool:
+    """Fixed-size pool of SQLite connections shared between threads."""
+
+    def __init__(self, db_path: str, pool_size: int = 5):
+        """
+        Open the pooled connections.
+
+        Args:
+            db_path: Path to the SQLite database file
+            pool_size: Number of connections to keep open
+        """
+        # Every connection to ":memory:" is a separate database, so share one
+        if db_path == ":memory:":
+            pool_size = 1
+
+        self.db_path = db_path
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=pool_size)
+
+        for _ in range(pool_size):
+            conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=64)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._pool.put(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a connection for the duration of a transaction.
+
+        Commits on success and rolls back if the block raises.
+        """
+        conn = self._pool.get()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._pool.put(conn)
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+
+class SQLiteUserRepository:
+    """SQLite-backed user storage with the same interface as UserRepository."""
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS users ("
+        " id TEXT PRIMARY KEY,"
+        " email TEXT NOT NULL,"
+        " email_key TEXT NOT NULL UNIQUE,"
+        " username TEXT NOT NULL,"
+        " username_key TEXT NOT NULL UNIQUE,"
+        " hashed_password TEXT NOT NULL"
+        ")"
+    )
+    _INSERT = (
+        "INSERT INTO users (id, email, email_key, username, username_key, hashed_password)"
+        " VALUES (?, ?, ?, ?, ?, ?)"
+    )
+    _SELECT = "SELECT email, hashed_password, username, id FROM users"
+
+    def __init__(self, db_path: str, pool_size: int = 5):
+        """
+        Open the database and create the users table if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+            pool_size: Number of pooled connections
+        """
+        self.pool = SQLiteConnectionPool(db_path, pool_size)
+        with self.pool.connection() as conn:
+            conn.execute(self._SCHEMA)
+
+    @staticmethod
+    def _row_params(user: UserLegacy) -> tuple:
+        """Build the INSERT parameters for a user."""
+        return (
+            str(user.id),
+            user.email,
+            normalize_email(user.email),
+            user.username,
+            normalize_username(user.username),
+            user.hashed_password,
+        )
+
+    def _fetch_one(self, where: str, value: str) -> Optional[UserLegacy]:
+        """Run a single-row lookup and rehydrate the result."""
+        with self.pool.connection() as conn:
+            row = conn.execute(f"{self._SELECT} WHERE {where} = ?", (value,)).fetchone()
+        if row is None:
+            return None
+        return UserLegacy(email=row[0], hashed_password=row[1], username=row[2], id=row[3])
+
+    def _exists(self, where: str, value: str) -> bool:
+        """Check whether any row matches the given key."""
+        with self.pool.connection() as conn:
+            row = conn.execute(f"SELECT 1 FROM users WHERE {where} = ?", (value,)).fetchone()
+        return row is not None
+
+    def add_user(self, user: UserLegacy) -> None:
+        """
+        Add a user to the repository.
+
+        Args:
+            user: User object to store
+
+        Raises:
+            ValueError: If a user with the same email or username already exists
+        """
+        try:
+            with self.pool.connection() as conn:
+                conn.execute(self._INSERT, self._row_params(user))
+        except sqlite3.IntegrityError as e:
+            raise ValueError(self._conflict_message(user, e))
+
+    @staticmethod
+    def _conflict_message(user: UserLegacy, error: sqlite3.IntegrityError) -> str:
+        """Describe which unique column an INSERT collided on."""
+        message = str(error)
+        if "username_key" in message:
+            return f"User with username {user.username} already exists"
+        if "users.id" in message:
+            return f"User with id {user.id} already exists"
+        return f"User with email {user.email} already exists"
+
+    def add_users(self, users: Iterable[UserLegacy],
+                  batch_size: int = DEFAULT_IMPORT_BATCH_SIZE) -> Dict[str, Any]:
+        """
+        Bulk-import users, one transaction per batch.
+
+        If another writer inserts a conflicting row between the key check and
+        the insert, the batch is rolled back and retried one row at a time so
+        the conflict is reported against its row.
+
+        Args:
+            users: Iterable of User objects to import
+            batch_size: Number of users inserted per transaction
+
+        Returns:
+            Dictionary with the ``imported`` count and a list of per-row ``errors``
+        """
+        imported = 0
+        errors: List[Dict[str, Any]] = []
+        offset = 0
+
+        for batch in _chunked(users, batch_size):
+            email_keys = [normalize_email(u.email) for u in batch]
+            username_keys = [normalize_username(u.username) for u in batch]
+            ids = [str(u.id) for u in batch]
+            batch_errors = len(errors)
+
+            try:
+                with self.pool.connection() as conn:
+                    taken_emails = self._existing_keys(conn, "email_key", email_keys)
+                    taken_usernames = self._existing_keys(conn, "username_key", username_keys)
+                    taken_ids = self._existing_keys(conn, "id", ids)
+                    accepted = _filter_batch(batch, offset, errors,
+                                             taken_emails.__contains__,
+                                             taken_usernames.__contains__,
+                                             taken_ids.__contains__)
+                    conn.executemany(self._INSERT, [self._row_params(u) for u in accepted])
+                imported += len(accepted)
+            except sqlite3.IntegrityError:
+                imported += self._insert_each(batch, offset, accepted, errors)
+                errors[batch_errors:] = sorted(errors[batch_errors:], key=lambda e: e["row"])
+
+            offset += len(batch)
+
+        return {"imported": imported, "errors": errors}
+
+    def _insert_each(self, batch: List[UserLegacy], offset: int, accepted: List[UserLegacy],
+                     errors: List[Dict[str, Any]]) -> int:
+        """
+        Insert the accepted users of a batch one transaction at a time.
+
+        Args:
+            batch: Users in this batch
+            offset: Row index of the first user in the batch
+            accepted: Users from the batch that passed the key check
+            errors: List that conflicting rows are appended to
+
+        Returns:
+            Number of users inserted
+        """
+        pending = {id(user) for user in accepted}
+        inserted = 0
+        for index, user in enumerate(batch, start=offset):
+            if id(user) not in pending:
+                continue
+            try:
+                with self.pool.connection() as conn:
+                    conn.execute(self._INSERT, self._row_params(user))
+                inserted += 1
+            except sqlite3.IntegrityError as e:
+                errors.append({"row": index, "email": user.email,
+                               "error": self._conflict_message(user, e)})
+        return inserted
+
+    @staticmethod
+    def _existing_keys(conn: sqlite3.Connection, column: str, keys: List[str]) -> set:
+        """Return which of ``keys`` are already stored in ``column``."""
+        found = set()
+        # Stay under SQLite's default bound-parameter limit
+        for start in range(0, len(keys), 900):
+            chunk = keys[start:start + 900]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT {column} FROM users WHERE {column} IN ({placeholders})", chunk
+            )
+            found.update(row[0] for row in rows)
+        return found
+
+    def get_user_by_email(self, email: str) -> Optional[UserLegacy]:
+        """
+        Retrieve a user by email address.
+
+        Args:
+            email: User's email address (case-insensitive)
+
+        Returns:
+            User object if found, None otherwise
+        """
+        return self._fetch_one("email_key", normalize_email(email))
+
+    def get_user_by_username(self, username: str) -> Optional[UserLegacy]:
+        """
+        Retrieve a user by username.
+
+        Args:
+            username: User's username (case-insensitive)
+
+        Returns:
+            User object if found, None otherwise
+        """
+        return self._fetch_one("username_key", normalize_username(username))
+
+    def user_exists(self, email: str) -> bool:
+        """
+        Check if a user exists by email address.
+
+        Args:
+            email: User's email address (case-insensitive)
+
+        Returns:
+            True if user exists, False otherwise
+        """
+        return self._exists("email_key", normalize_email(email))
+
+    def username_exists(self, username: str) -> bool:
+        """
+        Check if a username is already taken.
+
+        Args:
+            username: Username to check (case-insensitive)
+
+        Returns:
+            True if the username is taken, False otherwise
+        """
+        return self._exists("username_key", normalize_username(username))
+
+    def count_users(self) -> int:
+        """
+        Get the number of stored users.
+
+        Returns:
+            Total user count
+        """
+        with self.pool.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    def get_all_users(self) -> Dict[str, UserLegacy]:
+        """
+        Get all users for debugging/testing purposes.
+
+        Returns:
+            Dictionary of all users keyed by normalized email
+        """
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT email_key, email, hashed_password, username, id FROM users"
+            ).fetchall()
+        return {
+            row[0]: UserLegacy(email=row[1], hashed_password=row[2], username=row[3], id=row[4])
+            for row in rows
+        }
+
+    def clear_all_users(self) -> None:
+        """
+        Clear all users from repository (for testing).
+        """
+        with self.pool.connection() as conn:
+            conn.execute("DELETE FROM users")
+
+
+def create_user_repository(db_path: Optional[str] = None):
+    """
+    Create the configured user repository.
+
+    Args:
+        db_path: SQLite database path; defaults to ``settings.USER_DB_PATH``
+
+    Returns:
+        SQLiteUserRepository if a path is configured, UserRepository otherwise
+    """
+    db_path = db_path or settings.USER_DB_PATH
+    if db_path:
+        return SQLiteUserRepository(db_path, pool_size=settings.USER_DB_POOL_SIZE)
+    return UserRepository()
 
 
 # Global repository instance
-user_repository = UserRepository()
\ No newline at end of file
+user_repository = create_user_repository()
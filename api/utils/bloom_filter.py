@@ -0,0 +1,79 @@
+"""Compact Bloom filter for fast negative membership checks."""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Probabilistic set with no false negatives.
+
+    ``might_contain`` returning False means the item was definitely never
+    added; True means it probably was and an exact check should follow.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.001):
+        """
+        Size the bit array for the expected number of items.
+
+        Args:
+            capacity: Expected number of items to be added
+            false_positive_rate: Target false positive probability at capacity
+
+        Raises:
+            ValueError: If capacity or false_positive_rate is out of range
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.num_bits = max(8, int(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        """Yield bit positions for an item using double hashing."""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> None:
+        """
+        Add an item to the filter.
+
+        Args:
+            item: String to add
+        """
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def might_contain(self, item: str) -> bool:
+        """
+        Check whether an item may have been added.
+
+        Args:
+            item: String to check
+
+        Returns:
+            False if the item was definitely not added, True otherwise
+        """
+        bits = self._bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __contains__(self, item: str) -> bool:
+        return self.might_contain(item)
+
+    def clear(self) -> None:
+        """Reset the filter to empty."""
+        self._bits = bytearray(len(self._bits))
+        self.count = 0
@@ -38,12 +38,15 @@ class JWTManager:
 
         return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
 
-    def create_refresh_token(self, email: str) -> str:
+    def create_refresh_token(self, email: str, jti: Optional[str] = None,
+                             family_id: Optional[str] = None) -> str:
         """
         Create a refresh token with 7-day expiry.
 
         Args:
             email: User's email address
+            jti: Unique token ID used for rotation and revocation
+            family_id: ID shared by all tokens rotated from the same login
 
         Returns:
             JWT refresh token string
@@ -57,6 +60,10 @@ class JWTManager:
             "exp": expiry,
             "iat": now
         }
+        if jti is not None:
+            payload["jti"] = jti
+        if family_id is not None:
+            payload["fam"] = family_id
 
         return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
 
@@ -7,6 +7,15 @@ import re
 import html
 from typing import Optional
 
+# Patterns compiled once at import time
+CONTROL_CHARS_PATTERN = re.compile(r'[\x01-\x08\x0b\x0c\x0e-\x1f\x7f]')
+POSITION_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9\s\-_]+$')
+UNDERSCORE_RUN_PATTERN = re.compile(r'_+')
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+NAME_PATTERN = re.compile(r"^[a-zA-Z\s\-'.]+$")
+WHITESPACE_RUN_PATTERN = re.compile(r'\s+')
+VERIFICATION_CODE_PATTERN = re.compile(r'^\d{6}$')
+
 
 def sanitize_text_input(text: str, max_length: int = 255, allow_html: bool = False) -> str:
     """
@@ -39,7 +48,7 @@ def sanitize_text_input(text: str, max_length: int = 255, allow_html: bool = Fal
 
     # Remove null bytes and other control characters
     text = text.replace('\x00', '')
-    text = re.sub(r'[\x01-\x08\x0b\x0c\x0e-\x1f\x7f]', '', text)
+    text = CONTROL_CHARS_PATTERN.sub('', text)
 
     return text
 
@@ -68,14 +77,14 @@ def sanitize_position_name(position: str) -> str:
         raise ValueError("Position name cannot be empty")
 
     # Allow only letters, numbers, spaces, hyphens, and underscores
-    if not re.match(r'^[a-zA-Z0-9\s\-_]+$', position):
+    if not POSITION_NAME_PATTERN.match(position):
         raise ValueError("Position name contains invalid characters")
 
     # Convert to lowercase with underscores (standard format)
     normalized = position.lower().replace(' ', '_').replace('-', '_')
 
     # Remove multiple consecutive underscores
-    normalized = re.sub(r'_+', '_', normalized)
+    normalized = UNDERSCORE_RUN_PATTERN.sub('_', normalized)
 
     # Remove leading/trailing underscores
     normalized = normalized.strip('_')
@@ -107,8 +116,7 @@ def sanitize_email(email: str) -> str:
     email = email.lower().strip()
 
     # Basic email format validation
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(email_pattern, email):
+    if not EMAIL_PATTERN.match(email):
         raise ValueError("Invalid email format")
 
     return email
@@ -137,11 +145,11 @@ def sanitize_name(name: str) -> str:
         raise ValueError("Name cannot be empty")
 
     # Allow letters, spaces, hyphens, apostrophes, and periods
-    if not re.match(r"^[a-zA-Z\s\-'.]+$", name):
+    if not NAME_PATTERN.match(name):
         raise ValueError("Name contains invalid characters")
 
     # Remove multiple consecutive spaces
-    name = re.sub(r'\s+', ' ', name)
+    name = WHITESPACE_RUN_PATTERN.sub(' ', name)
 
     return name.strip()
 
@@ -195,7 +203,7 @@ def sanitize_verification_code(code: str) -> str:
     code = code.strip()
 
     # Check format (6 digits)
-    if not re.match(r'^\d{6}$', code):
+    if not VERIFICATION_CODE_PATTERN.match(code):
         raise ValueError("Verification code must be exactly 6 digits")
 
     return code
@@ -223,7 +231,7 @@ def sanitize_json_string(data: str, max_length: int = 1000) -> str:
 
     # Remove null bytes and control characters
     data = data.replace('\x00', '')
-    data = re.sub(r'[\x01-\x08\x0b\x0c\x0e-\x1f\x7f]', '', data)
+    data = CONTROL_CHARS_PATTERN.sub('', data)
 
     return data
 
@@ -1,12 +1,261 @@
 """
 Input validation functions for library API data.
 Validates book, member, and loan data according to business rules.
+
+Payload shapes are compiled once at import time with ``api.schema``; the
+public ``validate_*`` functions run the compiled shape and then any checks
+that depend on arguments other than the payload itself.
 """
 
 import re
 from datetime import datetime
-from typing import Dict, Tuple, Any, Optional
-from api.data_store import BOOKS, AUTHORS, MEMBERS, BALLOTS, PROPOSALS, VOTES
+from typing import Dict, Tuple, Any, Iterable, List, Optional
+from api.data_store import BOOKS, AUTHORS, MEMBERS, LOANS, BALLOTS, PROPOSALS, VOTES, get_proposal
+from api.schema import (
+    Check, compile_schema, required, text, integer, matches, boolean, one_of, read_only, custom,
+    validate_many
+)
+
+# Patterns compiled once at import time
+ISBN_PATTERN = re.compile(r"^(978|979)?[\d]{9}[\dX]$")
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+PROPOSAL_STATUSES = ("active", "closed", "draft")
+
+
+def _normalize_isbn(value: Any) -> str:
+    """Strip whitespace and hyphens from an ISBN."""
+    return str(value).strip().replace("-", "")
+
+
+def _normalize_email(value: Any) -> str:
+    """Strip and lower-case an email address."""
+    return value.strip().lower()
+
+
+def _check_book_copies(data: Dict[str, Any]) -> Optional[str]:
+    """Check total_copies against available_copies on book creation."""
+    if "total_copies" in data:
+        try:
+            total_copies = int(data["total_copies"])
+            if total_copies < 0:
+                return "total_copies must be non-negative"
+            if "available_copies" in data and total_copies < int(data["available_copies"]):
+                return "total_copies cannot be less than available_copies"
+        except (ValueError, TypeError):
+            return "total_copies must be a valid integer"
+    return None
+
+
+def _check_loan_availability(data: Dict[str, Any]) -> Optional[str]:
+    """Check that the requested book has a copy available."""
+    book = BOOKS[int(data["book_id"])]
+    if book.get("available_copies", 0) <= 0:
+        return "Book is not available for loan"
+    return None
+
+
+def _check_closing_date(data: Dict[str, Any]) -> Optional[str]:
+    """Check that closing_date is a future YYYY-MM-DD date."""
+    try:
+        closing_date = str(data["closing_date"])
+        datetime.strptime(closing_date, "%Y-%m-%d")
+
+        # Check closing date is in the future
+        today = datetime.now().strftime("%Y-%m-%d")
+        if closing_date <= today:
+            return "Closing date must be in the future"
+    except ValueError:
+        return "Invalid closing_date format, must be YYYY-MM-DD"
+    return None
+
+
+def _check_proposal_options(data: Dict[str, Any]) -> Optional[str]:
+    """Check that proposal options are at least two short, non-empty strings."""
+    options = data["options"]
+    if not isinstance(options, list) or len(options) < 2:
+        return "Options must be a list with at least 2 choices"
+
+    for option in options:
+        if not isinstance(option, str) or len(option.strip()) < 1:
+            return "Each option must be a non-empty string"
+        if len(option.strip()) > 100:
+            return "Each option must be 100 characters or less"
+    return None
+
+
+def _check_ballot_options(data: Dict[str, Any]) -> Optional[str]:
+    """Check ballot option count, IDs, titles and descriptions."""
+    options = data["options"]
+    if not isinstance(options, list) or len(options) < 2:
+        return "At least 2 options are required"
+
+    if len(options) > 20:
+        return "Maximum 20 options allowed"
+
+    option_ids = set()
+    for i, option in enumerate(options):
+        if not isinstance(option, dict):
+            return f"Option {i + 1} must be a dictionary"
+
+        if "id" not in option or "title" not in option or "description" not in option:
+            return f"Option {i + 1} must have id, title, and description fields"
+
+        try:
+            option_id = int(option["id"])
+            if option_id in option_ids:
+                return f"Duplicate option ID: {option_id}"
+            option_ids.add(option_id)
+        except (ValueError, TypeError):
+            return f"Option {i + 1} ID must be a valid integer"
+
+        option_title = str(option["title"]).strip()
+        if len(option_title) < 1 or len(option_title) > 100:
+            return f"Option {i + 1} title must be between 1 and 100 characters"
+
+        option_desc = str(option["description"]).strip()
+        if len(option_desc) > 500:
+            return f"Option {i + 1} description must be 500 characters or less"
+    return None
+
+
+def _check_ballot_dates(data: Dict[str, Any]) -> Optional[str]:
+    """Check that the ballot window is ordered and not stale."""
+    try:
+        start_date = datetime.fromisoformat(data["start_date"].replace('Z', '+00:00'))
+        end_date = datetime.fromisoformat(data["end_date"].replace('Z', '+00:00'))
+
+        if start_date >= end_date:
+            return "End date must be after start date"
+
+        # Check if start date is too far in the past (more than 1 year)
+        if (datetime.now() - start_date).days > 365:
+            return "Start date cannot be more than 1 year in the past"
+
+    except ValueError:
+        return "Invalid date format. Use ISO format (YYYY-MM-DDTHH:MM:SS)"
+    return None
+
+
+def _check_ballot_max_votes(data: Dict[str, Any]) -> Optional[str]:
+    """Check max_votes_per_member against the number of options."""
+    try:
+        max_votes = int(data["max_votes_per_member"])
+        if max_votes < 1 or max_votes > len(data["options"]):
+            return "max_votes_per_member must be between 1 and the number of options"
+    except (ValueError, TypeError):
+        return "max_votes_per_member must be a valid integer"
+    return None
+
+
+def _check_vote_choice(vote_choice: Any, proposal: Dict[str, Any]) -> Optional[str]:
+    """Check a vote choice against a proposal's options."""
+    vote_choice = str(vote_choice).strip().lower()
+    valid_choices = [option.lower() for option in proposal.get("options", [])]
+
+    # Add abstain option if allowed
+    if proposal.get("allow_abstain", False):
+        valid_choices.append("abstain")
+
+    if vote_choice not in valid_choices:
+        return (f"Invalid vote_choice. Valid options: {', '.join(proposal.get('options', []))}" +
+                (" (or 'abstain')" if proposal.get("allow_abstain", False) else ""))
+    return None
+
+
+def _optional_copies(field: str) -> Check:
+    """Build the non-negative integer check shared by copy-count fields."""
+    return integer(field, f"{field} must be a valid integer", optional=True,
+                   minimum=0, minimum_message=f"{field} must be non-negative")
+
+
+_BOOK_SCHEMA = compile_schema(
+    required("title", "author_id", "isbn"),
+    text("title", 1, 200, "Title must be between 1 and 200 characters", coerce=False),
+    integer("author_id", "author_id must be a valid integer",
+            member_of=AUTHORS, member_message="Invalid author_id: author does not exist"),
+    matches("isbn", ISBN_PATTERN, "Invalid ISBN format", normalize=_normalize_isbn),
+    _optional_copies("available_copies"),
+    custom(_check_book_copies),
+)
+
+_BOOK_UPDATE_SCHEMA = compile_schema(
+    text("title", 1, 200, "Title must be between 1 and 200 characters", optional=True),
+    integer("author_id", "author_id must be a valid integer", optional=True,
+            member_of=AUTHORS, member_message="Invalid author_id: author does not exist"),
+    matches("isbn", ISBN_PATTERN, "Invalid ISBN format", optional=True, normalize=_normalize_isbn),
+    _optional_copies("available_copies"),
+)
+
+_AUTHOR_SCHEMA = compile_schema(
+    required("name"),
+    text("name", 1, 200, "Name must be between 1 and 200 characters"),
+    text("bio", 0, 2000, "Bio must be at most 2000 characters", optional=True),
+)
+
+_MEMBER_SCHEMA = compile_schema(
+    required("name", "email", "password"),
+    text("name", 2, 100, "Name must be between 2 and 100 characters", coerce=False),
+    matches("email", EMAIL_PATTERN, "Invalid email format", normalize=_normalize_email),
+)
+
+_LOAN_SCHEMA = compile_schema(
+    required("book_id", "member_id", allow_falsy=True),
+    integer("book_id", "book_id must be a valid integer",
+            member_of=BOOKS, member_message="Invalid book_id: book does not exist"),
+    integer("member_id", "member_id must be a valid integer",
+            member_of=MEMBERS, member_message="Invalid member_id: member does not exist"),
+    custom(_check_loan_availability),
+)
+
+_BALLOT_VOTE_SCHEMA = compile_schema(
+    required("ballot_id", "option_id", allow_falsy=True),
+    integer("ballot_id", "ballot_id must be a valid integer",
+            member_of=BALLOTS, member_message="Invalid ballot_id: ballot does not exist"),
+    integer("option_id", "option_id must be a valid integer"),
+)
+
+_BALLOT_SCHEMA = compile_schema(
+    required("title", "description", "options", "start_date", "end_date", "max_votes_per_member",
+             allow_falsy=True),
+    text("title", 1, 200, "Title must be between 1 and 200 characters"),
+    text("description", 1, 1000, "Description must be between 1 and 1000 characters"),
+    custom(_check_ballot_options),
+    custom(_check_ballot_dates),
+    custom(_check_ballot_max_votes),
+)
+
+_PROPOSAL_SCHEMA = compile_schema(
+    required("title", "description", "created_by", "closing_date", "options", allow_falsy=True),
+    text("title", 3, 200, "Title must be between 3 and 200 characters"),
+    text("description", 10, 2000, "Description must be between 10 and 2000 characters"),
+    integer("created_by", "created_by must be a valid integer",
+            member_of=MEMBERS, member_message="Invalid created_by: member does not exist"),
+    custom(_check_closing_date),
+    custom(_check_proposal_options),
+    one_of("status", PROPOSAL_STATUSES, f"Status must be one of: {', '.join(PROPOSAL_STATUSES)}"),
+    boolean("allow_abstain", "allow_abstain must be a boolean value"),
+)
+
+_PROPOSAL_UPDATE_SCHEMA = compile_schema(
+    read_only("id", "created_by", "created_date"),
+    text("title", 3, 200, "Title must be between 3 and 200 characters", optional=True),
+    text("description", 10, 2000, "Description must be between 10 and 2000 characters", optional=True),
+    custom(lambda data: _check_closing_date(data) if "closing_date" in data else None),
+    one_of("status", PROPOSAL_STATUSES, f"Status must be one of: {', '.join(PROPOSAL_STATUSES)}"),
+    custom(lambda data: _check_proposal_options(data) if "options" in data else None),
+    boolean("allow_abstain", "allow_abstain must be a boolean value"),
+)
+
+_VOTE_SCHEMA = compile_schema(
+    required("proposal_id", "member_id", "vote_choice", allow_falsy=True),
+    integer("proposal_id", "proposal_id must be a valid integer"),
+)
+
+_VOTE_UPDATE_SCHEMA = compile_schema(
+    read_only("id", "proposal_id", "member_id", "timestamp"),
+)
+
 
 def validate_book(data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """
@@ -20,99 +269,113 @@ def validate_book(data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         - is_valid: True if data is valid, False otherwise
         - error_message: None if valid, error string if invalid
     """
-    if not isinstance(data, dict):
-        return False, "Invalid data format"
+    return _BOOK_SCHEMA(data)
 
-    # Check required fields
-    required_fields = ["title", "author_id", "isbn"]
-    for field in required_fields:
-        if field not in data or not data[field]:
-            return False, f"Missing required field: {field}"
 
-    # Validate title
-    title = data["title"].strip()
-    if len(title) < 1 or len(title) > 200:
-        return False, "Title must be between 1 and 200 characters"
+def validate_books(records: Iterable[Dict[str, Any]]) -> List[Tuple[int, Optional[str]]]:
+    """
+    Validate many book payloads, e.g. for bulk import.
 
-    # Validate author_id
-    try:
-        author_id = int(data["author_id"])
-        if author_id not in AUTHORS:
-            return False, "Invalid author_id: author does not exist"
-    except (ValueError, TypeError):
-        return False, "author_id must be a valid integer"
+    Args:
+        records: Book payloads to validate
 
-    # Validate ISBN format (comprehensive check)
-    isbn = str(data["isbn"]).strip().replace("-", "")
-    if not re.match(r"^(978|979)?[\d]{9}[\dX]$", isbn):
-        return False, "Invalid ISBN format"
+    Returns:
+        List of (row_index, error_message) for rejected rows only
+    """
+    return validate_many(_BOOK_SCHEMA, records)
 
-    # Validate optional fields
-    if "available_copies" in data:
-        try:
-            available_copies = int(data["available_copies"])
-            if available_copies < 0:
-                return False, "available_copies must be non-negative"
-        except (ValueError, TypeError):
-            return False, "available_copies must be a valid integer"
 
-    if "total_copies" in data:
-        try:
-            total_copies = int(data["total_copies"])
-            if total_copies < 0:
-                return False, "total_copies must be non-negative"
-            if "available_copies" in data and total_copies < int(data["available_copies"]):
-                return False, "total_copies cannot be less than available_copies"
-        except (ValueError, TypeError):
-            return False, "total_copies must be a valid integer"
+def validate_author(data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """
+    Validate author data for creation.
 
-    return True, None
+    Args:
+        data: Dictionary containing author data
+
+    Returns:
+        Tuple of (is_valid, error_message)
+        - is_valid: True if data is valid, False otherwise
+        - error_message: None if valid, error string if invalid
+    """
+    return _AUTHOR_SCHEMA(data)
 
-def validate_member(data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+
+def validate_authors(records: Iterable[Dict[str, Any]]) -> List[Tuple[int, Optional[str]]]:
+    """
+    Validate many author payloads, e.g. for bulk import.
+
+    Args:
+        records: Author payloads to validate
+
+    Returns:
+        List of (row_index, error_message) for rejected rows only
+    """
+    return validate_many(_AUTHOR_SCHEMA, records)
+
+
+def validate_member(data: Dict[str, Any],
+                    existing_emails: Optional[Dict[str, int]] = None) -> Tuple[bool, Optional[str]]:
     """
     Validate member data for registration or update.
 
     Args:
         data: Dictionary containing member data
+        existing_emails: Optional prebuilt map of lower-cased email to member ID;
+            built from MEMBERS when omitted
 
     Returns:
         Tuple of (is_valid, error_message)
         - is_valid: True if data is valid, False otherwise
         - error_message: None if valid, error string if invalid
     """
-    if not isinstance(data, dict):
-        return False, "Invalid data format"
-
-    # Check required fields
-    required_fields = ["name", "email", "password"]
-    for field in required_fields:
-        if field not in data or not data[field]:
-            return False, f"Missing required field: {field}"
-
-    # Validate name
-    name = data["name"].strip()
-    if len(name) < 2 or len(name) > 100:
-        return False, "Name must be between 2 and 100 characters"
-
-    # Validate email format
-    email = data["email"].strip().lower()
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(email_pattern, email):
-        return False, "Invalid email format"
+    is_valid, error = _MEMBER_SCHEMA(data)
+    if not is_valid:
+        return is_valid, error
 
     # Check for duplicate email (exclude current member for updates)
+    email = _normalize_email(data["email"])
     exclude_id = data.get("id")
-    for member_id, member in MEMBERS.items():
-        if member["email"].lower() == email and member_id != exclude_id:
+    if existing_emails is None:
+        for member_id, member in MEMBERS.items():
+            if member["email"].lower() == email and member_id != exclude_id:
+                return False, "Email already exists"
+    else:
+        owner = existing_emails.get(email)
+        if owner is not None and owner != exclude_id:
             return False, "Email already exists"
 
     # Validate password
-    password = data["password"]
-    if len(password) < 8:
+    if len(data["password"]) < 8:
         return False, "Password must be at least 8 characters long"
 
     return True, None
 
+
+def validate_members(records: Iterable[Dict[str, Any]]) -> List[Tuple[int, Optional[str]]]:
+    """
+    Validate many member payloads with one pass over existing emails.
+
+    Emails accepted earlier in the batch count as taken for later rows.
+
+    Args:
+        records: Member payloads to validate
+
+    Returns:
+        List of (row_index, error_message) for rejected rows only
+    """
+    existing_emails = {member["email"].lower(): member_id for member_id, member in MEMBERS.items()}
+    errors = []
+    for index, record in enumerate(records):
+        is_valid, error = validate_member(record, existing_emails)
+        if not is_valid:
+            errors.append((index, error))
+        else:
+            # Rows without an ID still claim their email for the rest of the batch
+            owner = record.get("id")
+            existing_emails[_normalize_email(record["email"])] = owner if owner is not None else ("row", index)
+    return errors
+
+
 def validate_loan(data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """
     Validate loan data for creation.
@@ -125,37 +388,8 @@ def validate_loan(data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         - is_valid: True if data is valid, False otherwise
         - error_message: None if valid, error string if invalid
     """
-    if not isinstance(data, dict):
-        return False, "Invalid data format"
+    return _LOAN_SCHEMA(data)
 
-    # Check required fields
-    required_fields = ["book_id", "member_id"]
-    for field in required_fields:
-        if field not in data or data[field] is None:
-            return False, f"Missing required field: {field}"
-
-    # Validate book_id
-    try:
-        book_id = int(data["book_id"])
-        if book_id not in BOOKS:
-            return False, "Invalid book_id: book does not exist"
-    except (ValueError, TypeError):
-        return False, "book_id must be a valid integer"
-
-    # Validate member_id
-    try:
-        member_id = int(data["member_id"])
-        if member_id not in MEMBERS:
-            return False, "Invalid member_id: member does not exist"
-    except (ValueError, TypeError):
-        return False, "member_id must be a valid integer"
-
-    # Check book availability
-    book = BOOKS[book_id]
-    if book.get("available_copies", 0) <= 0:
-        return False, "Book is not available for loan"
-
-    return True, None
 
 def validate_book_update(book_id: int, data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """
@@ -176,31 +410,9 @@ def validate_book_update(book_id: int, data: Dict[str, Any]) -> Tuple[bool, Opti
         return False, "No update data provided"
 
     # Validate only provided fields
-    if "title" in data:
-        title = str(data["title"]).strip()
-        if len(title) < 1 or len(title) > 200:
-            return False, "Title must be between 1 and 200 characters"
-
-    if "author_id" in data:
-        try:
-            author_id = int(data["author_id"])
-            if author_id not in AUTHORS:
-                return False, "Invalid author_id: author does not exist"
-        except (ValueError, TypeError):
-            return False, "author_id must be a valid integer"
-
-    if "isbn" in data:
-        isbn = str(data["isbn"]).strip().replace("-", "")
-        if not re.match(r"^(978|979)?[\d]{9}[\dX]$", isbn):
-            return False, "Invalid ISBN format"
-
-    if "available_copies" in data:
-        try:
-            available_copies = int(data["available_copies"])
-            if available_copies < 0:
-                return False, "available_copies must be non-negative"
-        except (ValueError, TypeError):
-            return False, "available_copies must be a valid integer"
+    is_valid, error = _BOOK_UPDATE_SCHEMA(data)
+    if not is_valid:
+        return is_valid, error
 
     if "total_copies" in data:
         try:
@@ -256,33 +468,16 @@ def validate_ballot_vote(data: Dict[str, Any], member_id: int) -> Tuple[bool, Op
         - is_valid: True if data is valid, False otherwise
         - error_message: None if valid, error string if invalid
     """
-    if not isinstance(data, dict):
-        return False, "Invalid data format"
+    is_valid, error = _BALLOT_VOTE_SCHEMA(data)
+    if not is_valid:
+        return is_valid, error
 
-    # Check required fields
-    required_fields = ["ballot_id", "option_id"]
-    for field in required_fields:
-        if field not in data or data[field] is None:
-            return False, f"Missing required field: {field}"
-
-    # Validate ballot_id
-    try:
-        ballot_id = int(data["ballot_id"])
-        if ballot_id not in BALLOTS:
-            return False, "Invalid ballot_id: ballot does not exist"
-    except (ValueError, TypeError):
-        return False, "ballot_id must be a valid integer"
-
-    # Validate option_id
-    try:
-        option_id = int(data["option_id"])
-    except (ValueError, TypeError):
-        return False, "option_id must be a valid integer"
+    ballot_id = int(data["ballot_id"])
+    option_id = int(data["option_id"])
 
     # Get ballot and validate option belongs to ballot
     ballot = BALLOTS[ballot_id]
-    valid_option_ids = [opt["id"] for opt in ballot["options"]]
-    if option_id not in valid_option_ids:
+    if not any(opt["id"] == option_id for opt in ballot["options"]):
         return False, "Invalid option_id for this ballot"
 
     # Check if ballot is active
@@ -295,10 +490,10 @@ def validate_ballot_vote(data: Dict[str, Any], member_id: int) -> Tuple[bool, Op
         return False, "Voting period has expired or not yet started"
 
     # Check if member has already used all votes for this ballot
-    existing_votes = [vote for vote in VOTES.values()
-                     if vote.get("ballot_id") == ballot_id and vote["member_id"] == member_id]
+    existing_votes = sum(1 for vote in VOTES.values()
+                         if vote.get("ballot_id") == ballot_id and vote["member_id"] == member_id)
 
-    if len(existing_votes) >= ballot["max_votes_per_member"]:
+    if existing_votes >= ballot["max_votes_per_member"]:
         return False, "Maximum votes per member exceeded for this ballot"
 
     return True, None
@@ -315,82 +510,7 @@ def validate_ballot(data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         - is_valid: True if data is valid, False otherwise
         - error_message: None if valid, error string if invalid
     """
-    if not isinstance(data, dict):
-        return False, "Invalid data format"
-
-    # Check required fields
-    required_fields = ["title", "description", "options", "start_date", "end_date", "max_votes_per_member"]
-    for field in required_fields:
-        if field not in data or data[field] is None:
-            return False, f"Missing required field: {field}"
-
-    # Validate title
-    title = str(data["title"]).strip()
-    if len(title) < 1 or len(title) > 200:
-        return False, "Title must be between 1 and 200 characters"
-
-    # Validate description
-    description = str(data["description"]).strip()
-    if len(description) < 1 or len(description) > 1000:
-        return False, "Description must be between 1 and 1000 characters"
-
-    # Validate options
-    options = data["options"]
-    if not isinstance(options, list) or len(options) < 2:
-        return False, "At least 2 options are required"
-
-    if len(options) > 20:
-        return False, "Maximum 20 options allowed"
-
-    # Validate each option
-    option_ids = []
-    for i, option in enumerate(options):
-        if not isinstance(option, dict):
-            return False, f"Option {i + 1} must be a dictionary"
-
-        if "id" not in option or "title" not in option or "description" not in option:
-            return False, f"Option {i + 1} must have id, title, and description fields"
-
-        try:
-            option_id = int(option["id"])
-            if option_id in option_ids:
-                return False, f"Duplicate option ID: {option_id}"
-            option_ids.append(option_id)
-        except (ValueError, TypeError):
-            return False, f"Option {i + 1} ID must be a valid integer"
-
-        option_title = str(option["title"]).strip()
-        if len(option_title) < 1 or len(option_title) > 100:
-            return False, f"Option {i + 1} title must be between 1 and 100 characters"
-
-        option_desc = str(option["description"]).strip()
-        if len(option_desc) > 500:
-            return False, f"Option {i + 1} description must be 500 characters or less"
-
-    # Validate dates
-    try:
-        start_date = datetime.fromisoformat(data["start_date"].replace('Z', '+00:00'))
-        end_date = datetime.fromisoformat(data["end_date"].replace('Z', '+00:00'))
-
-        if start_date >= end_date:
-            return False, "End date must be after start date"
-
-        # Check if start date is too far in the past (more than 1 year)
-        if (datetime.now() - start_date).days > 365:
-            return False, "Start date cannot be more than 1 year in the past"
-
-    except ValueError:
-        return False, "Invalid date format. Use ISO format (YYYY-MM-DDTHH:MM:SS)"
-
-    # Validate max_votes_per_member
-    try:
-        max_votes = int(data["max_votes_per_member"])
-        if max_votes < 1 or max_votes > len(options):
-            return False, "max_votes_per_member must be between 1 and the number of options"
-    except (ValueError, TypeError):
-        return False, "max_votes_per_member must be a valid integer"
-
-    return True, None
+    return _BALLOT_SCHEMA(data)
 
 # Proposal System Validators (for yes/no decisions and simple choices)
 
@@ -406,68 +526,7 @@ def validate_proposal(data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         - is_valid: True if data is valid, False otherwise
         - error_message: None if valid, error string if invalid
     """
-    if not isinstance(data, dict):
-        return False, "Invalid data format"
-
-    # Check required fields
-    required_fields = ["title", "description", "created_by", "closing_date", "options"]
-    for field in required_fields:
-        if field not in data or data[field] is None:
-            return False, f"Missing required field: {field}"
-
-    # Validate title
-    title = str(data["title"]).strip()
-    if len(title) < 3 or len(title) > 200:
-        return False, "Title must be between 3 and 200 characters"
-
-    # Validate description
-    description = str(data["description"]).strip()
-    if len(description) < 10 or len(description) > 2000:
-        return False, "Description must be between 10 and 2000 characters"
-
-    # Validate created_by (member_id)
-    try:
-        created_by = int(data["created_by"])
-        if created_by not in MEMBERS:
-            return False, "Invalid created_by: member does not exist"
-    except (ValueError, TypeError):
-        return False, "created_by must be a valid integer"
-
-    # Validate closing_date format
-    from datetime import datetime
-    try:
-        closing_date = str(data["closing_date"])
-        datetime.strptime(closing_date, "%Y-%m-%d")
-
-        # Check closing date is in the future
-        today = datetime.now().strftime("%Y-%m-%d")
-        if closing_date <= today:
-            return False, "Closing date must be in the future"
-    except ValueError:
-        return False, "Invalid closing_date format, must be YYYY-MM-DD"
-
-    # Validate options
-    options = data["options"]
-    if not isinstance(options, list) or len(options) < 2:
-        return False, "Options must be a list with at least 2 choices"
-
-    for option in options:
-        if not isinstance(option, str) or len(option.strip()) < 1:
-            return False, "Each option must be a non-empty string"
-        if len(option.strip()) > 100:
-            return False, "Each option must be 100 characters or less"
-
-    # Validate optional fields
-    if "status" in data:
-        valid_statuses = ["active", "closed", "draft"]
-        if data["status"] not in valid_statuses:
-            return False, f"Status must be one of: {', '.join(valid_statuses)}"
-
-    if "allow_abstain" in data:
-        if not isinstance(data["allow_abstain"], bool):
-            return False, "allow_abstain must be a boolean value"
-
-    return True, None
+    return _PROPOSAL_SCHEMA(data)
 
 def validate_vote(data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """
@@ -481,23 +540,11 @@ def validate_vote(data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         - is_valid: True if data is valid, False otherwise
         - error_message: None if valid, error string if invalid
     """
-    if not isinstance(data, dict):
-        return False, "Invalid data format"
-
-    # Check required fields
-    required_fields = ["proposal_id", "member_id", "vote_choice"]
-    for field in required_fields:
-        if field not in data or data[field] is None:
-            return False, f"Missing required field: {field}"
-
-    # Validate proposal_id
-    try:
-        proposal_id = int(data["proposal_id"])
-    except (ValueError, TypeError):
-        return False, "proposal_id must be a valid integer"
+    is_valid, error = _VOTE_SCHEMA(data)
+    if not is_valid:
+        return is_valid, error
 
-    from api.data_store import get_proposal
-    proposal = get_proposal(proposal_id)
+    proposal = get_proposal(int(data["proposal_id"]))
     if proposal is None:
         return False, "Invalid proposal_id: proposal does not exist"
 
@@ -506,7 +553,6 @@ def validate_vote(data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         return False, "Cannot vote on inactive proposals"
 
     # Check if proposal is still open (not past closing date)
-    from datetime import datetime
     closing_date = proposal.get("closing_date")
     if closing_date:
         try:
@@ -525,16 +571,9 @@ def validate_vote(data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         return False, "member_id must be a valid integer"
 
     # Validate vote_choice
-    vote_choice = str(data["vote_choice"]).strip().lower()
-    valid_choices = [option.lower() for option in proposal.get("options", [])]
-
-    # Add abstain option if allowed
-    if proposal.get("allow_abstain", False):
-        valid_choices.append("abstain")
-
-    if vote_choice not in valid_choices:
-        return False, f"Invalid vote_choice. Valid options: {', '.join(proposal.get('options', []))}" +
-                      (" (or 'abstain')" if proposal.get("allow_abstain", False) else "")
+    error = _check_vote_choice(data["vote_choice"], proposal)
+    if error is not None:
+        return False, error
 
     # Validate optional fields
     if "is_anonymous" in data:
@@ -554,8 +593,6 @@ def validate_proposal_update(proposal_id: int, data: Dict[str, Any]) -> Tuple[bo
     Returns:
         Tuple of (is_valid, error_message)
     """
-    from api.data_store import get_proposal
-
     proposal = get_proposal(proposal_id)
     if proposal is None:
         return False, "Proposal not found"
@@ -564,57 +601,7 @@ def validate_proposal_update(proposal_id: int, data: Dict[str, Any]) -> Tuple[bo
     if not isinstance(data, dict) or len(data) == 0:
         return False, "No update data provided"
 
-    # Don't allow updating certain fields
-    readonly_fields = ["id", "created_by", "created_date"]
-    for field in readonly_fields:
-        if field in data:
-            return False, f"Field '{field}' cannot be updated"
-
-    # Validate provided fields
-    if "title" in data:
-        title = str(data["title"]).strip()
-        if len(title) < 3 or len(title) > 200:
-            return False, "Title must be between 3 and 200 characters"
-
-    if "description" in data:
-        description = str(data["description"]).strip()
-        if len(description) < 10 or len(description) > 2000:
-            return False, "Description must be between 10 and 2000 characters"
-
-    if "closing_date" in data:
-        from datetime import datetime
-        try:
-            closing_date = str(data["closing_date"])
-            datetime.strptime(closing_date, "%Y-%m-%d")
-
-            # Check closing date is in the future
-            today = datetime.now().strftime("%Y-%m-%d")
-            if closing_date <= today:
-                return False, "Closing date must be in the future"
-        except ValueError:
-            return False, "Invalid closing_date format, must be YYYY-MM-DD"
-
-    if "status" in data:
-        valid_statuses = ["active", "closed", "draft"]
-        if data["status"] not in valid_statuses:
-            return False, f"Status must be one of: {', '.join(valid_statuses)}"
-
-    if "options" in data:
-        options = data["options"]
-        if not isinstance(options, list) or len(options) < 2:
-            return False, "Options must be a list with at least 2 choices"
-
-        for option in options:
-            if not isinstance(option, str) or len(option.strip()) < 1:
-                return False, "Each option must be a non-empty string"
-            if len(option.strip()) > 100:
-                return False, "Each option must be 100 characters or less"
-
-    if "allow_abstain" in data:
-        if not isinstance(data["allow_abstain"], bool):
-            return False, "allow_abstain must be a boolean value"
-
-    return True, None
+    return _PROPOSAL_UPDATE_SCHEMA(data)
 
 def validate_vote_update(vote_id: int, data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """
@@ -627,8 +614,6 @@ def validate_vote_update(vote_id: int, data: Dict[str, Any]) -> Tuple[bool, Opti
     Returns:
         Tuple of (is_valid, error_message)
     """
-    from api.data_store import VOTES, get_proposal
-
     if vote_id not in VOTES:
         return False, "Vote not found"
 
@@ -646,27 +631,18 @@ def validate_vote_update(vote_id: int, data: Dict[str, Any]) -> Tuple[bool, Opti
     if not isinstance(data, dict) or len(data) == 0:
         return False, "No update data provided"
 
-    # Don't allow updating certain fields
-    readonly_fields = ["id", "proposal_id", "member_id", "timestamp"]
-    for field in readonly_fields:
-        if field in data:
-            return False, f"Field '{field}' cannot be updated"
+    is_valid, error = _VOTE_UPDATE_SCHEMA(data)
+    if not is_valid:
+        return is_valid, error
 
     # Validate vote_choice if being updated
     if "vote_choice" in data:
-        vote_choice = str(data["vote_choice"]).strip().lower()
-        valid_choices = [option.lower() for option in proposal.get("options", [])]
-
-        # Add abstain option if allowed
-        if proposal.get("allow_abstain", False):
-            valid_choices.append("abstain")
-
-        if vote_choice not in valid_choices:
-            return False, f"Invalid vote_choice. Valid options: {', '.join(proposal.get('options', []))}" +
-                          (" (or 'abstain')" if proposal.get("allow_abstain", False) else "")
+        error = _check_vote_choice(data["vote_choice"], proposal)
+        if error is not None:
+            return False, error
 
     if "is_anonymous" in data:
         if not isinstance(data["is_anonymous"], bool):
             return False, "is_anonymous must be a boolean value"
 
-    return True, None
\ No newline at end of file
+    return True, None
@@ -391,7 +391,6 @@ if DATACLASSES_AVAILABLE:
         timestamp: datetime = field(default_factory=datetime.now)
 
 
-    @dataclass
     @dataclass
     class AuditLogDataclass:
         """Dataclass version of AuditLog for Flask applications."""
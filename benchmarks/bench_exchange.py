@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Load test of the bot's order path against the local exchange simulator.
+
+Submits orders from concurrent workers through ExecutionEngine (shared HTTP
+transport included), then settles them all with one SettlementTracker, and
+reports order throughput, submit latency percentiles, settlement time and
+the stream fan-out the simulator produced meanwhile. Simulated latency and
+error rate can be raised to see how the pipeline degrades.
+
+Usage:
+    python benchmarks/bench_exchange.py [--orders N] [--workers N]
+        [--latency SECONDS] [--error-rate P]
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from decimal import Decimal
+from types import SimpleNamespace
+
+# The bot lives in polymarket-bot/ but imports itself as polymarket_bot
+BOT_DIR = os.path.join(os.path.dirname(__file__), '..', 'polymarket-bot')
+if 'polymarket_bot' not in sys.modules:
+    spec = importlib.util.spec_from_file_location(
+        'polymarket_bot', os.path.join(BOT_DIR, '__init__.py'), submodule_search_locations=[BOT_DIR]
+    )
+    sys.modules['polymarket_bot'] = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(sys.modules['polymarket_bot'])
+
+from polymarket_bot.execution import ExecutionEngine, OrderExecutionError, OrderSettlementError  # noqa: E402
+from polymarket_bot.models import OrderSide, OutcomeType  # noqa: E402
+from polymarket_bot.settlement import SettlementTracker  # noqa: E402
+from polymarket_bot.simulator import ExchangeSimulator, SimulatorBehaviour  # noqa: E402
+from polymarket_bot.telemetry import LatencyHistogram  # noqa: E402
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def submit_orders(engine, count, workers):
+    """Submit ``count`` orders from ``workers`` threads; return (order IDs, histogram, failures, seconds)."""
+    histogram = LatencyHistogram()
+    order_ids = []
+    failures = 0
+
+    def submit(i):
+        started = time.perf_counter_ns()
+        trade = engine.submit_order(
+            "sim-btc-up-15m", OrderSide.BUY, OutcomeType.YES if i % 2 else OutcomeType.NO,
+            Decimal("5"), trade_id=f"bench_{i}"
+        )
+        return trade.order_id, (time.perf_counter_ns() - started) // 1000
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(submit, i) for i in range(count)]:
+            try:
+                order_id, micros = future.result()
+            except OrderExecutionError:
+                failures += 1
+                continue
+            order_ids.append(order_id)
+            histogram.record(micros)
+    return order_ids, histogram, failures, time.perf_counter() - started
+
+
+def settle_orders(engine, order_ids, poll_interval):
+    """Track every order to a terminal state; return (settled, unsettled, seconds)."""
+    tracker = SettlementTracker(engine, poll_interval=poll_interval, timeout=60)
+    started = time.perf_counter()
+    try:
+        futures = [tracker.track(order_id) for order_id in order_ids]
+        wait(futures)
+    finally:
+        tracker.close()
+    settled = sum(1 for future in futures if not isinstance(future.exception(), OrderSettlementError))
+    return settled, len(futures) - settled, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--orders", type=int, default=500, help="orders to submit")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent submitting threads")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated seconds per REST response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability a REST request fails")
+    args = parser.parse_args()
+
+    behaviour = SimulatorBehaviour(
+        latency=args.latency, latency_jitter=args.latency / 2, error_rate=args.error_rate,
+        settle_after=0.5, kline_interval=0.1, depth_interval=0.05
+    )
+    with ExchangeSimulator(behaviour, seed=1) as exchange:
+        config = SimpleNamespace(
+            polymarket_base_url=exchange.base_url, polymarket_api_key="bench", polymarket_api_secret="bench"
+        )
+        engine = ExecutionEngine(config)
+        try:
+            order_ids, histogram, failures, seconds = submit_orders(engine, args.orders, args.workers)
+            print(f"Order submission ({args.orders} orders, {args.workers} workers, "
+                  f"latency {args.latency * 1000:.0f} ms, error rate {args.error_rate:.1%})")
+            print(f"{'throughput':<24} {len(order_ids) / seconds:10.1f} orders/s")
+            print(f"{'failed':<24} {failures:10d}")
+            count, total, values = histogram.snapshot(PERCENTILES)
+            if count:
+                print(f"{'mean':<24} {total / count / 1000:10.2f} ms")
+            for percentile, value in zip(PERCENTILES, values):
+                if value is not None:
+                    print(f"{'p' + format(percentile, 'g'):<24} {value / 1000:10.2f} ms")
+
+            settled, unsettled, seconds = settle_orders(engine, order_ids, poll_interval=0.1)
+            print(f"\nSettlement ({len(order_ids)} orders, one tracker)")
+            print(f"{'settled':<24} {settled:10d}")
+            print(f"{'unsettled':<24} {unsettled:10d}")
+            print(f"{'elapsed':<24} {seconds:10.2f} s")
+        finally:
+            engine.close()
+
+        print("\nSimulator")
+        for key, value in sorted(exchange.stats.items()):
+            print(f"{key:<24} {value:10d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the Polymarket bot's ticker message path.
+
+Compares parsing a Binance 24hr ticker message into a validated BTCPriceData
+model (the previous per-message path) with parsing it into a PriceTick
+record, and reports per-message CPU time, memory allocated per message and
+the memory retained by 1000 parsed messages.
+
+Usage:
+    python benchmarks/bench_ticks.py [--number N]
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+from decimal import Decimal
+
+# The bot lives in polymarket-bot/ but imports itself as polymarket_bot
+BOT_DIR = os.path.join(os.path.dirname(__file__), '..', 'polymarket-bot')
+if 'polymarket_bot' not in sys.modules:
+    spec = importlib.util.spec_from_file_location(
+        'polymarket_bot', os.path.join(BOT_DIR, '__init__.py'), submodule_search_locations=[BOT_DIR]
+    )
+    sys.modules['polymarket_bot'] = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(sys.modules['polymarket_bot'])
+
+from polymarket_bot.market_data import BinanceWebSocket  # noqa: E402
+from polymarket_bot.models import BTCPriceData  # noqa: E402
+from polymarket_bot.records import PriceTick  # noqa: E402
+
+MESSAGE = {
+    'e': '24hrTicker', 'E': 1_700_000_000_000, 's': 'BTCUSDT', 'c': '45678.90',
+    'q': '123456789.50', 'h': '46000.00', 'l': '45000.00', 'p': '678.90', 'P': '1.51'
+}
+RAW = json.dumps(MESSAGE)
+
+
+def parse_model(data):
+    """Parse into a fully validated BTCPriceData, as every message used to be."""
+    return BTCPriceData(
+        symbol=data.get('s', 'BTCUSDT'),
+        price=Decimal(str(data['c'])),
+        timestamp=datetime.fromtimestamp(int(data['E']) / 1000, tz=timezone.utc),
+        volume_24h=Decimal(str(data['q'])),
+        high_24h=Decimal(str(data['h'])),
+        low_24h=Decimal(str(data['l'])),
+        price_change_24h=Decimal(str(data['p'])),
+        price_change_percent_24h=Decimal(str(data['P'])),
+        metadata=data
+    )
+
+
+CASES = [
+    ("BTCPriceData (validated model)", parse_model),
+    ("PriceTick.from_binance_ticker", PriceTick.from_binance_ticker),
+    ("PriceTick -> to_model (boundary)", lambda data: PriceTick.from_binance_ticker(data).to_model()),
+]
+
+
+def bench(label, func, arg, number):
+    """Time ``func(arg)`` and print the mean cost per call."""
+    seconds = timeit.timeit(lambda: func(arg), number=number)
+    print(f"{label:<40} {seconds / number * 1e6:8.2f} us/call")
+
+
+def allocations(label, func, arg, count=1000):
+    """Print bytes allocated per call and bytes retained by ``count`` results."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [func(dict(arg)) for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    print(f"{label:<40} {peak / count:8.0f} B/call peak {retained / count:8.0f} B/call retained")
+    del kept
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000, help="calls per benchmark")
+    args = parser.parse_args()
+
+    print("Ticker message parsing (decoded dict)")
+    for label, func in CASES:
+        bench(label, func, MESSAGE, args.number)
+
+    print("\nAllocations (1000 messages, raw dict excluded)")
+    for label, func in CASES[:2]:
+        allocations(label, func, MESSAGE)
+
+    print("\nBinanceWebSocket._on_message (JSON text, no callbacks)")
+    client = BinanceWebSocket(history_size=200)
+    bench("_on_message", lambda raw: client._on_message(None, raw), RAW, args.number)
+
+
+if __name__ == "__main__":
+    main()
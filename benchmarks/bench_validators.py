@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for request payload validators.
+
+Reports the per-call cost of each compiled validator on a valid payload and
+on a payload rejected at its last check, plus the batch validators.
+
+Usage:
+    python benchmarks/bench_validators.py [--number N]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api import validators
+from api.utils import sanitizer
+
+FUTURE_DATE = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+
+CASES = [
+    ("validate_book (valid)", validators.validate_book,
+     {"title": "Dune", "author_id": 1, "isbn": "978-0-441-17271-9",
+      "available_copies": 2, "total_copies": 3}),
+    ("validate_book (bad total)", validators.validate_book,
+     {"title": "Dune", "author_id": 1, "isbn": "978-0-441-17271-9",
+      "available_copies": 4, "total_copies": 3}),
+    ("validate_member (valid)", validators.validate_member,
+     {"name": "Ada Lovelace", "email": "ada@example.com", "password": "analytical"}),
+    ("validate_loan (valid)", validators.validate_loan,
+     {"book_id": 1, "member_id": 1}),
+    ("validate_ballot (valid)", validators.validate_ballot,
+     {"title": "Board", "description": "Annual vote",
+      "options": [{"id": i, "title": f"Option {i}", "description": ""} for i in range(1, 6)],
+      "start_date": datetime.now().isoformat(),
+      "end_date": (datetime.now() + timedelta(days=7)).isoformat(),
+      "max_votes_per_member": 2}),
+    ("validate_proposal (valid)", validators.validate_proposal,
+     {"title": "New books", "description": "Buy more books for the library",
+      "created_by": 1, "closing_date": FUTURE_DATE, "options": ["yes", "no"],
+      "status": "active", "allow_abstain": True}),
+]
+
+
+def bench(label, func, arg, number):
+    """Time ``func(arg)`` and print the mean cost per call."""
+    seconds = timeit.timeit(lambda: func(arg), number=number)
+    print(f"{label:<40} {seconds / number * 1e6:8.2f} us/call")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000, help="calls per benchmark")
+    args = parser.parse_args()
+
+    print("Single-payload validators")
+    for label, func, payload in CASES:
+        bench(label, func, payload, args.number)
+
+    print("\nBatch validators (1000 rows)")
+    books = [dict(CASES[0][2], title=f"Book {i}") for i in range(1000)]
+    members = [{"name": "Member", "email": f"m{i}@example.com", "password": "password1"}
+               for i in range(1000)]
+    batch_number = max(1, args.number // 1000)
+    bench("validate_books", validators.validate_books, books, batch_number)
+    bench("validate_members", validators.validate_members, members, batch_number)
+
+    print("\nSanitizers")
+    bench("sanitize_email", sanitizer.sanitize_email, "Voter@Example.com", args.number)
+    bench("sanitize_name", sanitizer.sanitize_name, "Mary-Jane Smith", args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -28,12 +28,66 @@ from .models import (
 
 # Market Data
 from .market_data import (
-    MarketDataService,
+    BinanceWebSocketClient,
+    PolymarketClient,
     PolymarketAPIError,
-    get_active_btc_markets,
-    get_market_odds_by_id,
+    MarketSnapshot,
+    get_market_data,
+    get_market_snapshot,
+    get_market_snapshots,
+    fetch_recent_klines,
+    fetch_concurrently,
+    SourceResult,
 )
 
+# Indicators
+from .indicators import IndicatorEngine, IndicatorSnapshot
+
+# Local Order Book
+from .order_book import (
+    LocalOrderBook,
+    BinanceOrderBookStream,
+    OrderBookSyncError,
+    OrderBookGapError,
+)
+
+# Market Catalogue
+from .market_catalogue import MarketCatalogue
+
+# Price History
+from .price_history import PriceHistory
+
+# Tick Records
+from .records import PriceTick
+
+# Tick Recording
+from .recorder import TickRecorder, TickReader, TickReplayer, TickFileError
+
+# HTTP Transport
+from .transport import HttpTransport, EndpointPolicy, get_transport, close_transport
+
+# Scheduling
+from .scheduler import EventScheduler, ScheduledEvent
+
+# Telemetry
+from .telemetry import Telemetry, LatencyHistogram, MetricsServer, get_telemetry
+
+# Backtesting
+from .backtest import (
+    Backtester,
+    BacktestData,
+    BacktestResult,
+    load_klines_csv,
+    load_odds_csv,
+)
+from .sweep import ParameterSweep, SweepResult, Uniform
+
+# Performance Analytics
+from .analytics import TradeAnalytics
+
+# Load Testing
+from .simulator import ExchangeSimulator, SimulatorBehaviour
+
 # Prediction Engine
 from .prediction import (
     PredictionEngine,
@@ -64,10 +118,62 @@ __all__ = [
     "OutcomeType",
     "SignalType",
     # Market Data
-    "MarketDataService",
+    "BinanceWebSocketClient",
+    "PolymarketClient",
     "PolymarketAPIError",
-    "get_active_btc_markets",
-    "get_market_odds_by_id",
+    "MarketSnapshot",
+    "get_market_data",
+    "get_market_snapshot",
+    "get_market_snapshots",
+    "fetch_recent_klines",
+    "fetch_concurrently",
+    "SourceResult",
+    # Indicators
+    "IndicatorEngine",
+    "IndicatorSnapshot",
+    # Local Order Book
+    "LocalOrderBook",
+    "BinanceOrderBookStream",
+    "OrderBookSyncError",
+    "OrderBookGapError",
+    # Market Catalogue
+    "MarketCatalogue",
+    # Price History
+    "PriceHistory",
+    # Tick Records
+    "PriceTick",
+    # Tick Recording
+    "TickRecorder",
+    "TickReader",
+    "TickReplayer",
+    "TickFileError",
+    # HTTP Transport
+    "HttpTransport",
+    "EndpointPolicy",
+    "get_transport",
+    "close_transport",
+    # Scheduling
+    "EventScheduler",
+    "ScheduledEvent",
+    # Telemetry
+    "Telemetry",
+    "LatencyHistogram",
+    "MetricsServer",
+    "get_telemetry",
+    # Backtesting
+    "Backtester",
+    "BacktestData",
+    "BacktestResult",
+    "load_klines_csv",
+    "load_odds_csv",
+    "ParameterSweep",
+    "SweepResult",
+    "Uniform",
+    # Performance Analytics
+    "TradeAnalytics",
+    # Load Testing
+    "ExchangeSimulator",
+    "SimulatorBehaviour",
     # Prediction Engine
     "PredictionEngine",
     "PredictionError",
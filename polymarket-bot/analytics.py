@@ -0,0 +1,464 @@
+"""
+Incremental Performance Analytics for Polymarket Bot.
+
+This module keeps trading performance statistics current as trades settle,
+so they can be read at any time without re-reading the trade log:
+- RollingTradeStats: Sharpe and Sortino ratios of per-trade equity returns,
+  profit factor, expectancy and win rate over the last N trades
+- HitRateTracker: hit rate per signal type
+- CalibrationTracker: realised hit rate per confidence bucket, Brier score
+  and expected calibration error of PredictionSignal.confidence
+- TradeAnalytics: all of the above behind a single ``record()`` call
+
+Every update is O(1); queries are O(1) except the calibration table, which
+is O(number of buckets). Ratios are per trade, not annualized.
+"""
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+class RollingTradeStats:
+    """
+    Return and PnL statistics over the last ``window`` trades.
+
+    Running sums are adjusted as trades enter and leave the window. The
+    sums are rebuilt from the window every ``window`` evictions so float
+    drift cannot accumulate over a long session.
+    """
+
+    __slots__ = (
+        "window", "_trades", "_evictions",
+        "_sum_return", "_sum_return_sq", "_sum_downside_sq",
+        "_sum_pnl", "_gross_profit", "_gross_loss", "_wins"
+    )
+
+    def __init__(self, window: int = 100):
+        """
+        Initialize the window.
+
+        Args:
+            window: Number of most recent trades covered
+
+        Raises:
+            ValueError: If window is less than 2
+        """
+        if window < 2:
+            raise ValueError(f"Window must be at least 2 trades, got {window}")
+        self.window = window
+        self._trades: Deque[Tuple[float, float, bool]] = deque()
+        self._evictions = 0
+        self._reset_sums()
+
+    def __len__(self) -> int:
+        return len(self._trades)
+
+    def _reset_sums(self) -> None:
+        self._sum_return = 0.0
+        self._sum_return_sq = 0.0
+        self._sum_downside_sq = 0.0
+        self._sum_pnl = 0.0
+        self._gross_profit = 0.0
+        self._gross_loss = 0.0
+        self._wins = 0
+
+    def _apply(self, trade_return: float, pnl: float, won: bool, sign: int) -> None:
+        self._sum_return += sign * trade_return
+        self._sum_return_sq += sign * trade_return * trade_return
+        if trade_return < 0:
+            self._sum_downside_sq += sign * trade_return * trade_return
+        self._sum_pnl += sign * pnl
+        if pnl > 0:
+            self._gross_profit += sign * pnl
+        elif pnl < 0:
+            self._gross_loss -= sign * pnl
+        self._wins += sign * won
+
+    def update(self, trade_return: float, pnl: float, won: bool) -> None:
+        """
+        Add a trade and drop the oldest one once the window is full.
+
+        Args:
+            trade_return: PnL as a fraction of equity before the trade
+            pnl: Profit/loss for the trade
+            won: Whether the trade won
+        """
+        self._trades.append((trade_return, pnl, won))
+        self._apply(trade_return, pnl, won, 1)
+        if len(self._trades) > self.window:
+            self._apply(*self._trades.popleft(), -1)
+            self._evictions += 1
+            if self._evictions >= self.window:
+                self._evictions = 0
+                self._reset_sums()
+                for trade in self._trades:
+                    self._apply(*trade, 1)
+
+    @property
+    def mean_return(self) -> Optional[float]:
+        """Mean per-trade return, or None if empty."""
+        if not self._trades:
+            return None
+        return self._sum_return / len(self._trades)
+
+    @property
+    def return_std(self) -> Optional[float]:
+        """Sample standard deviation of per-trade returns, or None with fewer than 2 trades."""
+        count = len(self._trades)
+        if count < 2:
+            return None
+        variance = (self._sum_return_sq - self._sum_return * self._sum_return / count) / (count - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    @property
+    def sharpe_ratio(self) -> Optional[float]:
+        """Mean return over its standard deviation, or None if undefined."""
+        std = self.return_std
+        if not std:
+            return None
+        return self.mean_return / std
+
+    @property
+    def sortino_ratio(self) -> Optional[float]:
+        """Mean return over the downside deviation (target 0), or None without losing returns."""
+        if not self._trades or self._sum_downside_sq <= 0:
+            return None
+        return self.mean_return / math.sqrt(self._sum_downside_sq / len(self._trades))
+
+    @property
+    def profit_factor(self) -> Optional[float]:
+        """Gross profit over gross loss, or None without losses."""
+        if self._gross_loss <= 0:
+            return None
+        return self._gross_profit / self._gross_loss
+
+    @property
+    def expectancy(self) -> Optional[float]:
+        """Mean PnL per trade, or None if empty."""
+        if not self._trades:
+            return None
+        return self._sum_pnl / len(self._trades)
+
+    @property
+    def win_rate(self) -> Optional[float]:
+        """Winning trades as a percentage of the window, or None if empty."""
+        if not self._trades:
+            return None
+        return self._wins / len(self._trades) * 100
+
+    @property
+    def newest(self) -> Optional[List[Any]]:
+        """Most recent trade as a ``[return, pnl, won]`` list, or None if empty."""
+        if not self._trades:
+            return None
+        return list(self._trades[-1])
+
+    def to_list(self) -> List[List[Any]]:
+        """Trades in the window as ``[return, pnl, won]`` lists, oldest first."""
+        return [list(trade) for trade in self._trades]
+
+    def clear(self) -> None:
+        """Drop every trade."""
+        self._trades.clear()
+        self._evictions = 0
+        self._reset_sums()
+
+
+class HitRateTracker:
+    """Trade and win counts per signal type."""
+
+    __slots__ = ("_counts",)
+
+    def __init__(self):
+        """Initialize with no trades."""
+        self._counts: Dict[str, List[int]] = {}
+
+    def update(self, signal_type: str, won: bool) -> None:
+        """
+        Count a settled trade.
+
+        Args:
+            signal_type: Signal that opened the trade, e.g. "up"
+            won: Whether the trade won
+        """
+        counts = self._counts.setdefault(signal_type, [0, 0])
+        counts[0] += 1
+        counts[1] += won
+
+    def hit_rate(self, signal_type: str) -> Optional[float]:
+        """
+        Get the hit rate of one signal type.
+
+        Args:
+            signal_type: Signal type
+
+        Returns:
+            Winning trades as a percentage, or None if the signal never traded
+        """
+        counts = self._counts.get(signal_type)
+        if not counts:
+            return None
+        return counts[1] / counts[0] * 100
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get counts and hit rate for every signal type.
+
+        Returns:
+            Dictionary of signal type to trades, wins and hit_rate
+        """
+        return {
+            signal_type: {'trades': trades, 'wins': wins, 'hit_rate': wins / trades * 100}
+            for signal_type, (trades, wins) in self._counts.items()
+        }
+
+    def to_dict(self) -> Dict[str, List[int]]:
+        """Counts as ``{signal_type: [trades, wins]}``."""
+        return {signal_type: list(counts) for signal_type, counts in self._counts.items()}
+
+    def load(self, counts: Dict[str, List[int]]) -> None:
+        """Replace the counts with ones from to_dict()."""
+        self._counts = {signal_type: [int(trades), int(wins)] for signal_type, (trades, wins) in counts.items()}
+
+
+class CalibrationTracker:
+    """
+    Calibration of signal confidence against trade outcomes.
+
+    Confidence is read as the predicted probability that the trade wins.
+    Trades are counted into ``bins`` equal-width confidence buckets, and the
+    Brier score is kept as a running sum.
+    """
+
+    __slots__ = ("bins", "_trades", "_wins", "_confidence_sums", "_squared_error")
+
+    def __init__(self, bins: int = 10):
+        """
+        Initialize the buckets.
+
+        Args:
+            bins: Number of equal-width buckets over [0, 1]
+
+        Raises:
+            ValueError: If bins is not positive
+        """
+        if bins < 1:
+            raise ValueError(f"Bins must be positive, got {bins}")
+        self.bins = bins
+        self._trades = [0] * bins
+        self._wins = [0] * bins
+        self._confidence_sums = [0.0] * bins
+        self._squared_error = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of trades counted."""
+        return sum(self._trades)
+
+    def update(self, confidence: float, won: bool) -> None:
+        """
+        Count a settled trade.
+
+        Args:
+            confidence: Signal confidence in [0, 1]
+            won: Whether the trade won
+
+        Raises:
+            ValueError: If confidence is outside [0, 1]
+        """
+        if not 0 <= confidence <= 1:
+            raise ValueError(f"Confidence must be between 0 and 1, got {confidence}")
+        bucket = min(int(confidence * self.bins), self.bins - 1)
+        self._trades[bucket] += 1
+        self._wins[bucket] += won
+        self._confidence_sums[bucket] += confidence
+        self._squared_error += (confidence - won) ** 2
+
+    @property
+    def brier_score(self) -> Optional[float]:
+        """Mean squared error of confidence against outcome, or None if empty."""
+        count = self.count
+        if not count:
+            return None
+        return self._squared_error / count
+
+    @property
+    def expected_calibration_error(self) -> Optional[float]:
+        """Trade-weighted mean gap between confidence and hit rate per bucket, or None if empty."""
+        count = self.count
+        if not count:
+            return None
+        gap = sum(
+            abs(confidence_sum - wins)
+            for confidence_sum, wins in zip(self._confidence_sums, self._wins)
+        )
+        return gap / count
+
+    def table(self) -> List[Dict[str, Any]]:
+        """
+        Get the reliability table.
+
+        Returns:
+            One entry per non-empty bucket with its bounds, trades, mean
+            confidence and hit rate (as fractions)
+        """
+        return [
+            {
+                'lower': bucket / self.bins,
+                'upper': (bucket + 1) / self.bins,
+                'trades': trades,
+                'mean_confidence': self._confidence_sums[bucket] / trades,
+                'hit_rate': self._wins[bucket] / trades,
+            }
+            for bucket, trades in enumerate(self._trades)
+            if trades
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Bucket counts and sums as plain lists."""
+        return {
+            'trades': list(self._trades),
+            'wins': list(self._wins),
+            'confidence_sums': list(self._confidence_sums),
+            'squared_error': self._squared_error,
+        }
+
+    def load(self, data: Dict[str, Any]) -> None:
+        """
+        Replace the counts with ones from to_dict().
+
+        Raises:
+            ValueError: If the saved bucket count differs from ``bins``
+        """
+        if len(data['trades']) != self.bins:
+            raise ValueError(f"Saved calibration has {len(data['trades'])} bins, expected {self.bins}")
+        self._trades = [int(value) for value in data['trades']]
+        self._wins = [int(value) for value in data['wins']]
+        self._confidence_sums = [float(value) for value in data['confidence_sums']]
+        self._squared_error = float(data['squared_error'])
+
+
+class TradeAnalytics:
+    """
+    Performance statistics updated once per settled trade.
+
+    StateManager feeds this from update_metrics and persists it with the
+    metrics, so statistics survive restarts without replaying the trade log.
+    """
+
+    def __init__(self, window: int = 100, calibration_bins: int = 10):
+        """
+        Initialize the analytics.
+
+        Args:
+            window: Trades covered by the rolling ratios
+            calibration_bins: Confidence buckets for calibration
+        """
+        self.rolling = RollingTradeStats(window)
+        self.hit_rates = HitRateTracker()
+        self.calibration = CalibrationTracker(calibration_bins)
+        self.total_trades = 0
+
+    def record(
+        self,
+        pnl: float,
+        equity: float,
+        won: Optional[bool] = None,
+        signal_type: Optional[str] = None,
+        confidence: Optional[float] = None
+    ) -> None:
+        """
+        Add a settled trade.
+
+        Args:
+            pnl: Profit/loss for the trade
+            equity: Equity after the trade; the trade's return is pnl over
+                the equity before it (0 if that was not positive)
+            won: Whether the trade won (defaults to pnl > 0)
+            signal_type: Signal that opened the trade, counted for hit rates
+            confidence: Signal confidence in [0, 1], counted for calibration
+        """
+        pnl = float(pnl)
+        if won is None:
+            won = pnl > 0
+        equity_before = float(equity) - pnl
+        trade_return = pnl / equity_before if equity_before > 0 else 0.0
+
+        self.rolling.update(trade_return, pnl, won)
+        if signal_type is not None:
+            self.hit_rates.update(getattr(signal_type, 'value', signal_type), won)
+        if confidence is not None:
+            self.calibration.update(float(confidence), won)
+        self.total_trades += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get every statistic.
+
+        Returns:
+            Dictionary of the rolling ratios, hit rates per signal type and
+            calibration; undefined ratios are None
+        """
+        return {
+            'total_trades': self.total_trades,
+            'window_trades': len(self.rolling),
+            'sharpe_ratio': self.rolling.sharpe_ratio,
+            'sortino_ratio': self.rolling.sortino_ratio,
+            'profit_factor': self.rolling.profit_factor,
+            'expectancy': self.rolling.expectancy,
+            'rolling_win_rate': self.rolling.win_rate,
+            'hit_rates': self.hit_rates.summary(),
+            'brier_score': self.calibration.brier_score,
+            'expected_calibration_error': self.calibration.expected_calibration_error,
+            'calibration': self.calibration.table(),
+        }
+
+    def to_dict(self, window: bool = True) -> Dict[str, Any]:
+        """
+        Get the JSON-serializable state for persistence.
+
+        Args:
+            window: Include the rolling window's trades; callers that
+                persist them separately (one line per trade) pass False
+
+        Returns:
+            Dictionary accepted by load()
+        """
+        data = {
+            'total_trades': self.total_trades,
+            'hit_rates': self.hit_rates.to_dict(),
+            'calibration': self.calibration.to_dict(),
+        }
+        if window:
+            data['window'] = self.rolling.to_list()
+        return data
+
+    def load(self, data: Dict[str, Any]) -> None:
+        """
+        Replace the state with one saved by to_dict().
+
+        Args:
+            data: Saved state
+
+        Raises:
+            ValueError: If the saved state is malformed
+        """
+        try:
+            self.rolling.clear()
+            for trade_return, pnl, won in data.get('window', [])[-self.rolling.window:]:
+                self.rolling.update(float(trade_return), float(pnl), bool(won))
+            self.hit_rates.load(data.get('hit_rates', {}))
+            if 'calibration' in data:
+                self.calibration.load(data['calibration'])
+            self.total_trades = int(data.get('total_trades', len(self.rolling)))
+        except (KeyError, TypeError, ValueError) as e:
+            self.reset()
+            raise ValueError(f"Invalid analytics state: {e}")
+
+    def reset(self) -> None:
+        """Drop every trade."""
+        self.rolling.clear()
+        self.hit_rates = HitRateTracker()
+        self.calibration = CalibrationTracker(self.calibration.bins)
+        self.total_trades = 0
@@ -0,0 +1,555 @@
+"""
+Historical Backtesting Engine for Polymarket Bot.
+
+This module replays recorded 1-minute klines (and optionally Polymarket
+odds) through the bot's real decision logic:
+- PredictionEngine._evaluate_conditions for UP/DOWN/SKIP signals
+- RiskManager drawdown halting, the streamed volatility check and
+  approve_trade pre-trade checks
+- CapitalAllocator win-streak position sizing
+
+RSI and MACD are computed once over the whole series with TA-Lib, and the
+signal thresholds are applied as NumPy masks, so the sequential loop only
+visits decision points where a signal can fire. Months of 1-minute data run
+in seconds. Trades are produced as ``Trade`` models that can be written to a
+StateManager trade log and metrics file.
+"""
+
+import csv
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import talib
+
+from .capital import CapitalAllocator
+from .config import Config, get_config
+from .models import (
+    BotState,
+    BotStatus,
+    OrderSide,
+    OrderType,
+    OutcomeType,
+    SignalType,
+    Trade,
+    TradeStatus,
+)
+from .prediction import PredictionEngine
+from .risk import RiskManager
+from .state import StateManager
+
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Length of a 1-minute kline
+KLINE_INTERVAL_MS = 60_000
+
+# Binance kline CSV column positions (no header)
+_KLINE_OPEN_TIME = 0
+_KLINE_HIGH = 2
+_KLINE_LOW = 3
+_KLINE_CLOSE = 4
+_KLINE_VOLUME = 5
+_KLINE_TAKER_BUY_VOLUME = 9
+
+
+@dataclass
+class BacktestData:
+    """
+    Aligned historical series, one entry per 1-minute kline.
+
+    ``order_book_imbalance`` is the bid/ask pressure fed to the signal logic.
+    Historical order books are rarely available, so load_klines_csv derives
+    it from kline taker buy/sell volume when those columns are present.
+    ``yes_price`` is the Polymarket YES odds at each bar; 0.5 is assumed when
+    no odds are supplied. ``high`` and ``low`` feed the risk manager's ATR
+    and default to the close.
+    """
+    open_time: np.ndarray
+    close: np.ndarray
+    order_book_imbalance: Optional[np.ndarray] = None
+    yes_price: Optional[np.ndarray] = None
+    high: Optional[np.ndarray] = None
+    low: Optional[np.ndarray] = None
+
+    def __post_init__(self):
+        self.open_time = np.asarray(self.open_time, dtype=np.int64)
+        self.close = np.asarray(self.close, dtype=np.float64)
+        n = len(self.close)
+        if len(self.open_time) != n:
+            raise ValueError("open_time and close must have the same length")
+        for name in ('order_book_imbalance', 'yes_price', 'high', 'low'):
+            values = getattr(self, name)
+            if values is not None:
+                values = np.asarray(values, dtype=np.float64)
+                if len(values) != n:
+                    raise ValueError(f"{name} must have one value per kline")
+                setattr(self, name, values)
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def with_odds(self, timestamps: np.ndarray, yes_prices: np.ndarray) -> "BacktestData":
+        """
+        Attach Polymarket odds, using the latest quote at or before each bar.
+
+        Bars before the first quote get 0.5.
+
+        Args:
+            timestamps: Quote times in ms since epoch, ascending
+            yes_prices: YES price of each quote
+
+        Returns:
+            New BacktestData with ``yes_price`` set
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        yes_prices = np.asarray(yes_prices, dtype=np.float64)
+        index = np.searchsorted(timestamps, self.open_time, side='right') - 1
+        aligned = np.where(index >= 0, yes_prices[np.clip(index, 0, None)], 0.5)
+        return BacktestData(self.open_time, self.close, self.order_book_imbalance, aligned, self.high, self.low)
+
+
+def load_klines_csv(path: Union[str, Path]) -> BacktestData:
+    """
+    Load klines from a CSV file.
+
+    Accepts Binance's kline export format (no header, open time in column 0,
+    high/low in columns 2 and 3, close in column 4, volume in column 5, taker
+    buy volume in column 9) or a CSV with a header containing ``open_time``
+    and ``close`` and optionally ``high``, ``low``, ``volume`` and
+    ``taker_buy_volume``.
+
+    Args:
+        path: CSV file path
+
+    Returns:
+        BacktestData, with order book imbalance derived from taker volume
+        when available
+
+    Raises:
+        ValueError: If the file has no usable rows
+    """
+    with open(path, newline='') as f:
+        rows = [row for row in csv.reader(f) if row]
+    if not rows:
+        raise ValueError(f"No klines in {path}")
+
+    header = rows[0]
+    if not header[0].strip().lstrip('-').isdigit():
+        columns = {name.strip(): i for i, name in enumerate(header)}
+        rows = rows[1:]
+        open_col, close_col = columns['open_time'], columns['close']
+        high_col, low_col = columns.get('high'), columns.get('low')
+        volume_col = columns.get('volume')
+        taker_col = columns.get('taker_buy_volume')
+    else:
+        open_col, close_col = _KLINE_OPEN_TIME, _KLINE_CLOSE
+        high_col, low_col = _KLINE_HIGH, _KLINE_LOW
+        volume_col = _KLINE_VOLUME if len(header) > _KLINE_TAKER_BUY_VOLUME else None
+        taker_col = _KLINE_TAKER_BUY_VOLUME if volume_col is not None else None
+
+    table = np.array(rows, dtype=object)
+    open_time = table[:, open_col].astype(np.float64).astype(np.int64)
+    close = table[:, close_col].astype(np.float64)
+    high = table[:, high_col].astype(np.float64) if high_col is not None else None
+    low = table[:, low_col].astype(np.float64) if low_col is not None else None
+
+    imbalance = None
+    if volume_col is not None and taker_col is not None:
+        buy = table[:, taker_col].astype(np.float64)
+        sell = table[:, volume_col].astype(np.float64) - buy
+        imbalance = np.divide(buy, sell, out=np.ones_like(buy), where=sell > 0)
+
+    return BacktestData(open_time, close, imbalance, high=high, low=low)
+
+
+def load_odds_csv(path: Union[str, Path]) -> tuple:
+    """
+    Load Polymarket odds from a CSV with ``timestamp`` (ms) and ``yes_price`` columns.
+
+    Args:
+        path: CSV file path
+
+    Returns:
+        Tuple of (timestamps, yes_prices) arrays sorted by time
+    """
+    with open(path, newline='') as f:
+        records = list(csv.DictReader(f))
+    timestamps = np.array([int(float(r['timestamp'])) for r in records], dtype=np.int64)
+    yes_prices = np.array([float(r['yes_price']) for r in records], dtype=np.float64)
+    order = np.argsort(timestamps, kind='stable')
+    return timestamps[order], yes_prices[order]
+
+
+@dataclass
+class BacktestResult:
+    """Outcome of a backtest run."""
+    trades: List[Trade]
+    equity_curve: List[Decimal]
+    starting_capital: Decimal
+    decision_points: int
+    signals: int
+    rejected: int
+    halted: bool = False
+    halt_reason: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def final_capital(self) -> Decimal:
+        """Capital after the last trade."""
+        return self.equity_curve[-1]
+
+    @property
+    def total_pnl(self) -> Decimal:
+        """Sum of trade PnL."""
+        return self.final_capital - self.starting_capital
+
+    @property
+    def winning_trades(self) -> int:
+        """Number of winning trades."""
+        return sum(1 for trade in self.trades if trade.metadata['result'] == 'win')
+
+    @property
+    def win_rate(self) -> float:
+        """Winning trades as a percentage of all trades."""
+        return self.winning_trades / len(self.trades) * 100 if self.trades else 0.0
+
+    @property
+    def max_drawdown(self) -> Decimal:
+        """Largest peak-to-trough equity decline as a fraction (StateManager convention)."""
+        peak = self.starting_capital
+        worst = Decimal("0")
+        for equity in self.equity_curve:
+            peak = max(peak, equity)
+            worst = max(worst, (peak - equity) / peak)
+        return worst
+
+    def write_to(self, state_manager: StateManager) -> None:
+        """
+        Write trades and metrics through a StateManager.
+
+        Appends every trade to the trade log, updates the metrics trade by
+        trade as the live bot does, and saves the metrics file.
+
+        Args:
+            state_manager: Destination state manager
+        """
+        for trade, before, after in zip(self.trades, self.equity_curve, self.equity_curve[1:]):
+            state_manager.log_trade(trade)
+            state_manager.update_metrics(
+                trade_result=trade.metadata['result'],
+                pnl=after - before,
+                current_equity=after,
+                signal_type=trade.metadata['signal'],
+                confidence=trade.metadata['confidence']
+            )
+        state_manager.save_metrics()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get headline statistics.
+
+        Returns:
+            Dictionary of trade counts, PnL, win rate and drawdown
+        """
+        return {
+            'decision_points': self.decision_points,
+            'signals': self.signals,
+            'rejected': self.rejected,
+            'total_trades': len(self.trades),
+            'winning_trades': self.winning_trades,
+            'win_rate': self.win_rate,
+            'starting_capital': float(self.starting_capital),
+            'final_capital': float(self.final_capital),
+            'total_pnl': float(self.total_pnl),
+            'max_drawdown': float(self.max_drawdown),
+            'halted': self.halted,
+            'halt_reason': self.halt_reason,
+        }
+
+
+class Backtester:
+    """
+    Replays history through the bot's signal, risk and sizing logic.
+
+    A decision is taken every ``cycle_bars`` klines (5 for the live bot's
+    5-minute cycle). A trade on a decision at bar ``i`` buys the YES (UP) or
+    NO (DOWN) outcome at that bar's odds and settles at bar ``i +
+    horizon_bars``: UP wins if the close rose, DOWN wins if it fell. As in
+    the live loop, no new decision is taken while a trade is unsettled, and
+    the run halts when the drawdown limit is breached.
+
+    Volatility is checked the way the live bot does it: klines are streamed
+    into the risk manager with update_market and check_volatility() reads
+    the rolling state. Only the klines inside the risk manager's volatility
+    window before each decision are streamed, because older ones would
+    expire before the check reads the state.
+    """
+
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        risk_manager: Optional[RiskManager] = None,
+        capital_allocator: Optional[CapitalAllocator] = None,
+        starting_capital: Decimal = Decimal("100.0"),
+        cycle_bars: int = 5,
+        horizon_bars: int = 5,
+        fee_rate: Decimal = Decimal("0")
+    ):
+        """
+        Initialize the backtester.
+
+        Args:
+            config: Configuration for indicator periods and thresholds. If None, loads from environment.
+            risk_manager: Risk manager (default: RiskManager with starting_capital)
+            capital_allocator: Position sizer (default: CapitalAllocator())
+            starting_capital: Capital at the start of the run
+            cycle_bars: Klines between decision points
+            horizon_bars: Klines from entry to settlement
+            fee_rate: Fee charged on each position, as a fraction of its size
+
+        Raises:
+            ValueError: If cycle_bars or horizon_bars is not positive
+        """
+        if cycle_bars < 1 or horizon_bars < 1:
+            raise ValueError("cycle_bars and horizon_bars must be positive")
+        self.config = config if config else get_config()
+        self.prediction_engine = PredictionEngine(self.config)
+        self.risk_manager = risk_manager or RiskManager(starting_capital=starting_capital)
+        self.capital_allocator = capital_allocator or CapitalAllocator()
+        self.starting_capital = starting_capital
+        self.cycle_bars = cycle_bars
+        self.horizon_bars = horizon_bars
+        self.fee_rate = fee_rate
+
+    def compute_indicators(self, close: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Compute RSI and MACD over the whole series.
+
+        Args:
+            close: Closing prices
+
+        Returns:
+            Dictionary with ``rsi``, ``macd_line`` and ``macd_signal`` arrays
+            (NaN during warm-up)
+        """
+        rsi = talib.RSI(close, timeperiod=self.config.rsi_period)
+        macd_line, macd_signal, _ = talib.MACD(
+            close,
+            fastperiod=self.config.macd_fast_period,
+            slowperiod=self.config.macd_slow_period,
+            signalperiod=self.config.macd_signal_period
+        )
+        return {'rsi': rsi, 'macd_line': macd_line, 'macd_signal': macd_signal}
+
+    def candidate_bars(self, data: BacktestData, indicators: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Find decision bars where an UP or DOWN signal can fire.
+
+        Applies the same thresholds as PredictionEngine._evaluate_conditions
+        as array masks; the loop re-evaluates each candidate with the real
+        method.
+
+        Args:
+            data: Historical series
+            indicators: Output of compute_indicators
+
+        Returns:
+            Ascending bar indices
+        """
+        rsi, macd, signal = indicators['rsi'], indicators['macd_line'], indicators['macd_signal']
+        imbalance = self._imbalance(data)
+        cfg = self.config
+
+        up = (rsi < cfg.rsi_oversold_threshold) & (macd > signal) & (imbalance > cfg.order_book_bullish_threshold)
+        down = (rsi > cfg.rsi_overbought_threshold) & (macd < signal) & (imbalance < cfg.order_book_bearish_threshold)
+
+        bars = np.arange(len(data))
+        decision = (bars % self.cycle_bars == 0) & (bars + self.horizon_bars < len(data))
+        ready = ~(np.isnan(rsi) | np.isnan(macd) | np.isnan(signal))
+        return np.flatnonzero(decision & ready & (up | down))
+
+    def _imbalance(self, data: BacktestData) -> np.ndarray:
+        if data.order_book_imbalance is not None:
+            return data.order_book_imbalance
+        logger.warning("No order book imbalance series; using neutral 1.0 (signals cannot fire)")
+        return np.ones(len(data))
+
+    def _stream_market(self, data: BacktestData, close_times: np.ndarray, start: int, bar: int) -> None:
+        """
+        Stream the klines up to ``bar`` that can still be in the volatility window.
+
+        Args:
+            data: Historical series
+            close_times: Kline close times in seconds
+            start: First bar not streamed yet
+            bar: Decision bar (streamed last)
+        """
+        window_start = close_times[bar] - self.risk_manager.market_risk.window_seconds
+        first = max(start, int(np.searchsorted(close_times, window_start, side='right')))
+        for j in range(first, bar + 1):
+            self.risk_manager.update_market(
+                float(data.close[j]),
+                float(close_times[j]),
+                high=None if data.high is None else float(data.high[j]),
+                low=None if data.low is None else float(data.low[j])
+            )
+
+    def run(self, data: BacktestData, indicators: Optional[Dict[str, np.ndarray]] = None) -> BacktestResult:
+        """
+        Run the backtest.
+
+        Args:
+            data: Historical series
+            indicators: Precomputed output of compute_indicators for this
+                series and config, to share between runs that differ only
+                in thresholds or risk settings
+
+        Returns:
+            BacktestResult with trades, equity curve and statistics
+        """
+        if indicators is None:
+            indicators = self.compute_indicators(data.close)
+        candidates = self.candidate_bars(data, indicators)
+        imbalance = self._imbalance(data)
+        yes_price = data.yes_price if data.yes_price is not None else np.full(len(data), 0.5)
+
+        self.risk_manager.reset(self.starting_capital)
+        close_times = (data.open_time + KLINE_INTERVAL_MS) / 1000
+        streamed = 0
+        bot_state = BotState(
+            bot_id="backtest",
+            status=BotStatus.RUNNING,
+            strategy_name="rsi_macd_momentum",
+            max_position_size=self.capital_allocator.max_size,
+            max_total_exposure=self.capital_allocator.max_size,
+            risk_per_trade=self.capital_allocator.base_size
+        )
+
+        capital = self.starting_capital
+        equity_curve = [capital]
+        trades: List[Trade] = []
+        win_streak = 0
+        signals = rejected = 0
+        halted, halt_reason = False, None
+        next_free_bar = 0
+
+        for i in candidates:
+            if i < next_free_bar:
+                continue
+
+            signal_type, confidence, reasoning = self.prediction_engine._evaluate_conditions(
+                float(indicators['rsi'][i]),
+                float(indicators['macd_line'][i]),
+                float(indicators['macd_signal'][i]),
+                float(imbalance[i])
+            )
+            if signal_type == SignalType.SKIP:
+                continue
+            signals += 1
+
+            drawdown_ok, drawdown = self.risk_manager.check_drawdown(capital, self.risk_manager.peak_capital)
+            if not drawdown_ok:
+                halted, halt_reason = True, f"Maximum drawdown breached ({drawdown:.2f}%)"
+                break
+
+            self._stream_market(data, close_times, streamed, i)
+            streamed = i + 1
+            volatility_ok, _ = self.risk_manager.check_volatility()
+            approval = self.risk_manager.approve_trade(bot_state)
+            if not (volatility_ok and approval.approved):
+                rejected += 1
+                continue
+
+            size = self.capital_allocator.calculate_position_size(win_streak, capital)
+            price = yes_price[i] if signal_type == SignalType.UP else 1.0 - yes_price[i]
+            if not 0 < price < 1:
+                rejected += 1
+                continue
+
+            exit_bar = i + self.horizon_bars
+            move = data.close[exit_bar] - data.close[i]
+            won = move > 0 if signal_type == SignalType.UP else move < 0
+            entry = Decimal(str(round(float(price), 6)))
+            fee = size * self.fee_rate
+            pnl = (size * (1 / entry - 1) if won else -size) - fee
+
+            capital += pnl
+            equity_curve.append(capital)
+            bot_state.total_pnl += pnl
+            bot_state.total_trades += 1
+            self.risk_manager.update_peak_capital(capital)
+            if won:
+                win_streak += 1
+                bot_state.winning_trades += 1
+            else:
+                win_streak = 0
+
+            trades.append(self._make_trade(
+                len(trades) + 1, data, i, exit_bar, signal_type, confidence, reasoning, entry, size, fee, pnl, won
+            ))
+            next_free_bar = exit_bar
+
+        result = BacktestResult(
+            trades=trades,
+            equity_curve=equity_curve,
+            starting_capital=self.starting_capital,
+            decision_points=int(np.count_nonzero(np.arange(len(data)) % self.cycle_bars == 0)),
+            signals=signals,
+            rejected=rejected,
+            halted=halted,
+            halt_reason=halt_reason,
+            metadata={'bars': len(data), 'candidates': len(candidates)}
+        )
+        logger.info(f"Backtest complete: {result.summary()}")
+        return result
+
+    def _make_trade(
+        self,
+        number: int,
+        data: BacktestData,
+        entry_bar: int,
+        exit_bar: int,
+        signal_type: SignalType,
+        confidence: float,
+        reasoning: str,
+        price: Decimal,
+        size: Decimal,
+        fee: Decimal,
+        pnl: Decimal,
+        won: bool
+    ) -> Trade:
+        entry_time = datetime.fromtimestamp(data.open_time[entry_bar] / 1000, tz=timezone.utc)
+        exit_time = datetime.fromtimestamp(data.open_time[exit_bar] / 1000, tz=timezone.utc)
+        quantity = (size / price).quantize(Decimal("0.000001"))
+        return Trade(
+            trade_id=f"backtest_{number}",
+            market_id="backtest",
+            order_id=f"backtest_order_{number}",
+            side=OrderSide.BUY,
+            order_type=OrderType.MARKET,
+            outcome=OutcomeType.YES if signal_type == SignalType.UP else OutcomeType.NO,
+            price=price,
+            quantity=quantity,
+            filled_quantity=quantity,
+            status=TradeStatus.EXECUTED,
+            created_at=entry_time,
+            executed_at=entry_time,
+            fee=fee,
+            metadata={
+                'signal': signal_type.value,
+                'confidence': confidence,
+                'reasoning': reasoning,
+                'position_size': float(size),
+                'btc_entry': float(data.close[entry_bar]),
+                'btc_exit': float(data.close[exit_bar]),
+                'settled_at': exit_time.isoformat(),
+                'result': 'win' if won else 'loss',
+                'pnl': float(pnl),
+            }
+        )
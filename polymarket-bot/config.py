@@ -10,6 +10,9 @@ import sys
 from typing import Optional
 from dotenv import load_dotenv
 
+# Binance WebSocket endpoint; streams are opened at <url>/<stream name>
+BINANCE_WS_URL = "wss://stream.binance.com:9443/ws"
+
 
 class ConfigurationError(Exception):
     """Raised when required configuration is missing or invalid."""
@@ -61,6 +64,7 @@ class Config:
             'BINANCE_BASE_URL',
             'https://api.binance.com'
         )
+        self.binance_ws_url = self._get_env('BINANCE_WS_URL', BINANCE_WS_URL)
         self.coingecko_base_url = self._get_env(
             'COINGECKO_BASE_URL',
             'https://api.coingecko.com/api/v3'
@@ -96,14 +100,31 @@ class Config:
         self.execution_settlement_poll_interval = self._get_int_env('EXECUTION_SETTLEMENT_POLL_INTERVAL', 10)
         self.execution_settlement_timeout = self._get_int_env('EXECUTION_SETTLEMENT_TIMEOUT', 300)
 
+        # Per-cycle data fetch deadlines (seconds from cycle start)
+        self.order_book_fetch_deadline = self._get_float_env('ORDER_BOOK_FETCH_DEADLINE', 3.0)
+        self.market_fetch_deadline = self._get_float_env('MARKET_FETCH_DEADLINE', 8.0)
+
+        # Market catalogue cache (seconds)
+        self.market_cache_ttl = self._get_float_env('MARKET_CACHE_TTL', 30.0)
+        self.market_cache_max_stale = self._get_float_env('MARKET_CACHE_MAX_STALE', 300.0)
+
         # Orchestrator configuration with defaults
         self.starting_capital = self._get_float_env('STARTING_CAPITAL', 100.0)
         self.base_position_size = self._get_float_env('BASE_POSITION_SIZE', 5.0)
         self.max_drawdown = self._get_float_env('MAX_DRAWDOWN', 0.30)
         self.max_volatility = self._get_float_env('MAX_VOLATILITY', 0.03)
         self.max_total_exposure = self._get_float_env('MAX_TOTAL_EXPOSURE', 50.0)
+        self.max_market_exposure = self._get_float_env('MAX_MARKET_EXPOSURE', 25.0)
+        self.max_concurrent_markets = self._get_int_env('MAX_CONCURRENT_MARKETS', 1)
         self.state_dir = self._get_env('STATE_DIR', 'data')
 
+        # Tick recording (disabled when empty)
+        self.tick_record_dir = self._get_env('TICK_RECORD_DIR', '')
+
+        # Prometheus metrics endpoint (disabled when the port is 0)
+        self.metrics_host = self._get_env('METRICS_HOST', '127.0.0.1')
+        self.metrics_port = self._get_int_env('METRICS_PORT', 0)
+
         # Validate numeric ranges
         self._validate_ranges()
 
@@ -294,6 +315,28 @@ class Config:
                 f"EXECUTION_SETTLEMENT_TIMEOUT must be greater than 0, got: {self.execution_settlement_timeout}"
             )
 
+        # Validate data fetch deadlines
+        if self.order_book_fetch_deadline <= 0:
+            raise ConfigurationError(
+                f"ORDER_BOOK_FETCH_DEADLINE must be greater than 0, got: {self.order_book_fetch_deadline}"
+            )
+
+        if self.market_fetch_deadline <= 0:
+            raise ConfigurationError(
+                f"MARKET_FETCH_DEADLINE must be greater than 0, got: {self.market_fetch_deadline}"
+            )
+
+        # Validate market catalogue cache
+        if self.market_cache_ttl <= 0:
+            raise ConfigurationError(
+                f"MARKET_CACHE_TTL must be greater than 0, got: {self.market_cache_ttl}"
+            )
+
+        if self.market_cache_max_stale < 0:
+            raise ConfigurationError(
+                f"MARKET_CACHE_MAX_STALE must be non-negative, got: {self.market_cache_max_stale}"
+            )
+
         # Validate orchestrator parameters
         if self.starting_capital <= 0:
             raise ConfigurationError(
@@ -321,6 +364,22 @@ class Config:
                 f"got: {self.max_total_exposure} < {self.base_position_size}"
             )
 
+        if self.max_market_exposure < self.base_position_size:
+            raise ConfigurationError(
+                f"MAX_MARKET_EXPOSURE must be at least BASE_POSITION_SIZE, "
+                f"got: {self.max_market_exposure} < {self.base_position_size}"
+            )
+
+        if self.max_concurrent_markets < 1:
+            raise ConfigurationError(
+                f"MAX_CONCURRENT_MARKETS must be at least 1, got: {self.max_concurrent_markets}"
+            )
+
+        if not 0 <= self.metrics_port <= 65535:
+            raise ConfigurationError(
+                f"METRICS_PORT must be between 0 and 65535, got: {self.metrics_port}"
+            )
+
     def __repr__(self) -> str:
         """Return a safe string representation (without exposing secrets)."""
         return (
@@ -17,12 +17,10 @@ import logging
 import time
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 from enum import Enum
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import httpx
 
 from polymarket_bot.models import (
     Trade,
@@ -34,6 +32,7 @@ from polymarket_bot.models import (
     PositionStatus
 )
 from polymarket_bot.config import Config, get_config
+from polymarket_bot.transport import TransportSession, get_transport
 from polymarket_bot.utils import (
     retry_with_backoff,
     validate_non_empty,
@@ -106,7 +105,7 @@ class ExecutionEngine:
         self.api_key = self.config.polymarket_api_key
         self.api_secret = self.config.polymarket_api_secret
 
-        # Configure session with connection pooling and retries at transport level
+        # Session over the shared connection pool
         self.session = self._create_session()
 
         # Execution settings from config or defaults
@@ -120,37 +119,26 @@ class ExecutionEngine:
             f"max_retries={self.max_retries}, retry_base_delay={self.retry_base_delay}s"
         )
 
-    def _create_session(self) -> requests.Session:
+    def _create_session(self) -> TransportSession:
         """
-        Create a requests session with retry logic and connection pooling.
+        Create a session on the shared HTTP transport.
+
+        The transport retries failed connection attempts and pools
+        keep-alive connections per host; application-level retries
+        (4xx, 5xx) are handled by @retry_with_backoff.
 
         Returns:
-            Configured requests.Session instance
+            TransportSession with the API headers and order endpoint policy
         """
-        session = requests.Session()
-
-        # Configure retry strategy for transport-level errors (connection, timeout)
-        # Note: Application-level retries (4xx, 5xx) are handled by @retry_with_backoff
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504],  # Retry on server errors
-            allowed_methods=["GET", "POST", "PUT", "DELETE"]
+        return get_transport().session(
+            headers={
+                "Content-Type": "application/json",
+                "User-Agent": "PolymarketBot/1.0",
+                "Authorization": f"Bearer {self.api_key}"
+            },
+            endpoint='polymarket.orders'
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=10, pool_maxsize=20)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        # Set default headers
-        session.headers.update({
-            "Content-Type": "application/json",
-            "User-Agent": "PolymarketBot/1.0",
-            "Authorization": f"Bearer {self.api_key}"
-        })
-
-        return session
-
     def _make_request(
         self,
         method: str,
@@ -180,8 +168,7 @@ class ExecutionEngine:
                 method=method.upper(),
                 url=url,
                 json=data,
-                params=params,
-                timeout=30
+                params=params
             )
 
             # Log request details
@@ -191,7 +178,7 @@ class ExecutionEngine:
             )
 
             # Check for HTTP errors
-            if not response.ok:
+            if not response.is_success:
                 error_data = {}
                 try:
                     error_data = response.json()
@@ -220,18 +207,18 @@ class ExecutionEngine:
 
             return response_data
 
-        except requests.exceptions.Timeout as e:
+        except httpx.TimeoutException as e:
             raise PolymarketAPIError(f"Request timeout: {str(e)}") from e
-        except requests.exceptions.ConnectionError as e:
+        except httpx.TransportError as e:
             raise PolymarketAPIError(f"Connection error: {str(e)}") from e
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise PolymarketAPIError(f"Request error: {str(e)}") from e
 
     @retry_with_backoff(
         max_attempts=3,
         base_delay=2.0,
         exponential_base=2.0,
-        exceptions=(PolymarketAPIError, requests.exceptions.RequestException)
+        exceptions=(PolymarketAPIError, httpx.HTTPError)
     )
     def submit_order(
         self,
@@ -364,7 +351,7 @@ class ExecutionEngine:
         max_attempts=3,
         base_delay=1.0,
         exponential_base=2.0,
-        exceptions=(PolymarketAPIError, requests.exceptions.RequestException)
+        exceptions=(PolymarketAPIError, httpx.HTTPError)
     )
     def get_order_status(self, order_id: str) -> Dict[str, Any]:
         """
@@ -700,6 +687,24 @@ class PolymarketAPIClient:
 
         return order
 
+    def get_order_statuses(self, order_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the current status of several orders in one request.
+
+        Args:
+            order_ids: Order IDs to check
+
+        Returns:
+            Dictionary mapping each found order ID to its status data;
+            unknown IDs are omitted
+        """
+        # Mock implementation - in production, this would be one HTTP GET with the IDs as a filter
+        return {
+            order_id: self.get_order_status(order_id)
+            for order_id in order_ids
+            if order_id in self._mock_orders
+        }
+
     def get_market_resolution(self, market_id: str) -> Optional[str]:
         """
         Get the resolution outcome for a market.
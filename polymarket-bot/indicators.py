@@ -0,0 +1,432 @@
+"""
+Streaming Technical Indicators for Polymarket Bot.
+
+This module provides incremental RSI and MACD calculators that update in
+O(1) per closed kline instead of re-running TA-Lib over the whole price
+buffer on every read:
+- StreamingEMA: exponential moving average seeded with an SMA
+- StreamingRSI: Wilder-smoothed Relative Strength Index
+- StreamingMACD: fast/slow EMA difference with an EMA signal line
+- IndicatorEngine: RSI + MACD fed from the Binance kline stream
+
+Values match TA-Lib's RSI and MACD run over the same series from its first
+price (including TA-Lib's seeding of the fast EMA at the slow EMA's first
+output). Prices of the kline still in progress can be supplied as
+provisional updates: they are reflected in reads without being committed
+to the smoothing state, so the next closed kline replaces them.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from .config import Config, get_config
+
+
+class StreamingEMA:
+    """
+    Exponential moving average with TA-Lib compatible SMA seeding.
+
+    The first value is the simple average of the first ``period`` inputs;
+    later values use smoothing factor ``2 / (period + 1)``.
+    """
+
+    __slots__ = ("period", "alpha", "value", "_seed_sum", "_seed_count")
+
+    def __init__(self, period: int):
+        """
+        Initialize the EMA.
+
+        Args:
+            period: EMA period
+
+        Raises:
+            ValueError: If period is less than 1
+        """
+        if period < 1:
+            raise ValueError(f"EMA period must be at least 1, got {period}")
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.value: Optional[float] = None
+        self._seed_sum = 0.0
+        self._seed_count = 0
+
+    @property
+    def ready(self) -> bool:
+        """Whether the EMA has produced its first value."""
+        return self.value is not None
+
+    def seed(self, value: float) -> None:
+        """
+        Start the EMA from an externally computed seed value.
+
+        Args:
+            value: Initial EMA value
+        """
+        self.value = value
+        self._seed_count = self.period
+
+    def update(self, price: float) -> Optional[float]:
+        """
+        Add a committed input.
+
+        Args:
+            price: New input value
+
+        Returns:
+            Current EMA value, or None while still seeding
+        """
+        if self.value is None:
+            self._seed_sum += price
+            self._seed_count += 1
+            if self._seed_count == self.period:
+                self.value = self._seed_sum / self.period
+            return self.value
+        self.value += self.alpha * (price - self.value)
+        return self.value
+
+    def peek(self, price: float) -> Optional[float]:
+        """
+        Get the EMA value if ``price`` were committed, without committing it.
+
+        Args:
+            price: Provisional input value
+
+        Returns:
+            Provisional EMA value, or None while still seeding
+        """
+        if self.value is None:
+            if self._seed_count + 1 == self.period:
+                return (self._seed_sum + price) / self.period
+            return None
+        return self.value + self.alpha * (price - self.value)
+
+
+class StreamingRSI:
+    """
+    Relative Strength Index with Wilder smoothing, updated per closed price.
+
+    The first value is produced after ``period + 1`` prices, from the simple
+    averages of the first ``period`` gains and losses.
+    """
+
+    __slots__ = ("period", "avg_gain", "avg_loss", "_last_price", "_seed_gain", "_seed_loss", "_seed_count")
+
+    def __init__(self, period: int = 14):
+        """
+        Initialize the RSI.
+
+        Args:
+            period: RSI period
+
+        Raises:
+            ValueError: If period is less than 2
+        """
+        if period < 2:
+            raise ValueError(f"RSI period must be at least 2, got {period}")
+        self.period = period
+        self.avg_gain: Optional[float] = None
+        self.avg_loss: Optional[float] = None
+        self._last_price: Optional[float] = None
+        self._seed_gain = 0.0
+        self._seed_loss = 0.0
+        self._seed_count = 0
+
+    @property
+    def ready(self) -> bool:
+        """Whether the RSI has produced its first value."""
+        return self.avg_gain is not None
+
+    @property
+    def value(self) -> Optional[float]:
+        """Current RSI value (0-100), or None while still seeding."""
+        if self.avg_gain is None:
+            return None
+        return self._rsi(self.avg_gain, self.avg_loss)
+
+    @staticmethod
+    def _rsi(avg_gain: float, avg_loss: float) -> float:
+        total = avg_gain + avg_loss
+        # TA-Lib reports 0 for a perfectly flat window
+        return 100.0 * avg_gain / total if total != 0 else 0.0
+
+    def _smoothed(self, price: float) -> Optional[Tuple[float, float]]:
+        """Average gain and loss after ``price``, without committing."""
+        change = price - self._last_price
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        if self.avg_gain is not None:
+            keep = self.period - 1
+            return ((self.avg_gain * keep + gain) / self.period,
+                    (self.avg_loss * keep + loss) / self.period)
+        if self._seed_count + 1 == self.period:
+            return (self._seed_gain + gain) / self.period, (self._seed_loss + loss) / self.period
+        return None
+
+    def update(self, price: float) -> Optional[float]:
+        """
+        Add a closed price.
+
+        Args:
+            price: Closing price
+
+        Returns:
+            Current RSI value, or None while still seeding
+        """
+        if self._last_price is None:
+            self._last_price = price
+            return None
+
+        smoothed = self._smoothed(price)
+        if smoothed is not None:
+            self.avg_gain, self.avg_loss = smoothed
+        else:
+            change = price - self._last_price
+            if change > 0:
+                self._seed_gain += change
+            else:
+                self._seed_loss -= change
+            self._seed_count += 1
+        self._last_price = price
+        return self.value
+
+    def peek(self, price: float) -> Optional[float]:
+        """
+        Get the RSI value if ``price`` were committed, without committing it.
+
+        Args:
+            price: Provisional closing price
+
+        Returns:
+            Provisional RSI value, or None while still seeding
+        """
+        if self._last_price is None:
+            return None
+        smoothed = self._smoothed(price)
+        return self._rsi(*smoothed) if smoothed is not None else None
+
+
+class StreamingMACD:
+    """
+    MACD line and signal line, updated per closed price.
+
+    Matches TA-Lib's MACD: both EMAs start at the slow EMA's first output,
+    with the fast EMA seeded from the last ``fast_period`` prices of that
+    window. The signal line is an EMA of the MACD line.
+    """
+
+    __slots__ = ("fast_period", "slow_period", "signal_period", "fast", "slow", "signal",
+                 "macd", "_window")
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        """
+        Initialize the MACD.
+
+        Args:
+            fast_period: Fast EMA period
+            slow_period: Slow EMA period
+            signal_period: Signal line EMA period
+
+        Raises:
+            ValueError: If periods are invalid
+        """
+        if fast_period < 1 or signal_period < 1:
+            raise ValueError("MACD periods must be at least 1")
+        if slow_period <= fast_period:
+            raise ValueError(
+                f"MACD slow period ({slow_period}) must be greater than fast period ({fast_period})"
+            )
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+        self.fast = StreamingEMA(fast_period)
+        self.slow = StreamingEMA(slow_period)
+        self.signal = StreamingEMA(signal_period)
+        self.macd: Optional[float] = None
+        # Warm-up prices, discarded once both EMAs are seeded
+        self._window: Optional[List[float]] = []
+
+    @property
+    def ready(self) -> bool:
+        """Whether both the MACD line and the signal line are available."""
+        return self.signal.ready
+
+    @property
+    def value(self) -> Optional[Tuple[float, float]]:
+        """Current (macd_line, signal_line), or None while still seeding."""
+        if not self.signal.ready:
+            return None
+        return self.macd, self.signal.value
+
+    def update(self, price: float) -> Optional[Tuple[float, float]]:
+        """
+        Add a closed price.
+
+        Args:
+            price: Closing price
+
+        Returns:
+            Current (macd_line, signal_line), or None while still seeding
+        """
+        if self._window is not None:
+            self._window.append(price)
+            if len(self._window) < self.slow_period:
+                return None
+            self.slow.seed(sum(self._window) / self.slow_period)
+            self.fast.seed(sum(self._window[-self.fast_period:]) / self.fast_period)
+            self._window = None
+        else:
+            self.fast.update(price)
+            self.slow.update(price)
+
+        self.macd = self.fast.value - self.slow.value
+        self.signal.update(self.macd)
+        return self.value
+
+    def peek(self, price: float) -> Optional[Tuple[float, float]]:
+        """
+        Get (macd_line, signal_line) if ``price`` were committed, without committing it.
+
+        Args:
+            price: Provisional closing price
+
+        Returns:
+            Provisional (macd_line, signal_line), or None while still seeding
+        """
+        if self._window is not None:
+            # Seeding needs the full window; one more price only helps if it completes it
+            if len(self._window) + 1 < self.slow_period or self.signal_period > 1:
+                return None
+            window = self._window + [price]
+            macd = sum(window[-self.fast_period:]) / self.fast_period - sum(window) / self.slow_period
+            return macd, macd
+        macd = self.fast.peek(price) - self.slow.peek(price)
+        signal = self.signal.peek(macd)
+        if signal is None:
+            return None
+        return macd, signal
+
+
+@dataclass(frozen=True)
+class IndicatorSnapshot:
+    """Point-in-time indicator values read from an IndicatorEngine."""
+    rsi: Optional[float]
+    macd_line: Optional[float]
+    macd_signal: Optional[float]
+    closed_count: int
+    provisional: bool
+
+    @property
+    def ready(self) -> bool:
+        """Whether RSI and both MACD lines are available."""
+        return self.rsi is not None and self.macd_line is not None and self.macd_signal is not None
+
+
+class IndicatorEngine:
+    """
+    Incremental RSI and MACD state fed by kline updates.
+
+    Closed klines are committed to the smoothing state in O(1). Updates for
+    the kline still in progress are held as a provisional price and applied
+    on read, so indicators can be read at any moment without recomputation.
+    Thread-safe: the WebSocket thread writes while the trading loop reads.
+    """
+
+    def __init__(
+        self,
+        rsi_period: int = 14,
+        macd_fast_period: int = 12,
+        macd_slow_period: int = 26,
+        macd_signal_period: int = 9
+    ):
+        """
+        Initialize the indicator engine.
+
+        Args:
+            rsi_period: RSI period
+            macd_fast_period: MACD fast EMA period
+            macd_slow_period: MACD slow EMA period
+            macd_signal_period: MACD signal EMA period
+        """
+        self.rsi = StreamingRSI(rsi_period)
+        self.macd = StreamingMACD(macd_fast_period, macd_slow_period, macd_signal_period)
+        self.closed_count = 0
+        self._pending: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Optional[Config] = None) -> "IndicatorEngine":
+        """
+        Create an engine using the configured indicator periods.
+
+        Args:
+            config: Configuration object. If None, loads from environment.
+
+        Returns:
+            IndicatorEngine instance
+        """
+        cfg = config if config else get_config()
+        return cls(
+            rsi_period=cfg.rsi_period,
+            macd_fast_period=cfg.macd_fast_period,
+            macd_slow_period=cfg.macd_slow_period,
+            macd_signal_period=cfg.macd_signal_period
+        )
+
+    @property
+    def warmup_period(self) -> int:
+        """Number of closed klines needed before all indicators are available."""
+        return max(
+            self.rsi.period + 1,
+            self.macd.slow_period + self.macd.signal_period - 1
+        )
+
+    @property
+    def ready(self) -> bool:
+        """Whether all indicators are available from closed klines."""
+        with self._lock:
+            return self.rsi.ready and self.macd.ready
+
+    def update(self, price: float, closed: bool = True) -> None:
+        """
+        Feed a kline close price.
+
+        Args:
+            price: Kline close price
+            closed: True if the kline is final (Binance ``k.x``); False for
+                an update of the kline still in progress
+        """
+        with self._lock:
+            if closed:
+                self.rsi.update(price)
+                self.macd.update(price)
+                self.closed_count += 1
+                self._pending = None
+            else:
+                self._pending = price
+
+    def snapshot(self, include_provisional: bool = True) -> IndicatorSnapshot:
+        """
+        Read the current indicator values.
+
+        Args:
+            include_provisional: Apply the in-progress kline's latest price, if any
+
+        Returns:
+            IndicatorSnapshot with None for indicators still warming up
+        """
+        with self._lock:
+            pending = self._pending if include_provisional else None
+            if pending is not None:
+                rsi = self.rsi.peek(pending)
+                macd = self.macd.peek(pending)
+            else:
+                rsi = self.rsi.value
+                macd = self.macd.value
+            return IndicatorSnapshot(
+                rsi=rsi,
+                macd_line=macd[0] if macd else None,
+                macd_signal=macd[1] if macd else None,
+                closed_count=self.closed_count,
+                provisional=pending is not None
+            )
@@ -0,0 +1,496 @@
+"""
+Append-Only Persistence for Polymarket Bot.
+
+This module backs StateManager with files that grow by appending instead of
+being rewritten on every save:
+- StateJournal: a JSON snapshot plus a journal of changed top-level keys;
+  saves append one delta line and every ``compact_every`` deltas the state
+  is compacted back into the snapshot
+- TradeLog: the JSON-lines trade log plus a binary offset index of
+  (byte offset, timestamp) records, so recent-N and time-range reads seek
+  straight to the lines they need
+
+Lines are encoded with orjson when it is installed (json otherwise). Writes
+are flushed to the OS immediately, so a crash of the bot loses nothing;
+fsync is batched to at most one per ``fsync_interval`` seconds (and on
+sync(), compaction and close()), bounding what a power loss can take.
+A torn final line left by a crash is dropped when the file is next opened.
+"""
+
+import json
+import logging
+import os
+import struct
+import time
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Snapshot key holding the sequence number of the last delta it includes
+SEQ_KEY = "_journal_seq"
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+if ORJSON_AVAILABLE:
+    def encode(value: Any) -> bytes:
+        """Encode a value as compact JSON bytes."""
+        return orjson.dumps(value, default=_default)
+
+    decode: Callable[[bytes], Any] = orjson.loads
+    DecodeError = orjson.JSONDecodeError
+else:
+    def encode(value: Any) -> bytes:
+        """Encode a value as compact JSON bytes."""
+        return json.dumps(value, default=_default, separators=(',', ':')).encode()
+
+    decode = json.loads
+    DecodeError = json.JSONDecodeError
+
+
+class _BatchedFsync:
+    """Append-mode file whose fsyncs are batched by time."""
+
+    def __init__(self, path: Path, fsync_interval: float, clock: Callable[[], float]):
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self._clock = clock
+        self._file = None
+        self._dirty = False
+        self._last_fsync = clock()
+
+    def write(self, data: bytes) -> int:
+        """Append data, flush it to the OS and fsync if the interval has passed."""
+        if self._file is None:
+            self._file = open(self.path, 'ab')
+        self._file.write(data)
+        self._file.flush()
+        self._dirty = True
+        if self._clock() - self._last_fsync >= self.fsync_interval:
+            self.sync()
+        return self._file.tell()
+
+    def sync(self) -> None:
+        """Fsync pending writes."""
+        if self._file is not None and self._dirty:
+            os.fsync(self._file.fileno())
+            self._dirty = False
+        self._last_fsync = self._clock()
+
+    def truncate(self, size: int = 0) -> None:
+        """Cut the file to ``size`` bytes."""
+        self.close()
+        with open(self.path, 'ab') as f:
+            f.truncate(size)
+            os.fsync(f.fileno())
+
+    def close(self) -> None:
+        """Fsync and close the file."""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+
+def _drop_torn_tail(path: Path) -> int:
+    """Truncate a line-oriented file after its last newline; return the new size."""
+    if not path.exists():
+        return 0
+    with open(path, 'rb+') as f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return 0
+        # Scan back for the last newline
+        end = size
+        while end > 0:
+            start = max(0, end - 65536)
+            f.seek(start)
+            chunk = f.read(end - start)
+            newline = chunk.rfind(b'\n')
+            if newline != -1:
+                end = start + newline + 1
+                break
+            end = start
+        if end != size:
+            logger.warning(f"Dropping {size - end} bytes of torn tail from {path.name}")
+            f.truncate(end)
+        return end
+
+
+class StateJournal:
+    """
+    Snapshot plus append-only delta journal for one JSON object.
+
+    save() appends the top-level keys that changed since the last save;
+    load() replays the journal over the snapshot. The snapshot is written
+    atomically (temporary file and rename) and records the last delta it
+    includes, so deltas left over from an interrupted compaction are
+    skipped rather than replayed over newer values.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        compact_every: int = 200,
+        fsync_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the journal. Nothing is read until load() or save().
+
+        Args:
+            snapshot_path: Snapshot file; the journal sits next to it with
+                a ``.journal`` suffix
+            compact_every: Deltas appended before the next save compacts
+            fsync_interval: Minimum seconds between journal fsyncs
+            clock: Monotonic time source
+
+        Raises:
+            ValueError: If compact_every is less than 1
+        """
+        if compact_every < 1:
+            raise ValueError(f"compact_every must be at least 1, got {compact_every}")
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = self.snapshot_path.with_suffix('.journal')
+        self.compact_every = compact_every
+        self._journal = _BatchedFsync(self.journal_path, fsync_interval, clock)
+        self._state: Optional[Dict[str, Any]] = None
+        self._seq = 0
+        self._pending = 0  # Deltas in the journal since the snapshot
+        self._loaded = False
+
+    @property
+    def pending_deltas(self) -> int:
+        """Number of deltas appended since the last compaction."""
+        return self._pending
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the snapshot and replay the journal.
+
+        Returns:
+            The current state, or None if nothing was ever saved
+
+        Raises:
+            ValueError: If the snapshot or a complete journal line is corrupted
+        """
+        state: Optional[Dict[str, Any]] = None
+        seq = 0
+        if self.snapshot_path.exists():
+            try:
+                state = decode(self.snapshot_path.read_bytes())
+            except DecodeError as e:
+                raise ValueError(f"Corrupted snapshot {self.snapshot_path.name}: {e}")
+            if not isinstance(state, dict):
+                raise ValueError(f"Corrupted snapshot {self.snapshot_path.name}: not an object")
+            seq = state.pop(SEQ_KEY, 0)
+
+        pending = 0
+        if _drop_torn_tail(self.journal_path):
+            with open(self.journal_path, 'rb') as f:
+                for number, line in enumerate(f, 1):
+                    try:
+                        delta = decode(line)
+                    except DecodeError as e:
+                        raise ValueError(f"Corrupted journal {self.journal_path.name} line {number}: {e}")
+                    if delta['seq'] <= seq:
+                        continue
+                    state = {} if state is None else state
+                    state.update(delta.get('set', {}))
+                    for key in delta.get('del', ()):
+                        state.pop(key, None)
+                    seq = delta['seq']
+                    pending += 1
+
+        self._state = state
+        self._seq = seq
+        self._pending = pending
+        self._loaded = True
+        return dict(state) if state is not None else None
+
+    def save(self, state: Dict[str, Any]) -> bool:
+        """
+        Persist a new version of the state.
+
+        Args:
+            state: Full state; only changed top-level keys are written
+
+        Returns:
+            True if anything was written
+
+        Raises:
+            ValueError: If the existing files are corrupted
+            TypeError: If a value cannot be encoded
+        """
+        if not self._loaded:
+            self.load()
+        if self._state is None or self._pending >= self.compact_every:
+            self.compact(state)
+            return True
+
+        changed = {k: v for k, v in state.items() if k not in self._state or self._state[k] != v}
+        removed = [k for k in self._state if k not in state]
+        if not changed and not removed:
+            return False
+
+        self._seq += 1
+        delta: Dict[str, Any] = {'seq': self._seq, 'set': changed}
+        if removed:
+            delta['del'] = removed
+        self._journal.write(encode(delta) + b'\n')
+        self._state = dict(state)
+        self._pending += 1
+        return True
+
+    def compact(self, state: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Write the state as a new snapshot and empty the journal.
+
+        Args:
+            state: State to write (default: the current state)
+        """
+        if not self._loaded:
+            self.load()
+        state = self._state if state is None else state
+        if state is None:
+            return
+        temp_file = self.snapshot_path.with_suffix('.tmp')
+        try:
+            with open(temp_file, 'wb') as f:
+                f.write(encode({**state, SEQ_KEY: self._seq}))
+                f.flush()
+                os.fsync(f.fileno())
+            temp_file.replace(self.snapshot_path)
+        except Exception:
+            if temp_file.exists():
+                temp_file.unlink()
+            raise
+        # The snapshot records the last sequence, so a crash here only leaves skippable deltas
+        self._journal.truncate(0)
+        self._state = dict(state)
+        self._pending = 0
+
+    def sync(self) -> None:
+        """Fsync journal writes still pending."""
+        self._journal.sync()
+
+    def close(self) -> None:
+        """Fsync and close the journal."""
+        self._journal.close()
+
+
+class TradeLog:
+    """
+    JSON-lines trade log with a binary offset index.
+
+    Each line is a JSON object; the index file (``<log>.idx``) holds one
+    little-endian (int64 byte offset, float64 unix timestamp) record per
+    line and is kept in memory as two arrays. Timestamps are expected to be
+    non-decreasing (lines are appended as trades settle). A missing or
+    inconsistent index is rebuilt from the log on open.
+    """
+
+    RECORD = struct.Struct('<qd')
+
+    def __init__(
+        self,
+        path: Path,
+        fsync_interval: float = 1.0,
+        timestamp_of: Callable[[Dict[str, Any]], float] = lambda entry: datetime.fromisoformat(
+            entry['timestamp']).timestamp(),
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Open the log and its index.
+
+        Args:
+            path: Log file
+            fsync_interval: Minimum seconds between fsyncs
+            timestamp_of: Extracts the unix timestamp of a decoded line
+                (used when rebuilding the index)
+            clock: Monotonic time source
+        """
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + '.idx')
+        self._timestamp_of = timestamp_of
+        self._log = _BatchedFsync(self.path, fsync_interval, clock)
+        self._index = _BatchedFsync(self.index_path, fsync_interval, clock)
+        self._offsets = array('q')
+        self._times = array('d')
+        self._size = 0
+        self._open()
+
+    def _open(self) -> None:
+        self._size = _drop_torn_tail(self.path)
+        if self.index_path.exists():
+            data = self.index_path.read_bytes()
+            usable = len(data) - len(data) % self.RECORD.size
+            for offset, timestamp in self.RECORD.iter_unpack(data[:usable]):
+                if offset >= self._size or (self._offsets and offset <= self._offsets[-1]):
+                    break
+                self._offsets.append(offset)
+                self._times.append(timestamp)
+            if len(self._offsets) * self.RECORD.size != len(data):
+                self._rewrite_index()
+
+        # Index lines appended after the last indexed one (or the whole log)
+        start = self._line_end(len(self._offsets) - 1) if self._offsets else 0
+        if start < self._size:
+            added = self._scan(start)
+            if added:
+                logger.info(f"Indexed {added} trade log lines missing from {self.index_path.name}")
+
+    def _line_end(self, i: int) -> int:
+        if i + 1 < len(self._offsets):
+            return self._offsets[i + 1]
+        with open(self.path, 'rb') as f:
+            f.seek(self._offsets[i])
+            return self._offsets[i] + len(f.readline())
+
+    def _scan(self, start: int) -> int:
+        added = 0
+        records = bytearray()
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if line.strip():
+                    try:
+                        timestamp = self._timestamp_of(decode(line))
+                    except (DecodeError, KeyError, TypeError, ValueError) as e:
+                        raise ValueError(f"Corrupted trades log at byte {offset}: {e}")
+                    self._offsets.append(offset)
+                    self._times.append(timestamp)
+                    records += self.RECORD.pack(offset, timestamp)
+                    added += 1
+                offset += len(line)
+        if records:
+            self._index.write(bytes(records))
+        return added
+
+    def _rewrite_index(self) -> None:
+        self._index.close()
+        temp_file = self.index_path.with_suffix('.tmp')
+        with open(temp_file, 'wb') as f:
+            for offset, timestamp in zip(self._offsets, self._times):
+                f.write(self.RECORD.pack(offset, timestamp))
+            f.flush()
+            os.fsync(f.fileno())
+        temp_file.replace(self.index_path)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def append(self, entry: Dict[str, Any], timestamp: float) -> None:
+        """
+        Append one entry.
+
+        Args:
+            entry: JSON-serializable object
+            timestamp: Unix timestamp indexed for time-range reads
+        """
+        line = encode(entry) + b'\n'
+        offset = self._size
+        self._size = self._log.write(line)
+        self._index.write(self.RECORD.pack(offset, timestamp))
+        self._offsets.append(offset)
+        self._times.append(timestamp)
+
+    def _read(self, first: int, last: int) -> List[Dict[str, Any]]:
+        """Decode lines first..last-1 with one seek and one read."""
+        if first >= last:
+            return []
+        start = self._offsets[first]
+        end = self._offsets[last] if last < len(self._offsets) else self._size
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            data = f.read(end - start)
+        try:
+            return [decode(line) for line in data.splitlines() if line.strip()]
+        except DecodeError as e:
+            raise ValueError(f"Corrupted trades log: {e}")
+
+    def read_all(self) -> List[Dict[str, Any]]:
+        """
+        Decode the whole log file.
+
+        Reads the file itself rather than the indexed range, so lines
+        written by another process are included.
+
+        Returns:
+            Entries in log order
+
+        Raises:
+            ValueError: If a line is corrupted
+        """
+        if not self.path.exists():
+            return []
+        try:
+            with open(self.path, 'rb') as f:
+                return [decode(line) for line in f if line.strip()]
+        except DecodeError as e:
+            raise ValueError(f"Corrupted trades log: {e}")
+
+    def recent(self, count: int) -> List[Dict[str, Any]]:
+        """
+        Decode the last ``count`` entries.
+
+        Args:
+            count: Number of entries
+
+        Returns:
+            Entries oldest first
+
+        Raises:
+            ValueError: If a line is corrupted
+        """
+        total = len(self._offsets)
+        return self._read(max(0, total - count), total) if count > 0 else []
+
+    def between(self, start: float, end: float) -> List[Dict[str, Any]]:
+        """
+        Decode the entries with start <= timestamp < end.
+
+        Args:
+            start: Range start (unix timestamp)
+            end: Range end (unix timestamp)
+
+        Returns:
+            Entries oldest first
+
+        Raises:
+            ValueError: If a line is corrupted
+        """
+        return self._read(bisect_left(self._times, start), bisect_left(self._times, end))
+
+    def sync(self) -> None:
+        """Fsync pending appends."""
+        self._log.sync()
+        self._index.sync()
+
+    def close(self) -> None:
+        """Fsync and close the log and index."""
+        self._log.close()
+        self._index.close()
@@ -9,7 +9,9 @@ This module implements the main event loop that coordinates all bot components:
 - Trade execution (order submission and settlement)
 - State persistence (logging and recovery)
 
-The bot runs for 18 cycles with 5-minute intervals between each cycle.
+The bot runs for 18 cycles with 5-minute intervals between each cycle. Cycles
+are triggered by closed Binance klines through an EventScheduler, so each
+decision is made as soon as fresh data arrives.
 It automatically halts if max drawdown (30%) is exceeded or on critical errors.
 Supports both dry-run simulation mode and live trading mode.
 """
@@ -18,18 +20,44 @@ import signal
 import logging
 import time
 import sys
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
 from decimal import Decimal
 from datetime import datetime, timezone
 
 from .config import Config, get_config, ConfigurationError
 from .models import BotState, BotStatus, SignalType, Trade
-from .market_data import BinanceWebSocketClient, PolymarketClient, get_market_data
+from .market_data import BinanceWebSocketClient, MarketSnapshot, PolymarketClient, get_market_snapshots
+from .market_catalogue import MarketCatalogue
+from .order_book import BinanceOrderBookStream, LocalOrderBook
+from .recorder import TickReader, TickRecorder
 from .prediction import PredictionEngine
 from .risk import RiskManager
 from .capital import CapitalAllocator
-from .execution import TradeExecutor, ExecutionError
+from .execution import TradeExecutor, ExecutionError, OrderSettlementError, SettlementOutcome
+from .settlement import SettlementFuture, SettlementTracker
 from .state import StateManager
+from .scheduler import (
+    CycleTrigger,
+    EventScheduler,
+    MarketWindowTimers,
+    ScheduledEvent,
+    KLINE_CLOSE,
+    MARKET_WINDOW,
+    SETTLEMENT,
+    TIMER,
+)
+from .telemetry import (
+    MetricsServer,
+    get_telemetry,
+    STAGE_DECISION,
+    STAGE_MARKET_DATA,
+    STAGE_ORDER_SUBMIT,
+    STAGE_RISK,
+    STAGE_SETTLEMENT,
+    STAGE_SIGNAL,
+)
+from .transport import close_transport
 
 # Setup logging
 logging.basicConfig(
@@ -55,6 +83,8 @@ class TradingBot:
     # Constants
     TOTAL_CYCLES = 18
     CYCLE_INTERVAL_SECONDS = 300  # 5 minutes
+    CYCLE_DEADLINE_SECONDS = 30  # Abandon a decision this long after its kline closed
+    KLINE_GRACE_SECONDS = 90  # Run a timer cycle if no kline close arrives in time
     STARTING_CAPITAL = Decimal("100.0")
 
     def __init__(self, config: Optional[Config] = None, dry_run: bool = False):
@@ -72,12 +102,24 @@ class TradingBot:
 
         # Initialize components
         self.binance_client: Optional[BinanceWebSocketClient] = None
+        self.order_book_stream: Optional[BinanceOrderBookStream] = None
+        self.tick_recorder: Optional[TickRecorder] = None
         self.polymarket_client: Optional[PolymarketClient] = None
+        self.market_catalogue: Optional[MarketCatalogue] = None
+        self.market_executor: Optional[ThreadPoolExecutor] = None
         self.prediction_engine: Optional[PredictionEngine] = None
         self.risk_manager: Optional[RiskManager] = None
         self.capital_allocator: Optional[CapitalAllocator] = None
         self.trade_executor: Optional[TradeExecutor] = None
+        self.settlement_tracker: Optional[SettlementTracker] = None
+        self._settlement_drain_deadline: Optional[float] = None
         self.state_manager: Optional[StateManager] = None
+        self.metrics_server: Optional[MetricsServer] = None
+        self.telemetry = get_telemetry()
+        self.scheduler = EventScheduler()
+        self._cycle_timer: Optional[int] = None
+        self.cycle_trigger = CycleTrigger(self.CYCLE_INTERVAL_SECONDS)
+        self.market_windows: Optional[MarketWindowTimers] = None
 
         # Bot state tracking
         self.bot_state: Optional[BotState] = None
@@ -96,6 +138,11 @@ class TradingBot:
             f"starting_capital=${self.STARTING_CAPITAL})"
         )
 
+    @property
+    def order_book(self) -> Optional[LocalOrderBook]:
+        """Local order book maintained by the depth stream, if connected."""
+        return self.order_book_stream.book if self.order_book_stream else None
+
     def _signal_handler(self, signum, frame):
         """
         Handle shutdown signals (SIGINT/SIGTERM).
@@ -125,14 +172,59 @@ class TradingBot:
             # Load or create bot state
             self.bot_state = self.load_or_create_bot_state()
 
+            # Record stream ticks to disk when configured
+            if self.config.tick_record_dir:
+                self.tick_recorder = TickRecorder(self.config.tick_record_dir)
+
+            # Serve stage latencies and API error counters for Prometheus when configured
+            if self.config.metrics_port:
+                try:
+                    self.metrics_server = MetricsServer(
+                        self.telemetry, host=self.config.metrics_host, port=self.config.metrics_port
+                    )
+                    self.metrics_server.start()
+                except OSError as e:
+                    # Metrics are not needed to trade
+                    logger.error(f"Failed to start metrics server: {e}")
+                    self.metrics_server = None
+
+            # Initialize risk manager
+            self.risk_manager = RiskManager(
+                starting_capital=self.STARTING_CAPITAL,
+                max_total_exposure=Decimal(str(self.config.max_total_exposure)),
+                max_market_exposure=Decimal(str(self.config.max_market_exposure))
+            )
+            logger.info("Risk manager initialized")
+
             # Initialize Binance WebSocket
-            self.binance_client = BinanceWebSocketClient(buffer_size=100)
+            self.binance_client = BinanceWebSocketClient(buffer_size=100, recorder=self.tick_recorder)
+
+            # Warm-start prices and indicators from recent klines; the stream continues from there
+            try:
+                self.binance_client.warm_start(self._recorded_klines())
+            except ConnectionError as e:
+                logger.warning(f"Kline backfill failed, indicators will warm up from the stream: {e}")
+
+            # Stream closed klines into the rolling risk state, starting from the backfill
+            self._seed_market_risk()
+            self.binance_client.add_kline_close_listener(self._update_market_risk)
+
             self.binance_client.connect()
             logger.info("Binance WebSocket connected")
 
-            # Wait for price buffer to fill
-            logger.info("Waiting for price buffer to populate...")
-            time.sleep(10)  # Give WebSocket time to accumulate data
+            # Maintain a local order book from the depth stream; REST depth is the fallback
+            try:
+                self.order_book_stream = BinanceOrderBookStream(self.config)
+                self.order_book_stream.connect()
+                logger.info("Binance depth stream connected")
+            except Exception as e:
+                logger.warning(f"Depth stream unavailable, using REST order book: {e}")
+                self.order_book_stream = None
+
+            # Without a backfill, wait for the stream's first prices
+            wait_deadline = time.monotonic() + 10
+            while not self.binance_client.get_latest_prices(1) and time.monotonic() < wait_deadline:
+                time.sleep(0.1)
 
             # Verify we have price data
             if len(self.binance_client.get_latest_prices(1)) == 0:
@@ -143,15 +235,25 @@ class TradingBot:
             self.polymarket_client = PolymarketClient(self.config)
             logger.info("Polymarket client initialized")
 
+            # Keep BTC market discovery out of the cycle's critical path
+            self.market_catalogue = MarketCatalogue(
+                self.polymarket_client,
+                ttl=self.config.market_cache_ttl,
+                max_stale=self.config.market_cache_max_stale
+            )
+            self.market_catalogue.start()
+
             # Initialize prediction engine
-            self.prediction_engine = PredictionEngine(self.config)
+            self.prediction_engine = PredictionEngine(self.config, order_book=self.order_book)
             logger.info("Prediction engine initialized")
 
-            # Initialize risk manager
-            self.risk_manager = RiskManager(
-                starting_capital=self.STARTING_CAPITAL
-            )
-            logger.info("Risk manager initialized")
+            # Worker threads for evaluating several markets per cycle
+            if self.config.max_concurrent_markets > 1:
+                self.market_executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_concurrent_markets,
+                    thread_name_prefix="market"
+                )
+                logger.info(f"Trading up to {self.config.max_concurrent_markets} markets per cycle")
 
             # Initialize capital allocator
             self.capital_allocator = CapitalAllocator()
@@ -161,6 +263,11 @@ class TradingBot:
             if not self.dry_run:
                 self.trade_executor = TradeExecutor(self.config)
                 logger.info("Trade executor initialized")
+                self.settlement_tracker = SettlementTracker(
+                    self.trade_executor,
+                    poll_interval=self.config.execution_settlement_poll_interval,
+                    timeout=self.config.execution_settlement_timeout
+                )
             else:
                 logger.info("Running in DRY RUN mode - no real trades")
 
@@ -171,6 +278,55 @@ class TradingBot:
             logger.error(f"Initialization failed: {e}", exc_info=True)
             return False
 
+    def _seed_market_risk(self) -> None:
+        """Feed the backfilled klines into the risk manager's rolling state (call before connect)."""
+        rows = self.binance_client.get_ohlcv_window()
+        for open_time, _, high, low, close, _ in rows.T.tolist():
+            self.risk_manager.update_market(
+                close,
+                (open_time + BinanceWebSocketClient.KLINE_INTERVAL_MS) / 1000,
+                high=high,
+                low=low
+            )
+
+    def _update_market_risk(self, kline: Dict[str, Any]) -> None:
+        """
+        Stream a closed kline into the rolling risk state.
+
+        Runs on the WebSocket thread; the update is O(1).
+
+        Args:
+            kline: Closed kline with ``open_time`` (ms), ``close`` and
+                optional ``close_time``, ``high`` and ``low``
+        """
+        close_time = kline.get('close_time')
+        if close_time is None:
+            open_time = kline.get('open_time')
+            close_time = (time.time() * 1000 if open_time is None
+                          else open_time + BinanceWebSocketClient.KLINE_INTERVAL_MS)
+        self.risk_manager.update_market(
+            kline['close'],
+            close_time / 1000,
+            high=kline.get('high'),
+            low=kline.get('low')
+        )
+
+    def _recorded_klines(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the last day of recorded klines for the warm start, if the recording is current.
+
+        Returns:
+            Closed klines oldest first, or None to fetch from REST
+        """
+        if not self.config.tick_record_dir:
+            return None
+        now_ms = int(time.time() * 1000)
+        klines = TickReader(self.config.tick_record_dir).klines(start=now_ms - 24 * 60 * 60 * 1000)
+        if not klines or klines[-1]['close_time'] < now_ms - 2 * BinanceWebSocketClient.KLINE_INTERVAL_MS:
+            return None
+        logger.info(f"Warm-starting from {len(klines)} recorded klines")
+        return klines
+
     def load_or_create_bot_state(self) -> BotState:
         """
         Load existing bot state or create new one.
@@ -210,11 +366,8 @@ class TradingBot:
         """Save current bot state to disk."""
         if self.bot_state and self.state_manager:
             try:
-                state_dict = self.bot_state.model_dump()
-                state_dict['current_cycle'] = self.current_cycle
-                # Convert datetime to string for JSON serialization
-                state_dict['last_heartbeat'] = state_dict['last_heartbeat'].isoformat()
-                self.state_manager.save_state(type('obj', (object,), {'to_dict': lambda: state_dict})())
+                # Appends only the fields that changed since the last save
+                self.state_manager.save_state(self.bot_state, extra={'current_cycle': self.current_cycle})
                 logger.debug("Bot state saved to disk")
             except Exception as e:
                 logger.error(f"Failed to save bot state: {e}")
@@ -223,6 +376,13 @@ class TradingBot:
         """
         Run the main trading loop for 18 cycles.
 
+        Cycles are event-driven: a cycle starts as soon as the first closed
+        1-minute kline at least CYCLE_INTERVAL_SECONDS after the previous
+        cycle's kline arrives, so decisions use data milliseconds old. If the
+        stream stalls, a timer starts the cycle instead. When a catalogued
+        market's window closes, the catalogue is refreshed at once so the
+        next cycle sees the market that replaces it.
+
         Each cycle:
         1. Fetches market data
         2. Generates prediction signal
@@ -250,40 +410,24 @@ class TradingBot:
         logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE TRADING'}")
         logger.info("=" * 60)
 
-        try:
-            for cycle in range(self.current_cycle + 1, self.TOTAL_CYCLES + 1):
-                if self.should_shutdown:
-                    break
-
-                self.current_cycle = cycle
-
-                logger.info(f"\n{'=' * 60}")
-                logger.info(f"CYCLE {cycle}/{self.TOTAL_CYCLES}")
-                logger.info(f"{'=' * 60}")
-
-                # Execute trading cycle
-                success = self.run_trading_cycle(cycle)
-
-                if not success:
-                    logger.error(f"Cycle {cycle} failed, halting bot")
-                    self.shutdown("Critical error in trading cycle")
-                    return
-
-                # Check if we've completed all cycles
-                if cycle >= self.TOTAL_CYCLES:
-                    logger.info(f"Completed all {self.TOTAL_CYCLES} cycles")
-                    break
+        # Cycles run on closed klines; the timer only covers a stalled stream
+        self.scheduler.subscribe(KLINE_CLOSE, self._on_kline_close)
+        self.scheduler.subscribe(TIMER, self._on_cycle_timer)
+        self.scheduler.subscribe(SETTLEMENT, self._on_settlement)
+        self.scheduler.subscribe(MARKET_WINDOW, self._on_market_window)
+        self.market_windows = MarketWindowTimers(
+            self.scheduler, self.market_catalogue, ttl=self.CYCLE_DEADLINE_SECONDS
+        )
+        self.market_windows.schedule()
+        self.binance_client.add_kline_close_listener(
+            lambda kline: self.scheduler.publish(KLINE_CLOSE, kline, ttl=self.CYCLE_DEADLINE_SECONDS)
+        )
+        self._arm_cycle_timer()
 
-                # Wait for next cycle (skip wait on last cycle)
-                if cycle < self.TOTAL_CYCLES and not self.should_shutdown:
-                    logger.info(
-                        f"Waiting {self.CYCLE_INTERVAL_SECONDS}s for next cycle..."
-                    )
-                    # Sleep in smaller intervals to allow for responsive shutdown
-                    for _ in range(self.CYCLE_INTERVAL_SECONDS):
-                        if self.should_shutdown:
-                            break
-                        time.sleep(1)
+        try:
+            self.scheduler.run(until=lambda: self.should_shutdown or self._run_complete())
+            if self.current_cycle >= self.TOTAL_CYCLES:
+                logger.info(f"Completed all {self.TOTAL_CYCLES} cycles")
 
         except KeyboardInterrupt:
             logger.info("Received interrupt signal, shutting down...")
@@ -301,7 +445,108 @@ class TradingBot:
         elif self.shutdown_reason:
             self.shutdown(self.shutdown_reason)
 
-    def run_trading_cycle(self, cycle_number: int) -> bool:
+    def _run_complete(self) -> bool:
+        """
+        Check whether every cycle ran and its trades were recorded.
+
+        After the final cycle the loop keeps dispatching until open orders
+        settle and their SETTLEMENT events are handled, so closing the
+        settlement tracker does not cancel them. The wait is bounded by the
+        settlement timeout.
+
+        Returns:
+            True once the loop can stop
+        """
+        if self.current_cycle < self.TOTAL_CYCLES or self.scheduler.pending():
+            return False
+        open_orders = self.settlement_tracker.pending if self.settlement_tracker else 0
+        if open_orders == 0:
+            return True
+        if self._settlement_drain_deadline is None:
+            timeout = self.config.execution_settlement_timeout
+            self._settlement_drain_deadline = time.monotonic() + timeout
+            logger.info(f"Waiting up to {timeout}s for {open_orders} open orders to settle")
+        if time.monotonic() < self._settlement_drain_deadline:
+            return False
+        logger.warning(f"Stopping with {open_orders} orders unsettled")
+        return True
+
+    def _arm_cycle_timer(self) -> None:
+        """(Re)start the fallback timer that runs a cycle if no kline close arrives."""
+        if self._cycle_timer is not None:
+            self.scheduler.cancel(self._cycle_timer)
+        self._cycle_timer = self.scheduler.schedule(
+            self.CYCLE_INTERVAL_SECONDS + self.KLINE_GRACE_SECONDS,
+            TIMER,
+            ttl=self.CYCLE_DEADLINE_SECONDS
+        )
+
+    def _on_kline_close(self, event: ScheduledEvent) -> None:
+        """
+        Start a cycle on the first closed kline a full interval after the last one.
+
+        Args:
+            event: KLINE_CLOSE event with the kline's ``close_time`` in ms
+        """
+        close_time = event.payload.get('close_time')
+        if close_time is None or not self.cycle_trigger.kline_closed(close_time):
+            return
+        self._start_cycle(event)
+
+    def _on_cycle_timer(self, event: ScheduledEvent) -> None:
+        """Run a cycle on the fallback timer when the kline stream has stalled."""
+        logger.warning("No kline close received in time, running cycle on timer")
+        self.cycle_trigger.timer_fired()
+        self._start_cycle(event)
+
+    def _on_market_window(self, event: ScheduledEvent) -> None:
+        """
+        Refresh the market catalogue when a market's window closes.
+
+        Args:
+            event: MARKET_WINDOW event with the market's ``market_id`` and ``end_date``
+        """
+        logger.info(
+            f"Market window closed for {event.payload.get('market_id')} "
+            f"({event.payload.get('end_date')}), refreshing market catalogue"
+        )
+        self.market_catalogue.revalidate()
+
+    def _start_cycle(self, event: ScheduledEvent) -> None:
+        """
+        Run the next trading cycle for a triggering event.
+
+        Args:
+            event: Triggering event; its deadline bounds the decision
+        """
+        if self.should_shutdown or self.current_cycle >= self.TOTAL_CYCLES:
+            return
+
+        cycle = self.current_cycle + 1
+        self.current_cycle = cycle
+
+        logger.info(f"\n{'=' * 60}")
+        logger.info(f"CYCLE {cycle}/{self.TOTAL_CYCLES} (trigger: {event.kind})")
+        logger.info(f"{'=' * 60}")
+
+        success = self.run_trading_cycle(cycle, deadline=event.deadline)
+
+        if not success:
+            logger.error(f"Cycle {cycle} failed, halting bot")
+            self.should_shutdown = True
+            self.shutdown_reason = self.shutdown_reason or "Critical error in trading cycle"
+            self.scheduler.stop()
+            return
+
+        # The cycle read the catalogue, so pick up windows of newly listed markets
+        if self.market_windows is not None:
+            self.market_windows.schedule()
+
+        if cycle < self.TOTAL_CYCLES:
+            logger.info(f"Waiting for the next kline close after {self.CYCLE_INTERVAL_SECONDS}s...")
+            self._arm_cycle_timer()
+
+    def run_trading_cycle(self, cycle_number: int, deadline: Optional[float] = None) -> bool:
         """
         Execute a single trading cycle.
 
@@ -309,12 +554,19 @@ class TradingBot:
         1. Fetch market data (BTC price, indicators, Polymarket odds)
         2. Generate prediction signal
         3. Check risk constraints
-        4. Calculate position size
+        4. Calculate position size and reserve it with the portfolio risk gate
         5. Execute trade (or simulate in dry-run mode)
         6. Log results and save state
 
+        With MAX_CONCURRENT_MARKETS above 1, step 1 runs once and steps 2-5
+        run for each active BTC market on worker threads. The markets share
+        the price feed, the indicators and the risk manager, whose exposure
+        reservation enforces total and per-market limits atomically.
+
         Args:
             cycle_number: Current cycle number (1-18)
+            deadline: time.monotonic() value after which no order is placed,
+                because the data the decision was made on is stale
 
         Returns:
             True if cycle completed successfully, False on critical failure
@@ -324,111 +576,258 @@ class TradingBot:
             self.bot_state.status = BotStatus.RUNNING
             self.bot_state.last_heartbeat = datetime.now(timezone.utc)
 
-            # Step 1: Fetch market data
-            logger.info("Step 1: Fetching market data...")
-            market_data = get_market_data(
-                self.binance_client,
-                self.polymarket_client
-            )
-            logger.info(
-                f"Market data fetched - BTC: ${market_data.metadata.get('btc_price'):.2f}, "
-                f"Market: {market_data.market_id[:8]}..."
-            )
+            # The decision span covers the whole cycle up to order submission
+            with self.telemetry.span(STAGE_DECISION):
+                # Step 1: Fetch market data (computed once, shared by every later step and market)
+                logger.info("Step 1: Fetching market data...")
+                with self.telemetry.span(STAGE_MARKET_DATA):
+                    snapshots = get_market_snapshots(
+                        self.binance_client,
+                        self.polymarket_client,
+                        self.config.max_concurrent_markets,
+                        order_book=self.order_book,
+                        catalogue=self.market_catalogue
+                    )
+                logger.info(
+                    f"Market data fetched - BTC: ${snapshots[0].btc_price:.2f}, "
+                    f"Market: {', '.join(s.market_id[:8] + '...' for s in snapshots)}"
+                )
 
-            # Step 2: Generate prediction signal
-            logger.info("Step 2: Generating prediction signal...")
-            prices = self.binance_client.get_latest_prices(100)
-            btc_price = self.binance_client.get_latest_price()
+                if len(snapshots) == 1:
+                    return self._trade_market(snapshots[0], deadline)
 
-            signal = self.prediction_engine.generate_signal(
-                prices=prices,
-                btc_price=btc_price
-            )
+                # Evaluate every market concurrently; the first critical error fails the cycle
+                results = list(self.market_executor.map(lambda s: self._trade_market(s, deadline), snapshots))
+                return all(results)
 
-            logger.info(
-                f"Signal: {signal.signal.value.upper()} "
-                f"(confidence: {signal.confidence:.2f})"
-            )
-            logger.info(f"Reasoning: {signal.reasoning}")
+        except Exception as e:
+            logger.error(f"Critical error in trading cycle: {e}", exc_info=True)
+            return False
 
-            # Step 3: Check if we should skip this cycle
-            if signal.signal == SignalType.SKIP:
-                logger.info("Skipping trade - no clear signal")
-                return True
+    def _trade_market(self, snapshot: MarketSnapshot, deadline: Optional[float] = None) -> bool:
+        """
+        Run the signal, risk and execution steps for one market.
 
-            # Step 4: Risk validation
-            logger.info("Step 3: Validating risk constraints...")
+        Safe to call from several worker threads at once: the shared state it
+        changes goes through the risk manager's lock or the scheduler.
 
-            # Check drawdown
+        Args:
+            snapshot: Market snapshot for this market
+            deadline: time.monotonic() value after which no order is placed
+
+        Returns:
+            True if the market was handled (traded or skipped), False on a
+            drawdown breach
+
+        Raises:
+            Exception: Any unexpected error, which the cycle treats as critical
+        """
+        market_data = snapshot.market
+        market_label = f"{snapshot.market_id[:8]}..."
+
+        # Step 2: Generate prediction signal
+        logger.info(f"Step 2: Generating prediction signal for {market_label}")
+        with self.telemetry.span(STAGE_SIGNAL):
+            signal = self.prediction_engine.generate_signal_from_snapshot(snapshot)
+
+        logger.info(
+            f"Signal: {signal.signal.value.upper()} "
+            f"(confidence: {signal.confidence:.2f}, market: {market_label})"
+        )
+        logger.info(f"Reasoning: {signal.reasoning}")
+
+        # Step 3: Check if we should skip this market
+        if signal.signal == SignalType.SKIP:
+            logger.info("Skipping trade - no clear signal")
+            return True
+
+        # Step 4: Risk validation
+        logger.info("Step 3: Validating risk constraints...")
+
+        # Check drawdown from the running peak
+        with self.telemetry.span(STAGE_RISK):
             drawdown_ok, current_drawdown = self.risk_manager.check_drawdown(
-                self.current_capital
+                self.current_capital,
+                self.risk_manager.peak_capital
             )
 
-            logger.info(f"Current drawdown: {current_drawdown:.2f}%")
-
-            if not drawdown_ok:
-                logger.error(
-                    f"DRAWDOWN LIMIT EXCEEDED: {current_drawdown:.2f}% > "
-                    f"{self.risk_manager.max_drawdown_percent}%"
-                )
-                self.should_shutdown = True
-                self.shutdown_reason = "Maximum drawdown threshold breached"
-                return False
+        logger.info(f"Current drawdown: {current_drawdown:.2f}%")
 
-            # Check volatility
-            volatility_ok, volatility = self.risk_manager.check_volatility(prices[-5:])
+        if not drawdown_ok:
+            logger.error(
+                f"DRAWDOWN LIMIT EXCEEDED: {current_drawdown:.2f}% > "
+                f"{self.risk_manager.max_drawdown_percent}%"
+            )
+            self.should_shutdown = True
+            self.shutdown_reason = "Maximum drawdown threshold breached"
+            return False
 
-            logger.info(f"Current 5-min volatility: {volatility:.2f}%")
+        # Check volatility over the rolling 5-minute window of closed klines
+        with self.telemetry.span(STAGE_RISK):
+            volatility_ok, volatility = self.risk_manager.check_volatility()
 
-            if not volatility_ok:
-                logger.warning(
-                    f"High volatility detected: {volatility:.2f}%, skipping trade"
-                )
-                return True
+        logger.info(f"Current 5-min volatility: {volatility:.2f}%")
 
-            # Step 5: Calculate position size
-            logger.info("Step 4: Calculating position size...")
-            position_size = self.capital_allocator.calculate_position_size(
-                win_streak=self.win_streak,
-                current_capital=self.current_capital
+        if not volatility_ok:
+            logger.warning(
+                f"High volatility detected: {volatility:.2f}%, skipping trade"
             )
+            return True
 
-            logger.info(
-                f"Position size: ${position_size:.2f} "
-                f"(win streak: {self.win_streak})"
+        # Step 5: Calculate position size
+        logger.info("Step 4: Calculating position size...")
+        position_size = self.capital_allocator.calculate_position_size(
+            win_streak=self.win_streak,
+            current_capital=self.current_capital
+        )
+
+        logger.info(
+            f"Position size: ${position_size:.2f} "
+            f"(win streak: {self.win_streak})"
+        )
+
+        # Abandon the decision if the triggering data has gone stale
+        if deadline is not None and time.monotonic() >= deadline:
+            logger.warning(
+                f"Decision deadline passed {time.monotonic() - deadline:.2f}s ago, skipping trade"
             )
+            return True
 
-            # Step 6: Execute trade
-            logger.info("Step 5: Executing trade...")
+        # Portfolio gate: reserve the exposure before any order leaves the bot
+        approval = self.risk_manager.reserve_exposure(market_data.market_id, position_size, self.current_capital)
+        if not approval:
+            logger.warning(f"Portfolio risk gate rejected trade in {market_label}, skipping")
+            return True
+        self._sync_exposure()
+
+        # Step 6: Execute trade
+        logger.info("Step 5: Executing trade...")
+        settlement = {
+            'market_id': market_data.market_id,
+            'signal': signal.signal,
+            'confidence': signal.confidence,
+            'position_size': position_size
+        }
 
+        try:
             if self.dry_run:
                 # Simulate trade execution
                 logger.info("[DRY RUN] Simulating trade execution...")
                 outcome, pnl = self._simulate_trade(signal.signal, position_size)
-                order_id = f"DRY_RUN_{cycle_number}"
+                logger.info(f"Trade result: {outcome}, PnL: ${pnl:.2f}")
+
+                # Step 7: Update state once the settlement event is handled
+                self.scheduler.publish(SETTLEMENT, {**settlement, 'outcome': outcome, 'pnl': pnl})
             else:
                 # Real trade execution
-                order_id = self.trade_executor.submit_order(
-                    market_id=market_data.market_id,
-                    signal=signal.signal,
-                    size=position_size
-                )
+                with self.telemetry.span(STAGE_ORDER_SUBMIT):
+                    order_id = self.trade_executor.submit_order(
+                        market_id=market_data.market_id,
+                        signal=signal.signal,
+                        size=position_size
+                    )
+                submitted_at = time.monotonic()
 
                 logger.info(f"Order submitted: {order_id}")
 
-                # Poll for settlement
-                outcome, pnl = self.trade_executor.poll_settlement(
+                # Step 7: Settlement is tracked in the background; the cycle does not wait for it
+                entry_price = market_data.yes_price if signal.signal == SignalType.UP else market_data.no_price
+                self.settlement_tracker.track(
                     order_id,
-                    timeout=300
+                    callback=lambda future: self._publish_settlement(future, settlement, entry_price, submitted_at)
                 )
 
-            logger.info(f"Trade result: {outcome}, PnL: ${pnl:.2f}")
+        except ExecutionError as e:
+            logger.error(f"Trade execution failed: {e}")
+            self._release_exposure(settlement)
+            # Execution errors are recoverable, skip this market
+            return True
+
+        except Exception:
+            self._release_exposure(settlement)
+            raise
+
+        return True
+
+    def _release_exposure(self, settlement: Dict[str, Any]) -> None:
+        """Return a trade's reserved exposure to the portfolio gate."""
+        self.risk_manager.release_exposure(settlement['market_id'], settlement['position_size'])
+        self._sync_exposure()
 
-            # Step 7: Update state
+    def _sync_exposure(self) -> None:
+        """
+        Mirror the risk manager's open exposure into the bot state.
+
+        Called from market workers, the settlement tracker thread and the
+        scheduler thread; the snapshot and the assignment happen under the
+        exposure lock, so the last writer always mirrors the latest exposure.
+        """
+        with self.risk_manager.exposure_lock():
+            exposure = self.risk_manager.exposure_by_market()
+            self.bot_state.current_exposure = sum(exposure.values(), Decimal("0"))
+            self.bot_state.active_markets = list(exposure)
+
+    def _publish_settlement(
+        self,
+        future: SettlementFuture,
+        settlement: Dict[str, Any],
+        entry_price: Decimal,
+        submitted_at: Optional[float] = None
+    ) -> None:
+        """
+        Turn a completed settlement future into a SETTLEMENT event.
+
+        Runs on the settlement tracker thread; the state update itself
+        happens in _on_settlement on the scheduler thread.
+
+        Args:
+            future: Completed future from the settlement tracker
+            settlement: Trade details recorded when the order was placed
+            entry_price: Price paid per share of the chosen outcome
+            submitted_at: time.monotonic() when the order was accepted, to
+                record the settlement latency
+        """
+        if submitted_at is not None:
+            self.telemetry.observe(STAGE_SETTLEMENT, time.monotonic() - submitted_at)
+        if future.cancelled():
+            self._release_exposure(settlement)
+            return
+        try:
+            result = future.result()
+        except OrderSettlementError as e:
+            logger.error(f"Order {future.order_id} did not settle: {e}")
+            self._release_exposure(settlement)
+            return
+
+        size = settlement['position_size']
+        outcome = result.outcome.value
+        if result.outcome == SettlementOutcome.WIN:
+            pnl = size * (Decimal("1") / Decimal(str(entry_price)) - Decimal("1"))
+        elif result.outcome == SettlementOutcome.LOSS:
+            pnl = -size
+        else:
+            pnl = Decimal("0")
+
+        logger.info(f"Trade result: {outcome}, PnL: ${pnl:.2f} (order {future.order_id})")
+        self.scheduler.publish(SETTLEMENT, {**settlement, 'outcome': outcome, 'pnl': pnl})
+
+    def _on_settlement(self, event: ScheduledEvent) -> None:
+        """
+        Record a settled trade: capital, win streak, trade log, metrics and state.
+
+        Args:
+            event: SETTLEMENT event with market_id, signal, confidence,
+                position_size, outcome and pnl
+        """
+        settlement = event.payload
+        outcome, pnl = settlement['outcome'], settlement['pnl']
+        try:
+            self._release_exposure(settlement)
             self.total_trades += 1
             self.bot_state.total_trades += 1
             self.current_capital += pnl
             self.bot_state.total_pnl += pnl
+            self.risk_manager.record_capital(self.current_capital)
 
             if outcome == "WIN":
                 self.win_streak += 1
@@ -440,15 +839,15 @@ class TradingBot:
             trade = Trade(
                 trade_id=f"trade_{self.bot_state.total_trades}",
                 bot_id=self.bot_state.bot_id,
-                market_id=market_data.market_id,
+                market_id=settlement['market_id'],
                 timestamp=datetime.now(timezone.utc),
-                side="YES" if signal.signal == SignalType.UP else "NO",
-                size=position_size,
+                side="YES" if settlement['signal'] == SignalType.UP else "NO",
+                size=settlement['position_size'],
                 status="executed",
                 outcome=outcome,
                 pnl=pnl,
-                signal_type=signal.signal,
-                confidence=signal.confidence
+                signal_type=settlement['signal'],
+                confidence=settlement['confidence']
             )
             self.state_manager.log_trade(trade)
 
@@ -456,7 +855,9 @@ class TradingBot:
             self.state_manager.update_metrics(
                 trade_result=outcome,
                 pnl=pnl,
-                current_equity=self.current_capital
+                current_equity=self.current_capital,
+                signal_type=settlement['signal'],
+                confidence=settlement['confidence']
             )
 
             # Save state
@@ -470,16 +871,11 @@ class TradingBot:
                 f"Win rate: {self.bot_state.winning_trades}/{self.bot_state.total_trades}"
             )
 
-            return True
-
-        except ExecutionError as e:
-            logger.error(f"Trade execution failed: {e}")
-            # Execution errors are recoverable, skip this cycle
-            return True
-
         except Exception as e:
-            logger.error(f"Critical error in trading cycle: {e}", exc_info=True)
-            return False
+            logger.error(f"Critical error recording settlement: {e}", exc_info=True)
+            self.should_shutdown = True
+            self.shutdown_reason = "Critical error recording settlement"
+            self.scheduler.stop()
 
     def _simulate_trade(
         self,
@@ -539,6 +935,40 @@ class TradingBot:
             except Exception as e:
                 logger.error(f"Error closing Binance WebSocket: {e}")
 
+        if self.order_book_stream:
+            try:
+                self.order_book_stream.close()
+                logger.info("Binance depth stream closed")
+            except Exception as e:
+                logger.error(f"Error closing Binance depth stream: {e}")
+
+        if self.metrics_server:
+            try:
+                self.metrics_server.stop()
+                logger.info("Metrics server stopped")
+            except Exception as e:
+                logger.error(f"Error stopping metrics server: {e}")
+
+        if self.tick_recorder:
+            try:
+                self.tick_recorder.close()
+                logger.info("Tick recorder closed")
+            except Exception as e:
+                logger.error(f"Error closing tick recorder: {e}")
+
+        # Stop market workers before the clients they call are closed
+        if self.market_executor:
+            self.market_executor.shutdown(wait=True)
+            logger.info("Market workers stopped")
+
+        # Stop market catalogue refreshes before closing the client they use
+        if self.market_catalogue:
+            try:
+                self.market_catalogue.close()
+                logger.info("Market catalogue stopped")
+            except Exception as e:
+                logger.error(f"Error stopping market catalogue: {e}")
+
         # Close Polymarket client
         if self.polymarket_client:
             try:
@@ -547,6 +977,14 @@ class TradingBot:
             except Exception as e:
                 logger.error(f"Error closing Polymarket client: {e}")
 
+        # Stop settlement tracking before closing the executor it polls through
+        if self.settlement_tracker:
+            try:
+                self.settlement_tracker.close()
+                logger.info("Settlement tracker closed")
+            except Exception as e:
+                logger.error(f"Error closing settlement tracker: {e}")
+
         # Close trade executor
         if self.trade_executor:
             try:
@@ -555,6 +993,12 @@ class TradingBot:
             except Exception as e:
                 logger.error(f"Error closing trade executor: {e}")
 
+        # Close shared HTTP connection pools after every API client is done
+        try:
+            close_transport()
+        except Exception as e:
+            logger.error(f"Error closing HTTP transport: {e}")
+
         # Final metrics report
         if self.state_manager:
             metrics = self.state_manager.get_metrics()
@@ -570,9 +1014,29 @@ class TradingBot:
             logger.info(f"Total PnL: ${self.current_capital - self.STARTING_CAPITAL:.2f}")
             logger.info(f"ROI: {(self.current_capital - self.STARTING_CAPITAL) / self.STARTING_CAPITAL * 100:.2f}%")
             logger.info(f"Max Drawdown: {metrics['max_drawdown']:.2f}%")
+            analytics = self.state_manager.get_analytics()
+            for label, key in (("Sharpe (per trade)", 'sharpe_ratio'), ("Sortino (per trade)", 'sortino_ratio'),
+                               ("Profit Factor", 'profit_factor'), ("Expectancy", 'expectancy'),
+                               ("Brier Score", 'brier_score')):
+                if analytics[key] is not None:
+                    logger.info(f"{label}: {analytics[key]:.4f}")
+            for signal_type, counts in analytics['hit_rates'].items():
+                logger.info(f"Hit Rate ({signal_type}): {counts['hit_rate']:.2f}% of {counts['trades']}")
+            for stage, latency in self.telemetry.summary().items():
+                if latency['count']:
+                    logger.info(
+                        f"Latency {stage}: p50 {latency['p50'] * 1000:.1f}ms, "
+                        f"p99 {latency['p99'] * 1000:.1f}ms over {latency['count']}"
+                    )
             logger.info(f"Shutdown Reason: {reason}")
             logger.info("=" * 60)
 
+            # Compact the state journals and fsync everything still pending
+            try:
+                self.state_manager.close()
+            except Exception as e:
+                logger.error(f"Error closing state files: {e}")
+
         logger.info("Bot shutdown complete")
 
 
@@ -0,0 +1,323 @@
+"""
+Market Catalogue for Polymarket Bot.
+
+This module caches Polymarket BTC market discovery so the trading cycle does
+not search, filter and parse the market list on every pass:
+- Parsed MarketData indexed by market ID and by expiry
+- Fresh for ``ttl`` seconds; after that, reads keep returning the cached
+  catalogue (stale-while-revalidate) while one background refresh runs
+- Reads block on a refresh only when the catalogue is empty or older than
+  ``ttl + max_stale``
+- An optional background thread refreshes every ``refresh_interval`` seconds
+  so the cycle normally never waits for the network
+
+Odds in the catalogue are as recent as the last refresh; keep ``ttl`` short
+enough for the strategy's tolerance.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .models import MarketData
+from .utils import ValidationError
+
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+class MarketCatalogue:
+    """
+    TTL cache of active BTC markets with background refresh.
+
+    ``client`` is a PolymarketClient (anything with ``get_btc_markets``,
+    ``parse_market_data`` and ``get_market_by_id``). Returned MarketData are
+    copies, so callers may update their metadata without touching the cache.
+    """
+
+    def __init__(
+        self,
+        client,
+        ttl: float = 30.0,
+        max_stale: float = 300.0,
+        refresh_interval: Optional[float] = None,
+        limit: int = 10,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the catalogue. Nothing is fetched until first use or start().
+
+        Args:
+            client: Polymarket API client
+            ttl: Seconds the catalogue is served without revalidating
+            max_stale: Further seconds stale data is served while revalidating
+            refresh_interval: Seconds between background refreshes (default: ttl)
+            limit: Maximum number of markets kept per refresh
+            clock: Monotonic time source
+
+        Raises:
+            ValueError: If ttl or refresh_interval is not positive or max_stale is negative
+        """
+        refresh_interval = ttl if refresh_interval is None else refresh_interval
+        if ttl <= 0 or refresh_interval <= 0 or max_stale < 0:
+            raise ValueError("ttl and refresh_interval must be positive and max_stale non-negative")
+        self.client = client
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.refresh_interval = refresh_interval
+        self.limit = limit
+        self._clock = clock
+
+        self._markets: Dict[str, MarketData] = {}
+        self._ranked: List[str] = []  # Discovery order, best first
+        self._expiry_index: List[Tuple[datetime, str]] = []
+        self._expiry: Dict[str, Optional[datetime]] = {}
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._revalidating: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.refresh_count = 0
+        self.refresh_errors = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the last successful refresh, or None if never refreshed."""
+        with self._lock:
+            refreshed_at = self._refreshed_at
+        return None if refreshed_at is None else self._clock() - refreshed_at
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._markets)
+
+    def refresh(self) -> int:
+        """
+        Rebuild the catalogue from the API.
+
+        Markets that fail to parse are skipped. On error the previous
+        catalogue is kept.
+
+        Returns:
+            Number of markets in the new catalogue
+
+        Raises:
+            PolymarketAPIError: If market discovery fails
+        """
+        with self._refresh_lock:
+            return self._refresh()
+
+    def _refresh(self) -> int:
+        # Called with the refresh lock held
+        try:
+            raw_markets = self.client.get_btc_markets(limit=self.limit)
+        except Exception as e:
+            self.refresh_errors += 1
+            self.last_error = str(e)
+            raise
+
+        markets: Dict[str, MarketData] = {}
+        ranked: List[str] = []
+        expiry: Dict[str, Optional[datetime]] = {}
+        for raw in raw_markets:
+            try:
+                market = self.client.parse_market_data(raw)
+            except (ValidationError, ValueError) as e:
+                logger.warning(f"Skipping unparseable market {raw.get('id') or raw.get('market_id')}: {e}")
+                continue
+            if market.market_id in markets:
+                continue
+            markets[market.market_id] = market
+            ranked.append(market.market_id)
+            # parse_market_data defaults a missing end date to now; only index real ones
+            has_end = raw.get('end_date') or raw.get('end_time')
+            expiry[market.market_id] = _as_utc(market.end_date) if has_end else None
+
+        expiry_index = sorted((end, market_id) for market_id, end in expiry.items() if end is not None)
+        with self._lock:
+            self._markets = markets
+            self._ranked = ranked
+            self._expiry = expiry
+            self._expiry_index = expiry_index
+            self._refreshed_at = self._clock()
+        self.refresh_count += 1
+        self.last_error = None
+        logger.info(f"Market catalogue refreshed: {len(markets)} BTC markets")
+        return len(markets)
+
+    def _refresh_if_older(self, seconds: float) -> None:
+        """Refresh unless another thread already did within ``seconds``."""
+        with self._refresh_lock:
+            age = self.age
+            if age is None or age >= seconds:
+                self._refresh()
+
+    def _revalidate(self, max_age: float) -> None:
+        try:
+            self._refresh_if_older(max_age)
+        except Exception as e:
+            logger.warning(f"Market catalogue revalidation failed, serving stale data: {e}")
+
+    def _start_revalidation(self, max_age: float) -> None:
+        # Called with the lock held
+        if self._revalidating is None or not self._revalidating.is_alive():
+            self._revalidating = threading.Thread(
+                target=self._revalidate, args=(max_age,), daemon=True, name="MarketCatalogueRevalidate"
+            )
+            self._revalidating.start()
+
+    def revalidate(self) -> None:
+        """
+        Refresh on a background thread now, whatever the catalogue's age.
+
+        Used when a market window closes, so the market that replaces it is
+        listed without waiting for the TTL. Does nothing if a background
+        refresh is already running.
+        """
+        with self._lock:
+            self._start_revalidation(0.0)
+
+    def _ensure_fresh(self) -> None:
+        """
+        Apply the TTL policy before a read.
+
+        Raises:
+            PolymarketAPIError: If a blocking refresh is needed and fails
+        """
+        age = self.age
+        if age is None or age >= self.ttl + self.max_stale:
+            self._refresh_if_older(self.ttl)
+        elif age >= self.ttl:
+            with self._lock:
+                self._start_revalidation(self.ttl)
+
+    def _is_tradeable(self, market_id: str, now: datetime) -> bool:
+        # Called with the lock held
+        market = self._markets[market_id]
+        if not market.is_active or market.is_closed:
+            return False
+        end = self._expiry.get(market_id)
+        return end is None or end > now
+
+    def best_market(self) -> MarketData:
+        """
+        Get the best active BTC market.
+
+        Markets keep their discovery order; the first one that is active and
+        has not ended since the last refresh wins.
+
+        Returns:
+            Copy of the market
+
+        Raises:
+            ValueError: If no active market is cached
+            PolymarketAPIError: If a blocking refresh is needed and fails
+        """
+        self._ensure_fresh()
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            for market_id in self._ranked:
+                if self._is_tradeable(market_id, now):
+                    return _copy(self._markets[market_id])
+        raise ValueError("No active Polymarket markets found")
+
+    def active_markets(self) -> List[MarketData]:
+        """
+        Get every active BTC market in discovery order.
+
+        Returns:
+            Copies of the markets
+
+        Raises:
+            PolymarketAPIError: If a blocking refresh is needed and fails
+        """
+        self._ensure_fresh()
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            return [_copy(self._markets[m]) for m in self._ranked if self._is_tradeable(m, now)]
+
+    def get(self, market_id: str) -> MarketData:
+        """
+        Get a market by ID, fetching it directly if it is not cached.
+
+        Args:
+            market_id: Market identifier
+
+        Returns:
+            Copy of the cached market, or the freshly fetched one
+
+        Raises:
+            PolymarketAPIError: If the market must be fetched and the request fails
+        """
+        self._ensure_fresh()
+        with self._lock:
+            market = self._markets.get(market_id)
+        if market is not None:
+            return _copy(market)
+        return self.client.parse_market_data(self.client.get_market_by_id(market_id))
+
+    def expiring_between(self, start: datetime, end: datetime) -> List[MarketData]:
+        """
+        Get cached markets whose end date falls in [start, end).
+
+        Args:
+            start: Range start (naive values are taken as UTC)
+            end: Range end (naive values are taken as UTC)
+
+        Returns:
+            Copies of the markets, soonest expiry first
+        """
+        start, end = _as_utc(start), _as_utc(end)
+        with self._lock:
+            lo = bisect_left(self._expiry_index, (start, ''))
+            hi = bisect_left(self._expiry_index, (end, ''))
+            return [_copy(self._markets[market_id]) for _, market_id in self._expiry_index[lo:hi]]
+
+    def start(self) -> None:
+        """Start the background refresh thread (first refresh runs immediately)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="MarketCatalogue")
+        self._thread.start()
+        logger.info(f"Market catalogue refreshing every {self.refresh_interval}s (ttl={self.ttl}s)")
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._refresh_if_older(self.refresh_interval)
+            except Exception as e:
+                logger.warning(f"Background market refresh failed: {e}")
+            age = self.age
+            wait = self.refresh_interval if age is None else max(self.refresh_interval - age, 0.0)
+            self._stop.wait(wait or self.refresh_interval)
+
+    def close(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def _copy(market: MarketData) -> MarketData:
+    return market.model_copy(update={'metadata': dict(market.metadata or {})})
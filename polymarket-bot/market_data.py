@@ -7,8 +7,9 @@ This module provides real-time market data integration including:
 - Real-time market data fetching with retry logic
 - Market metadata and pricing data management
 - Binance WebSocket client for real-time BTC/USDT price feed with BTCPriceData model
-- Technical indicator calculations (RSI, MACD)
-- Order book imbalance metrics
+- Technical indicator calculations (RSI, MACD), streamed per kline via IndicatorEngine
+- Order book imbalance metrics (from the local order book when streamed)
+- Concurrent per-cycle data fetching with per-source deadlines
 
 The service manages WebSocket connections with automatic reconnection logic,
 provides fallback mechanisms for data retrieval, and handles API interactions
@@ -18,20 +19,30 @@ with retry logic and error handling.
 import json
 import time
 import logging
-import requests
 import threading
 from typing import List, Dict, Any, Optional, Callable, Tuple
 from decimal import Decimal
 from threading import Thread, Lock
-from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field, replace
+from functools import partial
 from datetime import datetime, timezone
+import httpx
 import numpy as np
 import talib
 import websocket
 from websocket import WebSocketApp, WebSocketConnectionClosedException
 
-from .config import Config, get_config
+from .config import BINANCE_WS_URL, Config, get_config
 from .models import MarketData, OutcomeType, BTCPriceData
+from .indicators import IndicatorEngine, IndicatorSnapshot
+from .order_book import LocalOrderBook, OrderBookSyncError
+from .market_catalogue import MarketCatalogue
+from .price_history import PriceHistory
+from .recorder import TickRecorder
+from .records import PriceTick
+from .telemetry import STAGE_INDICATORS, get_telemetry
+from .transport import get_transport
 from .utils import (
     retry_with_backoff,
     validate_non_empty,
@@ -54,22 +65,37 @@ class BinanceWebSocketClient:
     """
     WebSocket client for streaming real-time BTC/USDT prices from Binance.
 
-    Manages WebSocket connection, maintains a rolling buffer of prices for
-    technical indicator calculation, and provides automatic reconnection
-    on network failures.
+    Manages WebSocket connection, keeps kline OHLCV rows in a preallocated
+    PriceHistory ring buffer, feeds every kline into an incremental
+    IndicatorEngine, and provides automatic reconnection on network failures.
+    The buffer holds one row per kline: in-progress updates overwrite the
+    newest row until the kline closes.
+
+    The buffer and indicators can be warm-started from REST klines; the
+    stream then continues from the last backfilled kline. With a recorder,
+    every kline message is also written to disk before it is processed.
     """
 
-    def __init__(self, buffer_size: int = 100):
+    KLINE_INTERVAL_MS = 60_000
+
+    def __init__(self, buffer_size: int = 100, recorder: Optional[TickRecorder] = None):
         """
         Initialize the Binance WebSocket client.
 
         Args:
-            buffer_size: Maximum number of price points to keep in memory
+            buffer_size: Number of price rows kept in the ring buffer
+            recorder: Optional TickRecorder receiving every kline message
         """
         self.config = get_config()
-        self.ws_url = "wss://stream.binance.com:9443/ws/btcusdt@kline_1m"
+        self.recorder = recorder
+        self.ws_url = f"{getattr(self.config, 'binance_ws_url', BINANCE_WS_URL)}/btcusdt@kline_1m"
         self.buffer_size = buffer_size
-        self.price_buffer: deque = deque(maxlen=buffer_size)
+        self.price_buffer = PriceHistory(buffer_size)
+        self.indicators = IndicatorEngine.from_config(self.config)
+        self.kline_close_listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self.last_closed_open_time: Optional[int] = None
+        # Open time of the in-progress kline held in the newest buffer row
+        self.provisional_open_time: Optional[int] = None
         self.ws: Optional[WebSocketApp] = None
         self.ws_thread: Optional[Thread] = None
         self.is_connected = False
@@ -134,19 +160,153 @@ class BinanceWebSocketClient:
         """
         try:
             data = json.loads(message)
+            if self.recorder is not None:
+                self.recorder.record(data)
 
             # Extract close price from kline data
             if 'k' in data:
-                close_price = float(data['k']['c'])
+                kline = data['k']
+                close_price = float(kline['c'])
+                closed = bool(kline.get('x', False))
+                open_time = kline.get('t')
+
+                with self.lock:
+                    last_closed = self.last_closed_open_time
+                if open_time is not None and last_closed is not None:
+                    if open_time <= last_closed:
+                        # Already committed by a backfill
+                        return
+                    if closed and open_time - last_closed > self.KLINE_INTERVAL_MS:
+                        self._fill_gap(last_closed + self.KLINE_INTERVAL_MS, open_time - 1)
 
                 with self.lock:
-                    self.price_buffer.append(close_price)
+                    # Updates to the same kline overwrite its row until it closes
+                    write = (
+                        self.price_buffer.replace_last
+                        if open_time is not None and open_time == self.provisional_open_time
+                        else self.price_buffer.append
+                    )
+                    write(
+                        close_price,
+                        timestamp=open_time if open_time is not None else time.time() * 1000,
+                        open=float(kline['o']) if 'o' in kline else None,
+                        high=float(kline['h']) if 'h' in kline else None,
+                        low=float(kline['l']) if 'l' in kline else None,
+                        volume=float(kline.get('v', 'nan'))
+                    )
+                    self.provisional_open_time = None if closed else open_time
+                    if closed and open_time is not None:
+                        self.last_closed_open_time = open_time
+
+                # Closed klines (k.x) are committed; in-progress updates are provisional
+                self.indicators.update(close_price, closed=closed)
 
                 logger.debug(f"Received BTC price: {close_price:.2f} (buffer size: {len(self.price_buffer)})")
 
+                if closed:
+                    event = {'open_time': open_time, 'close_time': kline.get('T'), 'close': close_price}
+                    if 'h' in kline and 'l' in kline:
+                        event.update(high=float(kline['h']), low=float(kline['l']))
+                    self._notify_kline_close(event)
+
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.error(f"Error parsing WebSocket message: {e}")
 
+    def warm_start(self, klines: Optional[List[Dict[str, Any]]] = None) -> int:
+        """
+        Pre-fill the price buffer and indicator state from recent closed klines.
+
+        Call before connect(): the stream then continues from the last
+        backfilled kline, skipping klines it repeats (by open time) and
+        fetching any it missed.
+
+        Args:
+            klines: Closed klines oldest first, as returned by
+                fetch_recent_klines (e.g. from a local recording). If None,
+                enough recent klines to warm up the indicators are fetched
+                from the REST API.
+
+        Returns:
+            Number of klines applied
+
+        Raises:
+            ConnectionError: If klines must be fetched and the request fails
+        """
+        if klines is None:
+            limit = min(1000, max(self.buffer_size, self.indicators.warmup_period * 4))
+            klines = fetch_recent_klines(limit=limit, config=self.config)
+
+        applied = self.backfill(klines)
+        logger.info(
+            f"Warm start applied {applied} klines "
+            f"(indicators {'ready' if self.indicators.ready else 'warming up'})"
+        )
+        return applied
+
+    def backfill(self, klines: List[Dict[str, Any]]) -> int:
+        """
+        Commit closed klines newer than the last committed one.
+
+        Args:
+            klines: Closed klines oldest first, each with ``open_time`` (ms)
+                and ``close`` (``open``, ``high``, ``low`` and ``volume`` are
+                stored when present)
+
+        Returns:
+            Number of klines applied
+        """
+        applied = 0
+        with self.lock:
+            for kline in klines:
+                open_time = kline['open_time']
+                if self.last_closed_open_time is not None and open_time <= self.last_closed_open_time:
+                    continue
+                # The first committed kline takes the place of an in-progress row,
+                # which the stream rewrites on its next update
+                write = self.price_buffer.replace_last if self.provisional_open_time is not None else self.price_buffer.append
+                self.provisional_open_time = None
+                write(
+                    kline['close'],
+                    timestamp=open_time,
+                    open=kline.get('open'),
+                    high=kline.get('high'),
+                    low=kline.get('low'),
+                    volume=kline.get('volume', float('nan'))
+                )
+                self.indicators.update(kline['close'], closed=True)
+                self.last_closed_open_time = open_time
+                applied += 1
+        return applied
+
+    def _fill_gap(self, start_time: int, end_time: int) -> None:
+        """Fetch and commit klines missed by the stream (e.g. across a reconnect)."""
+        try:
+            missing = fetch_recent_klines(start_time=start_time, end_time=end_time, config=self.config)
+            logger.info(f"Filled kline gap with {self.backfill(missing)} klines")
+        except ConnectionError as e:
+            logger.warning(f"Could not fill kline gap: {e}")
+
+    def add_kline_close_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Register a callback for closed klines.
+
+        The callback runs on the WebSocket thread and receives a dict with
+        ``open_time`` and ``close_time`` (ms since epoch), ``close`` and,
+        when the message has them, ``high`` and ``low``, so it should only
+        hand the event off or do O(1) work (e.g. EventScheduler.publish).
+
+        Args:
+            listener: Callable receiving the closed kline
+        """
+        self.kline_close_listeners.append(listener)
+
+    def _notify_kline_close(self, kline: Dict[str, Any]) -> None:
+        for listener in list(self.kline_close_listeners):
+            try:
+                listener(kline)
+            except Exception as e:
+                logger.error(f"Error in kline close listener: {e}")
+
     def _on_error(self, ws, error) -> None:
         """Handle WebSocket errors."""
         logger.error(f"Binance WebSocket error: {error}")
@@ -196,10 +356,34 @@ class BinanceWebSocketClient:
             List of prices (oldest to newest)
         """
         with self.lock:
-            prices = list(self.price_buffer)
+            return self.price_buffer.closes(count).tolist()
+
+    def get_price_window(self, count: Optional[int] = None) -> np.ndarray:
+        """
+        Get the most recent close prices without copying.
+
+        Args:
+            count: Number of recent prices (default: the whole buffer)
+
+        Returns:
+            Read-only view of the ring buffer (oldest to newest); it stays
+            unchanged for the next ``buffer_size - count`` messages
+        """
+        with self.lock:
+            return self.price_buffer.closes(count)
 
-        # Return up to 'count' most recent prices
-        return prices[-count:] if len(prices) >= count else prices
+    def get_ohlcv_window(self, count: Optional[int] = None) -> np.ndarray:
+        """
+        Get the most recent OHLCV rows without copying.
+
+        Args:
+            count: Number of recent rows (default: the whole buffer)
+
+        Returns:
+            Read-only view of shape (6, rows) in price_history.COLUMNS order
+        """
+        with self.lock:
+            return self.price_buffer.window(count)
 
     def get_latest_price(self) -> Optional[float]:
         """
@@ -209,9 +393,16 @@ class BinanceWebSocketClient:
             Latest BTC price or None if buffer is empty
         """
         with self.lock:
-            if len(self.price_buffer) > 0:
-                return self.price_buffer[-1]
-        return None
+            return self.price_buffer.last()
+
+    def get_indicators(self) -> IndicatorSnapshot:
+        """
+        Get the current RSI and MACD values without recomputation.
+
+        Returns:
+            IndicatorSnapshot including the in-progress kline's latest price
+        """
+        return self.indicators.snapshot()
 
     def close(self) -> None:
         """Close the WebSocket connection gracefully."""
@@ -243,18 +434,19 @@ class PolymarketClient:
         self.config = config
         self.base_url = config.polymarket_base_url
         self.api_key = config.polymarket_api_key
-        self.session = requests.Session()
-
-        # Set default headers
-        self.session.headers.update({
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        })
+        # Requests share the process-wide connection pool for this host
+        self.session = get_transport().session(
+            headers={
+                'Authorization': f'Bearer {self.api_key}',
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            },
+            endpoint='polymarket.markets'
+        )
 
         logger.info(f"Initialized PolymarketClient with base URL: {self.base_url}")
 
-    @retry_with_backoff(max_attempts=3, base_delay=1.0, exceptions=(requests.RequestException,))
+    @retry_with_backoff(max_attempts=3, base_delay=1.0, exceptions=(httpx.HTTPError,))
     def _make_request(
         self,
         method: str,
@@ -284,8 +476,7 @@ class PolymarketClient:
                 method=method,
                 url=url,
                 params=params,
-                json=data,
-                timeout=30
+                json=data
             )
 
             # Log rate limit information if available
@@ -297,12 +488,12 @@ class PolymarketClient:
 
             return response.json()
 
-        except requests.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             error_msg = f"HTTP error {e.response.status_code}: {e.response.text}"
             logger.error(error_msg)
             raise PolymarketAPIError(error_msg) from e
 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             error_msg = f"Request failed: {str(e)}"
             logger.error(error_msg)
             raise PolymarketAPIError(error_msg) from e
@@ -684,32 +875,45 @@ class BinanceWebSocket:
     WebSocket client for Binance BTC/USDT price feed.
 
     Connects to Binance WebSocket API to receive real-time BTC/USDT price updates.
-    Implements automatic reconnection logic and maintains a history of recent prices
-    for technical indicator calculations.
+    Implements automatic reconnection logic and keeps recent prices in a
+    PriceHistory ring buffer for technical indicator calculations (ticker rows
+    store the last price as OHLC and the 24h quote volume as volume).
+
+    Messages are parsed into lightweight PriceTick records; BTCPriceData
+    models are only built when a caller reads latest_price or registers
+    on_price_update.
     """
 
     # Binance WebSocket endpoints
-    STREAM_URL = "wss://stream.binance.com:9443/ws"
+    STREAM_URL = BINANCE_WS_URL
     TICKER_STREAM = "btcusdt@ticker"
 
     def __init__(
         self,
         on_price_update: Optional[Callable[[BTCPriceData], None]] = None,
-        history_size: int = 200
+        history_size: int = 200,
+        recorder: Optional[TickRecorder] = None,
+        on_tick: Optional[Callable[[PriceTick], None]] = None
     ):
         """
         Initialize Binance WebSocket client.
 
         Args:
             on_price_update: Optional callback function to call on each price update
+                (receives a BTCPriceData model; prefer on_tick on hot paths)
             history_size: Number of recent price updates to keep in history (default: 200)
+            recorder: Optional TickRecorder receiving every ticker message
+            on_tick: Optional callback receiving each update as a PriceTick
         """
         self.on_price_update = on_price_update
+        self.on_tick = on_tick
         self.history_size = history_size
+        self.recorder = recorder
 
         # Price data storage
-        self.latest_price: Optional[BTCPriceData] = None
-        self.price_history: deque = deque(maxlen=history_size)
+        self.latest_tick: Optional[PriceTick] = None
+        self.price_history = PriceHistory(history_size)
+        self.lock = threading.Lock()
 
         # WebSocket connection
         self.ws: Optional[websocket.WebSocketApp] = None
@@ -805,22 +1009,34 @@ class BinanceWebSocket:
         try:
             self.last_message_time = datetime.now(timezone.utc)
             data = json.loads(message)
+            if self.recorder is not None:
+                self.recorder.record(data)
 
-            # Parse Binance ticker data
-            price_data = self._parse_ticker_data(data)
+            # Parse and validate Binance ticker data once, at the boundary
+            tick = PriceTick.from_binance_ticker(data)
 
             # Update latest price and history
-            self.latest_price = price_data
-            self.price_history.append(price_data)
+            self.latest_tick = tick
+            with self.lock:
+                self.price_history.append(
+                    tick.price,
+                    timestamp=tick.timestamp_ms,
+                    volume=tick.volume_24h if tick.volume_24h is not None else float('nan')
+                )
 
-            # Call user callback if provided
+            # Call user callbacks if provided
+            if self.on_tick:
+                try:
+                    self.on_tick(tick)
+                except Exception as e:
+                    logger.error(f"Error in tick callback: {e}")
             if self.on_price_update:
                 try:
-                    self.on_price_update(price_data)
+                    self.on_price_update(tick.to_model())
                 except Exception as e:
                     logger.error(f"Error in price update callback: {e}")
 
-            logger.debug(f"BTC price update: {price_data.price} USDT")
+            logger.debug(f"BTC price update: {tick.price} USDT")
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse WebSocket message: {e}")
@@ -854,6 +1070,9 @@ class BinanceWebSocket:
         """
         Parse Binance ticker data into BTCPriceData model.
 
+        The stream itself uses PriceTick.from_binance_ticker; this builds
+        the pydantic model from the same validated record.
+
         Args:
             data: Raw ticker data from Binance WebSocket
 
@@ -863,33 +1082,13 @@ class BinanceWebSocket:
         Raises:
             ValidationError: If required fields are missing or invalid
         """
-        try:
-            # Extract price data from Binance 24hr ticker format
-            # Reference: https://binance-docs.github.io/apidocs/spot/en/#individual-symbol-ticker-streams
-            price = Decimal(str(data.get('c', data.get('lastPrice', 0))))
-            timestamp = datetime.fromtimestamp(int(data.get('E', 0)) / 1000)
-
-            # 24-hour statistics
-            volume_24h = data.get('q', data.get('quoteVolume'))
-            high_24h = data.get('h', data.get('highPrice'))
-            low_24h = data.get('l', data.get('lowPrice'))
-            price_change_24h = data.get('p', data.get('priceChange'))
-            price_change_percent_24h = data.get('P', data.get('priceChangePercent'))
-
-            return BTCPriceData(
-                symbol=data.get('s', 'BTCUSDT'),
-                price=price,
-                timestamp=timestamp if timestamp.year > 1970 else datetime.now(timezone.utc),
-                volume_24h=Decimal(str(volume_24h)) if volume_24h else None,
-                high_24h=Decimal(str(high_24h)) if high_24h else None,
-                low_24h=Decimal(str(low_24h)) if low_24h else None,
-                price_change_24h=Decimal(str(price_change_24h)) if price_change_24h else None,
-                price_change_percent_24h=Decimal(str(price_change_percent_24h)) if price_change_percent_24h else None,
-                metadata=data
-            )
+        return PriceTick.from_binance_ticker(data).to_model()
 
-        except (KeyError, ValueError, TypeError) as e:
-            raise ValidationError(f"Failed to parse Binance ticker data: {e}")
+    @property
+    def latest_price(self) -> Optional[BTCPriceData]:
+        """Most recent update as a BTCPriceData model, or None before the first message."""
+        tick = self.latest_tick
+        return tick.to_model() if tick is not None else None
 
     def get_latest_price(self) -> Optional[BTCPriceData]:
         """
@@ -904,18 +1103,29 @@ class BinanceWebSocket:
         """
         Get historical price data.
 
+        Rows are rebuilt from the ring buffer, so they carry the symbol,
+        price, timestamp and 24h quote volume but not the other 24h
+        statistics or raw metadata (those are on get_latest_price()).
+
         Args:
             limit: Maximum number of price updates to return (default: all)
 
         Returns:
             List of BTCPriceData in chronological order
         """
-        history = list(self.price_history)
-
-        if limit and limit < len(history):
-            return history[-limit:]
-
-        return history
+        with self.lock:
+            window = self.price_history.window(limit or None)
+            timestamps, closes, volumes = window[0].tolist(), window[4].tolist(), window[5].tolist()
+        symbol = self.latest_tick.symbol if self.latest_tick else 'BTCUSDT'
+        return [
+            BTCPriceData(
+                symbol=symbol,
+                price=Decimal(str(price)),
+                timestamp=datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc),
+                volume_24h=None if np.isnan(volume) else Decimal(str(volume))
+            )
+            for timestamp, price, volume in zip(timestamps, closes, volumes)
+        ]
 
     def get_price_series(self, limit: Optional[int] = None) -> List[Decimal]:
         """
@@ -927,8 +1137,22 @@ class BinanceWebSocket:
         Returns:
             List of price values in chronological order
         """
-        history = self.get_price_history(limit)
-        return [price_data.price for price_data in history]
+        with self.lock:
+            prices = self.price_history.closes(limit or None).tolist()
+        return [Decimal(str(price)) for price in prices]
+
+    def get_price_array(self, limit: Optional[int] = None) -> np.ndarray:
+        """
+        Get recent prices as a float array without copying.
+
+        Args:
+            limit: Maximum number of prices to return (default: all)
+
+        Returns:
+            Read-only view of the ring buffer (oldest to newest)
+        """
+        with self.lock:
+            return self.price_history.closes(limit or None)
 
     def is_healthy(self, max_message_age_seconds: int = 60) -> bool:
         """
@@ -1074,7 +1298,7 @@ def calculate_macd(
     return current_macd, current_signal
 
 
-def get_order_book_imbalance() -> float:
+def get_order_book_imbalance(order_book: Optional[LocalOrderBook] = None) -> float:
     """
     Calculate order book imbalance from Binance order book.
 
@@ -1083,20 +1307,33 @@ def get_order_book_imbalance() -> float:
     - Imbalance > 1.0: More buying pressure
     - Imbalance < 1.0: More selling pressure
 
+    Reads the top 10 levels of ``order_book`` from memory when it is
+    synchronized; otherwise fetches them from the REST depth endpoint.
+
+    Args:
+        order_book: Optional stream-maintained local order book
+
     Returns:
         Order book imbalance ratio (bid_volume / ask_volume)
 
     Raises:
         ConnectionError: If unable to fetch order book data
     """
+    if order_book is not None:
+        try:
+            return order_book.imbalance(10)
+        except OrderBookSyncError as e:
+            logger.debug(f"Local order book unavailable ({e}), using REST depth")
+
     config = get_config()
 
     try:
         # Fetch order book from Binance REST API
-        response = requests.get(
+        response = get_transport().request_sync(
+            'GET',
             f"{config.binance_base_url}/api/v3/depth",
-            params={'symbol': 'BTCUSDT', 'limit': 10},
-            timeout=5
+            endpoint='binance.depth',
+            params={'symbol': 'BTCUSDT', 'limit': 10}
         )
         response.raise_for_status()
 
@@ -1119,29 +1356,250 @@ def get_order_book_imbalance() -> float:
 
         return imbalance
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error fetching order book: {e}")
         raise ConnectionError(f"Failed to fetch order book data: {e}")
 
 
-def get_market_data(
-    binance_client: BinanceWebSocketClient,
+# Per-cycle analysis that get_market_snapshot adds to the market metadata
+_ANALYSIS_METADATA_KEYS = (
+    'btc_price', 'rsi_14', 'macd_line', 'macd_signal', 'order_book_imbalance',
+    'order_book_source', 'price_buffer_size', 'degraded_sources', 'fetch_latency'
+)
+
+# Order book imbalance used when the order book misses its deadline: it sits
+# between the bullish and bearish thresholds, so it never confirms a signal
+NEUTRAL_ORDER_BOOK_IMBALANCE = 1.0
+
+_fetch_executor: Optional[ThreadPoolExecutor] = None
+_fetch_executor_lock = Lock()
+
+
+def _get_fetch_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool used for per-cycle data fetches."""
+    global _fetch_executor
+    with _fetch_executor_lock:
+        if _fetch_executor is None:
+            _fetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="market-data")
+        return _fetch_executor
+
+
+@dataclass(frozen=True)
+class SourceResult:
+    """Outcome of one data source fetched by fetch_concurrently."""
+    name: str
+    value: Any = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the source returned a value before its deadline."""
+        return self.error is None
+
+
+def fetch_concurrently(
+    fetchers: Dict[str, Callable[[], Any]],
+    deadlines: Dict[str, float]
+) -> Dict[str, SourceResult]:
+    """
+    Run independent data fetches in parallel, each with its own deadline.
+
+    All fetchers start together, so the total wait is bounded by the largest
+    deadline rather than the sum of the fetch latencies. A fetcher that raises
+    or is still running at its deadline is reported as failed; its result is
+    discarded if it completes later.
+
+    Args:
+        fetchers: Mapping of source name to a zero-argument fetch function
+        deadlines: Mapping of source name to seconds allowed from the start
+
+    Returns:
+        Mapping of source name to SourceResult
+    """
+    executor = _get_fetch_executor()
+    start = time.monotonic()
+    futures = {name: executor.submit(fetch) for name, fetch in fetchers.items()}
+    return _collect_results(futures, start, deadlines)
+
+
+def _collect_results(
+    futures: Dict[str, Future],
+    start: float,
+    deadlines: Dict[str, float]
+) -> Dict[str, SourceResult]:
+    """
+    Wait for submitted fetches, giving each until ``start + deadline``.
+
+    Args:
+        futures: Mapping of source name to its running future
+        start: time.monotonic() value the fetches were submitted at
+        deadlines: Mapping of source name to seconds allowed from ``start``
+
+    Returns:
+        Mapping of source name to SourceResult
+    """
+    results = {}
+    for name in sorted(futures, key=lambda n: deadlines[n]):
+        future = futures[name]
+        remaining = start + deadlines[name] - time.monotonic()
+        try:
+            value = future.result(timeout=max(remaining, 0))
+            results[name] = SourceResult(name, value=value, elapsed=time.monotonic() - start)
+        except FutureTimeoutError:
+            future.cancel()
+            results[name] = SourceResult(
+                name,
+                error=f"deadline of {deadlines[name]:.1f}s exceeded",
+                elapsed=time.monotonic() - start
+            )
+        except Exception as e:
+            results[name] = SourceResult(name, error=str(e) or type(e).__name__, elapsed=time.monotonic() - start)
+
+    return results
+
+
+def _with_live_odds(polymarket_client: PolymarketClient, market: MarketData) -> MarketData:
+    """
+    Return a copy of a catalogued market carrying its current odds.
+
+    Args:
+        polymarket_client: Initialized Polymarket API client
+        market: Market as served from the catalogue cache
+
+    Returns:
+        MarketData with yes_price/no_price fetched now
+
+    Raises:
+        PolymarketAPIError: If the odds request fails
+    """
+    yes_price, no_price = polymarket_client.get_market_odds(market.market_id)
+    return market.model_copy(update={'yes_price': yes_price, 'no_price': no_price})
+
+
+def _fetch_market(
     polymarket_client: PolymarketClient,
-    market_id: Optional[str] = None
+    market_id: Optional[str],
+    catalogue: Optional[MarketCatalogue] = None
 ) -> MarketData:
     """
-    Aggregate market data from multiple sources.
+    Resolve the Polymarket market for the cycle.
+
+    Args:
+        polymarket_client: Initialized Polymarket API client
+        market_id: Specific market ID, or None to use the first active BTC market
+        catalogue: Optional market catalogue; when given, the market is picked
+            from its cache instead of searching the API, and only its odds
+            are fetched
+
+    Returns:
+        Parsed MarketData including current odds
+
+    Raises:
+        ValueError: If no active market is found
+    """
+    if catalogue is not None:
+        # Discovery is cached, odds are not: the catalogue's prices can be
+        # minutes old and the cycle trades at whatever price is returned here
+        market = catalogue.best_market() if market_id is None else catalogue.get(market_id)
+        return _with_live_odds(polymarket_client, market)
+    if market_id is None:
+        btc_markets = polymarket_client.get_btc_markets(limit=10)
+        if not btc_markets:
+            raise ValueError("No active Polymarket markets found")
+        # Use the first active market
+        return polymarket_client.parse_market_data(btc_markets[0])
+    return polymarket_client.parse_market_data(polymarket_client.get_market_by_id(market_id))
 
-    Combines real-time BTC prices, technical indicators, and Polymarket
-    odds into a single MarketData object for strategy evaluation.
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """
+    Immutable market view computed once per trading cycle.
+
+    Holds the price slice, technical indicators, order book imbalance and
+    Polymarket market used for a decision, so prediction, risk checks and
+    logging all read the same values without recomputing or refetching them.
+    ``degraded_sources`` names optional sources that failed or missed their
+    deadline and were replaced with neutral values.
+    """
+    market: MarketData
+    prices: Tuple[float, ...]
+    btc_price: float
+    rsi: float
+    macd_line: float
+    macd_signal: float
+    order_book_imbalance: float
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    degraded_sources: Tuple[str, ...] = ()
+
+    @property
+    def market_id(self) -> str:
+        """ID of the Polymarket market in this snapshot."""
+        return self.market.market_id
+
+    def recent_prices(self, count: int) -> List[float]:
+        """
+        Get the most recent prices of the snapshot.
+
+        Args:
+            count: Number of prices to return
+
+        Returns:
+            Up to ``count`` prices (oldest to newest)
+        """
+        return list(self.prices[-count:])
+
+    def for_market(self, market: MarketData) -> "MarketSnapshot":
+        """
+        Reuse this snapshot's prices and indicators for another market.
+
+        Args:
+            market: Market to pair with the shared data
+
+        Returns:
+            MarketSnapshot for ``market`` with the same analysis metadata
+        """
+        analysis = {key: self.market.metadata[key] for key in _ANALYSIS_METADATA_KEYS if key in self.market.metadata}
+        market = market.model_copy(update={'metadata': {**(market.metadata or {}), **analysis}})
+        return replace(self, market=market)
+
+
+def get_market_snapshot(
+    binance_client: BinanceWebSocketClient,
+    polymarket_client: PolymarketClient,
+    market_id: Optional[str] = None,
+    order_book: Optional[LocalOrderBook] = None,
+    catalogue: Optional[MarketCatalogue] = None
+) -> MarketSnapshot:
+    """
+    Build the per-cycle market snapshot from all sources.
+
+    Starts the order book request and the Polymarket market lookup
+    concurrently, then reads the price buffer once and takes RSI/MACD from the
+    streaming indicator engine (or computes them once from the buffer while it
+    warms up) while those requests are in flight. Each request has its own
+    deadline from the configuration, so the data stage takes as long as the
+    slowest source rather than the sum of all of them.
+
+    When a synchronized local order book is supplied, the imbalance is read
+    from memory and no depth request is made. Likewise, a market catalogue
+    replaces the market search with a cache lookup; the chosen market's odds
+    are still fetched every cycle.
+
+    The market is required. The order book is optional: if it fails or misses
+    its deadline, a neutral imbalance is used (which never confirms a signal)
+    and the snapshot lists it in ``degraded_sources``.
 
     Args:
         binance_client: Connected Binance WebSocket client
         polymarket_client: Initialized Polymarket API client
         market_id: Optional specific market ID (will search if not provided)
+        order_book: Optional stream-maintained local order book
+        catalogue: Optional market catalogue for the market lookup
 
     Returns:
-        MarketData object with all aggregated data
+        MarketSnapshot for this cycle
 
     Raises:
         ValueError: If insufficient data or market not available
@@ -1151,53 +1609,86 @@ def get_market_data(
     # Get configuration for indicator parameters
     config = get_config()
 
+    # Read the stream-maintained order book if it is in sync
+    local_imbalance = None
+    if order_book is not None:
+        try:
+            local_imbalance = order_book.imbalance(10)
+        except OrderBookSyncError as e:
+            logger.warning(f"Local order book unavailable ({e}), using REST depth")
+
+    # Start network-bound sources first so they overlap with local work
+    executor = _get_fetch_executor()
+    start = time.monotonic()
+    pending = {'market': executor.submit(_fetch_market, polymarket_client, market_id, catalogue)}
+    if local_imbalance is None:
+        pending['order_book'] = executor.submit(get_order_book_imbalance)
+
     # Get price data from Binance
     prices = binance_client.get_latest_prices(100)
 
+    # Prefer the streaming indicator state; fall back to recomputing from the buffer
+    indicators = None
+    if isinstance(getattr(binance_client, 'indicators', None), IndicatorEngine):
+        indicators = binance_client.get_indicators()
+        if not indicators.ready:
+            indicators = None
+
     # Calculate minimum required prices based on MACD configuration
     min_prices = config.macd_slow_period + config.macd_signal_period - 1
-    if len(prices) < min_prices:
+    if indicators is None and len(prices) < min_prices:
         raise ValueError(
             f"Insufficient price data for indicators. "
             f"Need at least {min_prices}, got {len(prices)}"
         )
+    if not prices:
+        raise ValueError("Insufficient price data for indicators. No prices received")
 
     latest_price = prices[-1]
 
     # Calculate technical indicators with configured parameters
     try:
-        rsi_value = calculate_rsi(prices, period=config.rsi_period)
-        macd_line, macd_signal = calculate_macd(
-            prices,
-            fast_period=config.macd_fast_period,
-            slow_period=config.macd_slow_period,
-            signal_period=config.macd_signal_period
-        )
-        order_book_imb = get_order_book_imbalance()
+        with get_telemetry().span(STAGE_INDICATORS):
+            if indicators is not None:
+                rsi_value = indicators.rsi
+                macd_line, macd_signal = indicators.macd_line, indicators.macd_signal
+            else:
+                rsi_value = calculate_rsi(prices, period=config.rsi_period)
+                macd_line, macd_signal = calculate_macd(
+                    prices,
+                    fast_period=config.macd_fast_period,
+                    slow_period=config.macd_slow_period,
+                    signal_period=config.macd_signal_period
+                )
     except Exception as e:
         logger.error(f"Error calculating indicators: {e}")
         raise ValueError(f"Failed to calculate technical indicators: {e}")
 
+    results = _collect_results(pending, start, {
+        'order_book': config.order_book_fetch_deadline,
+        'market': config.market_fetch_deadline,
+    })
+    if local_imbalance is not None:
+        results['order_book'] = SourceResult('order_book', value=local_imbalance)
+
     # Get Polymarket market and odds
-    if market_id is None:
-        # Search for active BTC markets
-        btc_markets = polymarket_client.get_btc_markets(limit=10)
-        if not btc_markets:
-            raise ValueError("No active Polymarket markets found")
-        # Use the first active market
-        market_raw = btc_markets[0]
-        market_data = polymarket_client.parse_market_data(market_raw)
-        market_id = market_data.market_id
+    market_result = results['market']
+    if not market_result.ok:
+        logger.error(f"Error fetching Polymarket market: {market_result.error}")
+        raise ValueError(f"Failed to fetch market odds: {market_result.error}")
+    market_data = market_result.value
+
+    degraded_sources = []
+    order_book_result = results['order_book']
+    if order_book_result.ok:
+        order_book_imb = order_book_result.value
     else:
-        # Get specific market
-        try:
-            yes_price, no_price = polymarket_client.get_market_odds(market_id)
-            # Get full market data for additional fields
-            market_raw = polymarket_client.get_market_by_id(market_id)
-            market_data = polymarket_client.parse_market_data(market_raw)
-        except Exception as e:
-            logger.error(f"Error fetching Polymarket odds: {e}")
-            raise ValueError(f"Failed to fetch market odds: {e}")
+        logger.warning(
+            f"Order book unavailable ({order_book_result.error}), "
+            f"using neutral imbalance {NEUTRAL_ORDER_BOOK_IMBALANCE}"
+        )
+        order_book_imb = NEUTRAL_ORDER_BOOK_IMBALANCE
+        degraded_sources.append('order_book')
 
     # Add metadata with technical analysis
     market_data.metadata = market_data.metadata or {}
@@ -1207,16 +1698,171 @@ def get_market_data(
         'macd_line': macd_line,
         'macd_signal': macd_signal,
         'order_book_imbalance': order_book_imb,
-        'price_buffer_size': len(prices)
+        'order_book_source': 'stream' if local_imbalance is not None else 'rest',
+        'price_buffer_size': len(prices),
+        'degraded_sources': list(degraded_sources),
+        'fetch_latency': {name: round(result.elapsed, 4) for name, result in results.items()}
     })
 
     logger.info(
         f"Market data aggregated - BTC: ${latest_price:.2f}, "
         f"RSI: {rsi_value:.2f}, MACD: {macd_line:.2f}/{macd_signal:.2f}, "
-        f"OB Imbalance: {order_book_imb:.4f}"
+        f"OB Imbalance: {order_book_imb:.4f}, "
+        f"fetch: {max(result.elapsed for result in results.values()):.3f}s"
     )
 
-    return market_data
+    return MarketSnapshot(
+        market=market_data,
+        prices=tuple(prices),
+        btc_price=latest_price,
+        rsi=rsi_value,
+        macd_line=macd_line,
+        macd_signal=macd_signal,
+        order_book_imbalance=order_book_imb,
+        degraded_sources=tuple(degraded_sources)
+    )
+
+
+def get_market_snapshots(
+    binance_client: BinanceWebSocketClient,
+    polymarket_client: PolymarketClient,
+    max_markets: int,
+    order_book: Optional[LocalOrderBook] = None,
+    catalogue: Optional[MarketCatalogue] = None
+) -> List[MarketSnapshot]:
+    """
+    Build snapshots for up to ``max_markets`` active BTC markets.
+
+    The price slice, indicators and order book imbalance are computed once
+    (by get_market_snapshot for the best market) and shared by every other
+    market's snapshot. With a catalogue the extra markets come from its cache
+    and their current odds are fetched concurrently; a market whose odds
+    cannot be fetched in time is skipped rather than evaluated at stale
+    prices. Without a catalogue they cost one more market search.
+
+    Args:
+        binance_client: Connected Binance WebSocket client
+        polymarket_client: Initialized Polymarket API client
+        max_markets: Maximum number of markets to return
+        order_book: Optional stream-maintained local order book
+        catalogue: Optional market catalogue for the market lookups
+
+    Returns:
+        Snapshots, best market first
+
+    Raises:
+        ValueError: If insufficient data or no market is available
+    """
+    primary = get_market_snapshot(binance_client, polymarket_client, order_book=order_book, catalogue=catalogue)
+    if max_markets <= 1:
+        return [primary]
+
+    if catalogue is not None:
+        candidates = [m for m in catalogue.active_markets() if m.market_id != primary.market_id][:max_markets - 1]
+        deadline = get_config().market_fetch_deadline
+        results = fetch_concurrently(
+            {m.market_id: partial(_with_live_odds, polymarket_client, m) for m in candidates},
+            {m.market_id: deadline for m in candidates}
+        )
+        markets = []
+        for market in candidates:
+            result = results[market.market_id]
+            if result.ok:
+                markets.append(result.value)
+            else:
+                logger.warning(f"Skipping market {market.market_id}: odds unavailable ({result.error})")
+    else:
+        markets = [polymarket_client.parse_market_data(m) for m in polymarket_client.get_btc_markets(limit=max_markets)]
+
+    snapshots = [primary]
+    for market in markets:
+        if len(snapshots) >= max_markets:
+            break
+        if market.market_id != primary.market_id:
+            snapshots.append(primary.for_market(market))
+
+    logger.info(f"Evaluating {len(snapshots)} markets on shared market data")
+    return snapshots
+
+
+def get_market_data(
+    binance_client: BinanceWebSocketClient,
+    polymarket_client: PolymarketClient,
+    market_id: Optional[str] = None,
+    order_book: Optional[LocalOrderBook] = None,
+    catalogue: Optional[MarketCatalogue] = None
+) -> MarketData:
+    """
+    Aggregate market data from multiple sources.
+
+    Combines real-time BTC prices, technical indicators, and Polymarket
+    odds into a single MarketData object for strategy evaluation. The
+    indicator values are stored in ``metadata``; use get_market_snapshot
+    to also keep the price slice for the rest of the cycle.
+
+    Args:
+        binance_client: Connected Binance WebSocket client
+        polymarket_client: Initialized Polymarket API client
+        market_id: Optional specific market ID (will search if not provided)
+        order_book: Optional stream-maintained local order book
+        catalogue: Optional market catalogue for the market lookup
+
+    Returns:
+        MarketData object with all aggregated data
+
+    Raises:
+        ValueError: If insufficient data or market not available
+    """
+    return get_market_snapshot(binance_client, polymarket_client, market_id, order_book, catalogue).market
+
+
+def fetch_recent_klines(
+    limit: int = 500,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None,
+    config: Optional[Config] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetch closed 1-minute BTC/USDT klines from the Binance REST API.
+
+    The kline still in progress is excluded, so every returned kline is final.
+
+    Args:
+        limit: Maximum number of klines (Binance allows up to 1000)
+        start_time: Optional earliest open time (ms since epoch)
+        end_time: Optional latest open time (ms since epoch)
+        config: Configuration object. If None, loads from environment.
+
+    Returns:
+        Klines oldest first, each a dict with ``open_time``, ``close_time``
+        (ms since epoch) and ``close``
+
+    Raises:
+        ConnectionError: If unable to fetch klines
+    """
+    config = config if config else get_config()
+    params = {'symbol': 'BTCUSDT', 'interval': '1m', 'limit': limit}
+    if start_time is not None:
+        params['startTime'] = start_time
+    if end_time is not None:
+        params['endTime'] = end_time
+
+    try:
+        response = get_transport().request_sync(
+            'GET', f"{config.binance_base_url}/api/v3/klines", endpoint='binance.klines', params=params
+        )
+        response.raise_for_status()
+        rows = response.json()
+    except httpx.HTTPError as e:
+        logger.error(f"Error fetching klines: {e}")
+        raise ConnectionError(f"Failed to fetch klines: {e}")
+
+    now_ms = int(time.time() * 1000)
+    return [
+        {'open_time': int(row[0]), 'close_time': int(row[6]), 'close': float(row[4])}
+        for row in rows
+        if int(row[6]) < now_ms
+    ]
 
 
 def get_fallback_btc_price() -> float:
@@ -1236,11 +1882,12 @@ def get_fallback_btc_price() -> float:
     try:
         logger.info("Fetching BTC price from CoinGecko fallback")
 
-        response = requests.get(
+        response = get_transport().request_sync(
+            'GET',
             f"{config.coingecko_base_url}/simple/price",
+            endpoint='coingecko.price',
             params={'ids': 'bitcoin', 'vs_currencies': 'usd'},
-            headers={'x-cg-demo-api-key': config.coingecko_api_key},
-            timeout=10
+            headers={'x-cg-demo-api-key': config.coingecko_api_key}
         )
         response.raise_for_status()
 
@@ -1251,6 +1898,6 @@ def get_fallback_btc_price() -> float:
 
         return price
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"CoinGecko fallback failed: {e}")
         raise ConnectionError(f"Failed to fetch BTC price from CoinGecko: {e}")
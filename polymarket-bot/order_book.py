@@ -0,0 +1,569 @@
+"""
+Local L2 Order Book for Polymarket Bot.
+
+This module keeps an in-memory copy of the Binance BTC/USDT order book in
+sync from the diff-depth WebSocket stream, so order book metrics are read
+from memory instead of polling the REST depth endpoint every cycle:
+- LocalOrderBook: price levels, sequence checking and book metrics
+- BinanceOrderBookStream: diff-depth stream client that seeds the book from
+  a REST snapshot and resynchronizes on sequence gaps
+
+Synchronization follows Binance's procedure for a local order book: diff
+events are buffered until a REST snapshot arrives, events already covered
+by the snapshot (``u <= lastUpdateId``) are dropped, and every applied event
+must continue the update ID sequence (``U <= lastUpdateId + 1 <= u``).
+A gap leaves the book unsynchronized until a fresh snapshot is applied.
+"""
+
+import json
+import time
+import logging
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from threading import Thread, Lock
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+from websocket import WebSocketApp
+
+from .config import BINANCE_WS_URL, Config, get_config
+from .transport import get_transport
+
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# A price level as (price, quantity)
+Level = Tuple[float, float]
+
+
+class OrderBookSyncError(Exception):
+    """Exception raised when the order book is read while not synchronized."""
+    pass
+
+
+class OrderBookGapError(OrderBookSyncError):
+    """Exception raised when a diff event does not continue the update sequence."""
+    pass
+
+
+class _BookSide:
+    """
+    One side of the book: price -> quantity plus an ascending price index.
+
+    Updating an existing level is O(1); adding or removing a level is a
+    bisect into the price index. Reading the best ``n`` levels is O(n).
+    """
+
+    __slots__ = ("quantities", "prices", "descending")
+
+    def __init__(self, descending: bool):
+        self.quantities: Dict[float, float] = {}
+        self.prices: List[float] = []
+        self.descending = descending
+
+    def clear(self) -> None:
+        self.quantities.clear()
+        self.prices.clear()
+
+    def set(self, price: float, quantity: float) -> None:
+        if quantity == 0:
+            if self.quantities.pop(price, None) is not None:
+                del self.prices[bisect_left(self.prices, price)]
+        else:
+            if price not in self.quantities:
+                insort(self.prices, price)
+            self.quantities[price] = quantity
+
+    def best(self) -> Optional[Level]:
+        if not self.prices:
+            return None
+        price = self.prices[-1] if self.descending else self.prices[0]
+        return price, self.quantities[price]
+
+    def top(self, levels: int) -> List[Level]:
+        prices = self.prices[:-levels - 1:-1] if self.descending else self.prices[:levels]
+        return [(price, self.quantities[price]) for price in prices]
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+
+class LocalOrderBook:
+    """
+    In-memory L2 order book maintained from snapshots and diff-depth events.
+
+    Thread-safe: the WebSocket thread applies events while the trading loop
+    reads metrics. Events received before the first snapshot are buffered and
+    replayed when it is applied.
+    """
+
+    def __init__(self, symbol: str = "BTCUSDT", max_buffered_events: int = 1000):
+        """
+        Initialize an empty, unsynchronized order book.
+
+        Args:
+            symbol: Trading pair the book tracks
+            max_buffered_events: Maximum diff events held while waiting for a snapshot
+        """
+        self.symbol = symbol
+        self.last_update_id: Optional[int] = None
+        self.updated_at: Optional[float] = None
+        self._bids = _BookSide(descending=True)
+        self._asks = _BookSide(descending=False)
+        self._buffer: deque = deque(maxlen=max_buffered_events)
+        self._lock = Lock()
+
+    @property
+    def synced(self) -> bool:
+        """Whether the book has a snapshot and no detected sequence gap."""
+        with self._lock:
+            return self.last_update_id is not None
+
+    def reset(self) -> None:
+        """Drop all levels and buffered events; the book waits for a new snapshot."""
+        with self._lock:
+            self._reset()
+
+    def _reset(self) -> None:
+        self._bids.clear()
+        self._asks.clear()
+        self._buffer.clear()
+        self.last_update_id = None
+
+    def apply_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Seed the book from a REST depth snapshot and replay buffered events.
+
+        Args:
+            snapshot: Response of ``GET /api/v3/depth`` with ``lastUpdateId``,
+                ``bids`` and ``asks``
+
+        Raises:
+            OrderBookGapError: If the buffered events do not connect to the
+                snapshot (the snapshot is older than the first buffered
+                event); the book is left unsynchronized
+        """
+        with self._lock:
+            buffered = list(self._buffer)
+            self._reset()
+            for price, quantity in snapshot.get('bids', []):
+                self._bids.set(float(price), float(quantity))
+            for price, quantity in snapshot.get('asks', []):
+                self._asks.set(float(price), float(quantity))
+            self.last_update_id = int(snapshot['lastUpdateId'])
+            self.updated_at = time.time()
+
+            for event in buffered:
+                self._apply(event)
+
+        logger.info(
+            f"Order book snapshot applied: lastUpdateId={self.last_update_id}, "
+            f"{len(self._bids)} bids, {len(self._asks)} asks, {len(buffered)} buffered events"
+        )
+
+    def apply_diff(self, event: Dict[str, Any]) -> bool:
+        """
+        Apply a diff-depth event.
+
+        Args:
+            event: ``depthUpdate`` event with ``U`` (first update ID),
+                ``u`` (final update ID), ``b`` (bids) and ``a`` (asks)
+
+        Returns:
+            True if the event changed the book, False if it was buffered
+            (no snapshot yet) or already covered by the book
+
+        Raises:
+            OrderBookGapError: If the event skips update IDs; the book is
+                left unsynchronized
+        """
+        with self._lock:
+            if self.last_update_id is None:
+                self._buffer.append(event)
+                return False
+            return self._apply(event)
+
+    def _apply(self, event: Dict[str, Any]) -> bool:
+        first_id, final_id = int(event['U']), int(event['u'])
+        if final_id <= self.last_update_id:
+            return False
+        if first_id > self.last_update_id + 1:
+            expected = self.last_update_id + 1
+            self._reset()
+            raise OrderBookGapError(
+                f"Order book sequence gap: expected update {expected}, got {first_id}-{final_id}"
+            )
+
+        for price, quantity in event.get('b', []):
+            self._bids.set(float(price), float(quantity))
+        for price, quantity in event.get('a', []):
+            self._asks.set(float(price), float(quantity))
+        self.last_update_id = final_id
+        self.updated_at = time.time()
+        return True
+
+    def _require_synced(self) -> None:
+        if self.last_update_id is None:
+            raise OrderBookSyncError(f"Order book for {self.symbol} is not synchronized")
+        if not self._bids or not self._asks:
+            raise OrderBookSyncError(f"Order book for {self.symbol} has an empty side")
+
+    def top_levels(self, levels: int = 10) -> Tuple[List[Level], List[Level]]:
+        """
+        Get the best price levels on each side.
+
+        Args:
+            levels: Number of levels per side
+
+        Returns:
+            Tuple of (bids best-first, asks best-first)
+
+        Raises:
+            OrderBookSyncError: If the book is not synchronized
+        """
+        with self._lock:
+            self._require_synced()
+            return self._bids.top(levels), self._asks.top(levels)
+
+    def best_bid(self) -> Optional[Level]:
+        """Best bid as (price, quantity), or None if there are no bids."""
+        with self._lock:
+            return self._bids.best()
+
+    def best_ask(self) -> Optional[Level]:
+        """Best ask as (price, quantity), or None if there are no asks."""
+        with self._lock:
+            return self._asks.best()
+
+    def spread(self) -> float:
+        """
+        Get the bid-ask spread.
+
+        Returns:
+            Best ask minus best bid
+
+        Raises:
+            OrderBookSyncError: If the book is not synchronized
+        """
+        with self._lock:
+            self._require_synced()
+            return self._asks.best()[0] - self._bids.best()[0]
+
+    def mid_price(self) -> float:
+        """
+        Get the midpoint of the best bid and ask.
+
+        Raises:
+            OrderBookSyncError: If the book is not synchronized
+        """
+        with self._lock:
+            self._require_synced()
+            return (self._asks.best()[0] + self._bids.best()[0]) / 2
+
+    def weighted_mid_price(self) -> float:
+        """
+        Get the size-weighted midpoint (microprice) of the top of book.
+
+        Leans toward the ask when the bid is larger, and vice versa.
+
+        Raises:
+            OrderBookSyncError: If the book is not synchronized
+        """
+        with self._lock:
+            self._require_synced()
+            bid_price, bid_qty = self._bids.best()
+            ask_price, ask_qty = self._asks.best()
+        return (bid_price * ask_qty + ask_price * bid_qty) / (bid_qty + ask_qty)
+
+    def imbalance(self, levels: int = 10) -> float:
+        """
+        Get the bid/ask volume ratio over the top levels.
+
+        Same metric as the REST-based get_order_book_imbalance.
+
+        Args:
+            levels: Number of levels per side
+
+        Returns:
+            Bid volume / ask volume (1.0 if ask volume is zero)
+
+        Raises:
+            OrderBookSyncError: If the book is not synchronized
+        """
+        bids, asks = self.top_levels(levels)
+        bid_volume = sum(quantity for _, quantity in bids)
+        ask_volume = sum(quantity for _, quantity in asks)
+        if ask_volume == 0:
+            return 1.0
+        return bid_volume / ask_volume
+
+    def weighted_imbalance(self, levels: int = 10, decay: float = 0.5) -> float:
+        """
+        Get a bid/ask volume ratio that weights levels near the top more.
+
+        Level ``i`` (0 = best) is weighted by ``decay ** i``.
+
+        Args:
+            levels: Number of levels per side
+            decay: Weight ratio between consecutive levels, in (0, 1]
+
+        Returns:
+            Weighted bid volume / weighted ask volume (1.0 if ask volume is zero)
+
+        Raises:
+            OrderBookSyncError: If the book is not synchronized
+        """
+        bids, asks = self.top_levels(levels)
+        bid_volume = sum(quantity * decay ** i for i, (_, quantity) in enumerate(bids))
+        ask_volume = sum(quantity * decay ** i for i, (_, quantity) in enumerate(asks))
+        if ask_volume == 0:
+            return 1.0
+        return bid_volume / ask_volume
+
+    def depth_within(self, bps: float) -> Tuple[float, float]:
+        """
+        Get the quantity resting within a distance of the mid price.
+
+        Args:
+            bps: Distance from the mid price in basis points
+
+        Returns:
+            Tuple of (bid quantity, ask quantity) within the band
+
+        Raises:
+            OrderBookSyncError: If the book is not synchronized
+        """
+        with self._lock:
+            self._require_synced()
+            mid = (self._asks.best()[0] + self._bids.best()[0]) / 2
+            band = mid * bps / 10000
+            bid_prices = self._bids.prices[bisect_left(self._bids.prices, mid - band):]
+            ask_prices = self._asks.prices[:bisect_right(self._asks.prices, mid + band)]
+            return (
+                sum(self._bids.quantities[price] for price in bid_prices),
+                sum(self._asks.quantities[price] for price in ask_prices)
+            )
+
+
+def replay_depth_stream(book: LocalOrderBook, messages: Iterable[str]) -> int:
+    """
+    Feed recorded stream messages into a book.
+
+    Each message is a JSON line that is either a REST snapshot (has
+    ``lastUpdateId``) or a diff-depth event, in the order they were received.
+
+    Args:
+        book: Order book to update
+        messages: JSON message strings
+
+    Returns:
+        Number of diff events that changed the book
+
+    Raises:
+        OrderBookGapError: If an event skips update IDs
+    """
+    applied = 0
+    for message in messages:
+        if not message.strip():
+            continue
+        data = json.loads(message)
+        if 'lastUpdateId' in data:
+            book.apply_snapshot(data)
+        elif book.apply_diff(data):
+            applied += 1
+    return applied
+
+
+class BinanceOrderBookStream:
+    """
+    Binance diff-depth stream client maintaining a LocalOrderBook.
+
+    On connect, subscribes to ``<symbol>@depth@100ms``, then fetches a REST
+    snapshot to seed the book while events are buffered. A sequence gap
+    triggers a new snapshot; a dropped connection reconnects with the same
+    backoff as BinanceWebSocketClient.
+    """
+
+    def __init__(self, config: Optional[Config] = None, symbol: str = "BTCUSDT", snapshot_limit: int = 1000):
+        """
+        Initialize the order book stream.
+
+        Args:
+            config: Configuration object. If None, loads from environment.
+            symbol: Trading pair to track
+            snapshot_limit: Depth of the REST snapshot used to seed the book
+        """
+        self.config = config if config else get_config()
+        self.symbol = symbol
+        self.snapshot_limit = snapshot_limit
+        self.ws_url = f"{getattr(self.config, 'binance_ws_url', BINANCE_WS_URL)}/{symbol.lower()}@depth@100ms"
+        self.book = LocalOrderBook(symbol)
+        self.ws: Optional[WebSocketApp] = None
+        self.ws_thread: Optional[Thread] = None
+        self.is_connected = False
+        self.reconnect_attempts = 0
+        self.lock = Lock()
+        self._resync_lock = Lock()
+        self._closing = False
+
+        logger.info(f"Initialized BinanceOrderBookStream for {symbol}")
+
+    def connect(self, timeout: float = 10) -> None:
+        """
+        Open the diff-depth stream and seed the book.
+
+        Args:
+            timeout: Seconds to wait for the connection
+
+        Raises:
+            ConnectionError: If the connection is not established within timeout
+        """
+        if self.is_connected:
+            logger.warning("Order book stream already connected")
+            return
+
+        logger.info(f"Connecting to Binance depth stream: {self.ws_url}")
+        self._closing = False
+        self.ws = WebSocketApp(
+            self.ws_url,
+            on_open=self._on_open,
+            on_message=self._on_message,
+            on_error=self._on_error,
+            on_close=self._on_close
+        )
+        self.ws_thread = Thread(target=self.ws.run_forever, daemon=True)
+        self.ws_thread.start()
+
+        start_time = time.time()
+        while time.time() - start_time < timeout:
+            with self.lock:
+                if self.is_connected:
+                    return
+            time.sleep(0.1)
+
+        raise ConnectionError("Failed to connect to Binance depth stream within timeout")
+
+    def fetch_snapshot(self) -> Dict[str, Any]:
+        """
+        Fetch a REST depth snapshot.
+
+        Returns:
+            Snapshot with ``lastUpdateId``, ``bids`` and ``asks``
+
+        Raises:
+            ConnectionError: If the request fails
+        """
+        try:
+            response = get_transport().request_sync(
+                'GET',
+                f"{self.config.binance_base_url}/api/v3/depth",
+                endpoint='binance.depth_snapshot',
+                params={'symbol': self.symbol, 'limit': self.snapshot_limit}
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError as e:
+            raise ConnectionError(f"Failed to fetch order book snapshot: {e}")
+
+    def resync(self) -> None:
+        """
+        Reset the book and seed it from a fresh snapshot.
+
+        Events received meanwhile are buffered and replayed. Retries every
+        ``ws_reconnect_delay`` seconds until the book is synchronized or the
+        stream disconnects.
+        """
+        if not self._resync_lock.acquire(blocking=False):
+            return  # A resync is already in progress
+        try:
+            self.book.reset()
+            while not self._closing and self.is_connected:
+                try:
+                    self.book.apply_snapshot(self.fetch_snapshot())
+                    return
+                except OrderBookGapError as e:
+                    # Snapshot predates the buffered events
+                    logger.warning(f"Order book snapshot did not connect to stream: {e}")
+                except Exception as e:
+                    logger.error(f"Order book resync failed: {e}")
+                time.sleep(self.config.ws_reconnect_delay)
+        finally:
+            self._resync_lock.release()
+
+    def _start_resync(self) -> None:
+        Thread(target=self.resync, daemon=True).start()
+
+    def _on_open(self, ws) -> None:
+        """Handle WebSocket connection opened."""
+        with self.lock:
+            self.is_connected = True
+            self.reconnect_attempts = 0
+        logger.info("Binance depth stream connection established")
+        self.book.reset()
+        self._start_resync()
+
+    def _on_message(self, ws, message: str) -> None:
+        """
+        Apply a diff-depth event, resynchronizing on gaps.
+
+        Args:
+            ws: WebSocket instance
+            message: JSON message string from Binance
+        """
+        try:
+            event = json.loads(message)
+            if event.get('e') != 'depthUpdate':
+                return
+            self.book.apply_diff(event)
+        except OrderBookGapError as e:
+            logger.warning(f"{e}; resynchronizing")
+            self._start_resync()
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            logger.error(f"Error parsing depth message: {e}")
+
+    def _on_error(self, ws, error) -> None:
+        """Handle WebSocket errors."""
+        logger.error(f"Binance depth stream error: {error}")
+
+    def _on_close(self, ws, close_status_code, close_msg) -> None:
+        """Handle WebSocket connection closed, reconnecting with exponential backoff."""
+        with self.lock:
+            self.is_connected = False
+            current_attempts = self.reconnect_attempts
+        self.book.reset()
+
+        logger.warning(f"Binance depth stream closed: {close_status_code} - {close_msg}")
+        if self._closing:
+            return
+
+        if current_attempts < self.config.ws_max_reconnect_attempts:
+            with self.lock:
+                self.reconnect_attempts += 1
+                next_attempt = self.reconnect_attempts
+            delay = min(self.config.ws_reconnect_delay * (2 ** (next_attempt - 1)), 60)
+
+            logger.info(f"Reconnecting depth stream {next_attempt}/{self.config.ws_max_reconnect_attempts} in {delay}s")
+
+            def delayed_reconnect():
+                time.sleep(delay)
+                try:
+                    self.connect()
+                except Exception as e:
+                    logger.error(f"Depth stream reconnection failed: {e}")
+
+            Thread(target=delayed_reconnect, daemon=True).start()
+        else:
+            logger.error(f"Max depth stream reconnection attempts ({self.config.ws_max_reconnect_attempts}) reached")
+
+    def close(self) -> None:
+        """Close the WebSocket connection gracefully."""
+        logger.info("Closing Binance depth stream")
+        self._closing = True
+        self.is_connected = False
+
+        if self.ws:
+            self.ws.close()
+
+        if self.ws_thread and self.ws_thread.is_alive():
+            self.ws_thread.join(timeout=2)
@@ -19,7 +19,9 @@ from datetime import datetime, timezone
 
 from .config import Config, get_config
 from .models import PredictionSignal, SignalType
-from .market_data import calculate_rsi, calculate_macd, get_order_book_imbalance
+from .market_data import calculate_rsi, calculate_macd, get_order_book_imbalance, MarketSnapshot
+from .order_book import LocalOrderBook
+from .indicators import IndicatorSnapshot
 
 
 # Setup logging
@@ -39,14 +41,17 @@ class PredictionEngine:
     to generate deterministic UP/DOWN/SKIP signals with confidence scores.
     """
 
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(self, config: Optional[Config] = None, order_book: Optional[LocalOrderBook] = None):
         """
         Initialize the prediction engine.
 
         Args:
             config: Configuration object. If None, loads from environment.
+            order_book: Optional stream-maintained local order book, read
+                instead of the REST depth endpoint while it is in sync
         """
         self.config = config if config else get_config()
+        self.order_book = order_book
         logger.info(
             f"Initialized PredictionEngine with "
             f"RSI({self.config.rsi_period}, oversold={self.config.rsi_oversold_threshold}, "
@@ -58,7 +63,8 @@ class PredictionEngine:
     def generate_signal(
         self,
         prices: List[float],
-        btc_price: Optional[float] = None
+        btc_price: Optional[float] = None,
+        indicators: Optional[IndicatorSnapshot] = None
     ) -> PredictionSignal:
         """
         Generate a trading signal based on technical indicators.
@@ -66,6 +72,8 @@ class PredictionEngine:
         Args:
             prices: List of historical prices (oldest to newest)
             btc_price: Current BTC price (optional, for context)
+            indicators: Streaming indicator values; when ready, used instead
+                of recomputing RSI and MACD from ``prices``
 
         Returns:
             PredictionSignal with signal type, confidence, and reasoning
@@ -75,48 +83,102 @@ class PredictionEngine:
         """
         try:
             # Calculate technical indicators
-            rsi = self._calculate_rsi(prices)
-            macd_line, macd_signal = self._calculate_macd(prices)
+            if indicators is not None and indicators.ready:
+                rsi = indicators.rsi
+                macd_line, macd_signal = indicators.macd_line, indicators.macd_signal
+            else:
+                rsi = self._calculate_rsi(prices)
+                macd_line, macd_signal = self._calculate_macd(prices)
             order_book_imbalance = self._get_order_book_imbalance()
 
-            logger.debug(
-                f"Indicators - RSI: {rsi:.2f}, MACD: {macd_line:.2f}, "
-                f"Signal: {macd_signal:.2f}, OB Imbalance: {order_book_imbalance:.2f}"
-            )
+            return self._build_signal(rsi, macd_line, macd_signal, order_book_imbalance, btc_price)
 
-            # Generate signal based on indicator conditions
-            signal, confidence, reasoning = self._evaluate_conditions(
-                rsi=rsi,
-                macd_line=macd_line,
-                macd_signal=macd_signal,
-                order_book_imbalance=order_book_imbalance
-            )
+        except ValueError as e:
+            raise PredictionError(f"Failed to generate signal: {str(e)}") from e
+        except Exception as e:
+            raise PredictionError(f"Unexpected error generating signal: {str(e)}") from e
 
-            # Create prediction signal
-            prediction = PredictionSignal(
-                signal=signal,
-                confidence=Decimal(str(confidence)),
-                rsi=Decimal(str(rsi)),
-                macd_line=Decimal(str(macd_line)),
-                macd_signal=Decimal(str(macd_signal)),
-                order_book_imbalance=Decimal(str(order_book_imbalance)),
-                btc_price=Decimal(str(btc_price)) if btc_price else None,
-                timestamp=datetime.now(timezone.utc),
-                reasoning=reasoning
-            )
+    def generate_signal_from_snapshot(self, snapshot: MarketSnapshot) -> PredictionSignal:
+        """
+        Generate a trading signal from a per-cycle market snapshot.
 
-            logger.info(
-                f"Generated signal: {signal.value.upper()} "
-                f"(confidence: {confidence:.2f}) - {reasoning}"
-            )
+        Uses the snapshot's indicators and order book imbalance as-is, so no
+        indicator is recomputed and no order book request is made.
 
-            return prediction
+        Args:
+            snapshot: Market snapshot built for this cycle
 
-        except ValueError as e:
-            raise PredictionError(f"Failed to generate signal: {str(e)}") from e
+        Returns:
+            PredictionSignal with signal type, confidence, and reasoning
+
+        Raises:
+            PredictionError: If unable to generate signal
+        """
+        try:
+            return self._build_signal(
+                snapshot.rsi,
+                snapshot.macd_line,
+                snapshot.macd_signal,
+                snapshot.order_book_imbalance,
+                snapshot.btc_price
+            )
         except Exception as e:
             raise PredictionError(f"Unexpected error generating signal: {str(e)}") from e
 
+    def _build_signal(
+        self,
+        rsi: float,
+        macd_line: float,
+        macd_signal: float,
+        order_book_imbalance: float,
+        btc_price: Optional[float]
+    ) -> PredictionSignal:
+        """
+        Evaluate indicator values and wrap the result in a PredictionSignal.
+
+        Args:
+            rsi: RSI value
+            macd_line: MACD line value
+            macd_signal: MACD signal line value
+            order_book_imbalance: Order book imbalance ratio
+            btc_price: Current BTC price (optional, for context)
+
+        Returns:
+            PredictionSignal with signal type, confidence, and reasoning
+        """
+        logger.debug(
+            f"Indicators - RSI: {rsi:.2f}, MACD: {macd_line:.2f}, "
+            f"Signal: {macd_signal:.2f}, OB Imbalance: {order_book_imbalance:.2f}"
+        )
+
+        # Generate signal based on indicator conditions
+        signal, confidence, reasoning = self._evaluate_conditions(
+            rsi=rsi,
+            macd_line=macd_line,
+            macd_signal=macd_signal,
+            order_book_imbalance=order_book_imbalance
+        )
+
+        # Create prediction signal
+        prediction = PredictionSignal(
+            signal=signal,
+            confidence=Decimal(str(confidence)),
+            rsi=Decimal(str(rsi)),
+            macd_line=Decimal(str(macd_line)),
+            macd_signal=Decimal(str(macd_signal)),
+            order_book_imbalance=Decimal(str(order_book_imbalance)),
+            btc_price=Decimal(str(btc_price)) if btc_price else None,
+            timestamp=datetime.now(timezone.utc),
+            reasoning=reasoning
+        )
+
+        logger.info(
+            f"Generated signal: {signal.value.upper()} "
+            f"(confidence: {confidence:.2f}) - {reasoning}"
+        )
+
+        return prediction
+
     def _calculate_rsi(self, prices: List[float]) -> float:
         """
         Calculate RSI using configured period.
@@ -162,7 +224,7 @@ class PredictionEngine:
         Raises:
             ConnectionError: If unable to fetch order book data
         """
-        return get_order_book_imbalance()
+        return get_order_book_imbalance(self.order_book)
 
     def _evaluate_conditions(
         self,
@@ -0,0 +1,195 @@
+"""
+Price History Ring Buffer for Polymarket Bot.
+
+This module stores streamed prices in preallocated NumPy columns instead of
+deques of floats or pydantic objects:
+- Fixed memory: ``capacity`` rows of (timestamp, open, high, low, close,
+  volume), allocated once; an append writes six floats
+- Zero-copy reads: every row is written twice, to two mirrored halves of
+  the array, so the latest ``n`` rows are always one contiguous slice and
+  windows are returned as read-only views instead of copies
+
+A window of ``n`` rows stays unchanged for the next ``capacity - n``
+appends, so a view taken under the owner's lock can be read after the lock
+is released while the stream keeps writing. The exception is the newest
+row, which ``replace_last`` rewrites in place (e.g. while a kline is still
+in progress). Copy windows that are kept longer, or that must not see the
+newest row change.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+COLUMNS: Tuple[str, ...] = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+TIMESTAMP, OPEN, HIGH, LOW, CLOSE, VOLUME = range(len(COLUMNS))
+
+
+class PriceHistory:
+    """
+    Fixed-capacity ring buffer of OHLCV rows with zero-copy windows.
+
+    Timestamps are milliseconds since the epoch. Not thread-safe on its own;
+    owners append and take views under their own lock.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Allocate the buffer.
+
+        Args:
+            capacity: Maximum number of rows kept
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        # Column-major so each column window is a contiguous 1-D view
+        self._data = np.full((len(COLUMNS), 2 * capacity), np.nan)
+        self._total = 0
+
+    def __len__(self) -> int:
+        return min(self._total, self.capacity)
+
+    @property
+    def total(self) -> int:
+        """Number of rows appended since creation (including evicted ones)."""
+        return self._total
+
+    def append(
+        self,
+        close: float,
+        timestamp: float = np.nan,
+        open: Optional[float] = None,
+        high: Optional[float] = None,
+        low: Optional[float] = None,
+        volume: float = np.nan
+    ) -> None:
+        """
+        Append one row, evicting the oldest when full.
+
+        Args:
+            close: Close (or last trade) price
+            timestamp: Row time in ms since the epoch
+            open: Open price (default: close)
+            high: High price (default: close)
+            low: Low price (default: close)
+            volume: Traded volume
+        """
+        self._write(self._total % self.capacity, close, timestamp, open, high, low, volume)
+        self._total += 1
+
+    def replace_last(
+        self,
+        close: float,
+        timestamp: float = np.nan,
+        open: Optional[float] = None,
+        high: Optional[float] = None,
+        low: Optional[float] = None,
+        volume: float = np.nan
+    ) -> None:
+        """
+        Overwrite the newest row, or append if the buffer is empty.
+
+        Args:
+            close: Close (or last trade) price
+            timestamp: Row time in ms since the epoch
+            open: Open price (default: close)
+            high: High price (default: close)
+            low: Low price (default: close)
+            volume: Traded volume
+        """
+        if self._total == 0:
+            self.append(close, timestamp, open, high, low, volume)
+            return
+        self._write((self._total - 1) % self.capacity, close, timestamp, open, high, low, volume)
+
+    def _write(self, position: int, close: float, timestamp: float, open: Optional[float],
+               high: Optional[float], low: Optional[float], volume: float) -> None:
+        row = (
+            timestamp,
+            close if open is None else open,
+            close if high is None else high,
+            close if low is None else low,
+            close,
+            volume
+        )
+        self._data[:, position] = row
+        self._data[:, position + self.capacity] = row
+
+    def _bounds(self, count: Optional[int]) -> Tuple[int, int]:
+        size = len(self)
+        count = size if count is None else max(0, min(count, size))
+        start = (self._total - count) % self.capacity
+        return start, start + count
+
+    def window(self, count: Optional[int] = None) -> np.ndarray:
+        """
+        Get the latest rows as a read-only view.
+
+        Args:
+            count: Number of rows (default: all)
+
+        Returns:
+            Array of shape (6, rows), one row per column in COLUMNS order,
+            oldest first
+        """
+        start, end = self._bounds(count)
+        view = self._data[:, start:end]
+        view.flags.writeable = False
+        return view
+
+    def column(self, name: str, count: Optional[int] = None) -> np.ndarray:
+        """
+        Get the latest values of one column as a read-only view.
+
+        Args:
+            name: Column name from COLUMNS
+            count: Number of values (default: all)
+
+        Returns:
+            Contiguous 1-D array, oldest first
+
+        Raises:
+            ValueError: If the column name is unknown
+        """
+        if name not in COLUMNS:
+            raise ValueError(f"Unknown column '{name}', expected one of {COLUMNS}")
+        start, end = self._bounds(count)
+        view = self._data[COLUMNS.index(name), start:end]
+        view.flags.writeable = False
+        return view
+
+    def closes(self, count: Optional[int] = None) -> np.ndarray:
+        """
+        Get the latest close prices as a read-only view.
+
+        Args:
+            count: Number of prices (default: all)
+
+        Returns:
+            Contiguous 1-D array, oldest first
+        """
+        return self.column('close', count)
+
+    def last(self, name: str = 'close') -> Optional[float]:
+        """
+        Get the newest value of a column.
+
+        Args:
+            name: Column name from COLUMNS
+
+        Returns:
+            The value, or None if the buffer is empty
+        """
+        if self._total == 0:
+            return None
+        return float(self._data[COLUMNS.index(name), (self._total - 1) % self.capacity])
+
+    def clear(self) -> None:
+        """Drop every row (the memory stays allocated)."""
+        self._data.fill(np.nan)
+        self._total = 0
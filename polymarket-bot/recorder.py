@@ -0,0 +1,487 @@
+"""
+Tick Recording and Replay for Polymarket Bot.
+
+This module keeps the Binance stream data the live clients would otherwise
+drop once it falls out of their in-memory buffers:
+- TickRecorder appends kline and 24hr ticker messages as fixed-width binary
+  records to a memory-mapped file, rotated per UTC day
+- TickReader maps the day files read-only and selects records by receive
+  time with a binary search over the (non-decreasing) timestamp column
+- TickReplayer feeds recorded messages back through the same WebSocket
+  ``on_message`` callbacks, as fast as possible or paced at real or
+  accelerated speed
+
+Recordings can warm-start the kline buffer, provide BacktestData without a
+CSV export, and replay an incident deterministically.
+
+File layout: a 64-byte header (magic, version, record size, committed record
+count) followed by RECORD_DTYPE records. The file is pre-allocated and grown
+by doubling; the count is written after each record, so a crash mid-write
+never exposes a partial record.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Record kinds
+KIND_KLINE = 1
+KIND_TICKER = 2
+
+RECORD_DTYPE = np.dtype([
+    ('kind', 'u1'),
+    ('closed', 'u1'),
+    ('_pad', 'V6'),
+    ('recv_time', '<i8'),  # ms since epoch, local receive time (index key)
+    ('event_time', '<i8'),
+    ('open_time', '<i8'),
+    ('close_time', '<i8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<f8'),
+    ('quote_volume', '<f8'),
+    ('taker_buy_volume', '<f8'),
+    ('price_change', '<f8'),
+    ('price_change_percent', '<f8'),
+])
+
+_MAGIC = b'PMTICKS1'
+_VERSION = 1
+_HEADER = struct.Struct('<8sIIQ')
+HEADER_SIZE = 64
+_COUNT_OFFSET = 16
+_FILE_SUFFIX = '.ticks'
+
+
+class TickFileError(Exception):
+    """Exception raised for unreadable or incompatible tick files."""
+    pass
+
+
+def _day_of(ms: int) -> str:
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).strftime('%Y%m%d')
+
+
+def _read_header(path: Path, buffer) -> int:
+    """Validate a file header and return the committed record count."""
+    magic, version, record_size, count = _HEADER.unpack_from(buffer, 0)
+    if magic != _MAGIC or version != _VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise TickFileError(f"{path} is not a version {_VERSION} tick file")
+    return count
+
+
+def _encode(message: Dict[str, Any]) -> Optional[tuple]:
+    """Map a parsed stream message to RECORD_DTYPE field values (minus recv_time)."""
+    if 'k' in message:
+        k = message['k']
+        close = float(k['c'])
+        return (
+            KIND_KLINE, bool(k.get('x', False)), b'',
+            int(message.get('E', 0)), int(k['t']), int(k['T']),
+            float(k.get('o', close)), float(k.get('h', close)), float(k.get('l', close)), close,
+            float(k.get('v', 0)), float(k.get('q', 0)), float(k.get('V', 0)),
+            0.0, 0.0
+        )
+    if message.get('e') == '24hrTicker':
+        return (
+            KIND_TICKER, False, b'',
+            int(message.get('E', 0)), int(message.get('O', 0)), int(message.get('C', 0)),
+            float(message.get('o', 0)), float(message.get('h', 0)), float(message.get('l', 0)),
+            float(message['c']),
+            float(message.get('v', 0)), float(message.get('q', 0)), 0.0,
+            float(message.get('p', 0)), float(message.get('P', 0))
+        )
+    return None
+
+
+def decode_message(record: np.void, symbol: str = 'BTCUSDT') -> str:
+    """
+    Rebuild a Binance stream message from a record.
+
+    Numbers are rendered as strings, as Binance sends them.
+
+    Args:
+        record: One RECORD_DTYPE record
+        symbol: Symbol to put in the message
+
+    Returns:
+        JSON message string
+    """
+    def num(name):
+        return repr(float(record[name]))
+
+    if record['kind'] == KIND_KLINE:
+        message = {
+            'e': 'kline', 'E': int(record['event_time']), 's': symbol,
+            'k': {
+                't': int(record['open_time']), 'T': int(record['close_time']), 's': symbol, 'i': '1m',
+                'o': num('open'), 'c': num('close'), 'h': num('high'), 'l': num('low'),
+                'v': num('volume'), 'q': num('quote_volume'), 'V': num('taker_buy_volume'),
+                'x': bool(record['closed'])
+            }
+        }
+    else:
+        message = {
+            'e': '24hrTicker', 'E': int(record['event_time']), 's': symbol,
+            'p': num('price_change'), 'P': num('price_change_percent'),
+            'o': num('open'), 'h': num('high'), 'l': num('low'), 'c': num('close'),
+            'v': num('volume'), 'q': num('quote_volume'),
+            'O': int(record['open_time']), 'C': int(record['close_time'])
+        }
+    return json.dumps(message)
+
+
+class _DayFile:
+    """One memory-mapped, append-only day file."""
+
+    def __init__(self, path: Path, initial_capacity: int):
+        self.path = path
+        exists = path.exists() and path.stat().st_size >= HEADER_SIZE
+        self.file = open(path, 'r+b' if exists else 'w+b')
+        if exists:
+            size = os.fstat(self.file.fileno()).st_size
+            self.capacity = (size - HEADER_SIZE) // RECORD_DTYPE.itemsize
+            self._map()
+            self.count = min(_read_header(path, self.mm), self.capacity)
+        else:
+            self.capacity = initial_capacity
+            self.file.truncate(HEADER_SIZE + self.capacity * RECORD_DTYPE.itemsize)
+            self._map()
+            self.count = 0
+            _HEADER.pack_into(self.mm, 0, _MAGIC, _VERSION, RECORD_DTYPE.itemsize, 0)
+        self.last_recv = int(self.records[self.count - 1]['recv_time']) if self.count else 0
+
+    def _map(self) -> None:
+        self.mm = mmap.mmap(self.file.fileno(), 0)
+        self.records = np.ndarray((self.capacity,), dtype=RECORD_DTYPE, buffer=self.mm, offset=HEADER_SIZE)
+
+    def _unmap(self) -> None:
+        # Views into the map must be released before it can be closed
+        del self.records
+        self.mm.close()
+
+    def append(self, recv_time: int, values: tuple) -> None:
+        if self.count == self.capacity:
+            self.mm.flush()
+            self._unmap()
+            self.capacity = max(self.capacity * 2, 1)
+            self.file.truncate(HEADER_SIZE + self.capacity * RECORD_DTYPE.itemsize)
+            self._map()
+        kind, closed, pad, *rest = values
+        self.records[self.count] = (kind, closed, pad, recv_time, *rest)
+        self.count += 1
+        struct.pack_into('<Q', self.mm, _COUNT_OFFSET, self.count)
+        self.last_recv = recv_time
+
+    def close(self) -> None:
+        self.mm.flush()
+        self._unmap()
+        self.file.close()
+
+
+class TickRecorder:
+    """
+    Appends stream messages to memory-mapped day files.
+
+    Safe to call from several WebSocket threads. Writing never raises into
+    the stream: I/O errors are logged and the message is dropped.
+    """
+
+    def __init__(self, directory: Union[str, Path], initial_capacity: int = 16384):
+        """
+        Initialize the recorder.
+
+        Args:
+            directory: Directory for the day files (created if missing)
+            initial_capacity: Records pre-allocated in a new day file
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.initial_capacity = initial_capacity
+        self.recorded = 0
+        self._day: Optional[str] = None
+        self._file: Optional[_DayFile] = None
+        self._lock = threading.Lock()
+
+        logger.info(f"Recording ticks to {self.directory}")
+
+    def record(self, message: Dict[str, Any], received_at: Optional[int] = None) -> bool:
+        """
+        Record a parsed kline or 24hr ticker message.
+
+        Args:
+            message: Message as decoded from the stream JSON
+            received_at: Receive time in ms since epoch (default: now)
+
+        Returns:
+            True if recorded, False if the message is of another type or
+            could not be written
+        """
+        try:
+            values = _encode(message)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Not recording malformed message: {e}")
+            return False
+        if values is None:
+            return False
+
+        recv_time = received_at if received_at is not None else int(time.time() * 1000)
+        with self._lock:
+            try:
+                day_file = self._file_for(_day_of(recv_time))
+                # Keep the index column sorted even if the wall clock steps back
+                day_file.append(max(recv_time, day_file.last_recv), values)
+            except OSError as e:
+                logger.error(f"Error recording tick: {e}")
+                return False
+            self.recorded += 1
+        return True
+
+    def _file_for(self, day: str) -> _DayFile:
+        if day != self._day:
+            if self._file is not None:
+                self._file.close()
+            self._file = _DayFile(self.directory / f"{day}{_FILE_SUFFIX}", self.initial_capacity)
+            self._day = day
+        return self._file
+
+    def flush(self) -> None:
+        """Flush the current day file to disk."""
+        with self._lock:
+            if self._file is not None:
+                self._file.mm.flush()
+
+    def close(self) -> None:
+        """Flush and close the current day file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._day = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+class TickReader:
+    """Read-only access to recorded day files."""
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Initialize the reader.
+
+        Args:
+            directory: Directory written by a TickRecorder
+        """
+        self.directory = Path(directory)
+
+    def days(self) -> List[str]:
+        """Recorded days (YYYYMMDD), oldest first."""
+        return sorted(p.stem for p in self.directory.glob(f"*{_FILE_SUFFIX}"))
+
+    def _map_day(self, day: str) -> np.ndarray:
+        path = self.directory / f"{day}{_FILE_SUFFIX}"
+        with open(path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise TickFileError(f"{path} is truncated")
+        count = _read_header(path, header)
+        capacity = (path.stat().st_size - HEADER_SIZE) // RECORD_DTYPE.itemsize
+        count = min(count, capacity)
+        if count == 0:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        return np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE, shape=(count,))
+
+    def segments(self, start: Optional[int] = None, end: Optional[int] = None) -> Iterator[np.ndarray]:
+        """
+        Yield records by day as read-only memory-mapped views.
+
+        Args:
+            start: Earliest receive time in ms (inclusive)
+            end: Latest receive time in ms (exclusive)
+
+        Yields:
+            RECORD_DTYPE arrays, one per day with matching records
+        """
+        first_day = _day_of(start) if start is not None else None
+        last_day = _day_of(end - 1) if end is not None else None
+        for day in self.days():
+            if (first_day and day < first_day) or (last_day and day > last_day):
+                continue
+            records = self._map_day(day)
+            lo = np.searchsorted(records['recv_time'], start, side='left') if start is not None else 0
+            hi = np.searchsorted(records['recv_time'], end, side='left') if end is not None else len(records)
+            if hi > lo:
+                yield records[lo:hi]
+
+    def records(self, start: Optional[int] = None, end: Optional[int] = None) -> np.ndarray:
+        """
+        Get records in a receive-time range.
+
+        A range within one day is returned as a memory-mapped view; ranges
+        spanning days are concatenated into a new array.
+
+        Args:
+            start: Earliest receive time in ms (inclusive)
+            end: Latest receive time in ms (exclusive)
+
+        Returns:
+            RECORD_DTYPE array in receive order
+        """
+        segments = list(self.segments(start, end))
+        if not segments:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        return segments[0] if len(segments) == 1 else np.concatenate(segments)
+
+    def closed_klines(self, start: Optional[int] = None, end: Optional[int] = None) -> np.ndarray:
+        """
+        Get closed klines, one per open time, oldest first.
+
+        Args:
+            start: Earliest receive time in ms (inclusive)
+            end: Latest receive time in ms (exclusive)
+
+        Returns:
+            RECORD_DTYPE array
+        """
+        records = self.records(start, end)
+        klines = records[(records['kind'] == KIND_KLINE) & (records['closed'] == 1)]
+        _, first = np.unique(klines['open_time'], return_index=True)
+        return klines[first]
+
+    def klines(self, start: Optional[int] = None, end: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get closed klines in the format returned by fetch_recent_klines.
+
+        Suitable for BinanceWebSocketClient.warm_start.
+
+        Args:
+            start: Earliest receive time in ms (inclusive)
+            end: Latest receive time in ms (exclusive)
+
+        Returns:
+            Dicts with ``open_time``, ``close_time`` and ``close``, oldest first
+        """
+        klines = self.closed_klines(start, end)
+        return [
+            {'open_time': int(o), 'close_time': int(c), 'close': float(p)}
+            for o, c, p in zip(klines['open_time'], klines['close_time'], klines['close'])
+        ]
+
+    def backtest_data(self, start: Optional[int] = None, end: Optional[int] = None):
+        """
+        Build backtest input from recorded closed klines.
+
+        As with load_klines_csv, the order book imbalance is derived from
+        taker buy/sell volume.
+
+        Args:
+            start: Earliest receive time in ms (inclusive)
+            end: Latest receive time in ms (exclusive)
+
+        Returns:
+            BacktestData
+        """
+        from .backtest import BacktestData
+
+        klines = self.closed_klines(start, end)
+        buy = klines['taker_buy_volume']
+        sell = klines['volume'] - buy
+        imbalance = np.divide(buy, sell, out=np.ones_like(buy), where=sell > 0)
+        return BacktestData(klines['open_time'], klines['close'], imbalance)
+
+
+MessageHandler = Callable[[Any, str], None]
+
+
+class TickReplayer:
+    """
+    Replays recorded messages through WebSocket ``on_message`` callbacks.
+
+    Messages are delivered in recorded order on the calling thread. With a
+    ``speed`` the gaps between receive times are reproduced, divided by
+    ``speed``; without one, messages are delivered back to back.
+    """
+
+    def __init__(self, reader: TickReader, speed: Optional[float] = None, symbol: str = 'BTCUSDT',
+                 sleep: Callable[[float], None] = time.sleep, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the replayer.
+
+        Args:
+            reader: Source of recorded ticks
+            speed: Playback rate (1.0 = real time, 60.0 = a minute per
+                second); None or 0 replays without pauses
+            symbol: Symbol to put in rebuilt messages
+            sleep: Sleep function, replaceable in tests
+            clock: Monotonic clock paired with ``sleep``
+        """
+        self.reader = reader
+        self.speed = speed
+        self.symbol = symbol
+        self.sleep = sleep
+        self.clock = clock
+
+    def replay(
+        self,
+        on_kline: Optional[MessageHandler] = None,
+        on_ticker: Optional[MessageHandler] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> int:
+        """
+        Deliver recorded messages to the handlers.
+
+        Args:
+            on_kline: Handler for kline messages, e.g.
+                ``BinanceWebSocketClient._on_message``
+            on_ticker: Handler for 24hr ticker messages, e.g.
+                ``BinanceWebSocket._on_message``
+            start: Earliest receive time in ms (inclusive)
+            end: Latest receive time in ms (exclusive)
+
+        Returns:
+            Number of messages delivered
+        """
+        handlers = {KIND_KLINE: on_kline, KIND_TICKER: on_ticker}
+        delivered = 0
+        first_recv = None
+        wall_start = self.clock()
+
+        for segment in self.reader.segments(start, end):
+            for record in segment:
+                handler = handlers.get(int(record['kind']))
+                if handler is None:
+                    continue
+                if self.speed:
+                    recv = int(record['recv_time'])
+                    if first_recv is None:
+                        first_recv = recv
+                    delay = (recv - first_recv) / 1000 / self.speed - (self.clock() - wall_start)
+                    if delay > 0:
+                        self.sleep(delay)
+                handler(None, decode_message(record, self.symbol))
+                delivered += 1
+
+        logger.info(f"Replayed {delivered} recorded messages")
+        return delivered
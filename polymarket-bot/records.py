@@ -0,0 +1,196 @@
+"""
+Lightweight Tick Records for Polymarket Bot.
+
+The pydantic models in models.py validate every field on construction, which
+is the right trade-off for persisted state and API output but too costly to
+pay on every WebSocket message. This module provides ``__slots__`` records
+for the tick path:
+- Validated once, where the raw exchange message is parsed
+- Plain float fields and an integer millisecond timestamp, no Decimal or
+  datetime until a caller asks for one
+- ``to_model()`` converts to the matching pydantic model for persistence
+  and API output, paid only when a caller needs the model
+"""
+
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from .models import BTCPriceData
+from .utils import ValidationError
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    # Binance sends numbers as strings; treat missing and zero values as absent
+    return float(value) if value else None
+
+
+def _decimal(value: Optional[float]) -> Optional[Decimal]:
+    return None if value is None else Decimal(str(value))
+
+
+class PriceTick:
+    """
+    One BTC price update from the Binance ticker stream.
+
+    The fields mirror BTCPriceData with floats instead of Decimals and
+    ``timestamp_ms`` instead of a datetime. ``raw`` is the decoded message,
+    kept by reference (not copied).
+    """
+
+    __slots__ = (
+        "symbol",
+        "price",
+        "timestamp_ms",
+        "volume_24h",
+        "high_24h",
+        "low_24h",
+        "price_change_24h",
+        "price_change_percent_24h",
+        "raw",
+    )
+
+    def __init__(
+        self,
+        symbol: str,
+        price: float,
+        timestamp_ms: int,
+        volume_24h: Optional[float] = None,
+        high_24h: Optional[float] = None,
+        low_24h: Optional[float] = None,
+        price_change_24h: Optional[float] = None,
+        price_change_percent_24h: Optional[float] = None,
+        raw: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Create a record from already validated values (see from_binance_ticker).
+
+        Args:
+            symbol: Trading pair symbol
+            price: Last price
+            timestamp_ms: Event time in ms since the epoch
+            volume_24h: 24-hour quote volume
+            high_24h: 24-hour high
+            low_24h: 24-hour low
+            price_change_24h: 24-hour price change
+            price_change_percent_24h: 24-hour price change percentage
+            raw: Decoded exchange message
+        """
+        self.symbol = symbol
+        self.price = price
+        self.timestamp_ms = timestamp_ms
+        self.volume_24h = volume_24h
+        self.high_24h = high_24h
+        self.low_24h = low_24h
+        self.price_change_24h = price_change_24h
+        self.price_change_percent_24h = price_change_percent_24h
+        self.raw = raw
+
+    @classmethod
+    def from_binance_ticker(cls, data: Dict[str, Any]) -> "PriceTick":
+        """
+        Parse and validate a Binance 24hr ticker message.
+
+        Accepts both the WebSocket (``c``, ``E``, ``q``, ...) and REST
+        (``lastPrice``, ``quoteVolume``, ...) field names. A missing event
+        time is replaced by the current time.
+
+        Args:
+            data: Decoded ticker message
+
+        Returns:
+            PriceTick
+
+        Raises:
+            ValidationError: If a field is malformed, the price is not
+                positive, the volume is negative or the 24h high/low is not
+                positive
+        """
+        # Reference: https://binance-docs.github.io/apidocs/spot/en/#individual-symbol-ticker-streams
+        try:
+            price = float(data.get('c', data.get('lastPrice', 0)))
+            event_time = int(data.get('E', 0))
+            tick = cls(
+                data.get('s', 'BTCUSDT'),
+                price,
+                event_time if event_time > 0 else int(time.time() * 1000),
+                _optional_float(data.get('q', data.get('quoteVolume'))),
+                _optional_float(data.get('h', data.get('highPrice'))),
+                _optional_float(data.get('l', data.get('lowPrice'))),
+                _optional_float(data.get('p', data.get('priceChange'))),
+                _optional_float(data.get('P', data.get('priceChangePercent'))),
+                data
+            )
+        except (KeyError, ValueError, TypeError) as e:
+            raise ValidationError(f"Failed to parse Binance ticker data: {e}")
+
+        if not tick.symbol:
+            raise ValidationError("Ticker symbol is empty")
+        if not price > 0:
+            raise ValidationError(f"Ticker price must be positive, got {price}")
+        if tick.volume_24h is not None and tick.volume_24h < 0:
+            raise ValidationError(f"Ticker 24h volume must be non-negative, got {tick.volume_24h}")
+        for name in ('high_24h', 'low_24h'):
+            value = getattr(tick, name)
+            if value is not None and not value > 0:
+                raise ValidationError(f"Ticker {name} must be positive, got {value}")
+        return tick
+
+    @classmethod
+    def from_model(cls, model: BTCPriceData) -> "PriceTick":
+        """
+        Create a record from a validated BTCPriceData.
+
+        Args:
+            model: Price data model
+
+        Returns:
+            PriceTick with the model's values
+        """
+        return cls(
+            model.symbol,
+            float(model.price),
+            int(model.timestamp.timestamp() * 1000),
+            _optional_float(model.volume_24h),
+            _optional_float(model.high_24h),
+            _optional_float(model.low_24h),
+            _optional_float(model.price_change_24h),
+            _optional_float(model.price_change_percent_24h),
+            model.metadata
+        )
+
+    @property
+    def timestamp(self) -> datetime:
+        """Event time as a UTC datetime."""
+        return datetime.fromtimestamp(self.timestamp_ms / 1000, tz=timezone.utc)
+
+    def to_model(self) -> BTCPriceData:
+        """
+        Convert to BTCPriceData.
+
+        Uses the normal constructor: with pydantic 2, validating values that
+        are already clean is cheaper than model_construct.
+
+        Returns:
+            BTCPriceData with Decimal prices and a UTC timestamp
+        """
+        return BTCPriceData(
+            symbol=self.symbol,
+            price=Decimal(str(self.price)),
+            timestamp=self.timestamp,
+            volume_24h=_decimal(self.volume_24h),
+            high_24h=_decimal(self.high_24h),
+            low_24h=_decimal(self.low_24h),
+            price_change_24h=_decimal(self.price_change_24h),
+            price_change_percent_24h=_decimal(self.price_change_percent_24h),
+            metadata=self.raw if self.raw is not None else {}
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PriceTick):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"PriceTick(symbol={self.symbol!r}, price={self.price}, timestamp_ms={self.timestamp_ms})"
@@ -6,6 +6,11 @@ This module implements the complete risk management controller including:
 - Volatility circuit breaker (3% 5-minute range check)
 - Pre-trade validation logic
 - Risk assessment and approval/rejection with clear reasons
+- Portfolio exposure gate shared by concurrently traded markets
+- Streaming market and equity risk state (rolling range, return volatility,
+  ATR, peak-to-trough drawdown) updated in O(1) per closed kline or capital
+  change, in float arithmetic; Decimal is used where results meet money
+  amounts and thresholds
 
 All risk checks integrate with BotState and MarketData models from models.py.
 """
@@ -14,8 +19,10 @@ from decimal import Decimal
 from typing import List, Tuple, Optional, Dict, Any
 from datetime import datetime, timezone
 import logging
+import threading
 
 from .models import BotState, MarketData
+from .rolling_risk import DrawdownTracker, MarketRiskSnapshot, RollingRiskState
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -97,6 +104,15 @@ class RiskManager:
 
     Implements all risk control mechanisms including drawdown monitoring,
     volatility checks, and pre-trade validation.
+
+    When several markets trade concurrently, reserve_exposure is the
+    portfolio gate: it checks drawdown, total exposure and the per-market
+    cap and records the trade's exposure under one lock, so two markets
+    cannot both pass against the same headroom.
+
+    Market statistics are streamed in with update_market and equity with
+    record_capital; check_volatility() without a price list then reads the
+    rolling 5-minute range instead of rescanning prices.
     """
 
     # Risk thresholds
@@ -107,7 +123,11 @@ class RiskManager:
         self,
         max_drawdown_percent: Optional[Decimal] = None,
         volatility_threshold_percent: Optional[Decimal] = None,
-        starting_capital: Decimal = Decimal("100.0")
+        starting_capital: Decimal = Decimal("100.0"),
+        max_total_exposure: Optional[Decimal] = None,
+        max_market_exposure: Optional[Decimal] = None,
+        volatility_window_seconds: float = 300.0,
+        atr_period: int = 14
     ):
         """
         Initialize the risk manager with configurable thresholds.
@@ -116,11 +136,25 @@ class RiskManager:
             max_drawdown_percent: Maximum allowed drawdown percentage (default: 30%)
             volatility_threshold_percent: Maximum allowed 5-min volatility (default: 3%)
             starting_capital: Starting capital for drawdown calculations (default: $100)
+            max_total_exposure: Maximum open exposure across all markets (default: no limit)
+            max_market_exposure: Maximum open exposure in a single market (default: no limit)
+            volatility_window_seconds: Rolling window of the streamed volatility check (default: 5 minutes)
+            atr_period: ATR period in klines (default: 14)
         """
         self.max_drawdown_percent = max_drawdown_percent or self.MAX_DRAWDOWN_PERCENT
         self.volatility_threshold_percent = volatility_threshold_percent or self.VOLATILITY_THRESHOLD_PERCENT
         self.starting_capital = starting_capital
         self.peak_capital = starting_capital
+        self.max_total_exposure = max_total_exposure
+        self.max_market_exposure = max_market_exposure
+
+        # Open exposure by market, guarded for concurrent market workers
+        self._exposure: Dict[str, Decimal] = {}
+        self._lock = threading.RLock()
+
+        # Streaming risk state
+        self.market_risk = RollingRiskState(window_seconds=volatility_window_seconds, atr_period=atr_period)
+        self.drawdown_tracker = DrawdownTracker(float(starting_capital))
 
         logger.info(
             f"RiskManager initialized: max_drawdown={self.max_drawdown_percent}%, "
@@ -249,12 +283,13 @@ class RiskManager:
 
         return volatility
 
-    def check_volatility(self, prices: List[Decimal]) -> Tuple[bool, Decimal]:
+    def check_volatility(self, prices: Optional[List[Decimal]] = None) -> Tuple[bool, Decimal]:
         """
         Check if 5-minute price volatility is within acceptable limits.
 
         Args:
-            prices: List of prices over the 5-minute window
+            prices: List of prices over the 5-minute window (default: the
+                rolling range streamed in with update_market)
 
         Returns:
             Tuple of (is_within_limit, current_volatility_percent)
@@ -266,19 +301,29 @@ class RiskManager:
             >>> rm.check_volatility([Decimal("100"), Decimal("105")])
             (False, Decimal('5.0'))
         """
-        try:
-            volatility = self.calculate_volatility(prices)
-        except ValueError as e:
-            logger.error(f"Volatility calculation failed: {e}")
-            # On error, fail safe by rejecting the trade
-            return False, Decimal("999.0")
+        if prices is None:
+            market = self.market_risk.snapshot()
+            range_percent = market.range_percent
+            if range_percent is None:
+                logger.error("Volatility calculation failed: no streamed prices")
+                # On error, fail safe by rejecting the trade
+                return False, Decimal("999.0")
+            volatility = Decimal(str(range_percent))
+        else:
+            try:
+                volatility = self.calculate_volatility(prices)
+            except ValueError as e:
+                logger.error(f"Volatility calculation failed: {e}")
+                # On error, fail safe by rejecting the trade
+                return False, Decimal("999.0")
 
         is_within_limit = volatility < self.volatility_threshold_percent
 
         if not is_within_limit:
+            low, high = (market.low, market.high) if prices is None else (min(prices), max(prices))
             logger.warning(
                 f"Volatility check FAILED: {volatility:.2f}% exceeds limit of {self.volatility_threshold_percent}% "
-                f"(price range: ${min(prices):.2f} - ${max(prices):.2f})"
+                f"(price range: ${low:.2f} - ${high:.2f})"
             )
         else:
             logger.debug(
@@ -287,6 +332,57 @@ class RiskManager:
 
         return is_within_limit, volatility
 
+    def update_market(
+        self,
+        price: float,
+        timestamp: float,
+        high: Optional[float] = None,
+        low: Optional[float] = None
+    ) -> None:
+        """
+        Stream a closed kline into the rolling market risk state.
+
+        Args:
+            price: Close price
+            timestamp: Close time in seconds since the epoch
+            high: Kline high (default: price)
+            low: Kline low (default: price)
+        """
+        self.market_risk.update(price, timestamp, high=high, low=low)
+
+    def market_risk_snapshot(self) -> MarketRiskSnapshot:
+        """
+        Get the streamed market risk statistics.
+
+        Returns:
+            MarketRiskSnapshot of range, return volatility and ATR
+        """
+        return self.market_risk.snapshot()
+
+    def record_capital(self, current_capital: Decimal) -> Decimal:
+        """
+        Stream the latest capital into the drawdown tracker.
+
+        Moves peak_capital up on a new high and keeps the worst
+        peak-to-trough drawdown seen.
+
+        Args:
+            current_capital: Current capital/equity
+
+        Returns:
+            Current drawdown from the peak as a percentage
+        """
+        with self._lock:
+            drawdown = self.drawdown_tracker.update(float(current_capital))
+            if current_capital > self.peak_capital:
+                self.peak_capital = current_capital
+        return Decimal(str(drawdown * 100.0))
+
+    @property
+    def max_drawdown_seen(self) -> Decimal:
+        """Worst peak-to-trough drawdown recorded by record_capital, as a percentage."""
+        return Decimal(str(self.drawdown_tracker.max_drawdown * 100.0))
+
     def approve_trade(
         self,
         bot_state: BotState,
@@ -404,6 +500,111 @@ class RiskManager:
 
         return result
 
+    @property
+    def open_exposure(self) -> Decimal:
+        """Total exposure reserved across all markets."""
+        with self._lock:
+            return sum(self._exposure.values(), Decimal("0"))
+
+    def exposure_by_market(self) -> Dict[str, Decimal]:
+        """
+        Get the open exposure of each market.
+
+        Returns:
+            Copy of the market ID to exposure mapping
+        """
+        with self._lock:
+            return dict(self._exposure)
+
+    def exposure_lock(self) -> threading.RLock:
+        """
+        Get the lock guarding open exposure.
+
+        Hold it to read the exposure and act on it as one step, so a
+        reservation or release from another thread cannot land in between.
+        The lock is reentrant; exposure methods may be called while holding it.
+
+        Returns:
+            The risk manager's reentrant lock
+        """
+        return self._lock
+
+    def reserve_exposure(
+        self,
+        market_id: str,
+        amount: Decimal,
+        current_capital: Decimal
+    ) -> RiskApprovalResult:
+        """
+        Atomically check portfolio limits and reserve exposure for a trade.
+
+        The drawdown, total exposure and per-market checks and the
+        reservation happen under one lock. Release the reservation with
+        release_exposure once the trade settles or fails.
+
+        Args:
+            market_id: Market the trade is placed in
+            amount: Position size of the trade
+            current_capital: Current capital for the drawdown check
+
+        Returns:
+            RiskApprovalResult; the exposure is reserved only if approved
+        """
+        rejection_reasons = []
+        with self._lock:
+            drawdown_ok, drawdown_percent = self.check_drawdown(current_capital, self.peak_capital)
+            open_exposure = sum(self._exposure.values(), Decimal("0"))
+            market_exposure = self._exposure.get(market_id, Decimal("0"))
+
+            if not drawdown_ok:
+                rejection_reasons.append(
+                    f"Drawdown of {drawdown_percent:.2f}% exceeds maximum allowed {self.max_drawdown_percent}%"
+                )
+            if self.max_total_exposure is not None and open_exposure + amount > self.max_total_exposure:
+                rejection_reasons.append(
+                    f"Total exposure ${open_exposure + amount} would exceed maximum ${self.max_total_exposure}"
+                )
+            if self.max_market_exposure is not None and market_exposure + amount > self.max_market_exposure:
+                rejection_reasons.append(
+                    f"Exposure in market {market_id} ${market_exposure + amount} would exceed "
+                    f"per-market maximum ${self.max_market_exposure}"
+                )
+
+            approved = not rejection_reasons
+            if approved:
+                self._exposure[market_id] = market_exposure + amount
+
+            details = {
+                'market_id': market_id,
+                'amount': float(amount),
+                'drawdown_ok': drawdown_ok,
+                'drawdown_percent': float(drawdown_percent),
+                'open_exposure': float(open_exposure + amount if approved else open_exposure),
+                'market_exposure': float(market_exposure + amount if approved else market_exposure)
+            }
+
+        result = RiskApprovalResult(approved=approved, rejection_reasons=rejection_reasons, details=details)
+        if approved:
+            logger.info(f"Reserved ${amount} exposure in market {market_id} (open: ${details['open_exposure']:.2f})")
+        else:
+            logger.warning(f"Exposure reservation REJECTED for market {market_id}: {'; '.join(rejection_reasons)}")
+        return result
+
+    def release_exposure(self, market_id: str, amount: Decimal) -> None:
+        """
+        Release exposure reserved by reserve_exposure.
+
+        Args:
+            market_id: Market the trade was placed in
+            amount: Position size to release
+        """
+        with self._lock:
+            remaining = self._exposure.get(market_id, Decimal("0")) - amount
+            if remaining > 0:
+                self._exposure[market_id] = remaining
+            else:
+                self._exposure.pop(market_id, None)
+
     def update_peak_capital(self, current_capital: Decimal) -> None:
         """
         Update the peak capital if current capital exceeds it.
@@ -426,6 +627,8 @@ class RiskManager:
             self.starting_capital = new_starting_capital
 
         self.peak_capital = self.starting_capital
+        self.drawdown_tracker.reset(float(self.starting_capital))
+        self.market_risk.clear()
         logger.info(f"RiskManager reset with starting capital: ${self.starting_capital}")
 
     def get_risk_metrics(self, bot_state: BotState) -> Dict[str, Any]:
@@ -440,6 +643,7 @@ class RiskManager:
         """
         current_capital = self.starting_capital + bot_state.total_pnl
         drawdown_percent = self.calculate_drawdown(current_capital, self.peak_capital)
+        market_risk = self.market_risk.snapshot()
 
         return {
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -449,7 +653,12 @@ class RiskManager:
             "drawdown_percent": float(drawdown_percent),
             "drawdown_limit": float(self.max_drawdown_percent),
             "drawdown_remaining": float(self.max_drawdown_percent - drawdown_percent),
+            "max_drawdown_seen": float(self.max_drawdown_seen),
+            "volatility_percent": market_risk.range_percent,
             "volatility_limit": float(self.volatility_threshold_percent),
+            "return_volatility_percent": market_risk.return_volatility_percent,
+            "atr": market_risk.atr,
+            "atr_percent": market_risk.atr_percent,
             "current_exposure": float(bot_state.current_exposure),
             "max_exposure": float(bot_state.max_total_exposure),
             "total_trades": bot_state.total_trades,
@@ -0,0 +1,392 @@
+"""
+Streaming Risk State for Polymarket Bot.
+
+This module keeps the market and equity statistics behind the risk checks
+up to date in O(1) amortized per update instead of rescanning price lists:
+- RollingExtrema: min/max over a time window using monotonic deques
+- RollingStats: mean and standard deviation over a time window from
+  running sums
+- StreamingATR: Wilder-smoothed Average True Range
+- DrawdownTracker: running peak, current drawdown and worst peak-to-trough
+  drawdown of an equity curve
+- RollingRiskState: the market statistics fed from closed klines
+
+Everything here runs in float arithmetic; RiskManager converts to Decimal
+only where results meet money amounts and thresholds.
+"""
+
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional, Tuple
+
+
+class RollingExtrema:
+    """
+    Rolling minimum and maximum over the last ``window`` time units.
+
+    Each deque holds the samples that can still become the window's
+    extreme, so every sample is pushed and popped at most once. Timestamps
+    must not decrease.
+    """
+
+    __slots__ = ("window", "_max", "_min")
+
+    def __init__(self, window: float):
+        """
+        Initialize the window.
+
+        Args:
+            window: Window length in the timestamps' unit
+
+        Raises:
+            ValueError: If window is not positive
+        """
+        if window <= 0:
+            raise ValueError(f"Window must be positive, got {window}")
+        self.window = window
+        self._max: Deque[Tuple[float, float]] = deque()
+        self._min: Deque[Tuple[float, float]] = deque()
+
+    def update(self, timestamp: float, value: float) -> None:
+        """
+        Add a sample and drop samples that left the window.
+
+        Args:
+            timestamp: Sample time
+            value: Sample value
+        """
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((timestamp, value))
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((timestamp, value))
+        self._expire(timestamp)
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._max[0][0] <= cutoff:
+            self._max.popleft()
+        while self._min[0][0] <= cutoff:
+            self._min.popleft()
+
+    @property
+    def max(self) -> Optional[float]:
+        """Largest value in the window, or None if empty."""
+        return self._max[0][1] if self._max else None
+
+    @property
+    def min(self) -> Optional[float]:
+        """Smallest value in the window, or None if empty."""
+        return self._min[0][1] if self._min else None
+
+    def clear(self) -> None:
+        """Drop every sample."""
+        self._max.clear()
+        self._min.clear()
+
+
+class RollingStats:
+    """
+    Rolling mean and sample standard deviation over the last ``window`` time units.
+
+    Sums are taken of deviations from the first sample to limit
+    cancellation error. Timestamps must not decrease.
+    """
+
+    __slots__ = ("window", "_samples", "_shift", "_sum", "_sum_sq")
+
+    def __init__(self, window: float):
+        """
+        Initialize the window.
+
+        Args:
+            window: Window length in the timestamps' unit
+
+        Raises:
+            ValueError: If window is not positive
+        """
+        if window <= 0:
+            raise ValueError(f"Window must be positive, got {window}")
+        self.window = window
+        self._samples: Deque[Tuple[float, float]] = deque()
+        self._shift: Optional[float] = None
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def update(self, timestamp: float, value: float) -> None:
+        """
+        Add a sample and drop samples that left the window.
+
+        Args:
+            timestamp: Sample time
+            value: Sample value
+        """
+        if self._shift is None:
+            self._shift = value
+        deviation = value - self._shift
+        self._samples.append((timestamp, deviation))
+        self._sum += deviation
+        self._sum_sq += deviation * deviation
+
+        cutoff = timestamp - self.window
+        while self._samples[0][0] <= cutoff:
+            _, old = self._samples.popleft()
+            self._sum -= old
+            self._sum_sq -= old * old
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean of the window, or None if empty."""
+        if not self._samples:
+            return None
+        return self._shift + self._sum / len(self._samples)
+
+    @property
+    def std(self) -> Optional[float]:
+        """Sample standard deviation of the window, or None with fewer than 2 samples."""
+        count = len(self._samples)
+        if count < 2:
+            return None
+        variance = (self._sum_sq - self._sum * self._sum / count) / (count - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def clear(self) -> None:
+        """Drop every sample."""
+        self._samples.clear()
+        self._shift = None
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+
+class StreamingATR:
+    """
+    Average True Range with Wilder smoothing.
+
+    The first value is the simple average of the first ``period`` true
+    ranges (the first bar's true range is its high-low range).
+    """
+
+    __slots__ = ("period", "value", "_previous_close", "_seed_sum", "_seed_count")
+
+    def __init__(self, period: int = 14):
+        """
+        Initialize the ATR.
+
+        Args:
+            period: ATR period in bars
+
+        Raises:
+            ValueError: If period is less than 1
+        """
+        if period < 1:
+            raise ValueError(f"ATR period must be at least 1, got {period}")
+        self.period = period
+        self.value: Optional[float] = None
+        self._previous_close: Optional[float] = None
+        self._seed_sum = 0.0
+        self._seed_count = 0
+
+    @property
+    def ready(self) -> bool:
+        """Whether the ATR has produced its first value."""
+        return self.value is not None
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        """
+        Add a closed bar.
+
+        Args:
+            high: Bar high
+            low: Bar low
+            close: Bar close
+
+        Returns:
+            Current ATR, or None while still seeding
+        """
+        true_range = high - low
+        if self._previous_close is not None:
+            true_range = max(true_range, abs(high - self._previous_close), abs(low - self._previous_close))
+        self._previous_close = close
+
+        if self.value is None:
+            self._seed_sum += true_range
+            self._seed_count += 1
+            if self._seed_count == self.period:
+                self.value = self._seed_sum / self.period
+        else:
+            self.value += (true_range - self.value) / self.period
+        return self.value
+
+
+class DrawdownTracker:
+    """
+    Running peak and drawdown of an equity curve.
+
+    Each update is O(1): the peak only moves up, the current drawdown is
+    measured from it and the worst peak-to-trough drawdown is kept.
+    Drawdowns are fractions (0.3 is 30%).
+    """
+
+    __slots__ = ("peak", "current", "drawdown", "max_drawdown")
+
+    def __init__(self, starting_equity: float):
+        """
+        Initialize the tracker.
+
+        Args:
+            starting_equity: Initial equity and peak
+        """
+        self.peak = starting_equity
+        self.current = starting_equity
+        self.drawdown = 0.0
+        self.max_drawdown = 0.0
+
+    def update(self, equity: float) -> float:
+        """
+        Record the latest equity.
+
+        Args:
+            equity: Current equity
+
+        Returns:
+            Current drawdown from the peak
+        """
+        self.current = equity
+        if equity > self.peak:
+            self.peak = equity
+        self.drawdown = (self.peak - equity) / self.peak if self.peak > 0 else 1.0
+        if self.drawdown > self.max_drawdown:
+            self.max_drawdown = self.drawdown
+        return self.drawdown
+
+    def reset(self, starting_equity: float) -> None:
+        """
+        Start a new equity curve.
+
+        Args:
+            starting_equity: Initial equity and peak
+        """
+        self.peak = starting_equity
+        self.current = starting_equity
+        self.drawdown = 0.0
+        self.max_drawdown = 0.0
+
+
+@dataclass(frozen=True)
+class MarketRiskSnapshot:
+    """Market risk statistics at one point in time (percentages are 0-100)."""
+    last_price: Optional[float]
+    low: Optional[float]  # Window minimum
+    high: Optional[float]  # Window maximum
+    range_percent: Optional[float]  # (max - min) / min over the window
+    return_volatility_percent: Optional[float]  # Std of close-to-close returns over the window
+    atr: Optional[float]
+    atr_percent: Optional[float]  # ATR relative to the last price
+
+
+class RollingRiskState:
+    """
+    Market risk statistics fed from closed klines.
+
+    Holds the price range and return volatility over a rolling time window
+    and the ATR over the last ``atr_period`` klines. Updates with a
+    timestamp older than the previous one are ignored. Thread-safe: the
+    kline handler writes while market workers read.
+    """
+
+    def __init__(self, window_seconds: float = 300.0, atr_period: int = 14):
+        """
+        Initialize the state.
+
+        Args:
+            window_seconds: Range and volatility window (default: 5 minutes)
+            atr_period: ATR period in klines
+        """
+        self.window_seconds = window_seconds
+        self.extrema = RollingExtrema(window_seconds)
+        self.returns = RollingStats(window_seconds)
+        self.atr = StreamingATR(atr_period)
+        self.last_price: Optional[float] = None
+        self.last_timestamp: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def update(
+        self,
+        price: float,
+        timestamp: float,
+        high: Optional[float] = None,
+        low: Optional[float] = None
+    ) -> bool:
+        """
+        Feed a closed kline.
+
+        Args:
+            price: Close price
+            timestamp: Close time in seconds
+            high: Kline high (default: price)
+            low: Kline low (default: price)
+
+        Returns:
+            False if the update was older than the state and ignored
+        """
+        with self._lock:
+            if self.last_timestamp is not None and timestamp < self.last_timestamp:
+                return False
+            self.extrema.update(timestamp, price)
+            if self.last_price:
+                self.returns.update(timestamp, price / self.last_price - 1.0)
+            self.atr.update(price if high is None else high, price if low is None else low, price)
+            self.last_price = price
+            self.last_timestamp = timestamp
+            return True
+
+    def clear(self) -> None:
+        """Drop every kline."""
+        with self._lock:
+            self.extrema.clear()
+            self.returns.clear()
+            self.atr = StreamingATR(self.atr.period)
+            self.last_price = None
+            self.last_timestamp = None
+
+    def range_percent(self) -> Optional[float]:
+        """
+        Get the price range over the window.
+
+        Returns:
+            (max - min) / min * 100, or None before the first update
+        """
+        with self._lock:
+            return self._range_percent()
+
+    def _range_percent(self) -> Optional[float]:
+        low, high = self.extrema.min, self.extrema.max
+        if low is None or low <= 0:
+            return None
+        return (high - low) / low * 100.0
+
+    def snapshot(self) -> MarketRiskSnapshot:
+        """
+        Read every statistic consistently.
+
+        Returns:
+            MarketRiskSnapshot with None for statistics not yet available
+        """
+        with self._lock:
+            std = self.returns.std
+            atr = self.atr.value
+            return MarketRiskSnapshot(
+                last_price=self.last_price,
+                low=self.extrema.min,
+                high=self.extrema.max,
+                range_percent=self._range_percent(),
+                return_volatility_percent=None if std is None else std * 100.0,
+                atr=atr,
+                atr_percent=None if atr is None or not self.last_price else atr / self.last_price * 100.0
+            )
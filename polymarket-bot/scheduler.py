@@ -0,0 +1,336 @@
+"""
+Event-Driven Scheduler for Polymarket Bot.
+
+This module dispatches trading work in response to events rather than on a
+fixed sleep interval:
+- Closed klines from the Binance stream (``k.x``)
+- Market window timers scheduled ahead of time from the market catalogue's
+  expiry index (MarketWindowTimers)
+- Settlement results reported by the execution layer
+
+Events are published from any thread (e.g. the WebSocket thread) and handled
+in order on the thread running the scheduler. Each event may carry a
+deadline: an event still queued when its deadline passes is dropped, and a
+handler can check ``event.expired`` between steps to abandon work whose data
+has gone stale.
+"""
+
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Event kinds
+KLINE_CLOSE = "kline_close"
+MARKET_WINDOW = "market_window"
+SETTLEMENT = "settlement"
+TIMER = "timer"
+
+# Length of the 1-minute klines that trigger cycles
+KLINE_INTERVAL_MS = 60_000
+
+
+@dataclass(frozen=True)
+class ScheduledEvent:
+    """An event to dispatch, with an optional monotonic-clock deadline."""
+    kind: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.monotonic)
+    deadline: Optional[float] = None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left until the deadline (negative once passed), or None if unbounded."""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+
+Handler = Callable[[ScheduledEvent], None]
+
+
+class EventScheduler:
+    """
+    Single-consumer event loop with publish/subscribe and timers.
+
+    Handlers run one at a time on the thread that calls ``run``, so they do
+    not need their own locking against each other. A handler that raises is
+    logged and the loop continues.
+    """
+
+    def __init__(self, poll_interval: float = 0.5):
+        """
+        Initialize the scheduler.
+
+        Args:
+            poll_interval: Maximum seconds between checks of the stop condition
+        """
+        self.poll_interval = poll_interval
+        self.dispatched = 0
+        self.expired = 0
+        self._queue: "queue.Queue[ScheduledEvent]" = queue.Queue()
+        self._handlers: Dict[str, List[Handler]] = defaultdict(list)
+        self._timers: List[Tuple[float, int, str, Dict[str, Any], Optional[float]]] = []
+        self._cancelled_timers = set()
+        self._timer_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def subscribe(self, kind: str, handler: Handler) -> None:
+        """
+        Register a handler for an event kind.
+
+        Args:
+            kind: Event kind, e.g. KLINE_CLOSE
+            handler: Callable receiving the ScheduledEvent
+        """
+        self._handlers[kind].append(handler)
+
+    def publish(self, kind: str, payload: Optional[Dict[str, Any]] = None, ttl: Optional[float] = None) -> ScheduledEvent:
+        """
+        Queue an event for dispatch. Safe to call from any thread.
+
+        Args:
+            kind: Event kind
+            payload: Event data
+            ttl: Seconds from now after which the event is stale, or None
+
+        Returns:
+            The queued event
+        """
+        now = time.monotonic()
+        event = ScheduledEvent(
+            kind=kind,
+            payload=payload or {},
+            created_at=now,
+            deadline=now + ttl if ttl is not None else None
+        )
+        self._queue.put(event)
+        return event
+
+    def schedule(self, delay: float, kind: str, payload: Optional[Dict[str, Any]] = None,
+                 ttl: Optional[float] = None) -> int:
+        """
+        Publish an event after a delay.
+
+        Args:
+            delay: Seconds from now
+            kind: Event kind
+            payload: Event data
+            ttl: Seconds after firing after which the event is stale, or None
+
+        Returns:
+            Timer ID for cancel()
+        """
+        timer_id = next(self._timer_ids)
+        with self._lock:
+            heapq.heappush(self._timers, (time.monotonic() + delay, timer_id, kind, payload or {}, ttl))
+        return timer_id
+
+    def cancel(self, timer_id: int) -> None:
+        """
+        Cancel a pending timer. Cancelling a fired or unknown timer is a no-op.
+
+        Args:
+            timer_id: ID returned by schedule()
+        """
+        with self._lock:
+            if any(entry[1] == timer_id for entry in self._timers):
+                self._cancelled_timers.add(timer_id)
+
+    def _fire_due_timers(self) -> Optional[float]:
+        """Publish due timers and return seconds until the next one, if any."""
+        now = time.monotonic()
+        with self._lock:
+            while self._timers and self._timers[0][0] <= now:
+                _, timer_id, kind, payload, ttl = heapq.heappop(self._timers)
+                if timer_id in self._cancelled_timers:
+                    self._cancelled_timers.discard(timer_id)
+                    continue
+                self.publish(kind, payload, ttl)
+            return self._timers[0][0] - now if self._timers else None
+
+    def _dispatch(self, event: ScheduledEvent) -> None:
+        if event.expired:
+            self.expired += 1
+            logger.warning(f"Dropping stale {event.kind} event ({-event.remaining():.3f}s past deadline)")
+            return
+
+        self.dispatched += 1
+        for handler in list(self._handlers.get(event.kind, [])):
+            try:
+                handler(event)
+            except Exception as e:
+                logger.error(f"Error handling {event.kind} event: {e}", exc_info=True)
+
+    def run_once(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for and dispatch a single event.
+
+        Args:
+            timeout: Maximum seconds to wait (defaults to poll_interval)
+
+        Returns:
+            True if an event was dispatched or dropped, False on timeout
+        """
+        wait = self.poll_interval if timeout is None else timeout
+        next_timer = self._fire_due_timers()
+        if next_timer is not None:
+            wait = min(wait, next_timer)
+        try:
+            event = self._queue.get(timeout=max(wait, 0))
+        except queue.Empty:
+            self._fire_due_timers()
+            return False
+        self._dispatch(event)
+        return True
+
+    def run(self, until: Optional[Callable[[], bool]] = None) -> None:
+        """
+        Dispatch events until stop() is called or ``until`` returns True.
+
+        Args:
+            until: Optional stop condition, checked after every event and at
+                least every ``poll_interval`` seconds
+        """
+        self._stopped.clear()
+        while not self._stopped.is_set() and not (until and until()):
+            self.run_once()
+
+    def stop(self) -> None:
+        """Stop the loop after the current handler returns."""
+        self._stopped.set()
+
+    def pending(self) -> int:
+        """Number of queued events not yet dispatched."""
+        return self._queue.qsize()
+
+
+class CycleTrigger:
+    """
+    Decide which kline closes start a trading cycle.
+
+    A cycle starts on the first closed kline at least ``interval`` seconds
+    after the previous cycle. Cycles run by the fallback timer count as well:
+    the timer marks the most recent kline close before it fired, so klines
+    arriving once a stalled stream recovers do not start a second cycle.
+    """
+
+    def __init__(self, interval: float, clock: Callable[[], float] = time.time):
+        """
+        Initialize the trigger.
+
+        Args:
+            interval: Minimum seconds between cycles
+            clock: Wall-clock time source (seconds since the epoch)
+        """
+        self.interval_ms = int(interval * 1000)
+        self.last_cycle_close: Optional[int] = None
+        self._clock = clock
+
+    def kline_closed(self, close_time: int) -> bool:
+        """
+        Check whether a closed kline starts a cycle, recording it if so.
+
+        Args:
+            close_time: Kline close time in ms
+
+        Returns:
+            True if a cycle should start
+        """
+        if self.last_cycle_close is not None and close_time - self.last_cycle_close < self.interval_ms:
+            return False
+        self.last_cycle_close = close_time
+        return True
+
+    def timer_fired(self) -> None:
+        """Record a cycle started by the fallback timer at the current time."""
+        now_ms = int(self._clock() * 1000)
+        self.last_cycle_close = now_ms // KLINE_INTERVAL_MS * KLINE_INTERVAL_MS - 1
+
+
+class MarketWindowTimers:
+    """
+    Schedule a MARKET_WINDOW event at the expiry of each catalogued market.
+
+    ``catalogue`` is a MarketCatalogue (anything with ``expiring_between``).
+    Call schedule() whenever the catalogue may have changed; markets that
+    already have a pending timer are skipped. Event payloads carry the
+    ``market_id`` and ISO 8601 ``end_date``.
+    """
+
+    def __init__(
+        self,
+        scheduler: EventScheduler,
+        catalogue,
+        horizon: float = 3600.0,
+        ttl: Optional[float] = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc)
+    ):
+        """
+        Initialize the timers and subscribe to their own events.
+
+        Args:
+            scheduler: Scheduler that fires the events
+            catalogue: Market catalogue providing expiry times
+            horizon: Seconds ahead to schedule expiries for
+            ttl: Seconds after firing after which an event is stale, or None
+            clock: Wall-clock time source returning aware datetimes
+        """
+        self.scheduler = scheduler
+        self.catalogue = catalogue
+        self.horizon = horizon
+        self.ttl = ttl
+        self._clock = clock
+        self._timers: Dict[str, int] = {}
+        scheduler.subscribe(MARKET_WINDOW, self._forget)
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def schedule(self) -> int:
+        """
+        Schedule timers for markets expiring within the horizon.
+
+        Returns:
+            Number of timers added
+        """
+        now = self._clock()
+        added = 0
+        for market in self.catalogue.expiring_between(now, now + timedelta(seconds=self.horizon)):
+            if market.market_id in self._timers:
+                continue
+            end = market.end_date if market.end_date.tzinfo else market.end_date.replace(tzinfo=timezone.utc)
+            self._timers[market.market_id] = self.scheduler.schedule(
+                max((end - now).total_seconds(), 0.0),
+                MARKET_WINDOW,
+                {'market_id': market.market_id, 'end_date': end.isoformat()},
+                ttl=self.ttl
+            )
+            added += 1
+        if added:
+            logger.info(f"Scheduled {added} market window timers")
+        return added
+
+    def cancel_all(self) -> None:
+        """Cancel every pending timer."""
+        for timer_id in self._timers.values():
+            self.scheduler.cancel(timer_id)
+        self._timers.clear()
+
+    def _forget(self, event: ScheduledEvent) -> None:
+        self._timers.pop(event.payload.get('market_id'), None)
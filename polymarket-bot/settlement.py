@@ -0,0 +1,345 @@
+"""
+Settlement Tracking for Polymarket Bot.
+
+This module watches open orders until they settle without blocking the
+trading cycle:
+- One background thread polls every tracked order on its own schedule
+- Orders due in the same round are queried together, with a single batch
+  request when the client supports ``get_order_statuses`` and concurrent
+  single-order requests otherwise
+- Each tracked order gets a Future that completes on a terminal state
+  (settled, cancelled, failed) or when its timeout passes
+
+The blocking ``poll_settlement`` helpers in ``execution`` hold the caller for
+up to the settlement timeout per order; the tracker lets the bot submit an
+order, register a callback and move on to the next market.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .execution import OrderSettlementError, SettlementOutcome, _determine_outcome
+
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+_CANCELLED_STATUSES = ("cancelled", "canceled")
+_FAILED_STATUSES = ("failed",)
+
+
+@dataclass(frozen=True)
+class SettlementResult:
+    """Final state of a settled order."""
+    order_id: str
+    outcome: SettlementOutcome
+    order_data: Dict[str, Any]
+    elapsed: float
+    polls: int
+
+
+class SettlementFuture(Future):
+    """Future for one tracked order; resolves to a SettlementResult."""
+
+    def __init__(self, order_id: str):
+        super().__init__()
+        self.order_id = order_id
+
+
+@dataclass
+class _Watch:
+    future: SettlementFuture
+    started: float
+    deadline: float
+    next_poll: float
+    polls: int = 0
+    last_status: Optional[str] = None
+
+
+class SettlementTracker:
+    """
+    Multiplexes settlement polling for many open orders.
+
+    ``client`` is anything with ``get_order_status(order_id)`` (the
+    ExecutionEngine or PolymarketAPIClient); if it also has
+    ``get_order_statuses(order_ids)`` returning a dict keyed by order ID,
+    due orders are fetched in batches of ``batch_size``.
+
+    Future callbacks run on the tracker thread, so they should only hand the
+    result off (e.g. EventScheduler.publish).
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        poll_interval: float = 10.0,
+        timeout: float = 300.0,
+        batch_size: int = 50,
+        max_workers: int = 4
+    ):
+        """
+        Initialize the settlement tracker.
+
+        Args:
+            client: Order status source
+            poll_interval: Seconds between polls of the same order
+            timeout: Default seconds to wait for an order to settle
+            batch_size: Maximum order IDs per batch request
+            max_workers: Concurrent single-order requests when the client
+                has no batch method
+
+        Raises:
+            ValueError: If poll_interval, timeout or batch_size is not positive
+        """
+        if poll_interval <= 0 or timeout <= 0 or batch_size < 1:
+            raise ValueError("poll_interval, timeout and batch_size must be positive")
+        self.client = client
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.batched = callable(getattr(client, 'get_order_statuses', None))
+
+        self._watches: Dict[str, _Watch] = {}
+        # Orders removed from _watches whose future callbacks are still running
+        self._completing = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        logger.info(
+            f"SettlementTracker initialized (poll_interval={poll_interval}s, timeout={timeout}s, "
+            f"{'batched' if self.batched else 'concurrent single-order'} status queries)"
+        )
+
+    def track(
+        self,
+        order_id: str,
+        callback: Optional[Callable[[SettlementFuture], None]] = None,
+        timeout: Optional[float] = None
+    ) -> SettlementFuture:
+        """
+        Start watching an order. Returns immediately.
+
+        The first poll happens right away. The future's result is a
+        SettlementResult; it raises OrderSettlementError if the order is
+        cancelled, fails or does not settle within the timeout.
+
+        Args:
+            order_id: Order to watch
+            callback: Optional callable receiving the completed future
+            timeout: Seconds to wait (default: the tracker's timeout)
+
+        Returns:
+            SettlementFuture for the order
+
+        Raises:
+            OrderSettlementError: If the tracker has been closed
+        """
+        now = time.monotonic()
+        with self._wakeup:
+            if self._stopped:
+                raise OrderSettlementError("Settlement tracker is closed")
+            existing = self._watches.get(order_id)
+            if existing is not None:
+                future = existing.future
+            else:
+                future = SettlementFuture(order_id)
+                self._watches[order_id] = _Watch(
+                    future=future,
+                    started=now,
+                    deadline=now + (timeout or self.timeout),
+                    next_poll=now
+                )
+                logger.info(f"Tracking settlement for order_id={order_id} ({len(self._watches)} open)")
+            self._ensure_thread()
+            self._wakeup.notify()
+
+        if callback is not None:
+            future.add_done_callback(callback)
+        return future
+
+    def cancel(self, order_id: str) -> bool:
+        """
+        Stop watching an order and cancel its future.
+
+        Args:
+            order_id: Order to stop watching
+
+        Returns:
+            True if the order was being watched
+        """
+        with self._lock:
+            watch = self._watches.pop(order_id, None)
+        if watch is None:
+            return False
+        watch.future.cancel()
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Number of orders still being watched or whose callbacks have not returned."""
+        with self._lock:
+            return len(self._watches) + self._completing
+
+    def _poll_once(self) -> int:
+        """
+        Poll every order that is due and complete those in a terminal state.
+
+        Returns:
+            Number of futures completed
+        """
+        now = time.monotonic()
+        with self._lock:
+            for order_id in [oid for oid, w in self._watches.items() if w.future.cancelled()]:
+                del self._watches[order_id]
+            expired = [w for w in self._watches.values() if w.deadline <= now]
+            due = [w for w in self._watches.values() if w.next_poll <= now and w.deadline > now]
+
+        completed = 0
+        for watch in expired:
+            completed += self._finish(watch, error=OrderSettlementError(
+                f"Settlement polling timed out after {now - watch.started:.0f}s "
+                f"({watch.polls} polls) for order {watch.future.order_id}"
+                + (f", last status: {watch.last_status}" if watch.last_status else "")
+            ))
+
+        if not due:
+            return completed
+
+        statuses = self._query([w.future.order_id for w in due])
+        for watch in due:
+            order_id = watch.future.order_id
+            watch.polls += 1
+            watch.next_poll = now + self.poll_interval
+            order_data = statuses.get(order_id)
+
+            if isinstance(order_data, Exception) or order_data is None:
+                # Transient errors keep the order watched until its deadline
+                reason = str(order_data) if order_data is not None else "missing from batch response"
+                logger.warning(f"Status query failed for order_id={order_id} (poll #{watch.polls}): {reason}")
+                continue
+
+            status = str(order_data.get("status", "")).lower()
+            watch.last_status = status
+            if status == "settled":
+                outcome = _determine_outcome(order_data)
+                completed += self._finish(watch, result=SettlementResult(
+                    order_id=order_id,
+                    outcome=outcome,
+                    order_data=order_data,
+                    elapsed=now - watch.started,
+                    polls=watch.polls
+                ))
+            elif status in _CANCELLED_STATUSES or status in _FAILED_STATUSES:
+                completed += self._finish(watch, error=OrderSettlementError(
+                    f"Order {order_id} ended with status: {status}"
+                ))
+
+        return completed
+
+    def _query(self, order_ids: List[str]) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """Fetch statuses for due orders, mapping each ID to its data or the error."""
+        results: Dict[str, Union[Dict[str, Any], Exception]] = {}
+
+        if self.batched:
+            for i in range(0, len(order_ids), self.batch_size):
+                chunk = order_ids[i:i + self.batch_size]
+                try:
+                    results.update(self.client.get_order_statuses(chunk))
+                except Exception as e:
+                    results.update({order_id: e for order_id in chunk})
+            return results
+
+        def fetch(order_id):
+            try:
+                return self.client.get_order_status(order_id)
+            except Exception as e:
+                return e
+
+        if len(order_ids) == 1:
+            return {order_ids[0]: fetch(order_ids[0])}
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="settlement")
+        return dict(zip(order_ids, self._executor.map(fetch, order_ids)))
+
+    def _finish(self, watch: _Watch, result: Optional[SettlementResult] = None,
+                error: Optional[Exception] = None) -> int:
+        order_id = watch.future.order_id
+        with self._lock:
+            if self._watches.get(order_id) is not watch:
+                return 0
+            del self._watches[order_id]
+            self._completing += 1
+        try:
+            if not watch.future.set_running_or_notify_cancel():
+                return 0
+
+            if error is not None:
+                logger.warning(str(error))
+                watch.future.set_exception(error)
+            else:
+                logger.info(
+                    f"Order settled: order_id={order_id}, outcome={result.outcome.value}, "
+                    f"elapsed={result.elapsed:.1f}s, polls={result.polls}"
+                )
+                # Callbacks run here, before the order stops counting as pending
+                watch.future.set_result(result)
+            return 1
+        finally:
+            with self._lock:
+                self._completing -= 1
+
+    def _ensure_thread(self) -> None:
+        # Called with the lock held
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True, name="SettlementTracker")
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self._poll_once()
+            except Exception as e:
+                logger.error(f"Error in settlement tracker loop: {e}", exc_info=True)
+
+            with self._wakeup:
+                if self._stopped:
+                    return
+                if not self._watches:
+                    self._wakeup.wait()
+                    continue
+                next_event = min(min(w.next_poll, w.deadline) for w in self._watches.values())
+                delay = next_event - time.monotonic()
+                if delay > 0:
+                    self._wakeup.wait(delay)
+
+    def close(self) -> None:
+        """Stop the tracker thread and cancel every pending future."""
+        with self._wakeup:
+            self._stopped = True
+            watches = list(self._watches.values())
+            self._watches.clear()
+            self._wakeup.notify()
+        for watch in watches:
+            watch.future.cancel()
+        if watches:
+            logger.warning(f"Settlement tracker closed with {len(watches)} orders unsettled")
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
@@ -0,0 +1,532 @@
+"""
+Local Exchange Simulator for Polymarket Bot.
+
+This module runs a stand-in for Binance and Polymarket on one local port,
+so the bot's real network clients can be exercised and load tested
+without leaving the machine:
+- Binance WebSocket streams: ``btcusdt@kline_1m``, ``btcusdt@depth@100ms``
+  (diff-depth events with consistent update IDs) and ``btcusdt@ticker``
+- Binance REST: ``/api/v3/klines`` and ``/api/v3/depth`` snapshots
+- Polymarket REST: ``/markets`` (list and search), ``/markets/{id}``,
+  ``POST /orders`` and ``/orders/{id}`` status with simulated settlement
+- Configurable response latency, random and scripted error injection,
+  stream drops, settlement delay and outcome probabilities
+
+The server runs aiohttp on a dedicated event-loop thread. Point the bot at
+it with ``config_overrides()`` (POLYMARKET_BASE_URL, BINANCE_BASE_URL and
+BINANCE_WS_URL). Streamed klines close every ``kline_interval`` seconds
+but advance one minute of exchange time each, so with short intervals the
+stream runs ahead of the wall clock.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set
+
+from aiohttp import WSMsgType, web
+
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+MINUTE_MS = 60_000
+SYMBOL = "BTCUSDT"
+
+
+@dataclass
+class SimulatorBehaviour:
+    """
+    Knobs for the simulated exchange.
+
+    Fields are read on every request and stream tick, so they can be
+    changed while the simulator runs.
+    """
+    latency: float = 0.0  # Seconds added to every REST response
+    latency_jitter: float = 0.0  # Extra uniform random seconds per response
+    error_rate: float = 0.0  # Probability that a REST request fails
+    error_status: int = 503
+    settle_after: float = 0.5  # Seconds from order acceptance to settlement
+    win_probability: float = 0.5
+    cancel_probability: float = 0.0
+    failure_probability: float = 0.0
+    kline_interval: float = 1.0  # Seconds between closed klines
+    ticks_per_kline: int = 1  # Messages per kline; the last one closes it
+    depth_interval: float = 0.1  # Seconds between diff-depth events
+    volatility: float = 0.0005  # Relative standard deviation of each price tick
+
+
+@dataclass
+class _Order:
+    order_id: str
+    market_id: str
+    side: str
+    outcome: str
+    amount: float
+    order_type: str
+    created: float
+    settle_at: float
+    final_status: str
+    won: bool
+
+    def to_dict(self, now: float) -> Dict[str, Any]:
+        data = {
+            'order_id': self.order_id,
+            'market_id': self.market_id,
+            'side': self.side,
+            'outcome': self.outcome,
+            'amount': self.amount,
+            'type': self.order_type,
+            'filled_amount': self.amount,
+            'fee': 0.0,
+            'status': 'matched',
+        }
+        if now >= self.settle_at:
+            data['status'] = self.final_status
+            if self.final_status == 'settled':
+                data['settlement_outcome'] = 'WIN' if self.won else 'LOSS'
+                losing_side = 'NO' if self.outcome == 'YES' else 'YES'
+                data['market_resolution'] = self.outcome if self.won else losing_side
+        return data
+
+
+def default_markets() -> List[Dict[str, Any]]:
+    """
+    Get the default simulated markets: two active BTC markets and one closed.
+
+    Returns:
+        Market dictionaries in the Polymarket API format
+    """
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            'id': 'sim-btc-up-15m', 'question': 'Will BTC be higher in 15 minutes?',
+            'yes_price': 0.52, 'no_price': 0.48, 'liquidity': 250000, 'yes_volume': 90000,
+            'no_volume': 85000, 'active': True, 'closed': False, 'category': 'crypto', 'tags': ['BTC'],
+            'created_at': (now - timedelta(hours=1)).isoformat(), 'end_date': (now + timedelta(days=1)).isoformat(),
+        },
+        {
+            'id': 'sim-btc-up-1h', 'question': 'Will Bitcoin close the hour higher?',
+            'yes_price': 0.47, 'no_price': 0.53, 'liquidity': 120000, 'yes_volume': 40000,
+            'no_volume': 42000, 'active': True, 'closed': False, 'category': 'crypto', 'tags': ['BTC'],
+            'created_at': (now - timedelta(hours=2)).isoformat(), 'end_date': (now + timedelta(days=1)).isoformat(),
+        },
+        {
+            'id': 'sim-btc-closed', 'question': 'Did BTC close yesterday higher?',
+            'yes_price': 1.0, 'no_price': 0.0, 'liquidity': 0, 'active': False, 'closed': True,
+            'category': 'crypto', 'tags': ['BTC'], 'resolved': True, 'resolution': 'yes',
+            'created_at': (now - timedelta(days=2)).isoformat(), 'end_date': (now - timedelta(days=1)).isoformat(),
+        },
+    ]
+
+
+class ExchangeSimulator:
+    """
+    Local Binance and Polymarket stand-in served over HTTP and WebSocket.
+
+    Usable as a context manager::
+
+        with ExchangeSimulator(SimulatorBehaviour(latency=0.02)) as exchange:
+            os.environ.update(exchange.config_overrides())
+            ...
+
+    ``stats`` counts requests, injected errors, orders and stream messages.
+    """
+
+    def __init__(
+        self,
+        behaviour: Optional[SimulatorBehaviour] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        start_price: float = 45_000.0,
+        markets: Optional[List[Dict[str, Any]]] = None,
+        history: int = 500,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize the simulator; call start() to serve.
+
+        Args:
+            behaviour: Latency, error and settlement settings
+            host: Interface to bind
+            port: TCP port (0 picks a free port)
+            start_price: First BTC price of the random walk
+            markets: Polymarket markets to serve (default: default_markets())
+            history: Closed klines available from /api/v3/klines at start
+            seed: Random seed for prices, errors and outcomes
+        """
+        self.behaviour = behaviour or SimulatorBehaviour()
+        self.host = host
+        self.port = port
+        self.markets = {str(m['id']): m for m in (markets if markets is not None else default_markets())}
+        self.orders: Dict[str, _Order] = {}
+        self.stats: Counter = Counter()
+
+        self._rng = random.Random(seed)
+        self._price = start_price
+        self._klines: List[List[Any]] = []
+        self._seed_history(history)
+        self._bids: Dict[float, float] = {}
+        self._asks: Dict[float, float] = {}
+        self._update_id = 1
+        self._seed_book()
+
+        self._scripted_errors: List[List[Any]] = []
+        self._errors_lock = threading.Lock()
+        self._subscribers: Dict[str, Set[web.WebSocketResponse]] = {'kline': set(), 'depth': set(), 'ticker': set()}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._tasks: List[asyncio.Task] = []
+
+    # Lifecycle
+
+    @property
+    def base_url(self) -> str:
+        """HTTP base URL for both the Polymarket and Binance REST APIs."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def ws_url(self) -> str:
+        """WebSocket base URL; streams are at <ws_url>/<stream name>."""
+        return f"ws://{self.host}:{self.port}/ws"
+
+    def config_overrides(self) -> Dict[str, str]:
+        """
+        Get the environment variables that point the bot at this simulator.
+
+        Returns:
+            Dictionary of Config environment variable names to values
+        """
+        return {
+            'POLYMARKET_BASE_URL': self.base_url,
+            'BINANCE_BASE_URL': self.base_url,
+            'BINANCE_WS_URL': self.ws_url,
+        }
+
+    def start(self) -> "ExchangeSimulator":
+        """
+        Bind the port and start serving and streaming in the background.
+
+        Returns:
+            This simulator
+
+        Raises:
+            OSError: If the port cannot be bound
+        """
+        if self._thread is not None:
+            return self
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="exchange-simulator", daemon=True)
+        self._thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        except Exception:
+            self._stop_loop()
+            raise
+        logger.info(f"Exchange simulator listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """Close every stream and stop the server."""
+        if self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result(timeout=10)
+        self._stop_loop()
+        logger.info("Exchange simulator stopped")
+
+    def _stop_loop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    def __enter__(self) -> "ExchangeSimulator":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    async def _start(self) -> None:
+        app = web.Application(middlewares=[self._rest_middleware])
+        app.router.add_get('/ws/{stream}', self._handle_stream)
+        app.router.add_get('/api/v3/klines', self._handle_klines)
+        app.router.add_get('/api/v3/depth', self._handle_depth)
+        app.router.add_get('/markets', self._handle_markets)
+        app.router.add_get('/markets/{market_id}', self._handle_market)
+        app.router.add_post('/orders', self._handle_submit_order)
+        app.router.add_get('/orders/{order_id}', self._handle_order_status)
+
+        self._runner = web.AppRunner(app, handle_signals=False, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        self._tasks = [
+            asyncio.ensure_future(self._stream_klines()),
+            asyncio.ensure_future(self._stream_depth()),
+        ]
+
+    async def _stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._close_streams()
+        await self._runner.cleanup()
+
+    # Error injection
+
+    def fail_next(self, count: int = 1, status: Optional[int] = None, path_prefix: str = "") -> None:
+        """
+        Fail the next ``count`` REST requests whose path starts with ``path_prefix``.
+
+        Args:
+            count: Number of requests to fail
+            status: HTTP status to return (default: behaviour.error_status)
+            path_prefix: Only fail matching paths, e.g. "/orders"
+        """
+        with self._errors_lock:
+            self._scripted_errors.append([path_prefix, count, status or self.behaviour.error_status])
+
+    def _injected_error(self, path: str) -> Optional[int]:
+        with self._errors_lock:
+            for rule in self._scripted_errors:
+                if path.startswith(rule[0]):
+                    rule[1] -= 1
+                    if rule[1] <= 0:
+                        self._scripted_errors.remove(rule)
+                    return rule[2]
+        if self.behaviour.error_rate and self._rng.random() < self.behaviour.error_rate:
+            return self.behaviour.error_status
+        return None
+
+    def drop_streams(self) -> None:
+        """Close every open WebSocket stream, as an exchange disconnect would."""
+        asyncio.run_coroutine_threadsafe(self._close_streams(), self._loop).result(timeout=10)
+
+    async def _close_streams(self) -> None:
+        sockets = [ws for subscribers in self._subscribers.values() for ws in subscribers]
+        for subscribers in self._subscribers.values():
+            subscribers.clear()
+        await asyncio.gather(*(ws.close() for ws in sockets), return_exceptions=True)
+
+    @web.middleware
+    async def _rest_middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        if request.path.startswith('/ws/'):
+            return await handler(request)
+        self.stats['requests'] += 1
+
+        behaviour = self.behaviour
+        delay = behaviour.latency + (self._rng.uniform(0, behaviour.latency_jitter) if behaviour.latency_jitter else 0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        status = self._injected_error(request.path)
+        if status is not None:
+            self.stats['injected_errors'] += 1
+            return web.json_response({'detail': 'Injected error'}, status=status)
+        return await handler(request)
+
+    # Binance market data
+
+    def _seed_history(self, count: int) -> None:
+        last_open = (int(time.time() * 1000) // MINUTE_MS - 1) * MINUTE_MS
+        for open_time in range(last_open - (count - 1) * MINUTE_MS, last_open + 1, MINUTE_MS):
+            self._klines.append(self._new_kline(open_time))
+
+    def _step_price(self) -> float:
+        self._price = max(1.0, self._price * (1 + self._rng.gauss(0, self.behaviour.volatility)))
+        return self._price
+
+    def _new_kline(self, open_time: int) -> List[Any]:
+        open_price = self._price
+        close = self._step_price()
+        high = max(open_price, close) * (1 + abs(self._rng.gauss(0, self.behaviour.volatility / 2)))
+        low = min(open_price, close) * (1 - abs(self._rng.gauss(0, self.behaviour.volatility / 2)))
+        volume = round(self._rng.uniform(5, 50), 4)
+        # Row layout of GET /api/v3/klines
+        return [
+            open_time, f"{open_price:.2f}", f"{high:.2f}", f"{low:.2f}", f"{close:.2f}", f"{volume}",
+            open_time + MINUTE_MS - 1, f"{volume * close:.2f}", 100, f"{volume / 2}", f"{volume * close / 2:.2f}", "0"
+        ]
+
+    async def _broadcast(self, channel: str, message: Dict[str, Any]) -> None:
+        subscribers = self._subscribers[channel]
+        if not subscribers:
+            return
+        text = json.dumps(message)
+        for ws in list(subscribers):
+            try:
+                await ws.send_str(text)
+                self.stats['ws_messages'] += 1
+            except (ConnectionError, RuntimeError):
+                subscribers.discard(ws)
+
+    async def _stream_klines(self) -> None:
+        open_price = self._price
+        open_time = self._klines[-1][0] + MINUTE_MS
+        high = low = open_price
+        tick = 0
+        while True:
+            ticks = max(1, self.behaviour.ticks_per_kline)
+            await asyncio.sleep(self.behaviour.kline_interval / ticks)
+            price = self._step_price()
+            high, low = max(high, price), min(low, price)
+            tick += 1
+            closed = tick >= ticks
+            volume = round(self._rng.uniform(5, 50), 4)
+            event_time = int(time.time() * 1000)
+            kline = {
+                't': open_time, 'T': open_time + MINUTE_MS - 1, 's': SYMBOL, 'i': '1m',
+                'o': f"{open_price:.2f}", 'c': f"{price:.2f}", 'h': f"{high:.2f}", 'l': f"{low:.2f}",
+                'v': f"{volume}", 'x': closed,
+            }
+            await self._broadcast('kline', {'e': 'kline', 'E': event_time, 's': SYMBOL, 'k': kline})
+            await self._broadcast('ticker', {
+                'e': '24hrTicker', 'E': event_time, 's': SYMBOL, 'c': f"{price:.2f}",
+                'q': f"{volume * price:.2f}", 'h': f"{high:.2f}", 'l': f"{low:.2f}",
+                'p': f"{price - open_price:.2f}", 'P': f"{(price - open_price) / open_price * 100:.3f}",
+            })
+            if closed:
+                self._klines.append([
+                    open_time, kline['o'], kline['h'], kline['l'], kline['c'], kline['v'],
+                    open_time + MINUTE_MS - 1, f"{volume * price:.2f}", 100, "0", "0", "0"
+                ])
+                open_time += MINUTE_MS
+                open_price = price
+                high = low = price
+                tick = 0
+
+    def _seed_book(self, levels: int = 50) -> None:
+        for level in range(1, levels + 1):
+            self._bids[round(self._price - level * 0.5, 2)] = round(self._rng.uniform(0.1, 5), 4)
+            self._asks[round(self._price + level * 0.5, 2)] = round(self._rng.uniform(0.1, 5), 4)
+
+    async def _stream_depth(self) -> None:
+        while True:
+            await asyncio.sleep(self.behaviour.depth_interval)
+            changes = {'b': [], 'a': []}
+            for side, book in (('b', self._bids), ('a', self._asks)):
+                for price in self._rng.sample(sorted(book), k=min(3, len(book))):
+                    book[price] = round(self._rng.uniform(0.1, 5), 4)
+                    changes[side].append([f"{price:.2f}", f"{book[price]}"])
+            self._update_id += 1
+            await self._broadcast('depth', {
+                'e': 'depthUpdate', 'E': int(time.time() * 1000), 's': SYMBOL,
+                'U': self._update_id, 'u': self._update_id, **changes,
+            })
+
+    async def _handle_stream(self, request: web.Request) -> web.WebSocketResponse:
+        stream = request.match_info['stream'].lower()
+        if '@kline' in stream:
+            channel = 'kline'
+        elif '@depth' in stream:
+            channel = 'depth'
+        elif stream.endswith('@ticker'):
+            channel = 'ticker'
+        else:
+            raise web.HTTPNotFound(text=f"Unknown stream {stream}")
+
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+        self._subscribers[channel].add(ws)
+        self.stats[f'{channel}_connections'] += 1
+        try:
+            async for message in ws:
+                if message.type == WSMsgType.ERROR:
+                    break
+        finally:
+            self._subscribers[channel].discard(ws)
+        return ws
+
+    async def _handle_klines(self, request: web.Request) -> web.Response:
+        limit = min(int(request.query.get('limit', 500)), 1000)
+        start = request.query.get('startTime')
+        end = request.query.get('endTime')
+        rows = [
+            row for row in self._klines
+            if (start is None or row[0] >= int(start)) and (end is None or row[0] <= int(end))
+        ]
+        return web.json_response(rows[:limit] if start is not None else rows[-limit:])
+
+    async def _handle_depth(self, request: web.Request) -> web.Response:
+        limit = int(request.query.get('limit', 100))
+        return web.json_response({
+            'lastUpdateId': self._update_id,
+            'bids': [[f"{p:.2f}", f"{q}"] for p, q in sorted(self._bids.items(), reverse=True)[:limit]],
+            'asks': [[f"{p:.2f}", f"{q}"] for p, q in sorted(self._asks.items())[:limit]],
+        })
+
+    # Polymarket markets and orders
+
+    async def _handle_markets(self, request: web.Request) -> web.Response:
+        query = request.query.get('query', '').lower()
+        include_closed = request.query.get('closed', 'false') == 'true'
+        offset = int(request.query.get('offset', 0))
+        limit = int(request.query.get('limit', 100))
+        markets = [
+            market for market in self.markets.values()
+            if (include_closed or not market.get('closed'))
+            and (not query or query in market.get('question', '').lower()
+                 or any(query == str(tag).lower() for tag in market.get('tags', [])))
+        ]
+        return web.json_response(markets[offset:offset + limit])
+
+    async def _handle_market(self, request: web.Request) -> web.Response:
+        market = self.markets.get(request.match_info['market_id'])
+        if market is None:
+            return web.json_response({'detail': 'Market not found'}, status=404)
+        return web.json_response(market)
+
+    async def _handle_submit_order(self, request: web.Request) -> web.Response:
+        try:
+            body = await request.json()
+            market_id = str(body['market_id'])
+            amount = float(body['amount'])
+            outcome = str(body['outcome']).upper()
+        except (ValueError, KeyError, TypeError) as e:
+            return web.json_response({'detail': f'Invalid order: {e}'}, status=400)
+        if market_id not in self.markets:
+            return web.json_response({'detail': 'Market not found'}, status=404)
+        if amount <= 0 or outcome not in ('YES', 'NO'):
+            return web.json_response({'detail': 'Invalid amount or outcome'}, status=400)
+        if self.markets[market_id].get('closed'):
+            return web.json_response({'detail': 'Market is closed'}, status=409)
+
+        behaviour = self.behaviour
+        draw = self._rng.random()
+        if draw < behaviour.failure_probability:
+            final_status = 'failed'
+        elif draw < behaviour.failure_probability + behaviour.cancel_probability:
+            final_status = 'cancelled'
+        else:
+            final_status = 'settled'
+        now = time.monotonic()
+        order = _Order(
+            order_id=f"sim-order-{len(self.orders) + 1}",
+            market_id=market_id,
+            side=str(body.get('side', 'BUY')).upper(),
+            outcome=outcome,
+            amount=amount,
+            order_type=str(body.get('type', 'MARKET')).upper(),
+            created=now,
+            settle_at=now + behaviour.settle_after,
+            final_status=final_status,
+            won=self._rng.random() < behaviour.win_probability,
+        )
+        self.orders[order.order_id] = order
+        self.stats['orders'] += 1
+        return web.json_response(order.to_dict(now))
+
+    async def _handle_order_status(self, request: web.Request) -> web.Response:
+        order = self.orders.get(request.match_info['order_id'])
+        if order is None:
+            return web.json_response({'detail': 'Order not found'}, status=404)
+        return web.json_response(order.to_dict(time.monotonic()))
@@ -5,42 +5,77 @@ This module provides state management, trade logging, and metrics tracking
 for the Polymarket trading bot.
 
 Key Features:
-- JSON-based state persistence with atomic writes
-- Trade history logging with timestamps
+- Journaled state persistence: saves append the changed fields and are
+  periodically compacted into an atomically written JSON snapshot
+- Trade history logging with timestamps and an offset index for recent
+  and time-range reads
 - Metrics tracking (win/loss streaks, drawdown, total trades)
-- Crash recovery using temporary files and renames
+- Incremental analytics (Sharpe, Sortino, profit factor, expectancy, hit
+  rates per signal and confidence calibration), see analytics.py; the
+  rolling window is appended to its own log, one line per trade
+- Crash recovery using temporary files and renames, with torn journal
+  lines dropped on load
+
+See journal.py for the file formats and fsync batching.
 """
 
-import json
+import time
 from datetime import datetime, timezone
 from decimal import Decimal
 from pathlib import Path
 from typing import Dict, Any, Optional, List
+from .analytics import TradeAnalytics
+from .journal import StateJournal, TradeLog
 from .models import BotState, Trade, Position
 
+# Prefix of the metrics keys holding the analytics counters
+ANALYTICS_PREFIX = "analytics_"
+
 
 class StateManager:
     """
     Manages bot state persistence, trade logging, and metrics tracking.
 
-    Uses atomic file writes with temporary files to prevent corruption
-    during crashes.
+    State and metrics are saved as appended deltas over atomically written
+    snapshots; call close() on shutdown to fsync and compact them.
     """
 
-    def __init__(self, state_dir: str = "data"):
+    def __init__(
+        self,
+        state_dir: str = "data",
+        compact_every: int = 200,
+        fsync_interval: float = 1.0,
+        analytics_window: int = 100
+    ):
         """
         Initialize the state manager.
 
         Args:
             state_dir: Directory for storing state and log files
+            compact_every: Journaled saves between snapshot compactions
+            fsync_interval: Minimum seconds between fsyncs of appended data
+            analytics_window: Trades covered by the rolling analytics ratios
         """
         self.state_dir = Path(state_dir)
         self.state_file = self.state_dir / "bot_state.json"
+        self.metrics_file = self.state_dir / "metrics.json"
         self.trades_log = self.state_dir / "trades.log"
+        self.analytics_log = self.state_dir / "analytics.log"
 
         # Create state directory if it doesn't exist
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
+        self._state_journal = StateJournal(
+            self.state_file, compact_every=compact_every, fsync_interval=fsync_interval
+        )
+        self._metrics_journal = StateJournal(
+            self.metrics_file, compact_every=compact_every, fsync_interval=fsync_interval
+        )
+        self._trade_log = TradeLog(self.trades_log, fsync_interval=fsync_interval)
+        self._analytics_log = TradeLog(
+            self.analytics_log, fsync_interval=fsync_interval, timestamp_of=lambda entry: entry['timestamp']
+        )
+
         # Initialize metrics
         self._metrics = {
             "win_streak": 0,
@@ -51,34 +86,33 @@ class StateManager:
             "winning_trades": 0,
             "losing_trades": 0
         }
+        self.analytics = TradeAnalytics(window=analytics_window)
+        # Analytics log line where the current window starts, and window
+        # trades recorded since the last save_metrics()
+        self._analytics_start = len(self._analytics_log)
+        self._unsaved_window: List[List[Any]] = []
 
-    def save_state(self, bot_state: BotState) -> None:
+    def save_state(self, bot_state: BotState, extra: Optional[Dict[str, Any]] = None) -> None:
         """
-        Save bot state to disk using atomic write operation.
+        Save bot state to disk.
 
-        Uses temporary file + rename pattern to prevent corruption
-        on crashes.
+        Appends the fields that changed since the last save to the state
+        journal; the first save and every ``compact_every`` saves write a
+        full snapshot (temporary file + rename) instead.
 
         Args:
             bot_state: BotState object to save
+            extra: Additional top-level fields to persist (e.g. current_cycle)
 
         Raises:
             IOError: If state cannot be saved
         """
-        temp_file = self.state_file.with_suffix('.tmp')
-
         try:
-            # Write to temporary file first
-            with open(temp_file, 'w') as f:
-                json.dump(bot_state.to_dict(), f, indent=2)
-
-            # Atomic rename (replaces existing file)
-            temp_file.replace(self.state_file)
-
+            state = bot_state.to_dict()
+            if extra:
+                state.update(extra)
+            self._state_journal.save(state)
         except Exception as e:
-            # Clean up temporary file on error
-            if temp_file.exists():
-                temp_file.unlink()
             raise IOError(f"Failed to save state: {e}")
 
     def load_state(self) -> Optional[Dict[str, Any]]:
@@ -91,13 +125,9 @@ class StateManager:
         Raises:
             ValueError: If state file is corrupted
         """
-        if not self.state_file.exists():
-            return None
-
         try:
-            with open(self.state_file, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            return self._state_journal.load()
+        except ValueError as e:
             raise ValueError(f"Corrupted state file: {e}")
 
     def validate_state(self, state_data: Dict[str, Any]) -> bool:
@@ -132,15 +162,14 @@ class StateManager:
             IOError: If trade cannot be logged
         """
         try:
-            timestamp = datetime.now(timezone.utc).isoformat()
+            now = datetime.now(timezone.utc)
             log_entry = {
-                "timestamp": timestamp,
+                "timestamp": now.isoformat(),
                 "trade": trade.to_dict()
             }
 
-            # Append to log file (creates file if it doesn't exist)
-            with open(self.trades_log, 'a') as f:
-                f.write(json.dumps(log_entry) + '\n')
+            # Append to log file and its offset index
+            self._trade_log.append(log_entry, now.timestamp())
 
         except Exception as e:
             raise IOError(f"Failed to log trade: {e}")
@@ -152,20 +181,42 @@ class StateManager:
         Returns:
             List of trade dictionaries
         """
-        if not self.trades_log.exists():
-            return []
+        return self._trade_log.read_all()
 
-        trades = []
-        try:
-            with open(self.trades_log, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        trades.append(json.loads(line))
-            return trades
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Corrupted trades log: {e}")
-
-    def update_metrics(self, trade_result: str, pnl: Decimal, current_equity: Decimal) -> None:
+    def recent_trades(self, count: int) -> List[Dict[str, Any]]:
+        """
+        Load the most recent trades without parsing the whole log.
+
+        Args:
+            count: Number of trades
+
+        Returns:
+            List of trade dictionaries, oldest first
+        """
+        return self._trade_log.recent(count)
+
+    def trades_between(self, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """
+        Load trades logged in [start, end) without parsing the whole log.
+
+        Args:
+            start: Range start (naive values are taken as UTC)
+            end: Range end (naive values are taken as UTC)
+
+        Returns:
+            List of trade dictionaries, oldest first
+        """
+        start, end = (t.replace(tzinfo=timezone.utc) if t.tzinfo is None else t for t in (start, end))
+        return self._trade_log.between(start.timestamp(), end.timestamp())
+
+    def update_metrics(
+        self,
+        trade_result: str,
+        pnl: Decimal,
+        current_equity: Decimal,
+        signal_type: Optional[str] = None,
+        confidence: Optional[Decimal] = None
+    ) -> None:
         """
         Update performance metrics based on trade result.
 
@@ -173,10 +224,15 @@ class StateManager:
             trade_result: "win" or "loss"
             pnl: Profit/loss for the trade
             current_equity: Current total equity
+            signal_type: Signal that opened the trade, for per-signal hit rates
+            confidence: Signal confidence (0-1), for calibration
         """
         self._metrics["total_trades"] += 1
+        won = trade_result.lower() == "win"
+        self.analytics.record(pnl, current_equity, won, signal_type, confidence)
+        self._unsaved_window.append(self.analytics.rolling.newest)
 
-        if trade_result.lower() == "win":
+        if won:
             self._metrics["winning_trades"] += 1
             self._metrics["win_streak"] += 1
             self._metrics["loss_streak"] = 0
@@ -212,6 +268,16 @@ class StateManager:
             "win_rate": self._calculate_win_rate()
         }
 
+    def get_analytics(self) -> Dict[str, Any]:
+        """
+        Get the incremental performance analytics.
+
+        Returns:
+            Dictionary of rolling ratios, hit rates and calibration
+            (see TradeAnalytics.summary)
+        """
+        return self.analytics.summary()
+
     def _calculate_win_rate(self) -> float:
         """Calculate win rate percentage."""
         if self._metrics["total_trades"] == 0:
@@ -229,34 +295,38 @@ class StateManager:
             "winning_trades": 0,
             "losing_trades": 0
         }
+        self.analytics.reset()
+        self._unsaved_window.clear()
+        self._analytics_start = len(self._analytics_log)
 
     def save_metrics(self) -> None:
         """
-        Save metrics to disk using atomic write operation.
+        Save metrics to disk.
+
+        Appends the changed metrics to the metrics journal, compacted into
+        metrics.json like the bot state. The analytics are split so each
+        save stays small: new window trades are appended to analytics.log
+        and only the fixed-size counters go into the journal.
 
         Raises:
             IOError: If metrics cannot be saved
         """
-        metrics_file = self.state_dir / "metrics.json"
-        temp_file = metrics_file.with_suffix('.tmp')
-
         try:
             # Convert Decimal to float for JSON serialization
             metrics_to_save = {
                 k: float(v) if isinstance(v, Decimal) else v
                 for k, v in self._metrics.items()
             }
-
-            # Write to temporary file first
-            with open(temp_file, 'w') as f:
-                json.dump(metrics_to_save, f, indent=2)
-
-            # Atomic rename
-            temp_file.replace(metrics_file)
+            now = time.time()
+            for trade_return, pnl, won in self._unsaved_window:
+                self._analytics_log.append({"timestamp": now, "return": trade_return, "pnl": pnl, "won": won}, now)
+            self._unsaved_window.clear()
+            for key, value in self.analytics.to_dict(window=False).items():
+                metrics_to_save[ANALYTICS_PREFIX + key] = value
+            metrics_to_save[ANALYTICS_PREFIX + "log_start"] = self._analytics_start
+            self._metrics_journal.save(metrics_to_save)
 
         except Exception as e:
-            if temp_file.exists():
-                temp_file.unlink()
             raise IOError(f"Failed to save metrics: {e}")
 
     def load_metrics(self) -> None:
@@ -266,14 +336,10 @@ class StateManager:
         Raises:
             ValueError: If metrics file is corrupted
         """
-        metrics_file = self.state_dir / "metrics.json"
-
-        if not metrics_file.exists():
-            return
-
         try:
-            with open(metrics_file, 'r') as f:
-                loaded_metrics = json.load(f)
+            loaded_metrics = self._metrics_journal.load()
+            if loaded_metrics is None:
+                return
 
             # Convert numeric values back to Decimal where appropriate
             self._metrics["win_streak"] = loaded_metrics.get("win_streak", 0)
@@ -283,10 +349,62 @@ class StateManager:
             self._metrics["total_trades"] = loaded_metrics.get("total_trades", 0)
             self._metrics["winning_trades"] = loaded_metrics.get("winning_trades", 0)
             self._metrics["losing_trades"] = loaded_metrics.get("losing_trades", 0)
-
-        except json.JSONDecodeError as e:
+            if ANALYTICS_PREFIX + "log_start" in loaded_metrics:
+                self._load_analytics(loaded_metrics)
+            elif "analytics" in loaded_metrics:
+                # Metrics saved with the window inline: move it to the log
+                self.analytics.load(loaded_metrics["analytics"])
+                self._analytics_start = len(self._analytics_log)
+                self._unsaved_window = self.analytics.rolling.to_list()
+
+        except ValueError as e:
             raise ValueError(f"Corrupted metrics file: {e}")
 
+    def _load_analytics(self, loaded_metrics: Dict[str, Any]) -> None:
+        """
+        Rebuild the analytics from the saved counters and the window's log lines.
+
+        Args:
+            loaded_metrics: Metrics loaded from the journal
+
+        Raises:
+            ValueError: If the saved analytics are malformed
+        """
+        data = {
+            key[len(ANALYTICS_PREFIX):]: value
+            for key, value in loaded_metrics.items()
+            if key.startswith(ANALYTICS_PREFIX)
+        }
+        start = int(data.pop("log_start"))
+        count = min(self.analytics.rolling.window, len(self._analytics_log) - start)
+        data["window"] = [
+            [entry["return"], entry["pnl"], entry["won"]]
+            for entry in self._analytics_log.recent(count)
+        ]
+        self.analytics.load(data)
+        self._analytics_start = start
+        self._unsaved_window.clear()
+
+    def compact(self) -> None:
+        """Fold the state and metrics journals into their snapshots."""
+        self._state_journal.compact()
+        self._metrics_journal.compact()
+
+    def sync(self) -> None:
+        """Fsync every write still pending."""
+        self._state_journal.sync()
+        self._metrics_journal.sync()
+        self._trade_log.sync()
+        self._analytics_log.sync()
+
+    def close(self) -> None:
+        """Compact the journals and fsync and close every file."""
+        self.compact()
+        self._state_journal.close()
+        self._metrics_journal.close()
+        self._trade_log.close()
+        self._analytics_log.close()
+
 
 def create_state_manager(state_dir: str = "data") -> StateManager:
     """
@@ -0,0 +1,473 @@
+"""
+Parallel Parameter Sweep for Polymarket Bot.
+
+This module tunes strategy configuration by running many backtests:
+- Grid search over every combination of candidate values
+- Random search over value lists and uniform ranges
+- A ProcessPoolExecutor fan-out with one worker per core
+
+The kline arrays are copied once into shared memory blocks; workers attach
+to them at start-up and build zero-copy NumPy views, so tasks only carry
+their parameter dictionaries. Runs are batched, ordered so that
+combinations sharing indicator periods land together, and each worker
+caches the RSI/MACD series for recently seen periods. Results come back as
+a table ranked by a chosen metric.
+"""
+
+import csv
+import itertools
+import logging
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from decimal import Decimal
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .backtest import Backtester, BacktestData
+from .capital import CapitalAllocator
+from .config import Config, get_config
+from .risk import RiskManager
+
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Config attributes read by the signal logic
+STRATEGY_PARAMETERS = (
+    'rsi_period',
+    'rsi_oversold_threshold',
+    'rsi_overbought_threshold',
+    'macd_fast_period',
+    'macd_slow_period',
+    'macd_signal_period',
+    'order_book_bullish_threshold',
+    'order_book_bearish_threshold',
+    'prediction_confidence_score',
+)
+
+# Config attributes that configure risk and sizing (fractions, as in Config)
+RISK_PARAMETERS = (
+    'max_drawdown',
+    'max_volatility',
+    'base_position_size',
+)
+
+# Backtester settings that may also be swept
+BACKTEST_PARAMETERS = (
+    'cycle_bars',
+    'horizon_bars',
+    'fee_rate',
+)
+
+SWEEPABLE_PARAMETERS = STRATEGY_PARAMETERS + RISK_PARAMETERS + BACKTEST_PARAMETERS
+
+# Parameters that change the indicator series
+_INDICATOR_PARAMETERS = ('rsi_period', 'macd_fast_period', 'macd_slow_period', 'macd_signal_period')
+
+# Indicator series kept per worker
+_INDICATOR_CACHE_SIZE = 16
+
+_SERIES = ('open_time', 'close', 'order_book_imbalance', 'yes_price')
+
+
+@dataclass(frozen=True)
+class Uniform:
+    """
+    Continuous range for random search.
+
+    Draws integers when both bounds are ints, floats otherwise.
+    """
+    low: Union[int, float]
+    high: Union[int, float]
+
+    def sample(self, rng: np.random.Generator) -> Union[int, float]:
+        """Draw one value."""
+        if isinstance(self.low, int) and isinstance(self.high, int):
+            return int(rng.integers(self.low, self.high + 1))
+        return float(rng.uniform(self.low, self.high))
+
+
+SearchSpace = Mapping[str, Union[Sequence[Any], Uniform]]
+
+
+def _validate_space(space: SearchSpace) -> None:
+    unknown = sorted(set(space) - set(SWEEPABLE_PARAMETERS))
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {', '.join(unknown)}")
+    if not space:
+        raise ValueError("Search space is empty")
+
+
+def grid_combinations(space: SearchSpace) -> List[Dict[str, Any]]:
+    """
+    Expand a search space into every combination of its values.
+
+    Args:
+        space: Mapping of parameter name to candidate values
+
+    Returns:
+        List of parameter dictionaries
+
+    Raises:
+        ValueError: If a parameter is unknown or given as a Uniform range
+    """
+    _validate_space(space)
+    names = list(space)
+    if any(isinstance(space[name], Uniform) for name in names):
+        raise ValueError("Grid search needs explicit values; use random search for Uniform ranges")
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+
+def random_combinations(space: SearchSpace, samples: int, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Draw random combinations from a search space.
+
+    Value lists are sampled uniformly; Uniform ranges are drawn continuously.
+
+    Args:
+        space: Mapping of parameter name to candidate values or a Uniform range
+        samples: Number of combinations to draw
+        seed: Random seed for reproducible sweeps
+
+    Returns:
+        List of parameter dictionaries
+
+    Raises:
+        ValueError: If a parameter is unknown or samples is not positive
+    """
+    _validate_space(space)
+    if samples < 1:
+        raise ValueError(f"samples must be positive, got: {samples}")
+    rng = np.random.default_rng(seed)
+    combinations = []
+    for _ in range(samples):
+        params = {}
+        for name, values in space.items():
+            if isinstance(values, Uniform):
+                params[name] = values.sample(rng)
+            else:
+                params[name] = values[int(rng.integers(len(values)))]
+        combinations.append(params)
+    return combinations
+
+
+@dataclass
+class SweepResult:
+    """
+    Ranked outcome of a parameter sweep (best first).
+
+    Each row holds the swept values as ``param_<name>`` columns (so
+    ``param_max_drawdown`` is the limit and ``max_drawdown`` the result)
+    followed by the BacktestResult summary.
+    """
+    rows: List[Dict[str, Any]]
+    parameters: List[str]
+    metric: str
+    failures: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def best(self) -> Optional[Dict[str, Any]]:
+        """Top-ranked row, or None if every run failed."""
+        return self.rows[0] if self.rows else None
+
+    def top(self, n: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get the best rows.
+
+        Args:
+            n: Number of rows
+
+        Returns:
+            Up to ``n`` rows, best first
+        """
+        return self.rows[:n]
+
+    def write_csv(self, path: Union[str, Path]) -> None:
+        """
+        Write the ranked table to a CSV file.
+
+        Args:
+            path: Destination file path
+        """
+        if not self.rows:
+            return
+        columns = ['rank'] + list(self.rows[0])
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+            writer.writeheader()
+            for rank, row in enumerate(self.rows, start=1):
+                writer.writerow({'rank': rank, **row})
+
+    def format_table(self, n: int = 20) -> str:
+        """
+        Format the best rows as a fixed-width text table.
+
+        Args:
+            n: Number of rows
+
+        Returns:
+            Table with parameter columns followed by headline statistics
+        """
+        columns = ['rank'] + self.parameters + ['total_trades', 'win_rate', 'total_pnl', 'max_drawdown']
+        lines = [columns]
+        for rank, row in enumerate(self.top(n), start=1):
+            values = {'rank': rank, **row}
+            lines.append([
+                f"{values[c]:.4g}" if isinstance(values[c], float) else str(values[c])
+                for c in columns
+            ])
+        widths = [max(len(line[i]) for line in lines) for i in range(len(columns))]
+        return "\n".join(
+            "  ".join(cell.rjust(width) for cell, width in zip(line, widths))
+            for line in lines
+        )
+
+
+class _StrategyConfig:
+    """Stand-in for Config holding only the signal settings."""
+
+    def __init__(self, values: Dict[str, Any]):
+        self.__dict__.update(values)
+
+
+# Per-worker state, set by _init_worker
+_worker_blocks: List[shared_memory.SharedMemory] = []
+_worker_data: Optional[BacktestData] = None
+_worker_base: Dict[str, Any] = {}
+_worker_indicators: "OrderedDict[Tuple, Dict[str, np.ndarray]]" = OrderedDict()
+
+
+def _share_array(array: np.ndarray) -> Tuple[shared_memory.SharedMemory, Tuple[str, Tuple[int, ...], str]]:
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[:] = array
+    del view
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def _init_worker(specs: Dict[str, Optional[Tuple]], base: Dict[str, Any]) -> None:
+    """Attach to the shared kline arrays and store the base settings."""
+    global _worker_data, _worker_base
+    arrays = {}
+    for name, spec in specs.items():
+        if spec is None:
+            arrays[name] = None
+            continue
+        block_name, shape, dtype = spec
+        block = shared_memory.SharedMemory(name=block_name)
+        _worker_blocks.append(block)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    _worker_data = BacktestData(**arrays)
+    _worker_base = base
+    _worker_indicators.clear()
+    # One summary line per run would flood the log on large sweeps
+    for module in (Backtester.__module__, RiskManager.__module__):
+        logging.getLogger(module).setLevel(logging.WARNING)
+
+
+def _run_one(params: Dict[str, Any]) -> Dict[str, Any]:
+    settings = {**_worker_base, **params}
+    config = _StrategyConfig({name: settings[name] for name in STRATEGY_PARAMETERS})
+    starting_capital = Decimal(str(settings['starting_capital']))
+
+    backtester = Backtester(
+        config=config,
+        risk_manager=RiskManager(
+            max_drawdown_percent=Decimal(str(settings['max_drawdown'])) * 100,
+            volatility_threshold_percent=Decimal(str(settings['max_volatility'])) * 100,
+            starting_capital=starting_capital
+        ),
+        capital_allocator=CapitalAllocator(base_size=Decimal(str(settings['base_position_size']))),
+        starting_capital=starting_capital,
+        cycle_bars=int(settings['cycle_bars']),
+        horizon_bars=int(settings['horizon_bars']),
+        fee_rate=Decimal(str(settings['fee_rate']))
+    )
+
+    key = tuple(int(settings[name]) for name in _INDICATOR_PARAMETERS)
+    indicators = _worker_indicators.get(key)
+    if indicators is None:
+        indicators = backtester.compute_indicators(_worker_data.close)
+        _worker_indicators[key] = indicators
+        if len(_worker_indicators) > _INDICATOR_CACHE_SIZE:
+            _worker_indicators.popitem(last=False)
+    else:
+        _worker_indicators.move_to_end(key)
+
+    return backtester.run(_worker_data, indicators=indicators).summary()
+
+
+def _run_batch(batch: List[Tuple[int, Dict[str, Any]]]) -> List[Tuple[int, Dict[str, Any], Optional[str]]]:
+    """Run a batch of (index, params) in a worker; errors are returned, not raised."""
+    results = []
+    for index, params in batch:
+        try:
+            results.append((index, _run_one(params), None))
+        except Exception as e:
+            results.append((index, {}, f"{type(e).__name__}: {e}"))
+    return results
+
+
+class ParameterSweep:
+    """
+    Runs backtests for many parameter combinations across processes.
+
+    Parameters not in a combination keep the values from the base config;
+    risk parameters use Config's fractional convention (``max_drawdown=0.3``
+    means a 30% limit).
+    """
+
+    def __init__(
+        self,
+        data: BacktestData,
+        config: Optional[Config] = None,
+        starting_capital: Decimal = Decimal("100.0"),
+        cycle_bars: int = 5,
+        horizon_bars: int = 5,
+        fee_rate: Decimal = Decimal("0"),
+        max_workers: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ):
+        """
+        Initialize the sweep.
+
+        Args:
+            data: Historical series shared by every run
+            config: Base configuration. If None, loads from environment.
+            starting_capital: Capital at the start of each run
+            cycle_bars: Default klines between decision points
+            horizon_bars: Default klines from entry to settlement
+            fee_rate: Default fee as a fraction of position size
+            max_workers: Worker processes (default: one per CPU)
+            batch_size: Combinations per task (default: spread evenly, at
+                most 4 tasks per worker)
+        """
+        config = config if config else get_config()
+        self.data = data
+        self.base = {name: getattr(config, name) for name in STRATEGY_PARAMETERS + RISK_PARAMETERS}
+        self.base.update(
+            starting_capital=starting_capital,
+            cycle_bars=cycle_bars,
+            horizon_bars=horizon_bars,
+            fee_rate=fee_rate
+        )
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+
+    def grid(self, space: SearchSpace, metric: str = 'total_pnl', descending: bool = True) -> SweepResult:
+        """
+        Run every combination in a search space.
+
+        Args:
+            space: Mapping of parameter name to candidate values
+            metric: Summary key to rank by
+            descending: Rank higher values first
+
+        Returns:
+            SweepResult
+        """
+        return self.run(grid_combinations(space), metric=metric, descending=descending)
+
+    def random(
+        self,
+        space: SearchSpace,
+        samples: int,
+        seed: Optional[int] = None,
+        metric: str = 'total_pnl',
+        descending: bool = True
+    ) -> SweepResult:
+        """
+        Run randomly drawn combinations from a search space.
+
+        Args:
+            space: Mapping of parameter name to candidate values or Uniform ranges
+            samples: Number of combinations
+            seed: Random seed
+            metric: Summary key to rank by
+            descending: Rank higher values first
+
+        Returns:
+            SweepResult
+        """
+        return self.run(random_combinations(space, samples, seed), metric=metric, descending=descending)
+
+    def run(
+        self,
+        combinations: Iterable[Dict[str, Any]],
+        metric: str = 'total_pnl',
+        descending: bool = True
+    ) -> SweepResult:
+        """
+        Backtest each parameter combination in the process pool.
+
+        Args:
+            combinations: Parameter dictionaries
+            metric: Summary key to rank by
+            descending: Rank higher values first
+
+        Returns:
+            SweepResult with successful runs ranked and failed runs listed
+            separately
+        """
+        combinations = list(combinations)
+        for params in combinations:
+            _validate_space(params)
+        parameters = list(dict.fromkeys(f"param_{name}" for params in combinations for name in params))
+
+        start = time.perf_counter()
+        outcomes = []
+        blocks = []
+        try:
+            specs = {}
+            for name in _SERIES:
+                array = getattr(self.data, name)
+                if array is None:
+                    specs[name] = None
+                else:
+                    block, specs[name] = _share_array(array)
+                    blocks.append(block)
+
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(specs, self.base)
+            ) as executor:
+                for batch_results in executor.map(_run_batch, self._batches(combinations)):
+                    outcomes.extend(batch_results)
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+        rows, failures = [], []
+        for index, summary, error in outcomes:
+            params = {f"param_{name}": value for name, value in combinations[index].items()}
+            if error is None:
+                rows.append({**params, **summary})
+            else:
+                failures.append({**params, 'error': error})
+        rows.sort(key=lambda row: row[metric], reverse=descending)
+
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"Sweep complete: {len(rows)} runs, {len(failures)} failed, "
+            f"{elapsed:.1f}s on {self.max_workers} workers"
+        )
+        return SweepResult(rows=rows, parameters=parameters, metric=metric, failures=failures, elapsed=elapsed)
+
+    def _batches(self, combinations: List[Dict[str, Any]]) -> List[List[Tuple[int, Dict[str, Any]]]]:
+        """Group combinations sharing indicator periods and split into tasks."""
+        def indicator_key(item):
+            settings = {**self.base, **item[1]}
+            return tuple(settings[name] for name in _INDICATOR_PARAMETERS)
+
+        ordered = sorted(enumerate(combinations), key=indicator_key)
+        size = self.batch_size or max(1, -(-len(ordered) // (self.max_workers * 4)))
+        return [ordered[i:i + size] for i in range(0, len(ordered), size)]
@@ -0,0 +1,406 @@
+"""
+Pipeline Telemetry for Polymarket Bot.
+
+This module records where time goes in the trading pipeline and exposes it
+for scraping:
+- LatencyHistogram: HDR-style log-linear histogram with a fixed relative
+  error, O(1) to record and O(buckets) to read a percentile
+- Telemetry: per-stage latency histograms fed by monotonic-clock spans,
+  plus labelled counters (retries and API errors from retry_with_backoff)
+- MetricsServer: Prometheus text exposition served from a local HTTP thread
+
+Spans use time.perf_counter_ns(), so wall-clock adjustments never distort
+a measurement. Stages are recorded in microseconds and exposed in seconds.
+"""
+
+import logging
+import math
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "polymarket_bot"
+EXPOSED_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+QUANTILE_NAMES = ("p50", "p90", "p99", "p999")
+
+# Pipeline stages timed by the bot
+STAGE_MARKET_DATA = "market_data"
+STAGE_INDICATORS = "indicators"
+STAGE_SIGNAL = "signal"
+STAGE_RISK = "risk"
+STAGE_ORDER_SUBMIT = "order_submit"
+STAGE_SETTLEMENT = "settlement"
+STAGE_DECISION = "decision"
+
+COUNTER_HELP = {
+    "retries_total": "Retries made by retry_with_backoff.",
+    "api_errors_total": "Failed attempts caught by retry_with_backoff.",
+}
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of non-negative integer values.
+
+    Each power-of-two range is split into equal sub-buckets, so a recorded
+    value is reported with a relative error of at most 10**-significant_digits
+    at any magnitude, as in HdrHistogram. Values above ``highest_value`` are
+    clamped to it. Percentiles report the upper bound of their bucket.
+    """
+
+    def __init__(self, highest_value: int = 3_600_000_000, significant_digits: int = 2):
+        """
+        Initialize the buckets.
+
+        Args:
+            highest_value: Largest value tracked exactly (default one hour in
+                microseconds)
+            significant_digits: Decimal digits of precision, 1 to 4
+
+        Raises:
+            ValueError: If an argument is out of range
+        """
+        if not 1 <= significant_digits <= 4:
+            raise ValueError(f"Significant digits must be between 1 and 4, got {significant_digits}")
+        if highest_value < 2:
+            raise ValueError(f"Highest value must be at least 2, got {highest_value}")
+        self.highest_value = highest_value
+        # Smallest power of two with enough sub-buckets for the precision
+        self._sub_bucket_bits = (2 * 10 ** significant_digits - 1).bit_length()
+        self._counts = array('q', [0]) * (self._index(highest_value) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def _index(self, value: int) -> int:
+        shift = max(value.bit_length() - self._sub_bucket_bits, 0)
+        return (shift << (self._sub_bucket_bits - 1)) + (value >> shift)
+
+    def _upper_bound(self, index: int) -> int:
+        shift = max((index >> (self._sub_bucket_bits - 1)) - 1, 0)
+        sub_bucket = index - (shift << (self._sub_bucket_bits - 1))
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        """
+        Record one value.
+
+        Args:
+            value: Non-negative integer, clamped to highest_value
+        """
+        value = min(max(int(value), 0), self.highest_value)
+        index = self._index(value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def percentile(self, percentile: float) -> Optional[int]:
+        """
+        Get the value at a percentile.
+
+        Args:
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the bucket holding the percentile (never above
+            the largest recorded value), or None if empty
+        """
+        return self.snapshot((percentile,))[2][0]
+
+    def snapshot(self, percentiles: Tuple[float, ...]) -> Tuple[int, int, List[Optional[int]]]:
+        """
+        Read count, total and several percentiles in one pass.
+
+        Args:
+            percentiles: Percentiles between 0 and 100, ascending
+
+        Returns:
+            Tuple of (count, total, values in the order of ``percentiles``)
+        """
+        with self._lock:
+            count, total, largest = self.count, self.total, self.max
+            values: List[Optional[int]] = [None] * len(percentiles)
+            if count:
+                # Rounded first so float percentiles like 99.9 do not overshoot a rank
+                ranks = [max(1, math.ceil(round(count * p / 100, 9))) for p in percentiles]
+                seen, position = 0, 0
+                for index, bucket_count in enumerate(self._counts):
+                    seen += bucket_count
+                    while position < len(ranks) and seen >= ranks[position]:
+                        values[position] = min(self._upper_bound(index), largest)
+                        position += 1
+                    if position == len(ranks):
+                        break
+        return count, total, values
+
+    def reset(self) -> None:
+        """Drop every recorded value."""
+        with self._lock:
+            for index in range(len(self._counts)):
+                self._counts[index] = 0
+            self.count = 0
+            self.total = 0
+            self.min = None
+            self.max = None
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(pairs: Tuple[Tuple[str, str], ...]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in pairs) + "}"
+
+
+class Telemetry:
+    """
+    Registry of stage latency histograms and labelled counters.
+
+    Safe to use from any thread. Histograms and counters are created on
+    first use.
+    """
+
+    def __init__(self, significant_digits: int = 2):
+        """
+        Initialize an empty registry.
+
+        Args:
+            significant_digits: Precision of the latency histograms
+        """
+        self.significant_digits = significant_digits
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], int] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, stage: str) -> LatencyHistogram:
+        """
+        Get the latency histogram of a stage, creating it on first use.
+
+        Args:
+            stage: Stage name
+
+        Returns:
+            Histogram of the stage's latencies in microseconds
+        """
+        histogram = self._histograms.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(
+                    stage, LatencyHistogram(significant_digits=self.significant_digits)
+                )
+        return histogram
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """
+        Record a stage latency measured elsewhere.
+
+        Args:
+            stage: Stage name
+            seconds: Latency in seconds
+        """
+        self.histogram(stage).record(int(seconds * 1_000_000))
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """
+        Time a block as one sample of a stage.
+
+        The sample is recorded whether the block returns or raises.
+
+        Args:
+            stage: Stage name
+        """
+        histogram = self.histogram(stage)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            histogram.record((time.perf_counter_ns() - start) // 1000)
+
+    def increment(self, name: str, amount: int = 1, **labels: str) -> None:
+        """
+        Add to a labelled counter.
+
+        Args:
+            name: Counter name without the metric prefix, e.g. "retries_total"
+            amount: Amount to add
+            **labels: Label values
+        """
+        key = (name, tuple(sorted((label, str(value)) for label, value in labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def counter(self, name: str, **labels: str) -> int:
+        """
+        Get a counter value.
+
+        Args:
+            name: Counter name
+            **labels: Label values
+
+        Returns:
+            Current value, 0 if never incremented
+        """
+        key = (name, tuple(sorted((label, str(value)) for label, value in labels.items())))
+        return self._counters.get(key, 0)
+
+    def summary(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Get per-stage latency statistics.
+
+        Returns:
+            Dictionary of stage to count, mean and p50/p90/p99/p999 in seconds
+        """
+        result = {}
+        for stage, histogram in sorted(self._histograms.items()):
+            count, total, values = histogram.snapshot(tuple(q * 100 for q in EXPOSED_QUANTILES))
+            stats: Dict[str, Optional[float]] = {
+                'count': count,
+                'mean': total / count / 1_000_000 if count else None,
+            }
+            for name, value in zip(QUANTILE_NAMES, values):
+                stats[name] = None if value is None else value / 1_000_000
+            result[stage] = stats
+        return result
+
+    def render_prometheus(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format (0.0.4).
+
+        Stage latencies are exposed as one summary with a ``stage`` label;
+        counters keep their labels.
+
+        Returns:
+            Exposition text
+        """
+        lines = []
+        latency = f"{METRIC_PREFIX}_stage_latency_seconds"
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+
+        if histograms:
+            lines.append(f"# HELP {latency} Latency of trading pipeline stages.")
+            lines.append(f"# TYPE {latency} summary")
+            for stage, histogram in histograms:
+                count, total, values = histogram.snapshot(tuple(q * 100 for q in EXPOSED_QUANTILES))
+                for quantile, value in zip(EXPOSED_QUANTILES, values):
+                    labels = _labels((("stage", stage), ("quantile", str(quantile))))
+                    rendered = "NaN" if value is None else repr(value / 1_000_000)
+                    lines.append(f"{latency}{labels} {rendered}")
+                lines.append(f"{latency}_sum{_labels((('stage', stage),))} {total / 1_000_000!r}")
+                lines.append(f"{latency}_count{_labels((('stage', stage),))} {count}")
+
+        previous = None
+        for (name, labels), value in counters:
+            metric = f"{METRIC_PREFIX}_{name}"
+            if name != previous:
+                lines.append(f"# HELP {metric} {COUNTER_HELP.get(name, name.replace('_', ' ') + '.')}")
+                lines.append(f"# TYPE {metric} counter")
+                previous = name
+            lines.append(f"{metric}{_labels(labels)} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop every histogram and counter."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves GET /metrics from the server's telemetry registry."""
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.telemetry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug("Metrics request: " + format, *args)
+
+
+class MetricsServer:
+    """Prometheus scrape endpoint on a daemon HTTP thread."""
+
+    def __init__(self, telemetry: Optional["Telemetry"] = None, host: str = "127.0.0.1", port: int = 9464):
+        """
+        Initialize the server; call start() to bind and serve.
+
+        Args:
+            telemetry: Registry to expose (default: the shared registry)
+            host: Interface to bind; keep it local unless scraped remotely
+            port: TCP port (0 picks a free port)
+        """
+        self.telemetry = telemetry or get_telemetry()
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Optional[Tuple[str, int]]:
+        """Bound (host, port), or None if not started."""
+        return self._server.server_address[:2] if self._server else None
+
+    def start(self) -> None:
+        """
+        Bind the port and start serving in the background.
+
+        Raises:
+            OSError: If the port cannot be bound
+        """
+        if self._server is not None:
+            return
+        server = ThreadingHTTPServer((self.host, self.port), _MetricsHandler)
+        server.daemon_threads = True
+        server.telemetry = self.telemetry
+        self._server = server
+        self._thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+        logger.info(f"Serving metrics on http://{self.address[0]}:{self.address[1]}/metrics")
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        server, self._server = self._server, None
+        if server is None:
+            return
+        server.shutdown()
+        server.server_close()
+        self._thread.join(timeout=5)
+        self._thread = None
+
+
+_telemetry = Telemetry()
+
+
+def get_telemetry() -> Telemetry:
+    """
+    Get the process-wide telemetry registry.
+
+    Returns:
+        Shared Telemetry
+    """
+    return _telemetry
@@ -0,0 +1,211 @@
+"""
+Tests for the incremental performance analytics.
+
+Tests cover:
+- Rolling Sharpe, Sortino, profit factor and expectancy against
+  recomputation from scratch
+- Hit rates per signal type and confidence calibration
+- Persistence through StateManager metrics
+"""
+
+import json
+import math
+import random
+from decimal import Decimal
+
+import pytest
+
+from polymarket_bot.analytics import CalibrationTracker, RollingTradeStats, TradeAnalytics
+from polymarket_bot.models import SignalType
+from polymarket_bot.state import StateManager
+
+
+def reference_stats(trades):
+    """Recompute the rolling statistics from a list of (return, pnl) pairs."""
+    returns = [r for r, _ in trades]
+    pnls = [p for _, p in trades]
+    mean = sum(returns) / len(returns)
+    std = math.sqrt(sum((r - mean) ** 2 for r in returns) / (len(returns) - 1))
+    downside = math.sqrt(sum(min(r, 0) ** 2 for r in returns) / len(returns))
+    return {
+        'sharpe': mean / std,
+        'sortino': mean / downside,
+        'profit_factor': sum(p for p in pnls if p > 0) / -sum(p for p in pnls if p < 0),
+        'expectancy': sum(pnls) / len(pnls),
+    }
+
+
+class TestRollingTradeStats:
+    """Windowed ratios from running sums."""
+
+    def test_matches_recomputation_over_window(self):
+        rng = random.Random(7)
+        stats = RollingTradeStats(window=20)
+        trades = []
+
+        for _ in range(250):
+            pnl = rng.uniform(-10, 12)
+            trades.append((pnl / 1000, pnl))
+            stats.update(pnl / 1000, pnl, pnl > 0)
+
+        expected = reference_stats(trades[-20:])
+        assert len(stats) == 20
+        assert stats.sharpe_ratio == pytest.approx(expected['sharpe'])
+        assert stats.sortino_ratio == pytest.approx(expected['sortino'])
+        assert stats.profit_factor == pytest.approx(expected['profit_factor'])
+        assert stats.expectancy == pytest.approx(expected['expectancy'])
+        assert stats.win_rate == pytest.approx(sum(p > 0 for _, p in trades[-20:]) / 20 * 100)
+
+    def test_undefined_ratios(self):
+        stats = RollingTradeStats(window=5)
+        assert stats.sharpe_ratio is None
+        assert stats.expectancy is None
+
+        stats.update(0.01, 10, True)
+        stats.update(0.01, 10, True)
+
+        assert stats.sharpe_ratio is None
+        assert stats.sortino_ratio is None
+        assert stats.profit_factor is None
+        assert stats.expectancy == 10
+
+    def test_window_too_small(self):
+        with pytest.raises(ValueError):
+            RollingTradeStats(window=1)
+
+
+class TestCalibrationTracker:
+    """Confidence buckets and Brier score."""
+
+    def test_table_and_scores(self):
+        calibration = CalibrationTracker(bins=10)
+        for won in (True, True, True, False):
+            calibration.update(0.75, won)
+        calibration.update(1.0, True)
+
+        table = calibration.table()
+
+        assert [(row['lower'], row['trades']) for row in table] == [(0.7, 4), (0.9, 1)]
+        assert table[0]['hit_rate'] == 0.75
+        assert calibration.brier_score == pytest.approx((3 * 0.25 ** 2 + 0.75 ** 2) / 5)
+        assert calibration.expected_calibration_error == pytest.approx(0.0)
+
+    def test_rejects_out_of_range_confidence(self):
+        with pytest.raises(ValueError):
+            CalibrationTracker().update(1.5, True)
+
+
+class TestTradeAnalytics:
+    """Combined statistics and persistence."""
+
+    def test_record(self):
+        analytics = TradeAnalytics(window=10)
+        analytics.record(Decimal("50"), Decimal("1050"), True, SignalType.UP, Decimal("0.8"))
+        analytics.record(Decimal("-30"), Decimal("1020"), False, SignalType.DOWN, Decimal("0.6"))
+        analytics.record(Decimal("20"), Decimal("1040"), True, SignalType.UP, Decimal("0.7"))
+
+        summary = analytics.summary()
+
+        assert summary['total_trades'] == 3
+        assert summary['hit_rates']['up'] == {'trades': 2, 'wins': 2, 'hit_rate': 100.0}
+        assert summary['hit_rates']['down']['hit_rate'] == 0.0
+        assert summary['profit_factor'] == pytest.approx(70 / 30)
+        assert summary['expectancy'] == pytest.approx(40 / 3)
+        assert analytics.rolling.to_list()[0][0] == pytest.approx(50 / 1000)
+
+    def test_round_trip(self):
+        analytics = TradeAnalytics(window=10)
+        for i in range(15):
+            analytics.record(10 if i % 3 else -8, 1000 + i, None, "up", 0.65)
+
+        restored = TradeAnalytics(window=10)
+        restored.load(analytics.to_dict())
+
+        original, loaded = analytics.summary(), restored.summary()
+        for key in ('sharpe_ratio', 'sortino_ratio', 'profit_factor', 'expectancy', 'brier_score'):
+            assert loaded[key] == pytest.approx(original[key])
+        assert loaded['total_trades'] == 15
+        assert loaded['hit_rates'] == original['hit_rates']
+        assert loaded['calibration'] == original['calibration']
+
+    def test_load_rejects_malformed_state(self):
+        analytics = TradeAnalytics()
+
+        with pytest.raises(ValueError, match="Invalid analytics state"):
+            analytics.load({'window': [[0.1]]})
+        assert analytics.total_trades == 0
+
+
+class TestStateManagerAnalytics:
+    """Analytics fed and persisted by StateManager."""
+
+    def test_update_metrics_feeds_analytics(self, tmp_path):
+        manager = StateManager(state_dir=str(tmp_path), analytics_window=50)
+        manager.update_metrics("win", Decimal("50"), Decimal("1050"), SignalType.UP, Decimal("0.75"))
+        manager.update_metrics("loss", Decimal("-30"), Decimal("1020"), SignalType.UP, Decimal("0.75"))
+        manager.save_metrics()
+
+        reloaded = StateManager(state_dir=str(tmp_path), analytics_window=50)
+        reloaded.load_metrics()
+
+        assert reloaded.get_analytics() == manager.get_analytics()
+        assert reloaded.get_analytics()['hit_rates']['up']['hit_rate'] == 50.0
+
+    def test_reset_metrics_resets_analytics(self, tmp_path):
+        manager = StateManager(state_dir=str(tmp_path))
+        manager.update_metrics("win", Decimal("50"), Decimal("1050"))
+
+        manager.reset_metrics()
+
+        assert manager.get_analytics()['total_trades'] == 0
+
+    def test_window_is_not_rewritten_on_every_save(self, tmp_path):
+        manager = StateManager(state_dir=str(tmp_path), analytics_window=50)
+        sizes = []
+        for i in range(40):
+            manager.update_metrics("win" if i % 3 else "loss", Decimal("5") if i % 3 else Decimal("-5"),
+                                   Decimal("1000"), SignalType.UP, Decimal("0.6"))
+            before = (tmp_path / "metrics.journal").stat().st_size if i else 0
+            manager.save_metrics()
+            sizes.append((tmp_path / "metrics.journal").stat().st_size - before)
+
+        # The first save is a snapshot; later deltas don't grow with the window
+        assert max(sizes[2:]) < 2 * sizes[2]
+        last_delta = json.loads((tmp_path / "metrics.journal").read_text().splitlines()[-1])
+        assert not any("window" in key for key in last_delta["set"])
+
+        reloaded = StateManager(state_dir=str(tmp_path), analytics_window=50)
+        reloaded.load_metrics()
+        assert reloaded.get_analytics() == manager.get_analytics()
+        assert reloaded.get_analytics()['window_trades'] == 40
+
+    def test_reload_after_reset_ignores_earlier_window(self, tmp_path):
+        manager = StateManager(state_dir=str(tmp_path))
+        manager.update_metrics("win", Decimal("50"), Decimal("1050"))
+        manager.save_metrics()
+        manager.reset_metrics()
+        manager.update_metrics("loss", Decimal("-30"), Decimal("1020"))
+        manager.save_metrics()
+        manager.close()
+
+        reloaded = StateManager(state_dir=str(tmp_path))
+        reloaded.load_metrics()
+
+        assert reloaded.get_analytics()['window_trades'] == 1
+        assert reloaded.get_analytics()['rolling_win_rate'] == 0.0
+
+    def test_inline_window_is_moved_to_the_log(self, tmp_path):
+        analytics = TradeAnalytics()
+        analytics.record(50, 1050, signal_type="up")
+        analytics.record(-30, 1020, signal_type="up")
+        (tmp_path / "metrics.json").write_text(json.dumps({"total_trades": 2, "analytics": analytics.to_dict()}))
+
+        manager = StateManager(state_dir=str(tmp_path))
+        manager.load_metrics()
+        manager.save_metrics()
+        manager.close()
+        reloaded = StateManager(state_dir=str(tmp_path))
+        reloaded.load_metrics()
+
+        assert reloaded.get_analytics() == analytics.summary()
+        assert "analytics" not in json.loads((tmp_path / "metrics.json").read_text())
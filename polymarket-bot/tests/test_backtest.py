@@ -0,0 +1,205 @@
+"""
+Tests for the vectorized backtesting engine.
+
+Tests cover:
+- Vectorized candidate selection agreeing with PredictionEngine per bar
+- Sequential trade settlement, sizing and equity accounting
+- Drawdown halting
+- CSV loading and odds alignment
+- Writing results through StateManager
+"""
+
+import json
+import time
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from polymarket_bot.backtest import Backtester, BacktestData, load_klines_csv, load_odds_csv
+from polymarket_bot.config import Config
+from polymarket_bot.models import SignalType
+from polymarket_bot.prediction import PredictionEngine
+from polymarket_bot.risk import RiskManager
+from polymarket_bot.state import StateManager
+
+MINUTE = 60_000
+
+
+@pytest.fixture
+def mock_config():
+    """Create a mock configuration for testing."""
+    config = Mock(spec=Config)
+    config.rsi_period = 14
+    # Wider than the defaults so random-walk data produces plenty of signals
+    config.rsi_oversold_threshold = 45.0
+    config.rsi_overbought_threshold = 55.0
+    config.macd_fast_period = 12
+    config.macd_slow_period = 26
+    config.macd_signal_period = 9
+    config.order_book_bullish_threshold = 1.1
+    config.order_book_bearish_threshold = 0.9
+    config.prediction_confidence_score = 0.75
+    return config
+
+
+def synthetic_data(bars, seed=11):
+    rng = np.random.default_rng(seed)
+    close = 45000.0 + np.cumsum(rng.normal(0, 15, bars))
+    imbalance = rng.lognormal(0, 0.3, bars)
+    open_time = np.arange(bars, dtype=np.int64) * MINUTE
+    return BacktestData(open_time, close, imbalance)
+
+
+class TestSignals:
+    """Vectorized pre-filter matches the scalar signal logic."""
+
+    def test_candidates_match_evaluate_conditions(self, mock_config):
+        data = synthetic_data(3000)
+        backtester = Backtester(config=mock_config)
+        indicators = backtester.compute_indicators(data.close)
+        engine = PredictionEngine(config=mock_config)
+
+        expected = []
+        for i in range(0, len(data) - backtester.horizon_bars, backtester.cycle_bars):
+            if np.isnan(indicators['macd_signal'][i]):
+                continue
+            signal, _, _ = engine._evaluate_conditions(
+                indicators['rsi'][i], indicators['macd_line'][i],
+                indicators['macd_signal'][i], data.order_book_imbalance[i]
+            )
+            if signal != SignalType.SKIP:
+                expected.append(i)
+
+        assert list(backtester.candidate_bars(data, indicators)) == expected
+        assert expected
+
+    def test_neutral_imbalance_never_trades(self, mock_config):
+        data = synthetic_data(2000)
+        data.order_book_imbalance = None
+
+        result = Backtester(config=mock_config).run(data)
+
+        assert result.trades == []
+        assert result.final_capital == Decimal("100.0")
+
+
+class TestRun:
+    """Trade replay and accounting."""
+
+    def test_trades_settle_sequentially(self, mock_config):
+        data = synthetic_data(20000)
+
+        result = Backtester(config=mock_config).run(data)
+
+        assert result.trades
+        entries = [int(t.created_at.timestamp() * 1000) // MINUTE for t in result.trades]
+        assert all(b - a >= 5 for a, b in zip(entries, entries[1:]))
+        for trade, before, after in zip(result.trades, result.equity_curve, result.equity_curve[1:]):
+            move = trade.metadata['btc_exit'] - trade.metadata['btc_entry']
+            won = move > 0 if trade.metadata['signal'] == 'up' else move < 0
+            assert trade.metadata['result'] == ('win' if won else 'loss')
+            assert (after - before > 0) == won
+            assert trade.metadata['position_size'] <= 25.0
+        assert result.total_pnl == sum(b - a for a, b in zip(result.equity_curve, result.equity_curve[1:]))
+
+    def test_odds_determine_payout(self, mock_config):
+        data = synthetic_data(20000)
+        cheap = data.with_odds(np.array([0]), np.array([0.25]))
+
+        trades = Backtester(config=mock_config).run(cheap).trades
+        up_wins = [t for t in trades if t.metadata['signal'] == 'up' and t.metadata['result'] == 'win']
+
+        assert up_wins
+        assert up_wins[0].metadata['pnl'] == pytest.approx(up_wins[0].metadata['position_size'] * 3)
+
+    def test_halts_on_drawdown(self, mock_config):
+        data = synthetic_data(20000)
+        risk = RiskManager(max_drawdown_percent=Decimal("1.0"))
+
+        result = Backtester(config=mock_config, risk_manager=risk).run(data)
+
+        assert result.halted
+        assert "drawdown" in result.halt_reason.lower()
+        assert result.trades[-1].metadata['result'] == 'loss'
+
+    def test_volatility_checked_on_streamed_klines(self, mock_config):
+        data = synthetic_data(20000)
+        risk = RiskManager()
+
+        with patch.object(risk, 'update_market', wraps=risk.update_market) as update, \
+                patch.object(risk, 'check_volatility', wraps=risk.check_volatility) as check:
+            result = Backtester(config=mock_config, risk_manager=risk).run(data)
+
+        assert check.call_count == result.signals - result.halted
+        assert all(call.args == () and call.kwargs == {} for call in check.call_args_list)
+        timestamps = [call.args[1] for call in update.call_args_list]
+        assert timestamps == sorted(set(timestamps))
+        # Each check sees the closes of the last five minutes, as in the live bot
+        last_bar = int(timestamps[-1] * 1000 - MINUTE) // MINUTE
+        window = data.close[last_bar - 4:last_bar + 1]
+        assert risk.market_risk_snapshot().range_percent == pytest.approx(
+            (window.max() - window.min()) / window.min() * 100
+        )
+
+    def test_high_volatility_rejects_trades(self, mock_config):
+        data = synthetic_data(20000)
+        risk = RiskManager(volatility_threshold_percent=Decimal("0.0001"))
+
+        result = Backtester(config=mock_config, risk_manager=risk).run(data)
+
+        assert result.trades == []
+        assert result.rejected == result.signals > 0
+
+    def test_rerun_is_identical(self, mock_config):
+        data = synthetic_data(5000)
+        backtester = Backtester(config=mock_config)
+
+        assert backtester.run(data).summary() == backtester.run(data).summary()
+
+    def test_months_of_data_run_in_seconds(self, mock_config):
+        data = synthetic_data(90 * 24 * 60)
+
+        start = time.perf_counter()
+        Backtester(config=mock_config).run(data)
+
+        assert time.perf_counter() - start < 10
+
+
+class TestIO:
+    """Loading inputs and writing results."""
+
+    def test_load_binance_kline_csv(self, tmp_path):
+        path = tmp_path / "klines.csv"
+        path.write_text(
+            "0,1,101,99,100.5,10,59999,0,5,6,0,0\n"
+            "60000,1,102,100,101.0,8,119999,0,5,2,0,0\n"
+        )
+
+        data = load_klines_csv(path)
+
+        assert list(data.open_time) == [0, 60000]
+        assert list(data.close) == [100.5, 101.0]
+        assert list(data.order_book_imbalance) == [1.5, 2 / 6]
+        assert (list(data.high), list(data.low)) == ([101.0, 102.0], [99.0, 100.0])
+
+    def test_odds_alignment(self, tmp_path):
+        path = tmp_path / "odds.csv"
+        path.write_text("timestamp,yes_price\n120000,0.6\n30000,0.4\n")
+        data = BacktestData(np.arange(4) * MINUTE, np.ones(4))
+
+        aligned = data.with_odds(*load_odds_csv(path))
+
+        assert list(aligned.yes_price) == [0.5, 0.4, 0.6, 0.6]
+
+    def test_write_to_state_manager(self, mock_config, tmp_path):
+        result = Backtester(config=mock_config).run(synthetic_data(20000))
+        manager = StateManager(state_dir=str(tmp_path))
+
+        result.write_to(manager)
+
+        assert len(manager.load_trades()) == len(result.trades)
+        metrics = json.loads((tmp_path / "metrics.json").read_text())
+        assert metrics["total_trades"] == len(result.trades)
+        assert metrics["winning_trades"] == result.winning_trades
@@ -15,7 +15,7 @@ import time
 from datetime import datetime, timezone
 from decimal import Decimal
 from unittest.mock import Mock, patch, MagicMock
-import requests
+import httpx
 
 from polymarket_bot.execution import (
     ExecutionEngine,
@@ -741,11 +741,11 @@ class TestExecutionEngine:
         assert session.headers['User-Agent'] == 'PolymarketBot/1.0'
         assert 'Authorization' in session.headers
 
-    @patch('polymarket_bot.execution.requests.Session.request')
+    @patch('polymarket_bot.transport.TransportSession.request')
     def test_make_request_success(self, mock_request, execution_engine):
         """Test successful API request."""
         mock_response = Mock()
-        mock_response.ok = True
+        mock_response.is_success = True
         mock_response.status_code = 200
         mock_response.json.return_value = {"order_id": "12345", "status": "pending"}
         mock_request.return_value = mock_response
@@ -755,11 +755,11 @@ class TestExecutionEngine:
         assert result == {"order_id": "12345", "status": "pending"}
         mock_request.assert_called_once()
 
-    @patch('polymarket_bot.execution.requests.Session.request')
+    @patch('polymarket_bot.transport.TransportSession.request')
     def test_make_request_http_error(self, mock_request, execution_engine):
         """Test API request with HTTP error."""
         mock_response = Mock()
-        mock_response.ok = False
+        mock_response.is_success = False
         mock_response.status_code = 400
         mock_response.json.return_value = {"detail": "Bad request"}
         mock_request.return_value = mock_response
@@ -770,10 +770,10 @@ class TestExecutionEngine:
         assert "400" in str(exc_info.value)
         assert exc_info.value.status_code == 400
 
-    @patch('polymarket_bot.execution.requests.Session.request')
+    @patch('polymarket_bot.transport.TransportSession.request')
     def test_make_request_network_error(self, mock_request, execution_engine):
         """Test API request with network error."""
-        mock_request.side_effect = requests.ConnectionError("Network error")
+        mock_request.side_effect = httpx.ConnectError("Network error")
 
         with pytest.raises(PolymarketAPIError) as exc_info:
             execution_engine._make_request("GET", "/markets")
@@ -0,0 +1,140 @@
+"""
+Tests for the streaming indicator engine.
+
+Tests cover:
+- Parity of streaming RSI and MACD with TA-Lib over the same series
+- Provisional (in-progress kline) reads matching a committed update
+- Warm-up behaviour and parameter validation
+- IndicatorEngine snapshots
+"""
+
+import numpy as np
+import pytest
+import talib
+
+from polymarket_bot.indicators import (
+    IndicatorEngine,
+    StreamingEMA,
+    StreamingMACD,
+    StreamingRSI,
+)
+
+
+@pytest.fixture
+def prices():
+    """Random-walk BTC-like closing prices."""
+    rng = np.random.default_rng(42)
+    return 45000.0 + np.cumsum(rng.normal(0, 25, 600))
+
+
+class TestTalibParity:
+    """Streaming values must match TA-Lib run over the full series."""
+
+    @pytest.mark.parametrize("period", [2, 14, 21])
+    def test_rsi_matches_talib(self, prices, period):
+        expected = talib.RSI(prices, timeperiod=period)
+        rsi = StreamingRSI(period)
+
+        for i, price in enumerate(prices):
+            value = rsi.update(float(price))
+            if np.isnan(expected[i]):
+                assert value is None
+            else:
+                assert value == pytest.approx(expected[i], abs=1e-9)
+
+    @pytest.mark.parametrize("fast,slow,signal", [(12, 26, 9), (5, 35, 5), (3, 10, 1)])
+    def test_macd_matches_talib(self, prices, fast, slow, signal):
+        expected_macd, expected_signal, _ = talib.MACD(
+            prices, fastperiod=fast, slowperiod=slow, signalperiod=signal
+        )
+        macd = StreamingMACD(fast, slow, signal)
+
+        for i, price in enumerate(prices):
+            value = macd.update(float(price))
+            if np.isnan(expected_signal[i]):
+                assert value is None
+            else:
+                assert value[0] == pytest.approx(expected_macd[i], abs=1e-9)
+                assert value[1] == pytest.approx(expected_signal[i], abs=1e-9)
+
+    def test_ema_matches_talib(self, prices):
+        expected = talib.EMA(prices, timeperiod=10)
+        ema = StreamingEMA(10)
+
+        values = [ema.update(float(price)) for price in prices]
+
+        assert values[8] is None
+        assert np.allclose(values[9:], expected[9:])
+
+    def test_flat_prices_rsi_is_zero_like_talib(self):
+        flat = np.full(30, 100.0)
+        rsi = StreamingRSI(14)
+
+        for price in flat:
+            value = rsi.update(float(price))
+
+        assert value == talib.RSI(flat, timeperiod=14)[-1] == 0.0
+
+
+class TestProvisionalReads:
+    """peek() must equal the value a committed update would produce."""
+
+    def test_peek_matches_update(self, prices):
+        rsi = StreamingRSI(14)
+        macd = StreamingMACD(12, 26, 9)
+
+        for price in prices[:200]:
+            price = float(price)
+            peeked_rsi, peeked_macd = rsi.peek(price), macd.peek(price)
+            committed_rsi, committed_macd = rsi.update(price), macd.update(price)
+            if committed_rsi is None:
+                assert peeked_rsi is None
+            else:
+                assert peeked_rsi == pytest.approx(committed_rsi)
+            if committed_macd is None:
+                assert peeked_macd is None
+            else:
+                assert peeked_macd == pytest.approx(committed_macd)
+
+
+class TestIndicatorEngine:
+    """Kline-driven engine behaviour."""
+
+    def test_warmup_and_ready(self, prices):
+        engine = IndicatorEngine()
+        assert engine.warmup_period == 34
+
+        for price in prices[:33]:
+            engine.update(float(price))
+        assert not engine.ready
+        assert engine.snapshot().macd_signal is None
+
+        engine.update(float(prices[33]))
+        assert engine.ready
+        assert engine.snapshot().ready
+
+    def test_provisional_updates_are_not_committed(self, prices):
+        engine = IndicatorEngine()
+        for price in prices[:100]:
+            engine.update(float(price))
+        committed = engine.snapshot()
+
+        engine.update(float(prices[100]) + 500.0, closed=False)
+        provisional = engine.snapshot()
+        engine.update(float(prices[100]), closed=False)
+        engine.update(float(prices[100]), closed=True)
+
+        assert provisional.provisional
+        assert provisional.rsi > committed.rsi
+        assert engine.closed_count == 101
+        expected = talib.RSI(prices[:101], timeperiod=14)[-1]
+        assert engine.snapshot().rsi == pytest.approx(expected)
+        assert engine.snapshot(include_provisional=False) == engine.snapshot()
+
+    def test_invalid_periods(self):
+        with pytest.raises(ValueError):
+            StreamingRSI(1)
+        with pytest.raises(ValueError):
+            StreamingMACD(26, 12, 9)
+        with pytest.raises(ValueError):
+            StreamingEMA(0)
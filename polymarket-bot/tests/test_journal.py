@@ -0,0 +1,228 @@
+"""
+Tests for the append-only state journal and indexed trade log.
+
+Tests cover:
+- Delta saves, replay and compaction into the snapshot
+- Recovery from torn writes and interrupted compactions
+- Batched fsync
+- Recent-N and time-range trade reads through the offset index
+- StateManager on top of both
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from polymarket_bot.journal import SEQ_KEY, StateJournal, TradeLog, encode
+from polymarket_bot.models import BotState
+from polymarket_bot.state import StateManager
+
+
+def bot_state(**overrides):
+    fields = dict(
+        bot_id="journal_test",
+        strategy_name="test_strategy",
+        max_position_size=Decimal("25.00"),
+        max_total_exposure=Decimal("100.00"),
+        risk_per_trade=Decimal("5.00"),
+    )
+    fields.update(overrides)
+    return BotState(**fields)
+
+
+class TestStateJournal:
+    """Snapshot plus delta journal."""
+
+    def test_first_save_writes_snapshot_then_deltas(self, tmp_path):
+        journal = StateJournal(tmp_path / "state.json")
+
+        journal.save({"a": 1, "b": 2})
+        journal.save({"a": 1, "b": 3})
+        journal.save({"a": 1, "b": 3})
+
+        assert json.loads((tmp_path / "state.json").read_text()) == {"a": 1, "b": 2, SEQ_KEY: 0}
+        lines = (tmp_path / "state.journal").read_bytes().splitlines()
+        assert [json.loads(line) for line in lines] == [{"seq": 1, "set": {"b": 3}}]
+        assert StateJournal(tmp_path / "state.json").load() == {"a": 1, "b": 3}
+
+    def test_removed_keys(self, tmp_path):
+        journal = StateJournal(tmp_path / "state.json")
+        journal.save({"a": 1, "b": 2})
+        journal.save({"a": 1})
+
+        assert StateJournal(tmp_path / "state.json").load() == {"a": 1}
+
+    def test_compaction(self, tmp_path):
+        journal = StateJournal(tmp_path / "state.json", compact_every=3)
+
+        for i in range(6):
+            journal.save({"n": i})
+
+        assert journal.pending_deltas == 1
+        assert json.loads((tmp_path / "state.json").read_text())["n"] == 4
+        assert StateJournal(tmp_path / "state.json").load() == {"n": 5}
+
+    def test_torn_tail_is_dropped(self, tmp_path):
+        journal = StateJournal(tmp_path / "state.json")
+        journal.save({"n": 0})
+        journal.save({"n": 1})
+        journal.close()
+        with open(tmp_path / "state.journal", "ab") as f:
+            f.write(b'{"seq":2,"set":{"n"')
+
+        reopened = StateJournal(tmp_path / "state.json")
+
+        assert reopened.load() == {"n": 1}
+        reopened.save({"n": 2})
+        assert StateJournal(tmp_path / "state.json").load() == {"n": 2}
+
+    def test_interrupted_compaction_skips_stale_deltas(self, tmp_path):
+        journal = StateJournal(tmp_path / "state.json")
+        journal.save({"n": 0})
+        journal.save({"n": 1})
+        stale = (tmp_path / "state.journal").read_bytes()
+        journal.save({"n": 2})
+        journal.compact()
+        # Crash between the snapshot rename and the journal truncation
+        (tmp_path / "state.journal").write_bytes(stale)
+
+        assert StateJournal(tmp_path / "state.json").load() == {"n": 2}
+
+    def test_corrupted_snapshot(self, tmp_path):
+        (tmp_path / "state.json").write_text("invalid json{{{")
+
+        with pytest.raises(ValueError, match="Corrupted snapshot"):
+            StateJournal(tmp_path / "state.json").load()
+
+    def test_fsync_is_batched(self, tmp_path):
+        now = [0.0]
+        journal = StateJournal(tmp_path / "state.json", fsync_interval=1.0, clock=lambda: now[0])
+        journal.save({"n": 0})
+
+        with patch("polymarket_bot.journal.os.fsync") as fsync:
+            for i in range(1, 50):
+                journal.save({"n": i})
+            assert fsync.call_count == 0
+            now[0] = 1.5
+            journal.save({"n": 50})
+            assert fsync.call_count == 1
+            journal.close()
+            assert fsync.call_count == 1
+
+
+class TestTradeLog:
+    """Offset-indexed JSON-lines log."""
+
+    START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def fill(self, log, count):
+        for i in range(count):
+            logged = self.START + timedelta(minutes=i)
+            log.append({"timestamp": logged.isoformat(), "trade": {"trade_id": f"t{i}"}}, logged.timestamp())
+
+    def ids(self, entries):
+        return [entry["trade"]["trade_id"] for entry in entries]
+
+    def test_recent_and_range(self, tmp_path):
+        log = TradeLog(tmp_path / "trades.log")
+        self.fill(log, 50)
+
+        assert self.ids(log.recent(3)) == ["t47", "t48", "t49"]
+        assert log.recent(0) == []
+        assert len(log.recent(500)) == 50
+        start = (self.START + timedelta(minutes=10)).timestamp()
+        end = (self.START + timedelta(minutes=13)).timestamp()
+        assert self.ids(log.between(start, end)) == ["t10", "t11", "t12"]
+
+    def test_reads_only_the_requested_bytes(self, tmp_path):
+        log = TradeLog(tmp_path / "trades.log")
+        self.fill(log, 200)
+
+        with patch("polymarket_bot.journal.decode", wraps=json.loads) as decode:
+            log.recent(2)
+
+        assert decode.call_count == 2
+
+    def test_index_survives_reopen(self, tmp_path):
+        log = TradeLog(tmp_path / "trades.log")
+        self.fill(log, 5)
+        log.close()
+
+        with patch.object(TradeLog, "_scan") as scan:
+            reopened = TradeLog(tmp_path / "trades.log")
+
+        scan.assert_not_called()
+        assert self.ids(reopened.recent(2)) == ["t3", "t4"]
+
+    def test_rebuilds_missing_index_and_drops_torn_line(self, tmp_path):
+        log = TradeLog(tmp_path / "trades.log")
+        self.fill(log, 5)
+        log.close()
+        (tmp_path / "trades.log.idx").unlink()
+        with open(tmp_path / "trades.log", "ab") as f:
+            f.write(encode({"timestamp": "2024-01-01T00:05:00+00:00"})[:10])
+
+        reopened = TradeLog(tmp_path / "trades.log")
+
+        assert len(reopened) == 5
+        assert self.ids(reopened.recent(5)) == ["t0", "t1", "t2", "t3", "t4"]
+        self.fill(reopened, 1)
+        assert self.ids(reopened.read_all())[-2:] == ["t4", "t0"]
+
+    def test_indexes_lines_missing_from_index(self, tmp_path):
+        log = TradeLog(tmp_path / "trades.log")
+        self.fill(log, 3)
+        log.close()
+        # Crash after the log line was written but before its index record
+        index = (tmp_path / "trades.log.idx").read_bytes()
+        (tmp_path / "trades.log.idx").write_bytes(index[:-TradeLog.RECORD.size])
+
+        assert self.ids(TradeLog(tmp_path / "trades.log").recent(1)) == ["t2"]
+
+
+class TestStateManagerJournal:
+    """StateManager persistence through the journal."""
+
+    def test_state_round_trip_with_extra_fields(self, tmp_path):
+        manager = StateManager(state_dir=str(tmp_path))
+        state = bot_state()
+        manager.save_state(state, extra={"current_cycle": 1})
+        state.total_trades = 4
+        manager.save_state(state, extra={"current_cycle": 2})
+
+        loaded = StateManager(state_dir=str(tmp_path)).load_state()
+
+        assert loaded["total_trades"] == 4
+        assert loaded["current_cycle"] == 2
+        assert SEQ_KEY not in loaded
+
+    def test_metrics_round_trip(self, tmp_path):
+        manager = StateManager(state_dir=str(tmp_path))
+        manager.update_metrics("win", Decimal("5"), Decimal("105"))
+        manager.save_metrics()
+        manager.update_metrics("loss", Decimal("-5"), Decimal("100"))
+        manager.save_metrics()
+        manager.close()
+
+        reloaded = StateManager(state_dir=str(tmp_path))
+        reloaded.load_metrics()
+
+        assert reloaded.get_metrics()["total_trades"] == 2
+        assert not (tmp_path / "metrics.journal").read_bytes()
+
+    def test_recent_trades_and_range(self, tmp_path):
+        manager = StateManager(state_dir=str(tmp_path))
+        before = datetime.now(timezone.utc) - timedelta(seconds=1)
+        for i in range(3):
+            logged = before + timedelta(minutes=i)
+            manager._trade_log.append(
+                {"timestamp": logged.isoformat(), "trade": {"trade_id": f"t{i}"}}, logged.timestamp()
+            )
+
+        assert [t["trade"]["trade_id"] for t in manager.recent_trades(2)] == ["t1", "t2"]
+        window = manager.trades_between(before + timedelta(seconds=30), before + timedelta(minutes=5))
+        assert [t["trade"]["trade_id"] for t in window] == ["t1", "t2"]
+        assert len(manager.load_trades()) == 3
@@ -0,0 +1,211 @@
+"""
+Tests for the market catalogue cache.
+
+Tests cover:
+- Serving cached markets within the TTL
+- Stale-while-revalidate and blocking refresh after max_stale
+- Best-market selection and the expiry index
+- Background refresh and the market snapshot integration
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+
+from polymarket_bot.config import Config
+from polymarket_bot.market_catalogue import MarketCatalogue
+from polymarket_bot.market_data import PolymarketAPIError, PolymarketClient, _fetch_market
+
+
+def raw_market(market_id, hours=1, **overrides):
+    market = {
+        'id': market_id,
+        'question': f'BTC market {market_id}?',
+        'yes_price': 0.6,
+        'no_price': 0.4,
+        'liquidity': 1000,
+        'end_date': (datetime.now(timezone.utc) + timedelta(hours=hours)).isoformat(),
+    }
+    market.update(overrides)
+    return market
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def client():
+    config = Mock(spec=Config)
+    config.polymarket_base_url = "https://clob.polymarket.com"
+    config.polymarket_api_key = "key"
+    client = PolymarketClient(config)
+    client.get_btc_markets = Mock(return_value=[raw_market('m1'), raw_market('m2', hours=3)])
+    return client
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class TestCaching:
+    """TTL and stale-while-revalidate."""
+
+    def test_reads_within_ttl_hit_cache(self, client, clock):
+        catalogue = MarketCatalogue(client, ttl=30, clock=clock)
+
+        for _ in range(5):
+            clock.now += 5
+            assert catalogue.best_market().market_id == 'm1'
+
+        assert client.get_btc_markets.call_count == 1
+
+    def test_returns_copies(self, client, clock):
+        catalogue = MarketCatalogue(client, ttl=30, clock=clock)
+
+        catalogue.best_market().metadata['rsi_14'] = 70.0
+
+        assert 'rsi_14' not in catalogue.best_market().metadata
+
+    def test_stale_read_revalidates_in_background(self, client, clock):
+        catalogue = MarketCatalogue(client, ttl=30, max_stale=300, clock=clock)
+        catalogue.refresh()
+        release = threading.Event()
+        client.get_btc_markets.side_effect = lambda limit: release.wait(2) and [raw_market('m3')]
+
+        clock.now = 40
+        assert catalogue.best_market().market_id == 'm1'
+        assert catalogue.best_market().market_id == 'm1'
+        release.set()
+
+        assert wait_for(lambda: catalogue.refresh_count == 2)
+        assert catalogue.best_market().market_id == 'm3'
+        assert client.get_btc_markets.call_count == 2
+
+    def test_failed_revalidation_keeps_stale_data(self, client, clock):
+        catalogue = MarketCatalogue(client, ttl=30, max_stale=300, clock=clock)
+        catalogue.refresh()
+        client.get_btc_markets.side_effect = PolymarketAPIError("down")
+
+        clock.now = 40
+        assert catalogue.best_market().market_id == 'm1'
+        assert wait_for(lambda: catalogue.refresh_errors == 1)
+        assert catalogue.best_market().market_id == 'm1'
+
+    def test_revalidate_refreshes_fresh_catalogue(self, client, clock):
+        catalogue = MarketCatalogue(client, ttl=30, max_stale=300, clock=clock)
+        catalogue.refresh()
+        client.get_btc_markets.return_value = [raw_market('m3')]
+
+        clock.now = 5
+        catalogue.revalidate()
+
+        assert wait_for(lambda: catalogue.refresh_count == 2)
+        assert catalogue.best_market().market_id == 'm3'
+
+    def test_blocks_after_max_stale(self, client, clock):
+        catalogue = MarketCatalogue(client, ttl=30, max_stale=60, clock=clock)
+        catalogue.refresh()
+        client.get_btc_markets.side_effect = PolymarketAPIError("down")
+
+        clock.now = 100
+        with pytest.raises(PolymarketAPIError):
+            catalogue.best_market()
+
+    def test_invalid_settings(self, client):
+        with pytest.raises(ValueError):
+            MarketCatalogue(client, ttl=0)
+
+
+class TestQueries:
+    """Best-market selection and indexes."""
+
+    def test_skips_closed_and_ended_markets(self, client, clock):
+        client.get_btc_markets.return_value = [
+            raw_market('closed', closed=True),
+            raw_market('ending', hours=0.1 / 3600),
+            raw_market('open', hours=2),
+        ]
+        catalogue = MarketCatalogue(client, ttl=30, clock=clock)
+        catalogue.refresh()
+
+        time.sleep(0.2)
+
+        assert catalogue.best_market().market_id == 'open'
+        assert [m.market_id for m in catalogue.active_markets()] == ['open']
+
+    def test_no_active_market(self, client, clock):
+        client.get_btc_markets.return_value = [raw_market('closed', closed=True)]
+        catalogue = MarketCatalogue(client, clock=clock)
+
+        with pytest.raises(ValueError, match="No active Polymarket markets"):
+            catalogue.best_market()
+
+    def test_get_by_id_falls_back_to_api(self, client, clock):
+        client.get_market_by_id = Mock(return_value=raw_market('other'))
+        catalogue = MarketCatalogue(client, clock=clock)
+
+        assert catalogue.get('m2').market_id == 'm2'
+        client.get_market_by_id.assert_not_called()
+        assert catalogue.get('other').market_id == 'other'
+        client.get_market_by_id.assert_called_once_with('other')
+
+    def test_expiry_index(self, client, clock):
+        client.get_btc_markets.return_value = [
+            raw_market('late', hours=5), raw_market('soon', hours=1), raw_market('mid', hours=3),
+            raw_market('undated', end_date=None),
+        ]
+        catalogue = MarketCatalogue(client, clock=clock)
+        catalogue.refresh()
+        now = datetime.now(timezone.utc)
+
+        soonest = catalogue.expiring_between(now, now + timedelta(hours=4))
+
+        assert [m.market_id for m in soonest] == ['soon', 'mid']
+        assert len(catalogue) == 4
+
+
+class TestIntegration:
+    """Background refresh and cycle lookups."""
+
+    def test_background_refresh(self, client):
+        with MarketCatalogue(client, ttl=0.05) as catalogue:
+            catalogue.start()
+            assert wait_for(lambda: client.get_btc_markets.call_count >= 3)
+
+        calls = client.get_btc_markets.call_count
+        time.sleep(0.15)
+        assert client.get_btc_markets.call_count == calls
+
+    def test_fetch_market_uses_catalogue(self, client, clock):
+        catalogue = MarketCatalogue(client, clock=clock)
+
+        with patch.object(client, 'search_markets') as search, \
+                patch.object(client, 'get_market_odds', return_value=(Decimal("0.7"), Decimal("0.3"))) as odds:
+            for _ in range(3):
+                market = _fetch_market(client, None, catalogue)
+                assert market.market_id == 'm1'
+                assert market.yes_price == Decimal("0.7")
+
+        search.assert_not_called()
+        assert client.get_btc_markets.call_count == 1
+        # Discovery is cached but the odds are fetched every cycle
+        assert [c.args for c in odds.call_args_list] == [('m1',)] * 3
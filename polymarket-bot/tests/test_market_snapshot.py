@@ -0,0 +1,314 @@
+"""
+Tests for the per-cycle MarketSnapshot.
+
+Tests cover:
+- Snapshot construction with a single order book request
+- Use of warm streaming indicators instead of TA-Lib recomputation
+- Signal generation from a snapshot without recomputation or network calls
+- Concurrent source fetching with per-source deadlines and partial results
+"""
+
+import json
+import time
+from dataclasses import FrozenInstanceError
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import MagicMock, Mock, patch
+
+import numpy as np
+import pytest
+
+from polymarket_bot.config import Config
+from polymarket_bot.market_data import (
+    BinanceWebSocketClient,
+    MarketSnapshot,
+    fetch_concurrently,
+    get_market_snapshot,
+    get_market_snapshots,
+)
+from polymarket_bot.models import MarketData, SignalType
+from polymarket_bot.order_book import LocalOrderBook
+from polymarket_bot.prediction import PredictionEngine
+
+
+@pytest.fixture
+def mock_config():
+    """Create a mock configuration for testing."""
+    config = Mock(spec=Config)
+    config.rsi_period = 14
+    config.rsi_oversold_threshold = 30.0
+    config.rsi_overbought_threshold = 70.0
+    config.macd_fast_period = 12
+    config.macd_slow_period = 26
+    config.macd_signal_period = 9
+    config.order_book_bullish_threshold = 1.1
+    config.order_book_bearish_threshold = 0.9
+    config.prediction_confidence_score = 0.75
+    config.ws_max_reconnect_attempts = 0
+    config.ws_reconnect_delay = 1
+    config.order_book_fetch_deadline = 0.5
+    config.market_fetch_deadline = 1.0
+    return config
+
+
+@pytest.fixture
+def polymarket_client():
+    client = MagicMock()
+    client.get_btc_markets.return_value = [{"id": "market_123"}]
+    client.parse_market_data.return_value = MarketData(
+        market_id="market_123",
+        question="Will BTC go up?",
+        end_date=datetime(2030, 1, 1, 12, 0, 0),
+        yes_price=Decimal("0.65"),
+        no_price=Decimal("0.35")
+    )
+    return client
+
+
+def make_snapshot(**overrides):
+    values = dict(
+        market=MarketData(
+            market_id="market_123",
+            question="Will BTC go up?",
+            end_date=datetime(2030, 1, 1),
+            yes_price=Decimal("0.5"),
+            no_price=Decimal("0.5")
+        ),
+        prices=tuple(45000.0 + i for i in range(40)),
+        btc_price=45039.0,
+        rsi=25.0,
+        macd_line=12.0,
+        macd_signal=10.0,
+        order_book_imbalance=1.3
+    )
+    values.update(overrides)
+    return MarketSnapshot(**values)
+
+
+class TestGetMarketSnapshot:
+    """Snapshot construction."""
+
+    def test_single_order_book_request(self, mock_config, polymarket_client):
+        binance_client = MagicMock()
+        binance_client.get_latest_prices.return_value = [100 + i * 0.2 for i in range(100)]
+
+        with patch('polymarket_bot.market_data.get_config', return_value=mock_config), \
+                patch('polymarket_bot.market_data.get_order_book_imbalance', return_value=1.2) as imbalance:
+            snapshot = get_market_snapshot(binance_client, polymarket_client)
+
+        imbalance.assert_called_once()
+        binance_client.get_latest_prices.assert_called_once()
+        assert snapshot.market_id == "market_123"
+        assert snapshot.btc_price == pytest.approx(119.8)
+        assert snapshot.recent_prices(3) == list(snapshot.prices[-3:])
+        assert snapshot.market.metadata["rsi_14"] == snapshot.rsi
+
+    def test_uses_warm_streaming_indicators(self, mock_config, polymarket_client):
+        with patch('polymarket_bot.market_data.get_config', return_value=mock_config):
+            binance_client = BinanceWebSocketClient(buffer_size=100)
+        prices = 45000.0 + np.cumsum(np.random.default_rng(7).normal(0, 20, 60))
+        for price in prices:
+            binance_client._on_message(None, json.dumps({'k': {'c': str(price), 'x': True}}))
+
+        with patch('polymarket_bot.market_data.get_config', return_value=mock_config), \
+                patch('polymarket_bot.market_data.get_order_book_imbalance', return_value=1.0), \
+                patch('polymarket_bot.market_data.calculate_rsi') as calculate_rsi:
+            snapshot = get_market_snapshot(binance_client, polymarket_client)
+
+        calculate_rsi.assert_not_called()
+        assert snapshot.rsi == binance_client.get_indicators().rsi
+
+    def test_snapshot_is_immutable(self):
+        snapshot = make_snapshot()
+
+        with pytest.raises(FrozenInstanceError):
+            snapshot.rsi = 50.0
+
+
+class TestMultiMarketSnapshots:
+    """One market data fetch shared by several markets."""
+
+    @staticmethod
+    def market(market_id):
+        return MarketData(
+            market_id=market_id,
+            question=f"Will BTC go up ({market_id})?",
+            end_date=datetime(2030, 1, 1),
+            yes_price=Decimal("0.6"),
+            no_price=Decimal("0.4"),
+            metadata={"id": market_id}
+        )
+
+    def test_fans_out_shared_data(self, mock_config, polymarket_client):
+        binance_client = MagicMock()
+        binance_client.get_latest_prices.return_value = [100 + i * 0.2 for i in range(100)]
+        catalogue = MagicMock()
+        catalogue.best_market.return_value = self.market("m1")
+        catalogue.active_markets.return_value = [self.market(m) for m in ("m1", "m2", "m3", "m4")]
+        polymarket_client.get_market_odds.return_value = (Decimal("0.7"), Decimal("0.3"))
+
+        with patch('polymarket_bot.market_data.get_config', return_value=mock_config), \
+                patch('polymarket_bot.market_data.get_order_book_imbalance', return_value=1.2) as imbalance:
+            snapshots = get_market_snapshots(binance_client, polymarket_client, 3, catalogue=catalogue)
+
+        imbalance.assert_called_once()
+        binance_client.get_latest_prices.assert_called_once()
+        assert [s.market_id for s in snapshots] == ["m1", "m2", "m3"]
+        assert len({(s.rsi, s.macd_line, s.order_book_imbalance, s.prices) for s in snapshots}) == 1
+        assert snapshots[2].market.metadata["rsi_14"] == snapshots[0].rsi
+        assert snapshots[2].market.metadata["id"] == "m3"
+        polymarket_client.get_btc_markets.assert_not_called()
+        assert sorted(c.args[0] for c in polymarket_client.get_market_odds.call_args_list) == ["m1", "m2", "m3"]
+        assert {(s.market.yes_price, s.market.no_price) for s in snapshots} == {(Decimal("0.7"), Decimal("0.3"))}
+
+    def test_catalogued_market_without_odds_is_skipped(self, mock_config, polymarket_client):
+        binance_client = MagicMock()
+        binance_client.get_latest_prices.return_value = [100 + i * 0.2 for i in range(100)]
+        catalogue = MagicMock()
+        catalogue.best_market.return_value = self.market("m1")
+        catalogue.active_markets.return_value = [self.market(m) for m in ("m1", "m2", "m3")]
+
+        def odds(market_id):
+            if market_id == "m2":
+                raise ConnectionError("odds request failed")
+            return Decimal("0.55"), Decimal("0.45")
+        polymarket_client.get_market_odds.side_effect = odds
+
+        with patch('polymarket_bot.market_data.get_config', return_value=mock_config), \
+                patch('polymarket_bot.market_data.get_order_book_imbalance', return_value=1.2):
+            snapshots = get_market_snapshots(binance_client, polymarket_client, 3, catalogue=catalogue)
+
+        assert [s.market_id for s in snapshots] == ["m1", "m3"]
+        assert snapshots[1].market.yes_price == Decimal("0.55")
+
+    def test_single_market_mode(self, mock_config, polymarket_client):
+        binance_client = MagicMock()
+        binance_client.get_latest_prices.return_value = [100 + i * 0.2 for i in range(100)]
+
+        with patch('polymarket_bot.market_data.get_config', return_value=mock_config), \
+                patch('polymarket_bot.market_data.get_order_book_imbalance', return_value=1.2):
+            snapshots = get_market_snapshots(binance_client, polymarket_client, 1)
+
+        assert [s.market_id for s in snapshots] == ["market_123"]
+        polymarket_client.get_btc_markets.assert_called_once()
+
+    def test_for_market_leaves_source_untouched(self):
+        snapshot = make_snapshot()
+        snapshot.market.metadata = {"rsi_14": 25.0}
+
+        other = snapshot.for_market(self.market("m2"))
+
+        assert other.market_id == "m2" and other.rsi == snapshot.rsi
+        assert snapshot.market.market_id == "market_123"
+
+class TestConcurrentFetch:
+    """Per-source deadlines and partial results."""
+
+    def test_sources_run_in_parallel(self):
+        def slow(value):
+            def fetch():
+                time.sleep(0.2)
+                return value
+            return fetch
+
+        start = time.monotonic()
+        results = fetch_concurrently(
+            {"a": slow(1), "b": slow(2), "c": slow(3)},
+            {"a": 1.0, "b": 1.0, "c": 1.0}
+        )
+
+        assert time.monotonic() - start < 0.5
+        assert [results[name].value for name in "abc"] == [1, 2, 3]
+        assert all(result.ok for result in results.values())
+
+    def test_deadline_and_error_are_partial_results(self):
+        def boom():
+            raise ConnectionError("refused")
+
+        start = time.monotonic()
+        results = fetch_concurrently(
+            {"late": lambda: time.sleep(1.0), "broken": boom, "fast": lambda: "ok"},
+            {"late": 0.1, "broken": 1.0, "fast": 1.0}
+        )
+
+        assert time.monotonic() - start < 0.5
+        assert "deadline" in results["late"].error
+        assert results["broken"].error == "refused"
+        assert results["fast"].value == "ok"
+
+    def test_late_order_book_degrades_to_neutral(self, mock_config, polymarket_client):
+        binance_client = MagicMock()
+        binance_client.get_latest_prices.return_value = [100 + i * 0.2 for i in range(100)]
+
+        def slow_order_book():
+            time.sleep(1.0)
+            return 2.0
+
+        start = time.monotonic()
+        with patch('polymarket_bot.market_data.get_config', return_value=mock_config), \
+                patch('polymarket_bot.market_data.get_order_book_imbalance', side_effect=slow_order_book):
+            snapshot = get_market_snapshot(binance_client, polymarket_client)
+
+        assert time.monotonic() - start < 0.9
+        assert snapshot.order_book_imbalance == 1.0
+        assert snapshot.degraded_sources == ("order_book",)
+        assert snapshot.market.metadata["degraded_sources"] == ["order_book"]
+
+    def test_market_failure_raises(self, mock_config, polymarket_client):
+        binance_client = MagicMock()
+        binance_client.get_latest_prices.return_value = [100 + i * 0.2 for i in range(100)]
+        polymarket_client.get_btc_markets.return_value = []
+
+        with patch('polymarket_bot.market_data.get_config', return_value=mock_config), \
+                patch('polymarket_bot.market_data.get_order_book_imbalance', return_value=1.2):
+            with pytest.raises(ValueError, match="No active Polymarket markets"):
+                get_market_snapshot(binance_client, polymarket_client)
+
+    def test_specific_market_fetched_once(self, mock_config, polymarket_client):
+        binance_client = MagicMock()
+        binance_client.get_latest_prices.return_value = [100 + i * 0.2 for i in range(100)]
+
+        with patch('polymarket_bot.market_data.get_config', return_value=mock_config), \
+                patch('polymarket_bot.market_data.get_order_book_imbalance', return_value=1.2):
+            snapshot = get_market_snapshot(binance_client, polymarket_client, market_id="market_123")
+
+        polymarket_client.get_market_by_id.assert_called_once_with("market_123")
+        polymarket_client.get_btc_markets.assert_not_called()
+        assert snapshot.degraded_sources == ()
+
+    def test_synced_local_book_skips_rest(self, mock_config, polymarket_client):
+        binance_client = MagicMock()
+        binance_client.get_latest_prices.return_value = [100 + i * 0.2 for i in range(100)]
+        order_book = LocalOrderBook()
+        order_book.apply_snapshot({"lastUpdateId": 1, "bids": [["99", "4"]], "asks": [["101", "2"]]})
+
+        with patch('polymarket_bot.market_data.get_config', return_value=mock_config), \
+                patch('polymarket_bot.market_data.get_order_book_imbalance') as imbalance:
+            snapshot = get_market_snapshot(binance_client, polymarket_client, order_book=order_book)
+
+        imbalance.assert_not_called()
+        assert snapshot.order_book_imbalance == 2.0
+        assert snapshot.market.metadata["order_book_source"] == "stream"
+
+
+class TestSignalFromSnapshot:
+    """Prediction from a snapshot."""
+
+    def test_no_recomputation(self, mock_config):
+        engine = PredictionEngine(config=mock_config)
+
+        with patch('polymarket_bot.prediction.get_order_book_imbalance') as imbalance, \
+                patch('polymarket_bot.prediction.calculate_rsi') as calculate_rsi:
+            signal = engine.generate_signal_from_snapshot(make_snapshot())
+
+        imbalance.assert_not_called()
+        calculate_rsi.assert_not_called()
+        assert signal.signal == SignalType.UP
+        assert signal.btc_price == Decimal("45039.0")
+
+    def test_skip_signal(self, mock_config):
+        engine = PredictionEngine(config=mock_config)
+
+        signal = engine.generate_signal_from_snapshot(make_snapshot(rsi=50.0))
+
+        assert signal.signal == SignalType.SKIP
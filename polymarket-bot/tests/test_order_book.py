@@ -0,0 +1,139 @@
+"""
+Tests for the stream-maintained local order book.
+
+Tests cover:
+- Offline replay of a recorded snapshot + diff-depth fixture
+- Buffering before the snapshot and dropping events it already covers
+- Sequence gap detection
+- Book metrics (imbalance, spread, microprice, depth)
+- Imbalance read from memory instead of the REST depth endpoint
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from polymarket_bot.config import Config
+from polymarket_bot.market_data import get_order_book_imbalance
+from polymarket_bot.order_book import (
+    BinanceOrderBookStream,
+    LocalOrderBook,
+    OrderBookGapError,
+    OrderBookSyncError,
+    replay_depth_stream,
+)
+
+FIXTURE = Path(__file__).parent / "fixtures" / "btcusdt_depth.jsonl"
+
+
+@pytest.fixture
+def fixture_messages():
+    return FIXTURE.read_text().splitlines()
+
+
+@pytest.fixture
+def book(fixture_messages):
+    book = LocalOrderBook()
+    replay_depth_stream(book, fixture_messages)
+    return book
+
+
+def diff(first_id, final_id, bids=(), asks=()):
+    return {"e": "depthUpdate", "U": first_id, "u": final_id, "b": list(bids), "a": list(asks)}
+
+
+class TestFixtureReplay:
+    """Replaying the recorded stream reconstructs the expected book."""
+
+    def test_final_levels(self, book):
+        bids, asks = book.top_levels(10)
+
+        assert book.synced
+        assert book.last_update_id == 110
+        # 44999.00 came in an event older than the snapshot and must be dropped
+        assert bids == [(45000.5, 0.7), (45000.0, 1.5), (44999.5, 2.0), (44997.0, 5.0)]
+        assert asks == [(45002.0, 1.5), (45003.0, 0.6), (45004.0, 4.0)]
+
+    def test_replay_counts_live_events(self, fixture_messages):
+        assert replay_depth_stream(LocalOrderBook(), fixture_messages) == 2
+
+    def test_metrics(self, book):
+        assert book.spread() == pytest.approx(1.5)
+        assert book.mid_price() == pytest.approx(45001.25)
+        assert book.imbalance(10) == pytest.approx(9.2 / 6.1)
+        assert book.imbalance(1) == pytest.approx(0.7 / 1.5)
+        assert book.weighted_mid_price() == pytest.approx((45000.5 * 1.5 + 45002.0 * 0.7) / 2.2)
+        assert book.weighted_imbalance(10, decay=1.0) == pytest.approx(book.imbalance(10))
+        assert book.depth_within(0.3) == pytest.approx((2.2, 1.5))
+
+
+class TestSequencing:
+    """Snapshot alignment and gap detection."""
+
+    def test_events_buffered_until_snapshot(self):
+        book = LocalOrderBook()
+
+        assert book.apply_diff(diff(5, 6, bids=[["100", "1"]])) is False
+        assert not book.synced
+        with pytest.raises(OrderBookSyncError):
+            book.imbalance()
+
+    def test_gap_unsyncs_book(self, book):
+        with pytest.raises(OrderBookGapError):
+            book.apply_diff(diff(112, 113, bids=[["45000.5", "9"]]))
+
+        assert not book.synced
+        with pytest.raises(OrderBookSyncError):
+            book.spread()
+
+    def test_snapshot_older_than_buffer_is_a_gap(self):
+        book = LocalOrderBook()
+        book.apply_diff(diff(200, 205, bids=[["100", "1"]]))
+
+        with pytest.raises(OrderBookGapError):
+            book.apply_snapshot({"lastUpdateId": 150, "bids": [["99", "1"]], "asks": [["101", "1"]]})
+        assert not book.synced
+
+    def test_stale_event_ignored(self, book):
+        assert book.apply_diff(diff(100, 110, bids=[["45000.5", "99"]])) is False
+        assert book.best_bid() == (45000.5, 0.7)
+
+    def test_stream_resyncs_on_gap(self, book):
+        config = Mock(spec=Config)
+        stream = BinanceOrderBookStream(config)
+        stream.book = book
+
+        with patch.object(stream, "_start_resync") as resync:
+            stream._on_message(None, json.dumps(diff(111, 111, asks=[["45002.0", "2"]])))
+            resync.assert_not_called()
+            stream._on_message(None, json.dumps(diff(120, 121)))
+            resync.assert_called_once()
+
+        assert book.last_update_id is None
+
+
+class TestImbalanceSource:
+    """get_order_book_imbalance prefers the synchronized local book."""
+
+    def test_reads_local_book(self, book):
+        with patch("polymarket_bot.market_data.get_transport") as rest:
+            imbalance = get_order_book_imbalance(book)
+
+        rest.assert_not_called()
+        assert imbalance == pytest.approx(9.2 / 6.1)
+
+    def test_falls_back_to_rest_when_unsynced(self):
+        config = Mock(spec=Config)
+        config.binance_base_url = "https://api.binance.com"
+        response = Mock()
+        response.json.return_value = {"bids": [["1", "3"]], "asks": [["2", "1"]]}
+
+        with patch("polymarket_bot.market_data.get_config", return_value=config), \
+                patch("polymarket_bot.market_data.get_transport") as rest:
+            rest.return_value.request_sync.return_value = response
+            imbalance = get_order_book_imbalance(LocalOrderBook())
+
+        rest.return_value.request_sync.assert_called_once()
+        assert imbalance == 3.0
@@ -0,0 +1,149 @@
+"""
+Tests for the price history ring buffer.
+
+Tests cover:
+- Appending, eviction and OHLCV defaults
+- Zero-copy, read-only windows that stay valid while the stream writes
+- The kline and ticker clients storing their history in the buffer
+"""
+
+import json
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from polymarket_bot.config import Config
+from polymarket_bot.market_data import BinanceWebSocket, BinanceWebSocketClient
+from polymarket_bot.price_history import COLUMNS, PriceHistory
+
+
+@pytest.fixture
+def mock_config():
+    config = Mock(spec=Config)
+    config.rsi_period = 14
+    config.macd_fast_period = 12
+    config.macd_slow_period = 26
+    config.macd_signal_period = 9
+    return config
+
+
+class TestRingBuffer:
+    """Appends and windows."""
+
+    def test_evicts_oldest(self):
+        history = PriceHistory(3)
+
+        for price in range(1, 6):
+            history.append(float(price), timestamp=price * 1000)
+
+        assert len(history) == 3
+        assert history.total == 5
+        assert history.closes().tolist() == [3.0, 4.0, 5.0]
+        assert history.closes(2).tolist() == [4.0, 5.0]
+        assert history.column('timestamp').tolist() == [3000.0, 4000.0, 5000.0]
+        assert history.last() == 5.0
+
+    def test_ohlc_default_to_close(self):
+        history = PriceHistory(2)
+
+        history.append(10.0, high=12.0, volume=3.5)
+
+        row = dict(zip(COLUMNS, history.window()[:, 0].tolist()))
+        assert row['open'] == row['low'] == row['close'] == 10.0
+        assert row['high'] == 12.0
+        assert row['volume'] == 3.5
+        assert np.isnan(row['timestamp'])
+
+    def test_empty(self):
+        history = PriceHistory(4)
+
+        assert len(history) == 0
+        assert history.closes().size == 0
+        assert history.last() is None
+        assert history.window(10).shape == (len(COLUMNS), 0)
+
+    def test_windows_are_read_only_views(self):
+        history = PriceHistory(5)
+        for price in range(12):
+            history.append(float(price))
+
+        window = history.closes(4)
+
+        assert np.shares_memory(window, history._data)
+        assert window.flags['C_CONTIGUOUS']
+        with pytest.raises(ValueError):
+            window[0] = 0.0
+
+    def test_window_stable_for_remaining_capacity(self):
+        history = PriceHistory(6)
+        for price in range(8):
+            history.append(float(price))
+
+        window = history.closes(2)
+        for price in range(8, 12):
+            history.append(float(price))
+
+        assert window.tolist() == [6.0, 7.0]
+
+    def test_replace_last_overwrites_newest_row(self):
+        history = PriceHistory(3)
+        history.replace_last(1.0, timestamp=0)
+        for price in (2.0, 3.0, 4.0):
+            history.append(price, timestamp=price)
+
+        history.replace_last(4.5, timestamp=4.0, high=5.0)
+
+        assert history.total == 4
+        assert history.closes().tolist() == [2.0, 3.0, 4.5]
+        assert history.last('high') == 5.0
+
+    def test_clear_and_invalid_arguments(self):
+        history = PriceHistory(2)
+        history.append(1.0)
+        history.clear()
+
+        assert len(history) == 0
+        with pytest.raises(ValueError):
+            PriceHistory(0)
+        with pytest.raises(ValueError, match="Unknown column"):
+            history.column('vwap')
+
+
+class TestClientIntegration:
+    """Kline and ticker clients."""
+
+    def test_kline_client_stores_ohlcv(self, mock_config):
+        with patch('polymarket_bot.market_data.get_config', return_value=mock_config):
+            client = BinanceWebSocketClient(buffer_size=3)
+
+        for minute in range(4):
+            client._on_message(None, json.dumps({'k': {
+                't': minute * 60_000, 'o': '100', 'h': '110', 'l': '90',
+                'c': str(100 + minute), 'v': '2.5', 'x': True
+            }}))
+
+        assert client.get_latest_prices() == [101.0, 102.0, 103.0]
+        assert client.get_latest_price() == 103.0
+        assert client.get_price_window(2).tolist() == [102.0, 103.0]
+        ohlcv = client.get_ohlcv_window()
+        assert ohlcv[COLUMNS.index('high')].tolist() == [110.0] * 3
+        assert ohlcv[COLUMNS.index('timestamp')].tolist() == [60_000.0, 120_000.0, 180_000.0]
+
+    def test_ticker_history(self):
+        client = BinanceWebSocket(history_size=2)
+
+        for second, price in enumerate(['50000.5', '50001.25', '49999.75']):
+            client._on_message(None, json.dumps({
+                'e': '24hrTicker', 's': 'BTCUSDT', 'c': price, 'q': '1000000',
+                'E': 1_700_000_000_000 + second * 1000
+            }))
+
+        assert client.get_price_series() == [Decimal('50001.25'), Decimal('49999.75')]
+        assert client.get_price_array(1).tolist() == [49999.75]
+        history = client.get_price_history()
+        assert [p.price for p in history] == [Decimal('50001.25'), Decimal('49999.75')]
+        assert history[-1].timestamp.timestamp() == 1_700_000_002
+        assert history[-1].volume_24h == Decimal('1000000')
+        assert client.get_latest_price().price == Decimal('49999.75')
@@ -0,0 +1,224 @@
+"""
+Tests for tick recording and replay.
+
+Tests cover:
+- Round-tripping kline and ticker messages through the binary format
+- Growing, reopening and rotating memory-mapped day files
+- Range selection by receive time
+- Replaying recordings through the live clients' message callbacks
+- Warm-start and backtest inputs from recordings
+"""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from polymarket_bot.config import Config
+from polymarket_bot.market_data import BinanceWebSocket, BinanceWebSocketClient
+from polymarket_bot.recorder import (
+    HEADER_SIZE,
+    KIND_KLINE,
+    KIND_TICKER,
+    TickFileError,
+    TickReader,
+    TickRecorder,
+    TickReplayer,
+)
+
+MINUTE = 60_000
+DAY_START = int(datetime(2026, 3, 1, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+@pytest.fixture
+def mock_config():
+    config = Mock(spec=Config)
+    config.binance_base_url = "https://api.binance.com"
+    config.rsi_period = 14
+    config.macd_fast_period = 12
+    config.macd_slow_period = 26
+    config.macd_signal_period = 9
+    return config
+
+
+def make_client(config):
+    with patch('polymarket_bot.market_data.get_config', return_value=config):
+        return BinanceWebSocketClient(buffer_size=100)
+
+
+def kline(open_time, close, closed=True, volume=10.0, taker_buy=6.0):
+    return {
+        'e': 'kline', 'E': open_time + 59_000, 's': 'BTCUSDT',
+        'k': {
+            't': open_time, 'T': open_time + MINUTE - 1, 's': 'BTCUSDT', 'i': '1m',
+            'o': '45000.00', 'h': '45100.00', 'l': '44900.00', 'c': f'{close:.2f}',
+            'v': str(volume), 'q': '450000.0', 'V': str(taker_buy), 'x': closed
+        }
+    }
+
+
+def ticker(event_time, price):
+    return {
+        'e': '24hrTicker', 'E': event_time, 's': 'BTCUSDT', 'p': '150.00', 'P': '0.334',
+        'o': '44900.00', 'h': '45200.00', 'l': '44800.00', 'c': f'{price:.2f}',
+        'v': '1200.5', 'q': '54000000.0', 'O': event_time - 86_400_000, 'C': event_time
+    }
+
+
+def record_minutes(recorder, start, count, closes=None):
+    closes = closes if closes is not None else [45000.0 + i for i in range(count)]
+    for i, close in enumerate(closes):
+        open_time = start + i * MINUTE
+        recorder.record(kline(open_time, close - 0.5, closed=False), received_at=open_time + 30_000)
+        recorder.record(kline(open_time, close), received_at=open_time + MINUTE)
+
+
+class TestRecording:
+    """Writing and reading the binary format."""
+
+    def test_round_trip(self, tmp_path):
+        with TickRecorder(tmp_path) as recorder:
+            assert recorder.record(kline(DAY_START, 45010.25), received_at=DAY_START + MINUTE)
+            assert recorder.record(ticker(DAY_START + 61_000, 45011.5), received_at=DAY_START + 61_000)
+            assert not recorder.record({'e': 'depthUpdate'}, received_at=DAY_START + 62_000)
+
+        records = TickReader(tmp_path).records()
+
+        assert list(records['kind']) == [KIND_KLINE, KIND_TICKER]
+        assert records[0]['close'] == 45010.25 and records[0]['closed'] == 1
+        assert records[0]['taker_buy_volume'] == 6.0
+        assert records[1]['price_change_percent'] == 0.334
+
+    def test_grows_and_reopens(self, tmp_path):
+        with TickRecorder(tmp_path, initial_capacity=4) as recorder:
+            record_minutes(recorder, DAY_START, 5)
+        with TickRecorder(tmp_path, initial_capacity=4) as recorder:
+            record_minutes(recorder, DAY_START + 5 * MINUTE, 5)
+
+        records = TickReader(tmp_path).records()
+
+        assert len(records) == 20
+        assert np.all(np.diff(records['recv_time']) >= 0)
+
+    def test_uncommitted_records_ignored(self, tmp_path):
+        with TickRecorder(tmp_path) as recorder:
+            record_minutes(recorder, DAY_START, 3)
+        path = next(tmp_path.glob("*.ticks"))
+        data = bytearray(path.read_bytes())
+        data[16:24] = (4).to_bytes(8, 'little')
+        path.write_bytes(bytes(data))
+
+        assert len(TickReader(tmp_path).records()) == 4
+
+    def test_rejects_foreign_file(self, tmp_path):
+        (tmp_path / "20260301.ticks").write_bytes(b'\0' * (HEADER_SIZE + 10))
+
+        with pytest.raises(TickFileError):
+            TickReader(tmp_path).records()
+
+    def test_receive_time_kept_sorted(self, tmp_path):
+        with TickRecorder(tmp_path) as recorder:
+            recorder.record(ticker(DAY_START, 1.0), received_at=DAY_START + 5000)
+            recorder.record(ticker(DAY_START, 2.0), received_at=DAY_START + 1000)
+
+        assert list(TickReader(tmp_path).records()['recv_time']) == [DAY_START + 5000] * 2
+
+
+class TestReading:
+    """Day rotation and range selection."""
+
+    def test_rotates_by_utc_day(self, tmp_path):
+        with TickRecorder(tmp_path) as recorder:
+            record_minutes(recorder, DAY_START - 3 * MINUTE, 6)
+
+        reader = TickReader(tmp_path)
+
+        assert reader.days() == ['20260228', '20260301']
+        assert len(reader.records()) == 12
+
+    def test_range_within_a_day_is_memory_mapped(self, tmp_path):
+        with TickRecorder(tmp_path) as recorder:
+            record_minutes(recorder, DAY_START, 10)
+
+        records = TickReader(tmp_path).records(start=DAY_START + 2 * MINUTE, end=DAY_START + 4 * MINUTE)
+
+        assert isinstance(records, np.memmap)
+        assert list(records['recv_time']) == [
+            DAY_START + 2 * MINUTE, DAY_START + 2 * MINUTE + 30_000,
+            DAY_START + 3 * MINUTE, DAY_START + 3 * MINUTE + 30_000,
+        ]
+
+    def test_klines_for_warm_start(self, tmp_path, mock_config):
+        closes = list(45000.0 + np.cumsum(np.random.default_rng(4).normal(0, 20, 40)))
+        with TickRecorder(tmp_path) as recorder:
+            record_minutes(recorder, DAY_START, 40, closes)
+            # A repeated closed kline (e.g. after a reconnect) is kept once
+            recorder.record(kline(DAY_START, closes[0]), received_at=DAY_START + 41 * MINUTE)
+
+        klines = TickReader(tmp_path).klines()
+        client = make_client(mock_config)
+
+        assert [k['open_time'] for k in klines] == [DAY_START + i * MINUTE for i in range(40)]
+        assert client.warm_start(klines) == 40
+        assert client.get_latest_prices(40) == pytest.approx([round(c, 2) for c in closes])
+
+    def test_backtest_data(self, tmp_path):
+        with TickRecorder(tmp_path) as recorder:
+            recorder.record(kline(DAY_START, 45000.0, volume=10.0, taker_buy=6.0), received_at=DAY_START + MINUTE)
+            recorder.record(kline(DAY_START + MINUTE, 45001.0, volume=8.0, taker_buy=2.0),
+                            received_at=DAY_START + 2 * MINUTE)
+
+        data = TickReader(tmp_path).backtest_data()
+
+        assert list(data.close) == [45000.0, 45001.0]
+        assert list(data.order_book_imbalance) == [1.5, 2 / 6]
+
+
+class TestReplay:
+    """Driving the live clients from a recording."""
+
+    def test_replay_reproduces_client_state(self, tmp_path, mock_config):
+        live = make_client(mock_config)
+        live.recorder = TickRecorder(tmp_path)
+        for i in range(30):
+            open_time = DAY_START + i * MINUTE
+            live._on_message(None, json.dumps(kline(open_time, 45000.0 + i * 3, closed=False)))
+            live._on_message(None, json.dumps(kline(open_time, 45001.0 + i * 3)))
+        live.recorder.close()
+
+        replayed = make_client(mock_config)
+        count = TickReplayer(TickReader(tmp_path)).replay(on_kline=replayed._on_message)
+
+        assert count == 60
+        assert replayed.get_latest_prices() == live.get_latest_prices()
+        assert replayed.last_closed_open_time == live.last_closed_open_time
+        assert replayed.indicators.snapshot() == live.indicators.snapshot()
+
+    def test_ticker_replay(self, tmp_path):
+        with TickRecorder(tmp_path) as recorder:
+            recorder.record(ticker(DAY_START, 45000.5), received_at=DAY_START)
+            recorder.record(ticker(DAY_START + 1000, 45002.0), received_at=DAY_START + 1000)
+        updates = []
+        client = BinanceWebSocket(on_price_update=updates.append)
+
+        TickReplayer(TickReader(tmp_path)).replay(on_ticker=client._on_message)
+
+        assert [float(u.price) for u in updates] == [45000.5, 45002.0]
+
+    def test_paced_replay(self, tmp_path):
+        with TickRecorder(tmp_path) as recorder:
+            record_minutes(recorder, DAY_START, 3)
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        replayer = TickReplayer(TickReader(tmp_path), speed=60.0, sleep=sleep, clock=lambda: now[0])
+        replayer.replay(on_kline=lambda ws, message: None)
+
+        assert sum(sleeps) == pytest.approx((2 * MINUTE + 30_000) / 1000 / 60)
+        assert all(s == pytest.approx(0.5) for s in sleeps)
@@ -0,0 +1,100 @@
+"""
+Tests for the lightweight tick records.
+
+Tests cover:
+- Parsing and validating Binance ticker messages at the boundary
+- Conversion to and from BTCPriceData
+- The ticker client keeping records instead of pydantic models
+"""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from polymarket_bot.market_data import BinanceWebSocket
+from polymarket_bot.models import BTCPriceData
+from polymarket_bot.records import PriceTick
+from polymarket_bot.utils import ValidationError
+
+TICKER = {
+    'e': '24hrTicker', 'E': 1_700_000_000_000, 's': 'BTCUSDT', 'c': '45678.90',
+    'q': '123456789.50', 'h': '46000.00', 'l': '45000.00', 'p': '-678.90', 'P': '-1.51'
+}
+
+
+class TestPriceTick:
+    """Boundary validation and model conversion."""
+
+    def test_from_binance_ticker(self):
+        tick = PriceTick.from_binance_ticker(TICKER)
+
+        assert tick.symbol == 'BTCUSDT'
+        assert tick.price == 45678.90
+        assert tick.timestamp_ms == 1_700_000_000_000
+        assert (tick.high_24h, tick.low_24h) == (46000.0, 45000.0)
+        assert tick.price_change_24h == -678.90
+        assert tick.raw is TICKER
+
+    def test_rest_field_names_and_missing_event_time(self):
+        tick = PriceTick.from_binance_ticker({'symbol': 'BTCUSDT', 'lastPrice': '50000', 'quoteVolume': '10'})
+
+        assert (tick.price, tick.volume_24h) == (50000.0, 10.0)
+        assert abs(tick.timestamp.timestamp() - datetime.now(timezone.utc).timestamp()) < 5
+
+    @pytest.mark.parametrize('overrides', [
+        {'c': '0'}, {'c': 'abc'}, {'c': 'nan'}, {'q': '-1'}, {'h': '-5'}, {'s': ''}, {'E': 'later'},
+    ])
+    def test_rejects_invalid_messages(self, overrides):
+        with pytest.raises(ValidationError):
+            PriceTick.from_binance_ticker({**TICKER, **overrides})
+
+    def test_to_model(self):
+        model = PriceTick.from_binance_ticker(TICKER).to_model()
+
+        assert isinstance(model, BTCPriceData)
+        assert model.price == Decimal('45678.9')
+        assert model.price_change_percent_24h == Decimal('-1.51')
+        assert model.timestamp == datetime.fromtimestamp(1_700_000_000, tz=timezone.utc)
+        assert model.metadata == TICKER
+        # The constructed model validates as the same values
+        assert BTCPriceData.model_validate(model.model_dump()) == model
+
+    def test_round_trip_from_model(self):
+        tick = PriceTick.from_binance_ticker(TICKER)
+
+        assert PriceTick.from_model(tick.to_model()) == tick
+
+    def test_uses_slots(self):
+        tick = PriceTick.from_binance_ticker(TICKER)
+
+        assert not hasattr(tick, '__dict__')
+        with pytest.raises(AttributeError):
+            tick.extra = 1
+
+
+class TestTickerClient:
+    """BinanceWebSocket on the record path."""
+
+    def test_callbacks_and_latest_price(self):
+        on_tick, on_price_update = Mock(), Mock()
+        client = BinanceWebSocket(on_price_update=on_price_update, on_tick=on_tick)
+
+        client._on_message(None, json.dumps(TICKER))
+
+        tick = on_tick.call_args[0][0]
+        assert isinstance(tick, PriceTick)
+        assert client.latest_tick is tick
+        assert on_price_update.call_args[0][0].price == Decimal('45678.9')
+        assert client.get_latest_price().high_24h == Decimal('46000.0')
+
+    def test_invalid_message_is_dropped(self):
+        client = BinanceWebSocket()
+
+        client._on_message(None, json.dumps({**TICKER, 'c': '-1'}))
+
+        assert client.latest_tick is None
+        assert client.get_latest_price() is None
+        assert client.get_price_series() == []
@@ -9,11 +9,14 @@ Tests cover:
 - Integration with BotState
 """
 
+import threading
+
 import pytest
 from decimal import Decimal
 from datetime import datetime
 
 from polymarket_bot.risk import (
+    RiskManager,
     check_drawdown,
     check_volatility,
     approve_trade,
@@ -631,5 +634,133 @@ class TestRiskThresholds:
         assert MAX_VOLATILITY_PERCENT == Decimal("3.0")
 
 
+
+class TestPortfolioExposureGate:
+    """Test suite for the shared exposure gate used by concurrent markets."""
+
+    @pytest.fixture
+    def risk_manager(self):
+        return RiskManager(
+            starting_capital=Decimal("100.0"),
+            max_total_exposure=Decimal("20.0"),
+            max_market_exposure=Decimal("10.0")
+        )
+
+    def test_reserve_and_release(self, risk_manager):
+        """Approved reservations count toward open exposure until released."""
+        result = risk_manager.reserve_exposure("m1", Decimal("5.0"), Decimal("100.0"))
+
+        assert result.approved
+        assert risk_manager.open_exposure == Decimal("5.0")
+
+        risk_manager.release_exposure("m1", Decimal("5.0"))
+
+        assert risk_manager.open_exposure == Decimal("0")
+        assert risk_manager.exposure_by_market() == {}
+
+    def test_per_market_cap(self, risk_manager):
+        """A market cannot exceed its own cap even with total headroom."""
+        assert risk_manager.reserve_exposure("m1", Decimal("10.0"), Decimal("100.0"))
+
+        result = risk_manager.reserve_exposure("m1", Decimal("5.0"), Decimal("100.0"))
+
+        assert not result.approved
+        assert "per-market" in result.rejection_reasons[0]
+        assert risk_manager.reserve_exposure("m2", Decimal("5.0"), Decimal("100.0"))
+
+    def test_total_cap(self, risk_manager):
+        """Reservations across markets respect the total cap."""
+        for market_id in ("m1", "m2"):
+            assert risk_manager.reserve_exposure(market_id, Decimal("10.0"), Decimal("100.0"))
+
+        result = risk_manager.reserve_exposure("m3", Decimal("5.0"), Decimal("100.0"))
+
+        assert not result.approved
+        assert "Total exposure" in result.rejection_reasons[0]
+        assert risk_manager.exposure_by_market() == {"m1": Decimal("10.0"), "m2": Decimal("10.0")}
+
+    def test_drawdown_blocks_reservation(self, risk_manager):
+        """No exposure is reserved past the drawdown limit."""
+        result = risk_manager.reserve_exposure("m1", Decimal("5.0"), Decimal("60.0"))
+
+        assert not result.approved
+        assert result.details["drawdown_ok"] is False
+        assert risk_manager.open_exposure == Decimal("0")
+
+    def test_concurrent_reservations_are_atomic(self, risk_manager):
+        """Many markets racing for headroom never overshoot the total cap."""
+        barrier = threading.Barrier(16)
+        approvals = []
+
+        def reserve(i):
+            barrier.wait()
+            approvals.append(risk_manager.reserve_exposure(f"m{i}", Decimal("5.0"), Decimal("100.0")).approved)
+
+        threads = [threading.Thread(target=reserve, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert approvals.count(True) == 4
+        assert risk_manager.open_exposure == Decimal("20.0")
+
+    def test_exposure_lock_holds_off_reservations(self, risk_manager):
+        """Exposure read under the lock stays current until the lock is released."""
+        reserved = threading.Event()
+
+        def reserve():
+            risk_manager.reserve_exposure("m2", Decimal("5.0"), Decimal("100.0"))
+            reserved.set()
+
+        with risk_manager.exposure_lock():
+            assert risk_manager.reserve_exposure("m1", Decimal("5.0"), Decimal("100.0"))
+            thread = threading.Thread(target=reserve)
+            thread.start()
+            assert not reserved.wait(0.1)
+            assert risk_manager.exposure_by_market() == {"m1": Decimal("5.0")}
+        thread.join()
+
+        assert risk_manager.exposure_by_market() == {"m1": Decimal("5.0"), "m2": Decimal("5.0")}
+
+
+class TestStreamingRiskState:
+    """Test suite for the risk manager's streamed market and equity state."""
+
+    def test_streamed_volatility_check(self):
+        """Without a price list the check reads the rolling 5-minute range."""
+        risk_manager = RiskManager()
+        for minute, price in enumerate([100.0, 100.5, 101.0, 102.0, 101.5]):
+            risk_manager.update_market(price, 60.0 * (minute + 1))
+
+        ok, volatility = risk_manager.check_volatility()
+
+        assert ok is True
+        assert volatility == Decimal("2.0")
+
+        risk_manager.update_market(104.0, 360.0)
+        ok, volatility = risk_manager.check_volatility()
+
+        assert ok is False
+        assert float(volatility) == pytest.approx(3.5 / 100.5 * 100)
+
+    def test_streamed_volatility_fails_safe_without_data(self):
+        """No streamed prices rejects like an invalid price list."""
+        assert RiskManager().check_volatility() == (False, Decimal("999.0"))
+
+    def test_record_capital_tracks_peak_to_trough(self):
+        """Recorded capital moves the peak and keeps the worst drawdown."""
+        risk_manager = RiskManager(starting_capital=Decimal("100.0"))
+
+        for capital in ("120.0", "90.0", "110.0"):
+            drawdown = risk_manager.record_capital(Decimal(capital))
+
+        assert risk_manager.peak_capital == Decimal("120.0")
+        assert float(drawdown) == pytest.approx(10 / 120 * 100)
+        assert risk_manager.max_drawdown_seen == Decimal("25.0")
+
+        risk_manager.reset()
+        assert risk_manager.max_drawdown_seen == Decimal("0.0")
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,144 @@
+"""
+Tests for the streaming risk state.
+
+Tests cover:
+- Rolling min/max and standard deviation matching a brute-force window
+- Wilder ATR seeding and smoothing
+- Peak-to-trough drawdown tracking
+- RollingRiskState updates and out-of-order klines
+"""
+
+import numpy as np
+import pytest
+
+from polymarket_bot.rolling_risk import (
+    DrawdownTracker,
+    RollingExtrema,
+    RollingRiskState,
+    RollingStats,
+    StreamingATR,
+)
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(11)
+    timestamps = np.cumsum(rng.integers(1, 30, 400)).astype(float)
+    values = 45000.0 + np.cumsum(rng.normal(0, 25, 400))
+    return timestamps.tolist(), values.tolist()
+
+
+def brute_window(timestamps, values, index, window):
+    now = timestamps[index]
+    return [v for t, v in zip(timestamps[:index + 1], values[:index + 1]) if t > now - window]
+
+
+class TestRollingWindows:
+    """Monotonic-deque extrema and running-sum statistics."""
+
+    def test_extrema_match_brute_force(self, series):
+        timestamps, values = series
+        extrema = RollingExtrema(window=120)
+
+        for i, (timestamp, value) in enumerate(zip(timestamps, values)):
+            extrema.update(timestamp, value)
+            expected = brute_window(timestamps, values, i, 120)
+            assert extrema.max == max(expected)
+            assert extrema.min == min(expected)
+
+    def test_stats_match_brute_force(self, series):
+        timestamps, values = series
+        stats = RollingStats(window=120)
+
+        for i, (timestamp, value) in enumerate(zip(timestamps, values)):
+            stats.update(timestamp, value)
+            expected = brute_window(timestamps, values, i, 120)
+            assert len(stats) == len(expected)
+            assert stats.mean == pytest.approx(np.mean(expected), rel=1e-12)
+            if len(expected) >= 2:
+                assert stats.std == pytest.approx(np.std(expected, ddof=1), rel=1e-6)
+            else:
+                assert stats.std is None
+
+    def test_empty_and_invalid(self):
+        assert RollingExtrema(10).max is None
+        assert RollingStats(10).mean is None
+        with pytest.raises(ValueError):
+            RollingExtrema(0)
+        with pytest.raises(ValueError):
+            RollingStats(-1)
+
+
+class TestStreamingATR:
+    """Wilder ATR."""
+
+    def test_matches_reference(self):
+        rng = np.random.default_rng(5)
+        close = 100 + np.cumsum(rng.normal(0, 1, 60))
+        high = close + rng.uniform(0, 1, 60)
+        low = close - rng.uniform(0, 1, 60)
+        atr = StreamingATR(period=14)
+
+        values = [atr.update(h, l, c) for h, l, c in zip(high, low, close)]
+
+        true_range = np.maximum.reduce([
+            high[1:] - low[1:], np.abs(high[1:] - close[:-1]), np.abs(low[1:] - close[:-1])
+        ])
+        true_range = np.concatenate([[high[0] - low[0]], true_range])
+        expected = true_range[:14].mean()
+        for tr in true_range[14:]:
+            expected += (tr - expected) / 14
+        assert values[12] is None
+        assert values[-1] == pytest.approx(expected)
+
+
+class TestDrawdownTracker:
+    """Running peak and worst drawdown."""
+
+    def test_peak_to_trough(self):
+        tracker = DrawdownTracker(100.0)
+
+        for equity in [110.0, 88.0, 95.0, 120.0, 108.0]:
+            tracker.update(equity)
+
+        assert tracker.peak == 120.0
+        assert tracker.drawdown == pytest.approx(0.1)
+        assert tracker.max_drawdown == pytest.approx(0.2)
+
+        tracker.reset(50.0)
+        assert (tracker.peak, tracker.max_drawdown) == (50.0, 0.0)
+
+
+class TestRollingRiskState:
+    """Kline-fed market statistics."""
+
+    def test_range_over_window(self):
+        state = RollingRiskState(window_seconds=300, atr_period=2)
+
+        for minute, price in enumerate([100.0, 104.0, 101.0, 102.0, 103.0, 102.5, 101.5]):
+            state.update(price, 60.0 * (minute + 1))
+
+        snapshot = state.snapshot()
+        # The 104.0 close has left the 5-minute window
+        assert (snapshot.low, snapshot.high) == (101.0, 103.0)
+        assert snapshot.range_percent == pytest.approx(2 / 101 * 100)
+        assert snapshot.return_volatility_percent is not None
+        assert snapshot.atr_percent == pytest.approx(snapshot.atr / 101.5 * 100)
+
+    def test_ignores_older_klines(self):
+        state = RollingRiskState()
+
+        assert state.update(100.0, 120.0)
+        assert not state.update(150.0, 60.0)
+        assert state.range_percent() == 0.0
+        assert RollingRiskState().range_percent() is None
+
+    def test_clear_accepts_earlier_klines(self):
+        state = RollingRiskState(atr_period=1)
+        state.update(100.0, 120.0, high=101.0, low=99.0)
+
+        state.clear()
+
+        assert state.snapshot().last_price is None
+        assert state.update(150.0, 60.0)
+        assert state.snapshot().atr == 0.0
@@ -0,0 +1,268 @@
+"""
+Tests for the event-driven scheduler.
+
+Tests cover:
+- Publish/subscribe dispatch and handler isolation
+- Deadline expiry of queued events
+- Timers and timer cancellation
+- Cycle triggering from kline closes and the fallback timer
+- Market window timers from catalogued expiries
+- Kline close notifications from the Binance client
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+
+from polymarket_bot.config import Config
+from polymarket_bot.market_data import BinanceWebSocketClient
+from polymarket_bot.models import MarketData
+from polymarket_bot.scheduler import (
+    KLINE_CLOSE,
+    MARKET_WINDOW,
+    SETTLEMENT,
+    TIMER,
+    CycleTrigger,
+    EventScheduler,
+    MarketWindowTimers,
+)
+
+
+@pytest.fixture
+def scheduler():
+    return EventScheduler(poll_interval=0.05)
+
+
+class TestDispatch:
+    """Event delivery."""
+
+    def test_handlers_receive_events_in_order(self, scheduler):
+        received = []
+        scheduler.subscribe(KLINE_CLOSE, lambda event: received.append(event.payload["close"]))
+
+        for close in (1.0, 2.0, 3.0):
+            scheduler.publish(KLINE_CLOSE, {"close": close})
+        while scheduler.run_once(timeout=0):
+            pass
+
+        assert received == [1.0, 2.0, 3.0]
+        assert scheduler.dispatched == 3
+
+    def test_failing_handler_does_not_stop_loop(self, scheduler):
+        received = []
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        scheduler.subscribe(SETTLEMENT, broken)
+        scheduler.subscribe(SETTLEMENT, received.append)
+        scheduler.publish(SETTLEMENT)
+
+        assert scheduler.run_once(timeout=0)
+        assert len(received) == 1
+
+    def test_cross_thread_publish_wakes_loop(self, scheduler):
+        latencies = []
+        scheduler.subscribe(KLINE_CLOSE, lambda event: latencies.append(time.monotonic() - event.created_at))
+        scheduler.subscribe(KLINE_CLOSE, lambda event: scheduler.stop())
+
+        threading.Timer(0.1, scheduler.publish, args=(KLINE_CLOSE,)).start()
+        scheduler.run()
+
+        assert latencies[0] < 0.05
+
+
+class TestDeadlines:
+    """Stale events are cancelled."""
+
+    def test_expired_event_is_dropped(self, scheduler):
+        handler = Mock()
+        scheduler.subscribe(KLINE_CLOSE, handler)
+
+        event = scheduler.publish(KLINE_CLOSE, ttl=0.01)
+        time.sleep(0.02)
+        scheduler.run_once(timeout=0)
+
+        assert event.expired
+        handler.assert_not_called()
+        assert scheduler.expired == 1
+
+    def test_remaining_time(self, scheduler):
+        event = scheduler.publish(KLINE_CLOSE, ttl=5)
+
+        assert 4 < event.remaining() <= 5
+        assert not event.expired
+        assert scheduler.publish(KLINE_CLOSE).remaining() is None
+
+
+class TestTimers:
+    """Delayed events."""
+
+    def test_timer_fires(self, scheduler):
+        fired = []
+        scheduler.subscribe(TIMER, fired.append)
+        scheduler.schedule(0.05, TIMER, {"n": 1})
+
+        scheduler.run(until=lambda: bool(fired))
+
+        assert fired[0].payload == {"n": 1}
+
+    def test_cancelled_timer_does_not_fire(self, scheduler):
+        fired = []
+        scheduler.subscribe(TIMER, fired.append)
+        timer_id = scheduler.schedule(0.02, TIMER)
+        scheduler.cancel(timer_id)
+
+        deadline = time.monotonic() + 0.1
+        scheduler.run(until=lambda: time.monotonic() > deadline)
+
+        assert fired == []
+
+
+class TestCycleTrigger:
+    """Cycles start a full interval apart, whichever event triggers them."""
+
+    @staticmethod
+    def wire(scheduler, trigger, cycles):
+        """Subscribe handlers that start cycles the way TradingBot does."""
+        def on_kline_close(event):
+            if trigger.kline_closed(event.payload['close_time']):
+                cycles.append(('kline', event.payload['close_time']))
+
+        def on_timer(event):
+            trigger.timer_fired()
+            cycles.append(('timer', None))
+
+        scheduler.subscribe(KLINE_CLOSE, on_kline_close)
+        scheduler.subscribe(TIMER, on_timer)
+
+    def test_klines_within_interval_are_ignored(self, scheduler):
+        trigger = CycleTrigger(300)
+        cycles = []
+        self.wire(scheduler, trigger, cycles)
+
+        for minute in range(11):
+            scheduler.publish(KLINE_CLOSE, {'close_time': minute * 60_000 + 59_999})
+        while scheduler.run_once(timeout=0):
+            pass
+
+        assert [close for _, close in cycles] == [59_999, 359_999, 659_999]
+
+    def test_kline_after_timer_cycle_does_not_start_another(self, scheduler):
+        now = [1_700_000_000.0]
+        trigger = CycleTrigger(300, clock=lambda: now[0])
+        cycles = []
+        self.wire(scheduler, trigger, cycles)
+        last_close = int(now[0] * 1000) // 60_000 * 60_000 - 1
+        scheduler.publish(KLINE_CLOSE, {'close_time': last_close})
+        scheduler.run_once(timeout=0)
+
+        # The stream stalls; the timer runs a cycle 390s later
+        now[0] += 390
+        scheduler.schedule(0, TIMER)
+        scheduler.run_once(timeout=0.1)
+        # The stream recovers moments later with the klines it missed
+        stalled_close = int(now[0] * 1000) // 60_000 * 60_000 - 1
+        scheduler.publish(KLINE_CLOSE, {'close_time': stalled_close})
+        scheduler.publish(KLINE_CLOSE, {'close_time': stalled_close + 60_000})
+        while scheduler.run_once(timeout=0):
+            pass
+
+        assert [kind for kind, _ in cycles] == ['kline', 'timer']
+
+        # A full interval after the timer cycle, klines trigger cycles again
+        scheduler.publish(KLINE_CLOSE, {'close_time': stalled_close + 300_000})
+        scheduler.run_once(timeout=0)
+        assert cycles[-1] == ('kline', stalled_close + 300_000)
+
+
+class TestMarketWindowTimers:
+    """MARKET_WINDOW events at catalogued market expiries."""
+
+    @staticmethod
+    def market(market_id, end_date):
+        return MarketData(
+            market_id=market_id,
+            question=f"Will BTC go up ({market_id})?",
+            end_date=end_date,
+            yes_price=Decimal("0.6"),
+            no_price=Decimal("0.4")
+        )
+
+    def test_fires_at_expiry_once_per_market(self, scheduler):
+        now = datetime.now(timezone.utc)
+        catalogue = Mock()
+        catalogue.expiring_between.return_value = [
+            self.market("m1", now + timedelta(seconds=0.05)),
+            self.market("m2", now + timedelta(hours=1, seconds=-1)),
+        ]
+        fired = []
+        timers = MarketWindowTimers(scheduler, catalogue, horizon=3600, clock=lambda: now)
+        scheduler.subscribe(MARKET_WINDOW, fired.append)
+
+        assert timers.schedule() == 2
+        assert timers.schedule() == 0
+        scheduler.run(until=lambda: bool(fired))
+
+        start, end = catalogue.expiring_between.call_args.args
+        assert end - start == timedelta(hours=1)
+        assert fired[0].payload == {'market_id': "m1", 'end_date': (now + timedelta(seconds=0.05)).isoformat()}
+        assert len(timers) == 1
+        # A fired market can be scheduled again if it is still listed
+        assert timers.schedule() == 1
+
+    def test_naive_end_dates_are_utc(self, scheduler):
+        now = datetime.now(timezone.utc)
+        end = now + timedelta(seconds=0.05)
+        catalogue = Mock()
+        catalogue.expiring_between.return_value = [self.market("m1", end.replace(tzinfo=None))]
+        fired = []
+        scheduler.subscribe(MARKET_WINDOW, fired.append)
+
+        MarketWindowTimers(scheduler, catalogue, clock=lambda: now).schedule()
+        scheduler.run(until=lambda: bool(fired))
+
+        assert fired[0].payload['end_date'] == end.isoformat()
+
+    def test_cancel_all(self, scheduler):
+        now = datetime.now(timezone.utc)
+        catalogue = Mock()
+        catalogue.expiring_between.return_value = [self.market("m1", now + timedelta(seconds=0.02))]
+        timers = MarketWindowTimers(scheduler, catalogue, clock=lambda: now)
+
+        timers.schedule()
+        timers.cancel_all()
+
+        assert len(timers) == 0
+        deadline = time.monotonic() + 0.1
+        scheduler.run(until=lambda: time.monotonic() > deadline)
+        assert scheduler.dispatched == 0
+
+
+class TestKlineCloseListener:
+    """BinanceWebSocketClient notifies listeners only for closed klines."""
+
+    def test_only_closed_klines_notify(self):
+        config = Mock(spec=Config)
+        config.rsi_period = 14
+        config.macd_fast_period = 12
+        config.macd_slow_period = 26
+        config.macd_signal_period = 9
+        with patch('polymarket_bot.market_data.get_config', return_value=config):
+            client = BinanceWebSocketClient(buffer_size=10)
+        scheduler = EventScheduler()
+        client.add_kline_close_listener(lambda kline: scheduler.publish(KLINE_CLOSE, kline))
+
+        client._on_message(None, json.dumps({'k': {'c': '45000.5', 'x': False, 't': 0, 'T': 59999}}))
+        client._on_message(None, json.dumps({'k': {'c': '45001.0', 'x': True, 't': 0, 'T': 59999}}))
+
+        assert scheduler.pending() == 1
+        received = []
+        scheduler.subscribe(KLINE_CLOSE, received.append)
+        scheduler.run_once(timeout=0)
+        assert received[0].payload == {'open_time': 0, 'close_time': 59999, 'close': 45001.0}
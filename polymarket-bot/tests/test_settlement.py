@@ -0,0 +1,223 @@
+"""
+Tests for the background settlement tracker.
+
+Tests cover:
+- Many orders settling concurrently from one loop
+- Batched status queries when the client supports them
+- Terminal failure states, timeouts and transient errors
+- Callbacks, cancellation and shutdown
+"""
+
+import threading
+import time
+from concurrent.futures import wait
+from decimal import Decimal
+
+import pytest
+
+from polymarket_bot.execution import OrderSettlementError, PolymarketAPIClient, SettlementOutcome
+from polymarket_bot.settlement import SettlementResult, SettlementTracker
+
+
+class ScriptedClient:
+    """Order status source whose orders settle after a set number of polls."""
+
+    def __init__(self, polls_to_settle=3, final_status="settled", outcome="WIN", delay=0.0):
+        self.polls_to_settle = polls_to_settle
+        self.final_status = final_status
+        self.outcome = outcome
+        self.delay = delay
+        self.polls = {}
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def get_order_status(self, order_id):
+        time.sleep(self.delay)
+        with self.lock:
+            self.calls += 1
+            self.polls[order_id] = self.polls.get(order_id, 0) + 1
+            settled = self.polls[order_id] >= self.polls_to_settle
+        if not settled:
+            return {"order_id": order_id, "status": "open"}
+        return {"order_id": order_id, "status": self.final_status, "settlement_outcome": self.outcome}
+
+
+class BatchClient(ScriptedClient):
+    """Scripted client with a batch status endpoint."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+
+    def get_order_statuses(self, order_ids):
+        self.batches.append(list(order_ids))
+        return {order_id: self.get_order_status(order_id) for order_id in order_ids}
+
+
+def wait_until(condition, timeout=2.0):
+    """Poll ``condition`` until it holds; the tracker thread finishes callbacks after futures resolve."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+@pytest.fixture
+def tracker_factory():
+    trackers = []
+
+    def make(client, **kwargs):
+        kwargs.setdefault("poll_interval", 0.01)
+        kwargs.setdefault("timeout", 5.0)
+        tracker = SettlementTracker(client, **kwargs)
+        trackers.append(tracker)
+        return tracker
+
+    yield make
+    for tracker in trackers:
+        tracker.close()
+
+
+class TestTracking:
+    """Orders settle without blocking the caller."""
+
+    def test_many_orders_settle_from_one_loop(self, tracker_factory):
+        client = BatchClient(polls_to_settle=3)
+        tracker = tracker_factory(client, batch_size=8)
+
+        start = time.monotonic()
+        futures = [tracker.track(f"order_{i}") for i in range(20)]
+        returned_after = time.monotonic() - start
+        done, not_done = wait(futures, timeout=5)
+
+        assert returned_after < 0.5
+        assert not not_done
+        results = [f.result() for f in futures]
+        assert all(isinstance(r, SettlementResult) and r.outcome == SettlementOutcome.WIN for r in results)
+        assert [r.order_id for r in results] == [f"order_{i}" for i in range(20)]
+        assert max(len(batch) for batch in client.batches) <= 8
+        assert len(client.batches) < client.calls
+        assert wait_until(lambda: tracker.pending == 0)
+
+    def test_single_order_queries_run_concurrently(self, tracker_factory):
+        client = ScriptedClient(polls_to_settle=1, delay=0.1)
+        tracker = tracker_factory(client, max_workers=8)
+
+        start = time.monotonic()
+        futures = [tracker.track(f"order_{i}") for i in range(8)]
+        wait(futures, timeout=5)
+
+        assert all(f.result().outcome == SettlementOutcome.WIN for f in futures)
+        assert time.monotonic() - start < 0.1 * 8 / 2
+
+    def test_callback_receives_future(self, tracker_factory):
+        tracker = tracker_factory(ScriptedClient(polls_to_settle=2, outcome="LOSS"))
+        received = threading.Event()
+        seen = []
+
+        def on_done(future):
+            seen.append((future.order_id, future.result().outcome))
+            received.set()
+
+        tracker.track("order_1", callback=on_done)
+
+        assert received.wait(5)
+        assert seen == [("order_1", SettlementOutcome.LOSS)]
+
+
+class TestTerminalStates:
+    """Failures, timeouts and transient errors."""
+
+    @pytest.mark.parametrize("status", ["cancelled", "failed"])
+    def test_unsuccessful_orders_raise(self, tracker_factory, status):
+        tracker = tracker_factory(ScriptedClient(polls_to_settle=2, final_status=status))
+
+        future = tracker.track("order_1")
+
+        with pytest.raises(OrderSettlementError, match=status):
+            future.result(timeout=5)
+
+    def test_timeout(self, tracker_factory):
+        tracker = tracker_factory(ScriptedClient(polls_to_settle=10 ** 6))
+
+        future = tracker.track("order_1", timeout=0.1)
+
+        with pytest.raises(OrderSettlementError, match="timed out.*last status: open"):
+            future.result(timeout=5)
+        assert wait_until(lambda: tracker.pending == 0)
+
+    def test_order_pending_until_callback_returns(self, tracker_factory):
+        tracker = tracker_factory(ScriptedClient(polls_to_settle=1))
+        seen = []
+        release = threading.Event()
+
+        def callback(future):
+            seen.append(tracker.pending)
+            release.wait(5)
+
+        tracker.track("order_1", callback=callback)
+        assert wait_until(lambda: seen)
+        assert seen == [1]
+        assert tracker.pending == 1
+
+        release.set()
+        assert wait_until(lambda: tracker.pending == 0)
+
+    def test_transient_errors_keep_polling(self, tracker_factory):
+        client = ScriptedClient(polls_to_settle=4)
+        original = client.get_order_status
+
+        def flaky(order_id):
+            if client.polls.get(order_id, 0) < 2 and client.calls % 2 == 0:
+                client.calls += 1
+                raise ConnectionError("temporary")
+            return original(order_id)
+
+        client.get_order_status = flaky
+        tracker = tracker_factory(client)
+
+        assert tracker.track("order_1").result(timeout=5).outcome == SettlementOutcome.WIN
+
+
+class TestLifecycle:
+    """Cancellation and shutdown."""
+
+    def test_cancel(self, tracker_factory):
+        tracker = tracker_factory(ScriptedClient(polls_to_settle=10 ** 6))
+
+        future = tracker.track("order_1")
+
+        assert tracker.cancel("order_1")
+        assert future.cancelled()
+        assert not tracker.cancel("order_1")
+
+    def test_close_cancels_pending(self, tracker_factory):
+        tracker = tracker_factory(ScriptedClient(polls_to_settle=10 ** 6))
+        future = tracker.track("order_1")
+
+        tracker.close()
+
+        assert future.cancelled()
+        with pytest.raises(OrderSettlementError):
+            tracker.track("order_2")
+
+    def test_tracking_same_order_twice_shares_future(self, tracker_factory):
+        tracker = tracker_factory(ScriptedClient(polls_to_settle=10 ** 6))
+
+        assert tracker.track("order_1") is tracker.track("order_1")
+        assert tracker.pending == 1
+
+
+class TestMockClientBatch:
+    """Batch status endpoint on the mock API client."""
+
+    def test_get_order_statuses(self):
+        client = PolymarketAPIClient("key", "secret", "https://example.test")
+        order = client.submit_order("market_1", "BUY", "YES", Decimal("5"))
+
+        statuses = client.get_order_statuses([order["order_id"], "missing"])
+
+        assert list(statuses) == [order["order_id"]]
+        assert statuses[order["order_id"]]["status"] == "pending"
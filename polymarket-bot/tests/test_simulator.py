@@ -0,0 +1,187 @@
+"""
+End-to-end tests against the local exchange simulator.
+
+Tests cover:
+- Market discovery and parsing through PolymarketClient
+- Order submission, status and settlement through ExecutionEngine
+  and SettlementTracker
+- Injected errors and the execution engine's retries
+- Kline warm start and streaming through BinanceWebSocketClient
+- Order book sync through BinanceOrderBookStream
+"""
+
+import time
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+
+from polymarket_bot.config import Config
+from polymarket_bot.execution import ExecutionEngine, OrderExecutionError, OrderSettlementError, SettlementOutcome
+from polymarket_bot.market_data import BinanceWebSocketClient, PolymarketClient, fetch_recent_klines
+from polymarket_bot.models import OrderSide, OutcomeType, TradeStatus
+from polymarket_bot.order_book import BinanceOrderBookStream
+from polymarket_bot.settlement import SettlementTracker
+from polymarket_bot.simulator import ExchangeSimulator, SimulatorBehaviour
+from polymarket_bot.utils import RetryError
+
+
+@pytest.fixture
+def exchange():
+    behaviour = SimulatorBehaviour(settle_after=0.2, kline_interval=0.2, depth_interval=0.05)
+    with ExchangeSimulator(behaviour, history=100, seed=11) as simulator:
+        yield simulator
+
+
+@pytest.fixture
+def sim_config(exchange):
+    config = Mock(spec=Config)
+    config.polymarket_base_url = exchange.base_url
+    config.polymarket_api_key = "sim_key"
+    config.polymarket_api_secret = "sim_secret"
+    config.binance_base_url = exchange.base_url
+    config.binance_ws_url = exchange.ws_url
+    config.ws_reconnect_delay = 1
+    config.ws_max_reconnect_attempts = 3
+    config.rsi_period = 14
+    config.macd_fast_period = 12
+    config.macd_slow_period = 26
+    config.macd_signal_period = 9
+    return config
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestMarkets:
+    """Polymarket market endpoints."""
+
+    def test_btc_markets_are_discovered_and_parsed(self, sim_config):
+        client = PolymarketClient(sim_config)
+
+        markets = client.get_btc_markets()
+        market = client.parse_market_data(client.get_market_by_id("sim-btc-up-15m"))
+
+        assert sorted(m['id'] for m in markets) == ["sim-btc-up-15m", "sim-btc-up-1h"]
+        assert market.yes_price == Decimal("0.52")
+        assert client.get_active_markets(closed=True)[-1]['closed'] is True
+
+
+class TestOrders:
+    """Order lifecycle through the execution engine."""
+
+    def test_order_settles_with_outcome(self, exchange, sim_config):
+        exchange.behaviour.win_probability = 1.0
+        engine = ExecutionEngine(sim_config)
+
+        trade = engine.submit_order("sim-btc-up-15m", OrderSide.BUY, OutcomeType.YES, Decimal("10"))
+        assert trade.status == TradeStatus.EXECUTED
+        assert engine.get_order_status(trade.order_id)['status'] == "matched"
+
+        tracker = SettlementTracker(engine, poll_interval=0.05, timeout=5)
+        try:
+            result = tracker.track(trade.order_id).result(timeout=10)
+        finally:
+            tracker.close()
+
+        assert result.outcome == SettlementOutcome.WIN
+        assert result.order_data['market_resolution'] == "YES"
+        assert exchange.stats['orders'] == 1
+
+    def test_tracker_settles_many_orders(self, exchange, sim_config):
+        exchange.behaviour.cancel_probability = 0.5
+        engine = ExecutionEngine(sim_config)
+        trades = [
+            engine.submit_order("sim-btc-up-1h", OrderSide.BUY, OutcomeType.NO, Decimal("5"))
+            for _ in range(20)
+        ]
+
+        tracker = SettlementTracker(engine, poll_interval=0.05, timeout=5)
+        try:
+            futures = [tracker.track(trade.order_id) for trade in trades]
+            settled = cancelled = 0
+            for future in futures:
+                try:
+                    assert future.result(timeout=10).outcome in (SettlementOutcome.WIN, SettlementOutcome.LOSS)
+                    settled += 1
+                except OrderSettlementError:
+                    cancelled += 1
+        finally:
+            tracker.close()
+
+        assert settled + cancelled == 20
+        assert settled and cancelled
+
+    def test_injected_errors(self, exchange, sim_config):
+        engine = ExecutionEngine(sim_config)
+        trade = engine.submit_order("sim-btc-up-15m", OrderSide.BUY, OutcomeType.YES, Decimal("10"))
+
+        with patch('polymarket_bot.utils.time.sleep'):
+            exchange.fail_next(2, status=503, path_prefix="/orders/")
+            assert engine.get_order_status(trade.order_id)['order_id'] == trade.order_id
+            exchange.fail_next(3, status=500, path_prefix="/orders/")
+            with pytest.raises(RetryError):
+                engine.get_order_status(trade.order_id)
+
+        exchange.fail_next(1, path_prefix="/orders")
+        with pytest.raises(OrderExecutionError):
+            engine.submit_order("sim-btc-up-15m", OrderSide.BUY, OutcomeType.YES, Decimal("10"))
+
+        assert exchange.stats['injected_errors'] == 6
+        assert exchange.stats['orders'] == 1
+
+
+class TestMarketDataStreams:
+    """Binance REST and WebSocket endpoints."""
+
+    def test_warm_start_then_stream(self, exchange, sim_config):
+        with patch('polymarket_bot.market_data.get_config', return_value=sim_config):
+            client = BinanceWebSocketClient(buffer_size=50)
+        closed = []
+        client.add_kline_close_listener(closed.append)
+
+        assert client.warm_start() == 100  # All of the simulator's history
+        assert client.indicators.ready
+        last_backfilled = client.last_closed_open_time
+        client.connect()
+        try:
+            assert wait_for(lambda: len(closed) >= 2)
+        finally:
+            client.close()
+
+        assert closed[0]['open_time'] == last_backfilled + 60_000
+        assert closed[1]['open_time'] - closed[0]['open_time'] == 60_000
+
+    def test_recent_klines_exclude_future_klines(self, exchange, sim_config):
+        klines = fetch_recent_klines(limit=10, config=sim_config)
+
+        assert len(klines) == 10
+        assert klines[-1]['close_time'] < time.time() * 1000
+
+    def test_order_book_stream_syncs(self, exchange, sim_config):
+        stream = BinanceOrderBookStream(sim_config, snapshot_limit=100)
+        stream.connect(timeout=5)
+        try:
+            assert wait_for(lambda: stream.book.synced and stream.book.last_update_id > 2)
+            bid, ask = stream.book.best_bid(), stream.book.best_ask()
+        finally:
+            stream.close()
+
+        assert bid[0] < ask[0]
+        assert exchange.stats['depth_connections'] == 1
+
+    def test_dropped_stream_reconnects_and_resyncs(self, exchange, sim_config):
+        stream = BinanceOrderBookStream(sim_config, snapshot_limit=100)
+        stream.connect(timeout=5)
+        try:
+            assert wait_for(lambda: stream.book.synced)
+            exchange.drop_streams()
+            assert wait_for(lambda: exchange.stats['depth_connections'] == 2 and stream.book.synced)
+        finally:
+            stream.close()
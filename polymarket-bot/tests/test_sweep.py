@@ -0,0 +1,143 @@
+"""
+Tests for the parallel parameter sweep.
+
+Tests cover:
+- Grid and random search space expansion
+- Sweep results matching direct Backtester runs
+- Ranking, failure capture and CSV output
+- Shared memory blocks released after the sweep
+"""
+
+import csv
+from decimal import Decimal
+from multiprocessing import shared_memory
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from polymarket_bot import sweep
+from polymarket_bot.backtest import Backtester, BacktestData
+from polymarket_bot.capital import CapitalAllocator
+from polymarket_bot.config import Config
+from polymarket_bot.risk import RiskManager
+from polymarket_bot.sweep import ParameterSweep, Uniform, grid_combinations, random_combinations
+
+
+@pytest.fixture
+def mock_config():
+    """Create a mock configuration for testing."""
+    config = Mock(spec=Config)
+    config.rsi_period = 14
+    config.rsi_oversold_threshold = 45.0
+    config.rsi_overbought_threshold = 55.0
+    config.macd_fast_period = 12
+    config.macd_slow_period = 26
+    config.macd_signal_period = 9
+    config.order_book_bullish_threshold = 1.1
+    config.order_book_bearish_threshold = 0.9
+    config.prediction_confidence_score = 0.75
+    config.max_drawdown = 0.30
+    config.max_volatility = 0.03
+    config.base_position_size = 5.0
+    return config
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(5)
+    bars = 6000
+    close = 45000.0 + np.cumsum(rng.normal(0, 15, bars))
+    return BacktestData(np.arange(bars) * 60_000, close, rng.lognormal(0, 0.3, bars))
+
+
+class TestSearchSpace:
+    """Expanding search spaces into combinations."""
+
+    def test_grid_is_cartesian_product(self):
+        combos = grid_combinations({'rsi_period': [7, 14], 'max_drawdown': [0.1, 0.2, 0.3]})
+
+        assert len(combos) == 6
+        assert {'rsi_period': 14, 'max_drawdown': 0.2} in combos
+
+    def test_random_is_reproducible(self):
+        space = {'rsi_period': [7, 14, 21], 'rsi_oversold_threshold': Uniform(20.0, 40.0),
+                 'macd_signal_period': Uniform(5, 12)}
+
+        first = random_combinations(space, 50, seed=3)
+
+        assert first == random_combinations(space, 50, seed=3)
+        assert all(20.0 <= c['rsi_oversold_threshold'] <= 40.0 for c in first)
+        assert all(isinstance(c['macd_signal_period'], int) and 5 <= c['macd_signal_period'] <= 12 for c in first)
+
+    def test_rejects_unknown_parameter(self):
+        with pytest.raises(ValueError, match="rsi_perod"):
+            grid_combinations({'rsi_perod': [14]})
+
+    def test_grid_rejects_ranges(self):
+        with pytest.raises(ValueError):
+            grid_combinations({'rsi_period': Uniform(5, 20)})
+
+
+class TestParameterSweep:
+    """Running backtests across worker processes."""
+
+    def test_matches_direct_backtests(self, mock_config, data):
+        space = {'rsi_period': [10, 14], 'max_drawdown': [0.05, 0.3], 'base_position_size': [2.0, 5.0]}
+
+        result = ParameterSweep(data, config=mock_config, max_workers=2).grid(space)
+
+        assert len(result.rows) == 8 and not result.failures
+        pnls = [row['total_pnl'] for row in result.rows]
+        assert pnls == sorted(pnls, reverse=True)
+        for row in result.rows:
+            mock_config.rsi_period = row['param_rsi_period']
+            expected = Backtester(
+                config=mock_config,
+                risk_manager=RiskManager(max_drawdown_percent=Decimal(str(row['param_max_drawdown'])) * 100),
+                capital_allocator=CapitalAllocator(base_size=Decimal(str(row['param_base_position_size'])))
+            ).run(data).summary()
+            assert {key: row[key] for key in expected} == expected
+
+    def test_failed_runs_are_reported(self, mock_config, data):
+        combos = [{'rsi_period': 14}, {'cycle_bars': 0}]
+
+        result = ParameterSweep(data, config=mock_config, max_workers=2).run(combos)
+
+        assert [row['param_rsi_period'] for row in result.rows] == [14]
+        assert len(result.failures) == 1
+        assert "cycle_bars" in result.failures[0]['error']
+
+    def test_shared_memory_released(self, mock_config, data):
+        created = []
+        original = sweep._share_array
+
+        def tracking(array):
+            block, spec = original(array)
+            created.append(spec[0])
+            return block, spec
+
+        with patch.object(sweep, "_share_array", tracking):
+            ParameterSweep(data, config=mock_config, max_workers=2).run([{'rsi_period': 14}])
+
+        assert len(created) == 3
+        for name in created:
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+    def test_write_csv_and_table(self, mock_config, data, tmp_path):
+        result = ParameterSweep(data, config=mock_config, max_workers=2).grid(
+            {'rsi_oversold_threshold': [40.0, 45.0]}
+        )
+        path = tmp_path / "sweep.csv"
+
+        result.write_csv(path)
+
+        with open(path, newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert [r['rank'] for r in rows] == ['1', '2']
+        assert {r['param_rsi_oversold_threshold'] for r in rows} == {'40.0', '45.0'}
+        assert float(rows[0]['total_pnl']) == pytest.approx(result.best['total_pnl'])
+        assert result.format_table().splitlines()[0].split() == [
+            'rank', 'param_rsi_oversold_threshold', 'total_trades', 'win_rate', 'total_pnl', 'max_drawdown'
+        ]
@@ -0,0 +1,147 @@
+"""
+Tests for pipeline telemetry.
+
+Tests cover:
+- Histogram precision, percentiles and clamping
+- Stage spans and labelled counters
+- Retry and API error counters from retry_with_backoff
+- Prometheus text exposition over the local HTTP server
+"""
+
+import math
+import random
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+from polymarket_bot.telemetry import LatencyHistogram, MetricsServer, Telemetry, get_telemetry
+from polymarket_bot.utils import RetryError, retry_with_backoff
+
+
+class TestLatencyHistogram:
+    """HDR-style log-linear buckets."""
+
+    def test_small_values_are_exact(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 101):
+            histogram.record(value)
+
+        assert histogram.percentile(50) == 50
+        assert histogram.percentile(99) == 99
+        assert histogram.percentile(100) == 100
+        assert (histogram.min, histogram.max, histogram.count) == (1, 100, 100)
+
+    def test_relative_error_bounded_at_every_magnitude(self):
+        rng = random.Random(3)
+        values = sorted(int(10 ** rng.uniform(0, 9)) for _ in range(5000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percentile in (50, 90, 99, 99.9):
+            exact = values[max(0, math.ceil(round(len(values) * percentile / 100, 9)) - 1)]
+            assert exact <= histogram.percentile(percentile) <= exact * 1.01 + 1
+
+    def test_snapshot_and_clamping(self):
+        histogram = LatencyHistogram(highest_value=1000)
+        histogram.record(5)
+        histogram.record(10 ** 9)
+
+        count, total, (p50, p100) = histogram.snapshot((50, 100))
+
+        assert (count, total) == (2, 1005)
+        assert (p50, p100) == (5, 1000)
+
+    def test_empty_and_reset(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(50) is None
+
+        histogram.record(7)
+        histogram.reset()
+
+        assert histogram.count == 0
+        assert histogram.percentile(50) is None
+
+
+class TestTelemetry:
+    """Spans, counters and exposition."""
+
+    def test_span_records_even_when_block_raises(self):
+        telemetry = Telemetry()
+        with patch("polymarket_bot.telemetry.time.perf_counter_ns", side_effect=[0, 2_500_000, 0, 1_000_000]):
+            with telemetry.span("signal"):
+                pass
+            with pytest.raises(RuntimeError):
+                with telemetry.span("signal"):
+                    raise RuntimeError("boom")
+
+        summary = telemetry.summary()["signal"]
+        assert summary["count"] == 2
+        assert summary["mean"] == pytest.approx(0.00175)
+        assert summary["p99"] == pytest.approx(0.0025, rel=0.01)
+
+    def test_counters(self):
+        telemetry = Telemetry()
+        telemetry.increment("retries_total", function="fetch")
+        telemetry.increment("retries_total", 2, function="fetch")
+
+        assert telemetry.counter("retries_total", function="fetch") == 3
+        assert telemetry.counter("retries_total", function="other") == 0
+
+    def test_render_prometheus(self):
+        telemetry = Telemetry()
+        telemetry.observe("risk", 0.002)
+        telemetry.increment("api_errors_total", function="get", error='Quote"d')
+
+        text = telemetry.render_prometheus()
+
+        assert "# TYPE polymarket_bot_stage_latency_seconds summary" in text
+        assert 'polymarket_bot_stage_latency_seconds{stage="risk",quantile="0.99"} 0.002' in text
+        assert 'polymarket_bot_stage_latency_seconds_count{stage="risk"} 1' in text
+        assert "# TYPE polymarket_bot_api_errors_total counter" in text
+        assert 'polymarket_bot_api_errors_total{error="Quote\\"d",function="get"} 1' in text
+        assert text.endswith("\n")
+
+
+class TestRetryCounters:
+    """retry_with_backoff feeds the shared registry."""
+
+    def test_retries_and_errors_are_counted(self):
+        telemetry = get_telemetry()
+        attempts = []
+
+        @retry_with_backoff(max_attempts=3, base_delay=0, exceptions=(ConnectionError,))
+        def flaky_telemetry_call():
+            attempts.append(1)
+            raise ConnectionError("down")
+
+        with pytest.raises(RetryError):
+            flaky_telemetry_call()
+
+        assert telemetry.counter("api_errors_total", function="flaky_telemetry_call", error="ConnectionError") == 3
+        assert telemetry.counter("retries_total", function="flaky_telemetry_call") == 2
+
+
+class TestMetricsServer:
+    """Local scrape endpoint."""
+
+    def test_serves_metrics(self):
+        telemetry = Telemetry()
+        telemetry.observe("market_data", 0.1)
+        server = MetricsServer(telemetry, port=0)
+        server.start()
+        try:
+            host, port = server.address
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+                body = response.read().decode()
+                content_type = response.headers["Content-Type"]
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"http://{host}:{port}/other", timeout=5)
+        finally:
+            server.stop()
+
+        assert content_type.startswith("text/plain; version=0.0.4")
+        assert 'polymarket_bot_stage_latency_seconds_count{stage="market_data"} 1' in body
+        assert server.address is None
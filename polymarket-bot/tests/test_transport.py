@@ -0,0 +1,174 @@
+"""
+Tests for the shared HTTP transport.
+
+Tests cover:
+- Blocking and async requests through one pool per host
+- Session default headers and endpoint policies
+- Per-endpoint concurrency limits and deadlines
+- Shutdown
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from polymarket_bot.transport import EndpointPolicy, HttpTransport, TransportSession
+
+
+class RecordingHandler:
+    """Async MockTransport handler tracking calls and peak concurrency."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.requests = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    async def __call__(self, request):
+        with self.lock:
+            self.requests.append(request)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            with self.lock:
+                self.active -= 1
+        return httpx.Response(200, json={"path": request.url.path, "query": dict(request.url.params)})
+
+
+@pytest.fixture
+def transport_factory():
+    transports = []
+
+    def make(handler, **kwargs):
+        transport = HttpTransport(transport=httpx.MockTransport(handler), http2=False, **kwargs)
+        transports.append(transport)
+        return transport
+
+    yield make
+    for transport in transports:
+        transport.close()
+
+
+class TestRequests:
+    """Blocking and async entry points."""
+
+    def test_request_sync(self, transport_factory):
+        handler = RecordingHandler()
+        transport = transport_factory(handler)
+
+        response = transport.request_sync("GET", "https://api.binance.com/api/v3/depth", params={"limit": 10})
+
+        assert response.status_code == 200
+        assert response.json() == {"path": "/api/v3/depth", "query": {"limit": "10"}}
+
+    def test_async_request_from_another_loop(self, transport_factory):
+        handler = RecordingHandler(delay=0.05)
+        transport = transport_factory(handler)
+
+        async def fetch_all():
+            return await asyncio.gather(*(
+                transport.request("GET", f"https://api.binance.com/api/v3/klines?i={i}") for i in range(5)
+            ))
+
+        start = time.monotonic()
+        responses = asyncio.run(fetch_all())
+
+        assert [r.json()["query"]["i"] for r in responses] == ["0", "1", "2", "3", "4"]
+        assert time.monotonic() - start < 0.05 * 5
+
+    def test_one_client_per_host(self, transport_factory):
+        transport = transport_factory(RecordingHandler())
+
+        for _ in range(3):
+            transport.request_sync("GET", "https://api.binance.com/api/v3/depth")
+        transport.request_sync("GET", "https://clob.polymarket.com/markets")
+
+        assert sorted(transport._clients) == ["https://api.binance.com", "https://clob.polymarket.com"]
+
+    def test_session_headers_and_endpoint(self, transport_factory):
+        handler = RecordingHandler()
+        transport = transport_factory(handler, endpoint_policies={"orders": EndpointPolicy(timeout=1.0)})
+        session = transport.session(headers={"Authorization": "Bearer key"}, endpoint="orders")
+
+        session.request("POST", "https://clob.polymarket.com/orders", json={"size": "5"})
+
+        assert isinstance(session, TransportSession)
+        assert handler.requests[0].headers["Authorization"] == "Bearer key"
+        assert handler.requests[0].content == b'{"size":"5"}'
+
+    def test_connection_errors_propagate(self, transport_factory):
+        def refuse(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        transport = transport_factory(refuse)
+
+        with pytest.raises(httpx.ConnectError):
+            transport.request_sync("GET", "https://api.binance.com/api/v3/depth")
+
+
+class TestEndpointPolicies:
+    """Concurrency limits and deadlines by endpoint name."""
+
+    def test_concurrency_limit(self, transport_factory):
+        handler = RecordingHandler(delay=0.05)
+        transport = transport_factory(
+            handler,
+            endpoint_policies={"depth": EndpointPolicy(timeout=5.0, max_concurrency=2)}
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(
+                lambda _: transport.request_sync("GET", "https://api.binance.com/api/v3/depth", endpoint="depth"),
+                range(8)
+            ))
+
+        assert len(handler.requests) == 8
+        assert handler.peak == 2
+
+    def test_deadline(self, transport_factory):
+        transport = transport_factory(
+            RecordingHandler(delay=1.0),
+            endpoint_policies={"depth": EndpointPolicy(timeout=0.05)}
+        )
+
+        start = time.monotonic()
+        with pytest.raises(httpx.TimeoutException, match="depth"):
+            transport.request_sync("GET", "https://api.binance.com/api/v3/depth", endpoint="depth")
+
+        assert time.monotonic() - start < 0.5
+
+    def test_unknown_endpoint_uses_default(self, transport_factory):
+        default = EndpointPolicy(timeout=2.0, max_concurrency=1)
+        transport = transport_factory(RecordingHandler(), default_policy=default)
+
+        assert transport.policy_for("missing") is default
+        assert transport.policy_for(None) is default
+
+
+class TestLifecycle:
+    """Shutdown and HTTP/2 availability."""
+
+    def test_close(self, transport_factory):
+        transport = transport_factory(RecordingHandler())
+        transport.request_sync("GET", "https://api.binance.com/api/v3/depth")
+        thread = transport._thread
+
+        transport.close()
+
+        assert not thread.is_alive()
+        with pytest.raises(RuntimeError, match="closed"):
+            transport.request_sync("GET", "https://api.binance.com/api/v3/depth")
+
+    def test_http2_requires_h2(self, monkeypatch):
+        monkeypatch.setattr("polymarket_bot.transport.HTTP2_AVAILABLE", False)
+
+        with pytest.raises(ValueError, match="h2"):
+            HttpTransport(http2=True)
+        assert HttpTransport().http2 is False
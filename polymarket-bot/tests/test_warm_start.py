@@ -0,0 +1,156 @@
+"""
+Tests for warm-starting the Binance client from REST klines.
+
+Tests cover:
+- Parsing of REST klines, excluding the kline still in progress
+- Backfilled indicators matching a client that streamed the same klines
+- De-duplication of streamed klines by open time
+- Filling gaps in the stream
+"""
+
+import json
+import time
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from polymarket_bot.config import Config
+from polymarket_bot.market_data import BinanceWebSocketClient, fetch_recent_klines
+
+MINUTE = 60_000
+
+
+@pytest.fixture
+def mock_config():
+    config = Mock(spec=Config)
+    config.binance_base_url = "https://api.binance.com"
+    config.rsi_period = 14
+    config.macd_fast_period = 12
+    config.macd_slow_period = 26
+    config.macd_signal_period = 9
+    return config
+
+
+@pytest.fixture
+def closes():
+    return list(45000.0 + np.cumsum(np.random.default_rng(3).normal(0, 20, 80)))
+
+
+def make_client(config, buffer_size=100):
+    with patch('polymarket_bot.market_data.get_config', return_value=config):
+        return BinanceWebSocketClient(buffer_size=buffer_size)
+
+
+def klines(closes, start=0):
+    return [
+        {'open_time': (start + i) * MINUTE, 'close_time': (start + i + 1) * MINUTE - 1, 'close': close}
+        for i, close in enumerate(closes)
+    ]
+
+
+def stream_message(open_time, close, closed=True):
+    return json.dumps({'k': {'t': open_time, 'T': open_time + MINUTE - 1, 'c': str(close), 'x': closed}})
+
+
+class TestFetchRecentKlines:
+    """REST kline parsing."""
+
+    def test_excludes_in_progress_kline(self, mock_config):
+        now = int(time.time() * 1000)
+        response = Mock()
+        response.json.return_value = [
+            [now - 2 * MINUTE, "1", "1", "1", "100.5", "1", now - MINUTE - 1],
+            [now - MINUTE, "1", "1", "1", "101.5", "1", now + 1000],
+        ]
+
+        with patch('polymarket_bot.market_data.get_transport') as transport:
+            transport.return_value.request_sync.return_value = response
+            result = fetch_recent_klines(limit=2, start_time=5, config=mock_config)
+
+        assert result == [{'open_time': now - 2 * MINUTE, 'close_time': now - MINUTE - 1, 'close': 100.5}]
+        assert transport.return_value.request_sync.call_args.kwargs['params']['startTime'] == 5
+
+
+class TestWarmStart:
+    """Backfill followed by streaming."""
+
+    def test_backfill_matches_streaming(self, mock_config, closes):
+        streamed = make_client(mock_config)
+        for i, close in enumerate(closes):
+            streamed._on_message(None, stream_message(i * MINUTE, close))
+
+        warm = make_client(mock_config)
+        assert warm.warm_start(klines(closes)) == len(closes)
+
+        assert warm.indicators.ready
+        assert warm.get_indicators() == streamed.get_indicators()
+        assert warm.get_latest_prices() == streamed.get_latest_prices()
+
+    def test_stream_deduplicates_by_open_time(self, mock_config, closes):
+        client = make_client(mock_config)
+        client.warm_start(klines(closes[:60]))
+        before = client.get_indicators()
+
+        # Replayed final kline and a late in-progress update of it are ignored
+        client._on_message(None, stream_message(59 * MINUTE, closes[59]))
+        client._on_message(None, stream_message(59 * MINUTE, closes[59] + 5, closed=False))
+        assert client.get_indicators() == before
+        assert len(client.get_latest_prices()) == 60
+
+        # The next kline continues the series
+        client._on_message(None, stream_message(60 * MINUTE, closes[60]))
+        reference = make_client(mock_config)
+        reference.warm_start(klines(closes[:61]))
+        assert client.get_indicators() == reference.get_indicators()
+
+    def test_in_progress_updates_share_one_row(self, mock_config, closes):
+        client = make_client(mock_config)
+        client.warm_start(klines(closes[:60]))
+
+        for offset in (1, 2, 3):
+            client._on_message(None, stream_message(60 * MINUTE, closes[60] + offset, closed=False))
+        assert len(client.get_latest_prices()) == 61
+        assert client.get_latest_price() == closes[60] + 3
+
+        client._on_message(None, stream_message(60 * MINUTE, closes[60]))
+        client._on_message(None, stream_message(61 * MINUTE, closes[61], closed=False))
+
+        timestamps = client.get_ohlcv_window()[0]
+        assert timestamps[-3:].tolist() == [59 * MINUTE, 60 * MINUTE, 61 * MINUTE]
+        assert client.get_latest_prices()[-2] == closes[60]
+
+    def test_gap_fill_replaces_in_progress_row(self, mock_config, closes):
+        client = make_client(mock_config)
+        client.warm_start(klines(closes[:50]))
+        client._on_message(None, stream_message(53 * MINUTE, closes[53] + 1, closed=False))
+
+        with patch('polymarket_bot.market_data.fetch_recent_klines',
+                   return_value=klines(closes[50:53], start=50)):
+            client._on_message(None, stream_message(53 * MINUTE, closes[53]))
+
+        timestamps = client.get_ohlcv_window()[0]
+        assert timestamps[-5:].tolist() == [m * MINUTE for m in range(49, 54)]
+        assert client.get_latest_prices()[-4:] == closes[50:54]
+
+    def test_gap_is_filled_from_rest(self, mock_config, closes):
+        client = make_client(mock_config)
+        client.warm_start(klines(closes[:50]))
+
+        with patch('polymarket_bot.market_data.fetch_recent_klines',
+                   return_value=klines(closes[50:53], start=50)) as fetch:
+            client._on_message(None, stream_message(53 * MINUTE, closes[53]))
+
+        assert fetch.call_args.kwargs['start_time'] == 50 * MINUTE
+        assert fetch.call_args.kwargs['end_time'] == 53 * MINUTE - 1
+        reference = make_client(mock_config)
+        reference.warm_start(klines(closes[:54]))
+        assert client.get_indicators() == reference.get_indicators()
+
+    def test_warm_start_fetches_enough_for_indicators(self, mock_config):
+        client = make_client(mock_config, buffer_size=50)
+
+        with patch('polymarket_bot.market_data.fetch_recent_klines', return_value=[]) as fetch:
+            client.warm_start()
+
+        assert fetch.call_args.kwargs['limit'] == client.indicators.warmup_period * 4
@@ -0,0 +1,402 @@
+"""
+Shared HTTP Transport for Polymarket Bot.
+
+This module gives every REST call in the bot one connection layer:
+- One httpx.AsyncClient per host, each with its own keep-alive pool, kept
+  warm between trading cycles
+- HTTP/2 where the server negotiates it (requires the ``h2`` package)
+- Named endpoint policies with a total deadline and a concurrency limit
+  (e.g. the Binance depth snapshot gets a short deadline)
+
+The clients live on a dedicated event-loop thread. Async code awaits
+``HttpTransport.request`` from any loop; the existing threaded code calls
+``request_sync``, which blocks only the calling thread. Both share the same
+pools, so concurrent calls from the scheduler, fetch executor and
+settlement tracker reuse connections instead of opening new ones.
+"""
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EndpointPolicy:
+    """Limits applied to every request made under an endpoint name."""
+    timeout: float = 10.0  # Total seconds, including waiting for a concurrency slot
+    connect_timeout: float = 5.0
+    max_concurrency: int = 8
+
+
+@dataclass(frozen=True)
+class HostPoolPolicy:
+    """Connection pool settings for one host."""
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    connect_retries: int = 2
+
+
+DEFAULT_ENDPOINT_POLICIES: Dict[str, EndpointPolicy] = {
+    'binance.depth': EndpointPolicy(timeout=3.0, connect_timeout=2.0, max_concurrency=4),
+    'binance.depth_snapshot': EndpointPolicy(timeout=10.0, max_concurrency=2),
+    'binance.klines': EndpointPolicy(timeout=10.0, max_concurrency=4),
+    'coingecko.price': EndpointPolicy(timeout=10.0, max_concurrency=2),
+    'polymarket.markets': EndpointPolicy(timeout=10.0, max_concurrency=8),
+    'polymarket.orders': EndpointPolicy(timeout=15.0, max_concurrency=8),
+}
+
+
+class HttpTransport:
+    """
+    Shared async HTTP client pool with per-endpoint limits.
+
+    Requests made without an endpoint name use ``default_policy``.
+    """
+
+    def __init__(
+        self,
+        endpoint_policies: Optional[Dict[str, EndpointPolicy]] = None,
+        default_policy: EndpointPolicy = EndpointPolicy(),
+        pool_policy: HostPoolPolicy = HostPoolPolicy(),
+        host_pool_policies: Optional[Dict[str, HostPoolPolicy]] = None,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Initialize the transport. The event loop starts on first use.
+
+        Args:
+            endpoint_policies: Policies by endpoint name (default: DEFAULT_ENDPOINT_POLICIES)
+            default_policy: Policy for requests without an endpoint name
+            pool_policy: Pool settings for hosts without their own entry
+            host_pool_policies: Pool settings by host name
+            http2: Negotiate HTTP/2 (default: when h2 is installed)
+            transport: httpx transport used for every host instead of the
+                network (e.g. httpx.MockTransport in tests)
+
+        Raises:
+            ValueError: If http2 is requested but h2 is not installed
+        """
+        if http2 and not HTTP2_AVAILABLE:
+            raise ValueError("HTTP/2 requires the h2 package (pip install 'httpx[http2]')")
+        self.endpoint_policies = dict(DEFAULT_ENDPOINT_POLICIES if endpoint_policies is None else endpoint_policies)
+        self.default_policy = default_policy
+        self.pool_policy = pool_policy
+        self.host_pool_policies = dict(host_pool_policies or {})
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self._transport = transport
+
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._semaphores: Dict[Optional[str], asyncio.Semaphore] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def policy_for(self, endpoint: Optional[str]) -> EndpointPolicy:
+        """
+        Get the policy for an endpoint name.
+
+        Args:
+            endpoint: Endpoint name, or None
+
+        Returns:
+            The named policy, or the default policy
+        """
+        return self.endpoint_policies.get(endpoint, self.default_policy) if endpoint else self.default_policy
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("HTTP transport is closed")
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, daemon=True, name="HttpTransport")
+                self._thread.start()
+                logger.info(f"HTTP transport started (http2={'on' if self.http2 else 'off'})")
+            return self._loop
+
+    def _client_for(self, url: str) -> httpx.AsyncClient:
+        # Runs on the transport loop
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        client = self._clients.get(origin)
+        if client is None:
+            pool = self.host_pool_policies.get(parts.hostname or '', self.pool_policy)
+            limits = httpx.Limits(
+                max_connections=pool.max_connections,
+                max_keepalive_connections=pool.max_keepalive_connections,
+                keepalive_expiry=pool.keepalive_expiry
+            )
+            transport = self._transport or httpx.AsyncHTTPTransport(
+                http2=self.http2,
+                limits=limits,
+                retries=pool.connect_retries
+            )
+            client = httpx.AsyncClient(transport=transport, http2=self.http2, limits=limits)
+            self._clients[origin] = client
+            logger.debug(f"Opened connection pool for {origin}")
+        return client
+
+    def _semaphore_for(self, endpoint: Optional[str]) -> asyncio.Semaphore:
+        # Runs on the transport loop
+        semaphore = self._semaphores.get(endpoint)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.policy_for(endpoint).max_concurrency)
+            self._semaphores[endpoint] = semaphore
+        return semaphore
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        endpoint: Optional[str],
+        params: Optional[Dict[str, Any]],
+        json: Any,
+        headers: Optional[Dict[str, str]]
+    ) -> httpx.Response:
+        policy = self.policy_for(endpoint)
+        client = self._client_for(url)
+
+        async def send() -> httpx.Response:
+            async with self._semaphore_for(endpoint):
+                return await client.request(
+                    method,
+                    url,
+                    params=params,
+                    json=json,
+                    headers=headers,
+                    timeout=httpx.Timeout(policy.timeout, connect=policy.connect_timeout)
+                )
+
+        try:
+            return await asyncio.wait_for(send(), timeout=policy.timeout)
+        except asyncio.TimeoutError:
+            raise httpx.TimeoutException(
+                f"{method} {url} exceeded the {policy.timeout}s deadline for endpoint '{endpoint or 'default'}'",
+                request=httpx.Request(method, url)
+            ) from None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        endpoint: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        Send a request from any event loop.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            endpoint: Endpoint policy name
+            params: Query parameters
+            json: JSON request body
+            headers: Extra request headers
+
+        Returns:
+            The response (status is not checked)
+
+        Raises:
+            httpx.HTTPError: On connection failure or when the endpoint deadline passes
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._request(method, url, endpoint, params, json, headers),
+            self._ensure_loop()
+        )
+        return await asyncio.wrap_future(future)
+
+    def request_sync(
+        self,
+        method: str,
+        url: str,
+        endpoint: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        Send a request and block the calling thread until it completes.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            endpoint: Endpoint policy name
+            params: Query parameters
+            json: JSON request body
+            headers: Extra request headers
+
+        Returns:
+            The response (status is not checked)
+
+        Raises:
+            httpx.HTTPError: On connection failure or when the endpoint deadline passes
+            RuntimeError: If called from the transport's own loop thread
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("request_sync cannot be called from the transport loop; await request() instead")
+        future = asyncio.run_coroutine_threadsafe(
+            self._request(method, url, endpoint, params, json, headers),
+            loop
+        )
+        return future.result()
+
+    def session(self, headers: Optional[Dict[str, str]] = None, endpoint: Optional[str] = None) -> "TransportSession":
+        """
+        Create a lightweight session with default headers and endpoint.
+
+        Args:
+            headers: Headers sent with every request
+            endpoint: Default endpoint policy name
+
+        Returns:
+            TransportSession sharing this transport's pools
+        """
+        return TransportSession(self, headers=headers, endpoint=endpoint)
+
+    def close(self) -> None:
+        """Close every connection pool and stop the loop thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+        if loop is None:
+            return
+
+        async def close_clients():
+            for client in self._clients.values():
+                await client.aclose()
+            self._clients.clear()
+
+        try:
+            asyncio.run_coroutine_threadsafe(close_clients(), loop).result(timeout=5)
+        except Exception as e:
+            logger.warning(f"Error closing HTTP connection pools: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+        logger.info("HTTP transport closed")
+
+
+class TransportSession:
+    """
+    Default headers and endpoint over a shared HttpTransport.
+
+    Sessions hold no connections of their own, so closing one is a no-op;
+    the pools belong to the transport.
+    """
+
+    def __init__(self, transport: HttpTransport, headers: Optional[Dict[str, str]] = None,
+                 endpoint: Optional[str] = None):
+        """
+        Initialize the session.
+
+        Args:
+            transport: Shared transport
+            headers: Headers sent with every request
+            endpoint: Default endpoint policy name
+        """
+        self.transport = transport
+        self.headers: Dict[str, str] = dict(headers or {})
+        self.endpoint = endpoint
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        endpoint: Optional[str] = None
+    ) -> httpx.Response:
+        """
+        Send a request, blocking the calling thread.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            params: Query parameters
+            json: JSON request body
+            endpoint: Endpoint policy name (default: the session's)
+
+        Returns:
+            The response (status is not checked)
+        """
+        return self.transport.request_sync(
+            method, url, endpoint=endpoint or self.endpoint, params=params, json=json, headers=self.headers
+        )
+
+    async def arequest(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        endpoint: Optional[str] = None
+    ) -> httpx.Response:
+        """
+        Send a request from async code.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            params: Query parameters
+            json: JSON request body
+            endpoint: Endpoint policy name (default: the session's)
+
+        Returns:
+            The response (status is not checked)
+        """
+        return await self.transport.request(
+            method, url, endpoint=endpoint or self.endpoint, params=params, json=json, headers=self.headers
+        )
+
+    def close(self) -> None:
+        """No-op: the connections belong to the shared transport."""
+
+
+_transport: Optional[HttpTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """
+    Get the process-wide shared transport, creating it on first use.
+
+    Returns:
+        Shared HttpTransport
+    """
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = HttpTransport()
+        return _transport
+
+
+def close_transport() -> None:
+    """Close the shared transport; the next get_transport() creates a new one."""
+    global _transport
+    with _transport_lock:
+        transport, _transport = _transport, None
+    if transport is not None:
+        transport.close()
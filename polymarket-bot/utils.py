@@ -21,6 +21,20 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
 
+def _get_telemetry():
+    """
+    Return the process-wide telemetry registry.
+
+    Imported on first use so this module also loads on its own, outside the
+    polymarket_bot package (as the standalone utils tests do).
+    """
+    try:
+        from .telemetry import get_telemetry
+    except ImportError:
+        from telemetry import get_telemetry
+    return get_telemetry()
+
+
 class RetryError(Exception):
     """Exception raised when retry attempts are exhausted."""
     pass
@@ -42,6 +56,9 @@ def retry_with_backoff(
     """
     Decorator that implements exponential backoff retry logic for API calls.
 
+    Every caught failure increments the ``api_errors_total`` telemetry
+    counter and every retry ``retries_total``, labelled by function name.
+
     Args:
         max_attempts: Maximum number of retry attempts (default: 3)
         base_delay: Initial delay in seconds (default: 1.0)
@@ -85,6 +102,8 @@ def retry_with_backoff(
 
                 except exceptions as e:
                     last_exception = e
+                    telemetry = _get_telemetry()
+                    telemetry.increment("api_errors_total", function=func.__name__, error=type(e).__name__)
 
                     # Don't sleep after the last attempt
                     if attempt == max_attempts:
@@ -101,6 +120,7 @@ def retry_with_backoff(
                         f"Retrying in {delay:.2f} seconds..."
                     )
 
+                    telemetry.increment("retries_total", function=func.__name__)
                     time.sleep(delay)
 
             # All attempts exhausted
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk NDJSON/CSV import and streaming export.
+
+Tests cover:
+- Line-by-line NDJSON and CSV parsing
+- Batched inserts with per-row errors and one audit entry per batch
+- Import and export endpoints, including auth checks
+"""
+
+import csv
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from api import bulk, data_store
+from api.app import app
+from api.auth import generate_token
+from api.bulk import iter_csv, iter_ndjson
+
+
+@pytest.fixture
+def client():
+    data_store.reset_data_store()
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+    data_store.reset_data_store()
+
+
+def auth_header(member_id):
+    return {"Authorization": f"Bearer {generate_token(member_id)}"}
+
+
+def _try_lock(lock):
+    """Return True if ``lock`` is free, leaving it released."""
+    if not lock.acquire(blocking=False):
+        return False
+    lock.release()
+    return True
+
+
+def ndjson(*records):
+    return "\n".join(json.dumps(record) for record in records) + "\n"
+
+
+class TestParsers:
+    """Incremental payload parsers."""
+
+    def test_ndjson_reports_bad_lines(self):
+        rows = list(iter_ndjson(['{"name": "a"}\n', '\n', 'not json\n', '[1]\n']))
+
+        assert rows == [
+            (1, {"name": "a"}, None),
+            (3, None, "Invalid JSON"),
+            (4, None, "Each line must be a JSON object"),
+        ]
+
+    def test_csv_drops_empty_cells(self):
+        rows = list(iter_csv(["name,bio\n", "Ada,\n", '"Multi\n', 'line",x\n']))
+
+        assert rows == [
+            (2, {"name": "Ada"}, None),
+            (4, {"name": "Multi\nline", "bio": "x"}, None),
+        ]
+
+    def test_csv_reports_malformed_row_and_continues(self):
+        limit = csv.field_size_limit(10)
+        try:
+            rows = list(iter_csv(["name,bio\n", "Ada,x\n", "A" * 20 + ",y\n", "Grace,z\n"]))
+        finally:
+            csv.field_size_limit(limit)
+
+        assert rows[0] == (2, {"name": "Ada", "bio": "x"}, None)
+        assert rows[1][0] == 3 and rows[1][2].startswith("Malformed CSV")
+        assert rows[2] == (4, {"name": "Grace", "bio": "z"}, None)
+
+
+class TestBulkImport:
+    """Import endpoints."""
+
+    def test_import_books_ndjson_with_row_errors(self, client):
+        body = ndjson(
+            {"title": "Dune", "author_id": 1, "isbn": "978-0-441-17271-9"},
+            {"title": "Ghost", "author_id": 999, "isbn": "978-0-441-17271-9"},
+            {"title": 42, "author_id": 1, "isbn": "978-0-441-17271-9"},
+            {"id": 1, "title": "Emma", "author_id": 2, "isbn": "978-0-14-143958-7", "total_copies": 2},
+        )
+
+        response = client.post("/books/import?batch_size=2", data=body,
+                               content_type="application/x-ndjson", headers=auth_header(1))
+
+        assert response.status_code == 201
+        summary = response.get_json()
+        assert summary["imported"] == 2
+        assert summary["errors"] == [
+            {"row": 2, "error": "Invalid author_id: author does not exist"},
+            {"row": 3, "error": "title must be a string"},
+        ]
+        first, second = summary["ids"]
+        assert data_store.BOOKS[first]["available_copies"] == 1
+        assert data_store.BOOKS[second]["title"] == "Emma"
+        assert data_store.BOOKS[1]["title"] == "The Great Gatsby"
+
+        audits = [log for log in data_store.AUDIT_LOGS.values() if log["action"] == "IMPORT"]
+        assert [log["new_value"]["count"] for log in audits] == [1, 1]
+        assert audits[0]["user_id"] == 1
+
+    def test_import_authors_csv(self, client):
+        body = "name,bio\nUrsula K. Le Guin,Author of Earthsea\nOctavia Butler,\n"
+
+        response = client.post("/authors/import", data=body, content_type="text/csv",
+                               headers=auth_header(1))
+
+        assert response.status_code == 201
+        ids = response.get_json()["ids"]
+        assert [data_store.AUTHORS[i]["name"] for i in ids] == ["Ursula K. Le Guin", "Octavia Butler"]
+        assert data_store.AUTHORS[ids[1]]["bio"] == ""
+
+    def test_import_members_requires_admin(self, client):
+        body = ndjson({"name": "Ada", "email": "ada@example.com", "password": "password1"})
+
+        response = client.post("/members/import", data=body, content_type="application/x-ndjson",
+                               headers=auth_header(1))
+
+        assert response.status_code == 403
+
+    def test_import_members_rejects_duplicates(self, client):
+        body = ndjson(
+            {"name": "Ada", "email": "ada@example.com", "password": "password1"},
+            {"name": "Ada Again", "email": "ADA@example.com", "password": "password1"},
+        )
+
+        response = client.post("/members/import", data=body, content_type="application/x-ndjson",
+                               headers=auth_header(3))
+
+        summary = response.get_json()
+        assert summary["imported"] == 1
+        assert summary["errors"] == [{"row": 2, "error": "Email already exists"}]
+        member = data_store.MEMBERS[summary["ids"][0]]
+        assert member["email"] == "ada@example.com"
+        assert member["role"] == "user"
+
+    def test_member_passwords_hashed_outside_data_lock(self, client, monkeypatch):
+        lock_free = []
+
+        def check_lock(password):
+            probe = threading.Thread(target=lambda: lock_free.append(_try_lock(data_store.DATA_LOCK)))
+            probe.start()
+            probe.join()
+            return f"hashed-{password}"
+
+        monkeypatch.setattr(bulk, "generate_password_hash", check_lock)
+        body = ndjson(
+            {"name": "Ada", "email": "ada@example.com", "password": "password1"},
+            {"name": "Grace", "email": "grace@example.com", "password": "password2"},
+        )
+
+        response = client.post("/members/import", data=body, content_type="application/x-ndjson",
+                               headers=auth_header(3))
+
+        summary = response.get_json()
+        assert summary["imported"] == 2
+        assert lock_free == [True, True]
+        assert data_store.MEMBERS[summary["ids"][0]]["password_hash"] == "hashed-password1"
+
+    def test_unsupported_content_type(self, client):
+        response = client.post("/books/import", data="{}", content_type="application/json",
+                               headers=auth_header(1))
+
+        assert response.status_code == 415
+
+    def test_empty_body(self, client):
+        response = client.post("/books/import", data="", content_type="text/csv",
+                               headers=auth_header(1))
+
+        assert response.status_code == 400
+
+
+class TestBulkExport:
+    """Streaming export endpoints."""
+
+    def test_export_books_ndjson(self, client):
+        response = client.get("/books/export")
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert [row["id"] for row in rows] == sorted(data_store.BOOKS)
+
+    def test_export_csv_round_trips_through_import(self, client):
+        exported = client.get("/authors/export?format=csv").get_data(as_text=True)
+
+        response = client.post("/authors/import", data=exported, content_type="text/csv",
+                               headers=auth_header(1))
+
+        assert response.get_json()["imported"] == 3
+        assert len(data_store.AUTHORS) == 6
+
+    def test_export_members_omits_password_hash(self, client):
+        response = client.get("/members/export", headers=auth_header(3))
+
+        assert response.status_code == 200
+        assert "password_hash" not in response.get_data(as_text=True)
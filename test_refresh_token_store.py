@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Tests for refresh-token rotation, revocation and the Bloom filter denylist.
+
+Tests cover:
+- Bloom filter membership guarantees
+- Token consumption, reuse detection and family revocation
+- Expiry purging through the heap
+- SQLite persistence across restarts and worker processes
+- AuthService rotation and logout flows
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from api.models.user import UserLegacy
+from api.services.token_store import (
+    RefreshTokenStore,
+    SQLiteRefreshTokenStore,
+    TokenReuseError,
+    create_refresh_token_store,
+)
+from api.utils.bloom_filter import BloomFilter
+
+
+class TestBloomFilter:
+    """Bloom filter behaviour."""
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000, false_positive_rate=0.01)
+        items = [f"jti-{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+
+    def test_false_positive_rate_near_target(self):
+        bloom = BloomFilter(capacity=5000, false_positive_rate=0.01)
+        for i in range(5000):
+            bloom.add(f"added-{i}")
+
+        false_positives = sum(bloom.might_contain(f"absent-{i}") for i in range(10000))
+        assert false_positives / 10000 < 0.03
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=10, false_positive_rate=1.5)
+
+
+class TestRefreshTokenStore:
+    """Refresh-token family store."""
+
+    @pytest.fixture(params=["memory", "sqlite"])
+    def store(self, request, tmp_path):
+        """Yield each store implementation in turn."""
+        if request.param == "memory":
+            yield RefreshTokenStore(denylist_capacity=1000, false_positive_rate=0.01)
+        else:
+            token_store = SQLiteRefreshTokenStore(str(tmp_path / "users.db"), pool_size=2)
+            yield token_store
+            token_store.pool.close()
+
+    def test_consume_revokes_token(self, store):
+        store.register("a", "fam1", "user@example.com", time.time() + 60)
+
+        record = store.consume("a")
+
+        assert record.email == "user@example.com"
+        assert store.is_revoked("a")
+        assert store.active_count() == 0
+
+    def test_reuse_revokes_family(self, store):
+        expires = time.time() + 60
+        store.register("a", "fam1", "user@example.com", expires)
+        store.consume("a")
+        store.register("b", "fam1", "user@example.com", expires)
+        store.register("c", "fam2", "user@example.com", expires)
+
+        with pytest.raises(TokenReuseError):
+            store.consume("a")
+
+        assert store.is_revoked("b")
+        assert not store.is_revoked("c")
+
+    def test_unknown_token_rejected(self, store):
+        with pytest.raises(ValueError):
+            store.consume("missing")
+
+    def test_purge_expired_entries(self, store):
+        now = time.time()
+        store.register("old", "fam1", "user@example.com", now - 1)
+        store.register("live", "fam2", "user@example.com", now + 60)
+        store.revoke("live")
+
+        store.purge_expired(now)
+        assert store.active_count() == 0
+        assert store.revoked_count() == 1
+        assert store.purge_expired(now + 120) == 1
+        assert store.revoked_count() == 0
+        assert not store.is_revoked("live")
+
+
+class TestSQLiteRefreshTokenStore:
+    """State shared through the SQLite user database."""
+
+    def test_tokens_survive_restart(self, tmp_path):
+        db_path = str(tmp_path / "users.db")
+        first = SQLiteRefreshTokenStore(db_path)
+        first.register("a", "fam1", "user@example.com", time.time() + 60)
+        first.pool.close()
+
+        second = SQLiteRefreshTokenStore(db_path)
+        assert second.consume("a").family_id == "fam1"
+        second.pool.close()
+
+    def test_reuse_detected_across_workers(self, tmp_path):
+        db_path = str(tmp_path / "users.db")
+        worker_a = SQLiteRefreshTokenStore(db_path, pool_size=1)
+        worker_b = SQLiteRefreshTokenStore(db_path, pool_size=1)
+        expires = time.time() + 60
+        worker_a.register("a", "fam1", "user@example.com", expires)
+        worker_a.consume("a")
+        worker_a.register("b", "fam1", "user@example.com", expires)
+
+        with pytest.raises(TokenReuseError):
+            worker_b.consume("a")
+
+        assert worker_a.is_revoked("b")
+        worker_a.pool.close()
+        worker_b.pool.close()
+
+    def test_factory_selects_backend(self, tmp_path):
+        assert isinstance(create_refresh_token_store(), RefreshTokenStore)
+        token_store = create_refresh_token_store(str(tmp_path / "users.db"))
+        assert isinstance(token_store, SQLiteRefreshTokenStore)
+        token_store.pool.close()
+
+
+class TestAuthServiceRotation:
+    """Rotation and logout through AuthService."""
+
+    @pytest.fixture
+    def service(self):
+        from api.services.auth_service import auth_service
+        auth_service.user_repo.clear_all_users()
+        auth_service.token_store.clear()
+        auth_service.user_repo.add_user(
+            UserLegacy(email="rotate@example.com", hashed_password="x", username="rotate")
+        )
+        return auth_service
+
+    def test_rotation_issues_new_refresh_token(self, service):
+        tokens = service.generate_tokens("rotate@example.com")
+
+        rotated = service.rotate_refresh_token(tokens["refresh_token"])
+
+        assert rotated["refresh_token"] != tokens["refresh_token"]
+        assert service.refresh_access_token(rotated["refresh_token"])
+
+    def test_reused_refresh_token_revokes_successor(self, service):
+        tokens = service.generate_tokens("rotate@example.com")
+        rotated = service.rotate_refresh_token(tokens["refresh_token"])
+
+        with pytest.raises(ValueError):
+            service.rotate_refresh_token(tokens["refresh_token"])
+        with pytest.raises(ValueError):
+            service.rotate_refresh_token(rotated["refresh_token"])
+
+    def test_logout_revokes_family(self, service):
+        tokens = service.generate_tokens("rotate@example.com")
+
+        assert service.revoke_refresh_token(tokens["refresh_token"]) == 1
+        with pytest.raises(ValueError):
+            service.refresh_access_token(tokens["refresh_token"])
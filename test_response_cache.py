@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for the version-stamped response cache and conditional GET.
+
+Tests cover:
+- Cache hits, stamp invalidation, expiry and LRU eviction
+- ETag / If-None-Match handling on library endpoints
+- Invalidation by book, vote and proposal mutations
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from api import data_store
+from api.app import app
+from api.auth import generate_token
+from api.response_cache import CachedResponse, ResponseCache, response_cache
+
+
+def entry(stamp, expires=None):
+    return CachedResponse(stamp=stamp, expires=expires, body=b"{}", mimetype="application/json", etag="x")
+
+
+class TestResponseCache:
+    """Cache container behaviour."""
+
+    def test_stamp_mismatch_misses(self):
+        cache = ResponseCache()
+        cache.put("k", entry((1, 2)))
+
+        assert cache.get("k", (1, 2), "2024") is not None
+        assert cache.get("k", (1, 3), "2024") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_expired_entry_misses(self):
+        cache = ResponseCache()
+        cache.put("k", entry((1,), expires="2024-06-01"))
+
+        assert cache.get("k", (1,), "2024-05-31") is not None
+        assert cache.get("k", (1,), "2024-06-01") is None
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", entry((1,)))
+        cache.put("b", entry((1,)))
+        cache.get("a", (1,), "2024")
+        cache.put("c", entry((1,)))
+
+        assert cache.get("b", (1,), "2024") is None
+        assert cache.get("a", (1,), "2024") is not None
+        assert len(cache) == 2
+
+
+@pytest.fixture
+def client():
+    data_store.reset_data_store()
+    response_cache.clear()
+    app.config["TESTING"] = True
+    with app.test_client() as client:
+        yield client
+    data_store.reset_data_store()
+
+
+def auth_header(member_id=1):
+    return {"Authorization": f"Bearer {generate_token(member_id)}"}
+
+
+class TestConditionalGet:
+    """ETag handling on cached endpoints."""
+
+    def test_if_none_match_returns_304(self, client):
+        first = client.get("/books")
+        etag = first.headers["ETag"]
+
+        second = client.get("/books", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.get_data() == b""
+        assert second.headers["ETag"] == etag
+        assert response_cache.hits == 1
+
+    def test_query_parameters_are_part_of_key(self, client):
+        everything = client.get("/books")
+        filtered = client.get("/books?title=gatsby")
+
+        assert len(filtered.get_json()) == 1
+        assert filtered.headers["ETag"] != everything.headers["ETag"]
+
+    def test_book_update_invalidates(self, client):
+        etag = client.get("/books/1").headers["ETag"]
+
+        client.put("/books/1", json={"title": "The Great Gatsby (Annotated)"}, headers=auth_header())
+        response = client.get("/books/1", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.get_json()["title"] == "The Great Gatsby (Annotated)"
+        assert response.headers["ETag"] != etag
+
+    def test_borrow_invalidates_book_list(self, client):
+        before = client.get("/books").get_json()
+
+        client.post("/loans/borrow", json={"book_id": 1, "member_id": 2}, headers=auth_header(2))
+        after = client.get("/books").get_json()
+
+        copies = {book["id"]: book["available_copies"] for book in before}
+        assert {book["id"]: book["available_copies"] for book in after}[1] == copies[1] - 1
+
+    def test_errors_are_not_cached(self, client):
+        assert client.get("/books/999").status_code == 404
+        assert len(response_cache) == 0
+
+    def test_proposals_require_auth_before_cache(self, client):
+        client.get("/proposals", headers=auth_header())
+
+        assert client.get("/proposals").status_code == 401
+
+    def test_vote_invalidates_proposals(self, client):
+        etag = client.get("/proposals", headers=auth_header()).headers["ETag"]
+
+        data_store.create_vote({"proposal_id": 2, "member_id": 2, "vote_choice": "approve"})
+        response = client.get("/proposals", headers=dict(auth_header(), **{"If-None-Match": etag}))
+
+        assert response.status_code == 200
+
+    def test_ballot_list_expires_when_ballot_opens(self, client):
+        start = (datetime.now() + timedelta(seconds=2)).isoformat()
+        data_store.BALLOTS[1]["start_date"] = start
+        data_store.bump_data_version("ballots")
+
+        client.get("/ballots")
+        key = next(iter(response_cache._entries))
+
+        assert response_cache._entries[key].expires == start
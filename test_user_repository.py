@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tests for the indexed in-memory and SQLite-backed user repositories.
+
+Tests cover:
+- Case-folded email and username lookups
+- Duplicate detection on both indexes
+- Batched bulk import with per-row error reporting
+- SQLite persistence across repository instances
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from api.models.user import UserLegacy
+from api.services.user_repository import (
+    SQLiteUserRepository,
+    UserRepository,
+    create_user_repository,
+)
+
+
+def make_user(index, email=None, username=None):
+    """Build a test user with predictable fields."""
+    return UserLegacy(
+        email=email or f"user{index}@example.com",
+        hashed_password=f"hash{index}",
+        username=username or f"user{index}",
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repo(request, tmp_path):
+    """Yield each repository implementation in turn."""
+    if request.param == "memory":
+        yield UserRepository()
+    else:
+        repository = SQLiteUserRepository(str(tmp_path / "users.db"), pool_size=2)
+        yield repository
+        repository.pool.close()
+
+
+class TestIndexedLookups:
+    """Lookups through the case-folded indexes."""
+
+    def test_email_lookup_is_case_insensitive(self, repo):
+        repo.add_user(make_user(1, email="Alice@Example.COM"))
+
+        user = repo.get_user_by_email("  alice@example.com ")
+        assert user is not None
+        assert user.email == "Alice@Example.COM"
+        assert repo.user_exists("ALICE@EXAMPLE.COM")
+
+    def test_username_lookup_is_case_insensitive(self, repo):
+        repo.add_user(make_user(1, username="Alice"))
+
+        user = repo.get_user_by_username("ALICE")
+        assert user is not None
+        assert user.username == "Alice"
+        assert repo.username_exists("alice")
+        assert repo.get_user_by_username("bob") is None
+
+    def test_duplicate_email_rejected(self, repo):
+        repo.add_user(make_user(1, email="a@example.com"))
+
+        with pytest.raises(ValueError, match="email"):
+            repo.add_user(make_user(2, email="A@example.com"))
+
+    def test_duplicate_username_rejected(self, repo):
+        repo.add_user(make_user(1, username="alice"))
+
+        with pytest.raises(ValueError, match="username"):
+            repo.add_user(make_user(2, username="Alice"))
+
+    def test_clear_all_users(self, repo):
+        repo.add_user(make_user(1))
+        repo.clear_all_users()
+
+        assert repo.count_users() == 0
+        assert not repo.user_exists("user1@example.com")
+        assert not repo.username_exists("user1")
+
+
+class TestBulkImport:
+    """Batched bulk import."""
+
+    def test_imports_across_batches(self, repo):
+        result = repo.add_users((make_user(i) for i in range(25)), batch_size=10)
+
+        assert result == {"imported": 25, "errors": []}
+        assert repo.count_users() == 25
+        assert repo.get_user_by_email("user24@example.com") is not None
+
+    def test_reports_duplicates_per_row(self, repo):
+        repo.add_user(make_user(0))
+        users = [
+            make_user(1),
+            make_user(2, email="USER0@example.com"),
+            make_user(3, username="User1"),
+            make_user(4),
+        ]
+
+        result = repo.add_users(users, batch_size=2)
+
+        assert result["imported"] == 2
+        assert [error["row"] for error in result["errors"]] == [1, 2]
+        assert repo.count_users() == 3
+
+
+class TestSQLiteConflicts:
+    """Conflicts only the database can detect."""
+
+    @pytest.fixture
+    def sqlite_repo(self, tmp_path):
+        repository = SQLiteUserRepository(str(tmp_path / "users.db"), pool_size=2)
+        yield repository
+        repository.pool.close()
+
+    def test_concurrent_insert_is_reported_per_row(self, sqlite_repo, monkeypatch):
+        sqlite_repo.add_user(make_user(0))
+        # Another writer inserted user0 after the batch's key check
+        monkeypatch.setattr(SQLiteUserRepository, "_existing_keys", staticmethod(lambda conn, column, keys: set()))
+
+        result = sqlite_repo.add_users([make_user(1), make_user(5, email="USER0@example.com"), make_user(2)])
+
+        assert result["imported"] == 2
+        assert result["errors"] == [{"row": 1, "email": "USER0@example.com",
+                                     "error": "User with email USER0@example.com already exists"}]
+        assert sqlite_repo.count_users() == 3
+
+    def test_id_collision_reported_as_id(self, sqlite_repo):
+        existing = make_user(0)
+        sqlite_repo.add_user(existing)
+        clash = UserLegacy(email="other@example.com", hashed_password="h", username="other", id=existing.id)
+
+        result = sqlite_repo.add_users([clash])
+
+        assert result["imported"] == 0
+        assert result["errors"][0]["error"] == f"User with id {existing.id} already exists"
+        with pytest.raises(ValueError, match="User with id"):
+            sqlite_repo.add_user(clash)
+
+
+class TestSQLitePersistence:
+    """State kept by the SQLite repository."""
+
+    def test_users_survive_reopen(self, tmp_path):
+        db_path = str(tmp_path / "users.db")
+        first = SQLiteUserRepository(db_path)
+        first.add_user(make_user(1, email="Persist@example.com"))
+        first.pool.close()
+
+        second = SQLiteUserRepository(db_path)
+        user = second.get_user_by_email("persist@example.com")
+        assert user is not None
+        assert user.hashed_password == "hash1"
+        second.pool.close()
+
+    def test_factory_selects_backend(self, tmp_path):
+        assert isinstance(create_user_repository(), UserRepository)
+
+        repository = create_user_repository(str(tmp_path / "users.db"))
+        assert isinstance(repository, SQLiteUserRepository)
+        repository.pool.close()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled payload schema layer and batch validators.
+
+Tests cover:
+- Schema builders and first-error-wins ordering
+- Live membership checks against data store dictionaries
+- Batch book and member validation
+"""
+
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.abspath('.'))
+
+from api.schema import (
+    compile_schema, required, text, integer, matches, boolean, one_of, read_only, validate_many
+)
+from api.validators import validate_books, validate_members
+
+
+class TestCompileSchema:
+    """Compiled validator behaviour."""
+
+    def test_rejects_non_dict(self):
+        validator = compile_schema(required("name"))
+
+        assert validator(["name"]) == (False, "Invalid data format")
+
+    def test_first_error_wins(self):
+        validator = compile_schema(
+            required("name", "age"),
+            text("name", 2, 10, "bad name"),
+            integer("age", "bad age"),
+        )
+
+        assert validator({"age": 3}) == (False, "Missing required field: name")
+        assert validator({"name": "x", "age": "old"}) == (False, "bad name")
+        assert validator({"name": "xy", "age": "old"}) == (False, "bad age")
+        assert validator({"name": "xy", "age": "3"}) == (True, None)
+
+    def test_required_allow_falsy(self):
+        strict = compile_schema(required("count"))
+        lenient = compile_schema(required("count", allow_falsy=True))
+
+        assert strict({"count": 0})[0] is False
+        assert lenient({"count": 0}) == (True, None)
+        assert lenient({"count": None})[0] is False
+
+    def test_integer_membership_is_live(self):
+        table = {1: "a"}
+        validator = compile_schema(integer("id", "bad id", member_of=table, member_message="missing"))
+
+        assert validator({"id": 2}) == (False, "missing")
+        table[2] = "b"
+        assert validator({"id": 2}) == (True, None)
+
+    def test_optional_field_checks(self):
+        validator = compile_schema(
+            matches("code", re.compile(r"^\d+$"), "bad code", optional=True),
+            boolean("flag", "bad flag"),
+            one_of("status", ("open", "closed"), "bad status"),
+            read_only("id"),
+        )
+
+        assert validator({}) == (True, None)
+        assert validator({"code": "12a"}) == (False, "bad code")
+        assert validator({"flag": 1}) == (False, "bad flag")
+        assert validator({"status": ["open"]}) == (False, "bad status")
+        assert validator({"id": 1}) == (False, "Field 'id' cannot be updated")
+
+    def test_validate_many_reports_rejected_rows(self):
+        validator = compile_schema(required("name"))
+
+        assert validate_many(validator, [{"name": "a"}, {}, {"name": ""}]) == [
+            (1, "Missing required field: name"),
+            (2, "Missing required field: name"),
+        ]
+
+
+class TestBatchValidators:
+    """Batch validators used by bulk import."""
+
+    def test_validate_books(self):
+        books = [
+            {"title": "Dune", "author_id": 1, "isbn": "978-0-441-17271-9"},
+            {"title": "Dune", "author_id": 999, "isbn": "978-0-441-17271-9"},
+        ]
+
+        assert validate_books(books) == [(1, "Invalid author_id: author does not exist")]
+
+    def test_validate_members_detects_in_batch_duplicates(self):
+        members = [
+            {"name": "Ada", "email": "ada@example.com", "password": "password1"},
+            {"name": "Ada Two", "email": "ADA@example.com", "password": "password1"},
+            {"name": "John", "email": "john.doe@email.com", "password": "password1"},
+        ]
+
+        assert validate_members(members) == [
+            (1, "Email already exists"),
+            (2, "Email already exists"),
+        ]